@@ -10,8 +10,15 @@
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
 
+from pyomo.common.collections import ComponentSet
 from pyomo.common.config import ConfigValue, In
-from pyomo.environ import Set
+from pyomo.common.errors import ApplicationError, IterationLimitError
+from pyomo.contrib.incidence_analysis import (
+    IncidenceGraphInterface,
+    solve_strongly_connected_components,
+)
+from pyomo.environ import Block, Constraint, Set, Var, check_optimal_termination
+from pyomo.util.subsystems import TemporarySubsystemManager, create_subsystem_block
 from idaes.core import (
     declare_process_block_class,
     DistributedVars,
@@ -28,6 +35,7 @@ from watertap.core.membrane_channel_base import (
     PressureChangeType,
     CONFIG_Template as Base_CONFIG_Template,
 )
+from watertap.core.solvers import get_solver
 
 CONFIG_Template = Base_CONFIG_Template()
 
@@ -89,6 +97,27 @@ CONFIG_Template.declare(
 )
 
 
+def _get_element(component_data, length_sets, top):
+    """
+    Return the point of the length domain a constraint or variable belongs
+    to, or None if it does not belong to a single point. This is the
+    length index of the component itself or of the nearest block above it
+    (e.g. a state block) which is indexed by one of length_sets.
+    """
+    obj = component_data
+    while obj is not None and obj is not top:
+        comp = obj.parent_component()
+        if comp.is_indexed():
+            pos = 0
+            for s in comp.index_set().subsets(expand_all_set_operators=True):
+                if s in length_sets:
+                    idx = obj.index()
+                    return idx[pos] if type(idx) is tuple else idx
+                pos += s.dimen
+        obj = obj.parent_block()
+    return None
+
+
 @declare_process_block_class("MembraneChannel1DBlock")
 class MembraneChannel1DBlockData(MembraneChannelMixin, ControlVolume1DBlockData):
     def _skip_element(self, x):
@@ -241,6 +270,127 @@ class MembraneChannel1DBlockData(MembraneChannelMixin, ControlVolume1DBlockData)
         else:
             self.release_state(source_flags, outlvl)
 
+    def initialize_by_element_marching(
+        self, block=None, outlvl=idaeslog.NOTSET, solver=None, optarg=None
+    ):
+        """
+        Initialize the finite elements of a unit model one at a time, in the
+        direction of flow in this channel.
+
+        At each point of the length domain, the equations at that point
+        (e.g. flux, concentration polarization, property and balance
+        equations) are solved for the variables at that point, with the
+        values of the previous point, the inlet and variables which are not
+        indexed by length (e.g. length, width and area) held at their
+        current values. Each element therefore starts from the outlet of the
+        previous one, which gives a near-converged profile for the solve of
+        the whole unit. Equations which cannot be matched to variables at a
+        point (e.g. specifications on the inlet) are skipped.
+
+        Marching stops at the first point which fails to solve, or at which
+        the solver or an evaluation of the equations fails, leaving that
+        point and the points after it at their previous values.
+
+        Keyword Arguments:
+            block : block containing the channel equations, e.g. the unit
+                    model (default = the parent block of the channel)
+            outlvl : sets output log level of initialization routine
+            optarg : solver options dictionary object (default=None, use
+                     default solver options)
+            solver : str indicating which solver to use for coupled systems
+                     at each point (default = None)
+
+        Returns:
+            number of points of the length domain which were solved
+        """
+        init_log = idaeslog.getInitLogger(self.name, outlvl, tag="control_volume")
+
+        if self.config.transformation_method != "dae.finite_difference":
+            init_log.info(
+                "Element marching requires a finite difference transformation, "
+                "skipping."
+            )
+            return 0
+
+        if block is None:
+            block = self.parent_block()
+
+        # Points of all 1D membrane channels in block, so that the points of
+        # both channels are solved together in counter-current units
+        length_sets = ComponentSet()
+        for b in block.component_data_objects(Block, descend_into=True):
+            if isinstance(b, MembraneChannel1DBlockData):
+                length_sets.add(b.length_domain)
+                length_sets.add(b.difference_elements)
+
+        element_vars = {}
+        for v in block.component_data_objects(Var, descend_into=True):
+            x = _get_element(v, length_sets, block)
+            if x is not None and not v.fixed:
+                element_vars.setdefault(x, []).append(v)
+        element_cons = {}
+        for c in block.component_data_objects(
+            Constraint, active=True, descend_into=True
+        ):
+            x = _get_element(c, length_sets, block)
+            if x is not None:
+                element_cons.setdefault(x, []).append(c)
+
+        opt = get_solver(solver, optarg)
+
+        points = list(self.length_domain)
+        if self._flow_direction == FlowDirection.backward:
+            points.reverse()
+
+        n_solved = 0
+        for x in points:
+            variables = element_vars.get(x, [])
+            constraints = element_cons.get(x, [])
+            if not variables or not constraints:
+                continue
+
+            values = [v.value for v in variables]
+            subsystem = create_subsystem_block(constraints, variables)
+            with TemporarySubsystemManager(to_fix=list(subsystem.input_vars.values())):
+                igraph = IncidenceGraphInterface(subsystem, include_inequality=False)
+                var_dmp, con_dmp = igraph.dulmage_mendelsohn()
+                square = create_subsystem_block(con_dmp.square, var_dmp.square)
+                try:
+                    with TemporarySubsystemManager(
+                        to_fix=list(square.input_vars.values())
+                    ):
+                        results = solve_strongly_connected_components(
+                            square, solver=opt
+                        )
+                    solved = all(
+                        r is None or check_optimal_termination(r) for r in results
+                    )
+                except (
+                    ValueError,
+                    ArithmeticError,
+                    IterationLimitError,
+                    RuntimeError,
+                    ApplicationError,
+                ):
+                    # Failed evaluations (e.g. in the AMPL solver library)
+                    # and solver errors stop the marching
+                    solved = False
+
+            if not solved:
+                for v, val in zip(variables, values):
+                    v.set_value(val, skip_validation=True)
+                init_log.warning(
+                    f"Element marching failed at x = {x}, the remaining elements "
+                    "keep their initial guesses."
+                )
+                break
+            n_solved += 1
+
+        init_log.info_high(
+            f"Element marching solved {n_solved} of {len(points)} points"
+        )
+        return n_solved
+
     def calculate_scaling_factors(self):
         if iscale.get_scaling_factor(self.area) is None:
             iscale.set_scaling_factor(self.area, 100)
@@ -15,8 +15,16 @@ Tests for WaterTAP database wrapper
 
 import pytest
 import os
+import pickle
 
-from watertap.core.wt_database import Database
+import watertap.core.wt_database as wt_database
+from watertap.core.wt_database import (
+    Database,
+    clear_shared_cache,
+    load_snapshot,
+    load_yaml,
+    save_snapshot,
+)
 
 
 @pytest.mark.unit
@@ -229,3 +237,85 @@ class TestDatabase:
         db.flush_cache()
 
         assert db._cached_files == {}
+
+
+class TestSharedCache:
+    @pytest.fixture
+    def yaml_file(self, tmp_path):
+        clear_shared_cache()
+        fpath = tmp_path / "tech.yaml"
+        fpath.write_text("default:\n  param: 1\n")
+        yield fpath
+        clear_shared_cache()
+
+    @pytest.mark.unit
+    def test_load_yaml_shared(self, yaml_file):
+        data = load_yaml(yaml_file)
+        assert data == {"default": {"param": 1}}
+        assert os.path.abspath(yaml_file) in wt_database._shared_cache
+
+        # Returned data is a copy, so modifying it does not affect the cache
+        data["default"]["param"] = 2
+        assert load_yaml(yaml_file) == {"default": {"param": 1}}
+
+    @pytest.mark.unit
+    def test_load_yaml_modified(self, yaml_file):
+        assert load_yaml(yaml_file) == {"default": {"param": 1}}
+
+        yaml_file.write_text("default:\n  param: 10\n")
+        stat = os.stat(yaml_file)
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_yaml(yaml_file) == {"default": {"param": 10}}
+
+    @pytest.mark.unit
+    def test_load_yaml_missing(self, tmp_path):
+        with pytest.raises(OSError):
+            load_yaml(tmp_path / "foo.yaml")
+
+    @pytest.mark.unit
+    def test_databases_share_cache(self, yaml_file):
+        db1 = Database(dbpath=str(yaml_file.parent))
+        db2 = Database(dbpath=str(yaml_file.parent))
+
+        data1 = db1._get_technology("tech")
+        data1["default"]["param"] = "overloaded"
+
+        assert len(wt_database._shared_cache) == 1
+        assert db2._get_technology("tech") == {"default": {"param": 1}}
+
+    @pytest.mark.unit
+    def test_snapshot(self, yaml_file, tmp_path):
+        (tmp_path / "other.yaml").write_text("default:\n  param: 2\n")
+        snapshot = tmp_path / "db.pickle"
+
+        assert save_snapshot(snapshot, dbpath=tmp_path) == 2
+
+        clear_shared_cache()
+        assert load_snapshot(snapshot) == 2
+        assert len(wt_database._shared_cache) == 2
+
+        db = Database(dbpath=str(tmp_path))
+        assert db.get_unit_operation_parameters("other") == {"param": 2}
+
+    @pytest.mark.unit
+    def test_snapshot_default_database(self, tmp_path):
+        snapshot = tmp_path / "db.pickle"
+        n_files = save_snapshot(snapshot)
+        assert n_files > 100
+
+        clear_shared_cache()
+        assert load_snapshot(snapshot) == n_files
+        assert Database().get_solute_set("seawater")[0] == "boron"
+        clear_shared_cache()
+
+    @pytest.mark.unit
+    def test_snapshot_invalid(self, tmp_path):
+        snapshot = tmp_path / "db.pickle"
+        with open(snapshot, "wb") as f:
+            pickle.dump({"version": -1}, f)
+
+        with pytest.raises(
+            ValueError, match="is not a compatible WaterTAP database snapshot."
+        ):
+            load_snapshot(snapshot)
@@ -0,0 +1,200 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+Tests for batched evaluation of zero-order trains
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from pyomo.environ import ConcreteModel, TransformationFactory, value
+from pyomo.network import Arc
+
+from idaes.core import FlowsheetBlock, UnitModelCostingBlock
+
+from watertap.core.util.initialization import direct_initializer
+from watertap.core.wt_database import Database
+from watertap.core.zero_order_batch import ZeroOrderTrainEvaluator
+from watertap.core.zero_order_properties import WaterParameterBlock
+from watertap.costing.zero_order_costing import ZeroOrderCosting
+from watertap.unit_models.zero_order import DualMediaFiltrationZO, NanofiltrationZO
+
+solutes = ["tds", "toc", "tss"]
+technologies = ["dual_media_filtration", "nanofiltration"]
+
+
+@pytest.fixture(scope="module")
+def db():
+    return Database()
+
+
+@pytest.fixture(scope="module")
+def evaluator(db):
+    return ZeroOrderTrainEvaluator(db, technologies, solutes, use_default_removal=True)
+
+
+def build_train(db, feed):
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.params = WaterParameterBlock(solute_list=solutes)
+    m.fs.costing = ZeroOrderCosting()
+
+    m.fs.dmf = DualMediaFiltrationZO(property_package=m.fs.params, database=db)
+    m.fs.nf = NanofiltrationZO(property_package=m.fs.params, database=db)
+    m.fs.s01 = Arc(source=m.fs.dmf.treated, destination=m.fs.nf.inlet)
+    TransformationFactory("network.expand_arcs").apply_to(m)
+
+    for j, flow in zip(["H2O"] + solutes, feed):
+        m.fs.dmf.inlet.flow_mass_comp[0, j].fix(flow)
+    for unit in (m.fs.dmf, m.fs.nf):
+        unit.load_parameters_from_database(use_default_removal=True)
+        unit.costing = UnitModelCostingBlock(flowsheet_costing_block=m.fs.costing)
+
+    m.fs.costing.cost_process()
+    product = m.fs.nf.properties_treated[0].flow_vol
+    m.fs.costing.add_LCOW(product)
+    m.fs.costing.add_electricity_intensity(product)
+    return m
+
+
+class TestZeroOrderTrainEvaluator:
+    @pytest.mark.unit
+    def test_parameters(self, evaluator):
+        assert evaluator.component_list == ["H2O"] + solutes
+        assert evaluator.technologies == [
+            ("dual_media_filtration", None),
+            ("nanofiltration", None),
+        ]
+        assert evaluator.recovery_frac_mass_H2O[0] == pytest.approx(0.99, rel=1e-12)
+        assert np.all(evaluator.removal_frac_mass_comp >= 0)
+        assert np.all(evaluator.removal_frac_mass_comp <= 1)
+
+    @pytest.mark.unit
+    def test_unsupported_technology(self, db):
+        # Nanofiltration with membrane costing is not a power law
+        with pytest.raises(ValueError, match="only cost_power_law_flow"):
+            ZeroOrderTrainEvaluator(
+                db,
+                [("nanofiltration", "rHGO_dye_rejection")],
+                solutes,
+                use_default_removal=True,
+            )
+
+    @pytest.mark.unit
+    def test_reactions(self, db):
+        with pytest.raises(ValueError, match="defines reactions"):
+            ZeroOrderTrainEvaluator(
+                db, ["anaerobic_digestion_reactive"], ["cod"], use_default_removal=True
+            )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "tech",
+        [
+            # Sized on total mass and capacity basis by cost_landfill
+            "landfill",
+            # Chemical flows registered by cost_fixed_bed
+            "fixed_bed",
+        ],
+    )
+    def test_unsupported_costing(self, db, tech):
+        with pytest.raises(ValueError, match="requires constant intensity"):
+            ZeroOrderTrainEvaluator(db, [tech], solutes, use_default_removal=True)
+
+    @pytest.mark.unit
+    def test_missing_removal(self, db):
+        with pytest.raises(KeyError, match="removal_frac_mass_comp with index foo"):
+            ZeroOrderTrainEvaluator(db, technologies, ["foo"])
+
+    @pytest.mark.component
+    def test_compare_model(self, db, evaluator):
+        feed = np.array([1000, 35, 0.02, 0.3])
+        m = build_train(db, feed)
+        # Zero-order trains with costing are solved without a solver
+        assert direct_initializer(m) is None
+
+        res = evaluator.evaluate(feed)
+        for i, unit in enumerate((m.fs.dmf, m.fs.nf)):
+            for k, j in enumerate(evaluator.component_list):
+                assert res["treated"][0, i, k] == pytest.approx(
+                    value(unit.treated.flow_mass_comp[0, j]), rel=1e-8, abs=1e-12
+                )
+                if hasattr(unit, "byproduct"):
+                    assert res["byproduct"][0, i, k] == pytest.approx(
+                        value(unit.byproduct.flow_mass_comp[0, j]),
+                        rel=1e-8,
+                        abs=1e-12,
+                    )
+            assert res["electricity"][0, i] == pytest.approx(
+                value(unit.electricity[0]), rel=1e-8
+            )
+            assert res["capital_cost"][0, i] == pytest.approx(
+                value(unit.costing.capital_cost), rel=1e-8
+            )
+
+        costing = m.fs.costing
+        for key, var in [
+            ("aggregate_capital_cost", costing.aggregate_capital_cost),
+            ("aggregate_flow_electricity", costing.aggregate_flow_electricity),
+            ("total_capital_cost", costing.total_capital_cost),
+            ("total_operating_cost", costing.total_operating_cost),
+            ("total_annualized_cost", costing.total_annualized_cost),
+            ("LCOW", costing.LCOW),
+            ("electricity_intensity", costing.electricity_intensity),
+        ]:
+            assert res[key][0] == pytest.approx(value(var), rel=1e-8)
+
+    @pytest.mark.unit
+    def test_feed_from_sources(self, db, evaluator):
+        feed = evaluator.feed_from_sources(["seawater", "agricultural"])
+        assert feed.shape == (2, 4)
+        # Flows are the concentrations times the default flow
+        data = db.get_source_data("agricultural")
+        Q = data["default_flow"]["value"]
+        assert feed[1, 1] == pytest.approx(Q * data["solutes"]["tds"]["value"])
+        assert feed[1, 3] == 0
+        assert feed[1].sum() == pytest.approx(Q * 1000, rel=1e-12)
+
+        feed = evaluator.feed_from_sources(["seawater", "agricultural"], flow_vol=2)
+        assert feed.sum(axis=1) == pytest.approx([2000, 2000], rel=1e-12)
+
+    @pytest.mark.unit
+    def test_broadcast(self, evaluator):
+        feed = np.array([[1000, 35, 0.02, 0.3], [500, 1, 0.01, 0.1]])
+        res = evaluator.evaluate(feed, recovery_frac_mass_H2O=[[0.9, 0.8], [1, 0.5]])
+        assert res["treated"].shape == (2, 2, 4)
+        assert res["LCOW"].shape == (2,)
+        assert res["product"][:, 0] == pytest.approx(
+            [1000 * 0.9 * 0.8, 500 * 0.5], rel=1e-12
+        )
+        # Mass is conserved over each unit
+        assert res["inlet"] == pytest.approx(res["treated"] + res["byproduct"])
+
+        with pytest.raises(ValueError, match="Expected feed flows with 4 components"):
+            evaluator.evaluate(feed[:, :3])
+
+    @pytest.mark.unit
+    def test_screening(self, evaluator):
+        rng = np.random.default_rng(42)
+        n = 10000
+        feed = np.column_stack(
+            [rng.uniform(100, 1000, n), rng.uniform(0, 40, (n, len(solutes)))]
+        )
+        start = time.perf_counter()
+        res = evaluator.evaluate(
+            feed, recovery_frac_mass_H2O=rng.uniform(0.5, 1, (n, 2))
+        )
+        assert time.perf_counter() - start < 5
+        assert res["LCOW"].shape == (n,)
+        assert np.all(res["LCOW"] > 0)
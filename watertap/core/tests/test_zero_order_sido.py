@@ -38,6 +38,7 @@ from watertap.property_models.multicomp_aq_sol_prop_pack import (
     MCASParameterBlock,
     MaterialFlowBasis,
 )
+from watertap.core import zero_order_sido
 from watertap.core.zero_order_sido import (
     build_sido,
     initialize_sido,
@@ -269,3 +270,32 @@ def test_with_MCAS():
 
     # Check for optimal solution
     assert_optimal_termination(results)
+
+
+@pytest.mark.component
+def test_initialize_directly(monkeypatch):
+    class _Solver:
+        def solve(self, blk, tee=False):
+            raise AssertionError("Solver should not be called")
+
+    monkeypatch.setattr(zero_order_sido, "get_solver", lambda solver, optarg: _Solver())
+
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.water_props = WaterParameterBlock(solute_list=["A", "B"])
+    m.fs.unit = DerivedSIDO(property_package=m.fs.water_props)
+    m.fs.unit.inlet.flow_mass_comp[0, "H2O"].fix(1000)
+    m.fs.unit.inlet.flow_mass_comp[0, "A"].fix(10)
+    m.fs.unit.inlet.flow_mass_comp[0, "B"].fix(20)
+    m.fs.unit.recovery_frac_mass_H2O.fix(0.8)
+    m.fs.unit.removal_frac_mass_comp[0, "A"].fix(0.1)
+    m.fs.unit.removal_frac_mass_comp[0, "B"].fix(1)
+
+    m.fs.unit.initialize()
+
+    assert value(m.fs.unit.treated.flow_mass_comp[0, "H2O"]) == pytest.approx(800)
+    assert value(m.fs.unit.byproduct.flow_mass_comp[0, "H2O"]) == pytest.approx(200)
+    assert value(m.fs.unit.treated.flow_mass_comp[0, "A"]) == pytest.approx(9)
+    assert value(m.fs.unit.byproduct.flow_mass_comp[0, "A"]) == pytest.approx(1)
+    assert value(m.fs.unit.treated.flow_mass_comp[0, "B"]) == pytest.approx(0)
+    assert value(m.fs.unit.byproduct.flow_mass_comp[0, "B"]) == pytest.approx(20)
@@ -9,16 +9,21 @@
 # information, respectively. These files are also available online at the URL
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
+import csv
+from functools import lru_cache
 from re import findall
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 from pyomo.environ import units as pyunits
 
+_PERIODIC_TABLE_FILE = Path(__file__).parent / "periodic_table.csv"
 
+
+@lru_cache(maxsize=1024)
 def get_charge(watertap_name: str) -> int:
     """
-    Gets charge from WaterTAP formatted names.
+    Gets charge from WaterTAP formatted names (memoized).
     :param watertap_name: string name of a solute in WaterTAP format
     :return charge: integer value of charge
     """
@@ -62,17 +67,18 @@ def get_charge(watertap_name: str) -> int:
     return charge
 
 
+@lru_cache(maxsize=1024)
 def get_molar_mass(watertap_name: str) -> float:
     """
     Extracts atomic weight data from a periodic table file
-    to generate the molar mass of a chemical substance.
+    to generate the molar mass of a chemical substance (memoized).
     TODO: additional testing for complex solutes
     such as CH3CO2H, [UO2]2[OH]4, etc.
     :param watertap_name: string name of a solute in WaterTAP format
     :return molar_mass: float value for molar mass of solute
     """
 
-    periodic_table = get_periodic_table()
+    atomic_masses = _get_atomic_masses()
 
     components = watertap_name.split("_")
     elements = findall("[A-Z][a-z]?[0-9]*", components[0])
@@ -102,12 +108,8 @@ def get_molar_mass(watertap_name: str) -> float:
     molar_mass = 0
     for element in element_counts:
         try:
-            atomic_mass = float(
-                periodic_table["AtomicMass"][
-                    (periodic_table["Symbol"] == element)
-                ].values[0]
-            )
-        except IndexError:
+            atomic_mass = atomic_masses[element]
+        except KeyError:
             raise IOError(
                 f"The symbol '{element}' from the component name '{components[0]}' could not be found in the periodic table."
             )
@@ -138,9 +140,41 @@ def get_charge_group(charge: int) -> str:
     return group
 
 
-def get_periodic_table() -> pd.DataFrame:
-    parent_dir = Path(__file__).parent
-    return pd.read_csv(parent_dir / "periodic_table.csv")
+def get_molar_masses(watertap_names) -> np.ndarray:
+    """
+    Gets molar masses for a list of solutes.
+
+    :param watertap_names: iterable of solute names in WaterTAP format
+
+    :return molar_masses: array of molar mass values (g/mol), in the order of watertap_names
+    """
+
+    return np.array([get_molar_mass(name) for name in watertap_names], dtype=float)
+
+
+def get_charges(watertap_names) -> np.ndarray:
+    """
+    Gets charges for a list of solutes.
+
+    :param watertap_names: iterable of solute names in WaterTAP format
+
+    :return charges: array of integer charge values, in the order of watertap_names
+    """
+
+    return np.array([get_charge(name) for name in watertap_names], dtype=int)
+
+
+@lru_cache(maxsize=None)
+def _get_atomic_masses() -> dict:
+    # read once per process; maps element symbol to atomic mass
+    with open(_PERIODIC_TABLE_FILE, newline="", encoding="utf-8") as f:
+        return {row["Symbol"]: float(row["AtomicMass"]) for row in csv.DictReader(f)}
+
+
+def get_periodic_table() -> "pandas.DataFrame":
+    import pandas as pd
+
+    return pd.read_csv(_PERIODIC_TABLE_FILE)
 
 
 def get_molar_mass_quantity(watertap_name: str, units=pyunits.kg / pyunits.mol):
@@ -0,0 +1,245 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module compiles a square system of Pyomo equations, with a set of input
+variables, to a vectorized NumPy function evaluating the other variables from
+the inputs without a solver.
+
+The equations are block triangularized with the inputs fixed. Blocks in which
+the variable appears linearly (possibly next to nonlinear terms of the
+inputs and of previously evaluated variables) are compiled to explicit
+assignments, and coupled or nonlinear blocks are solved by a vectorized Newton
+method with symbolic Jacobians. Parameters and all other fixed variables are
+taken at their values when compiling.
+
+The expressions are converted to NumPy source by NumPyCodeVisitor (see
+numpy_expressions).
+"""
+
+import numpy as np
+
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.common.errors import IterationLimitError
+from pyomo.contrib.incidence_analysis import IncidenceGraphInterface
+from pyomo.core.expr.calculus.derivatives import differentiate, Modes
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import value
+from pyomo.repn import generate_standard_repn
+from pyomo.util.subsystems import TemporarySubsystemManager
+
+from watertap.core.util.numpy_expressions import (
+    NumPyCodeVisitor,
+    compile_numpy_function,
+)
+
+
+class CompiledEquations:
+    """
+    Vectorized NumPy evaluation of the variables determined by a square system
+    of equations from a set of input variables.
+
+    Args:
+        constraints - list of equality constraints
+        inputs - list of input variables
+        variables (optional) - list of variables determined by the
+                               constraints, default is all variables of the
+                               constraints which are neither inputs nor fixed
+        tol (optional) - relative tolerance of the Newton method for
+                         implicit blocks, default 1e-10
+        max_iter (optional) - maximum number of Newton iterations, default 50
+        name (optional) - name of the system used in messages
+
+    Raises:
+        ValueError if the constraints do not determine the variables from the
+        inputs
+    """
+
+    def __init__(
+        self,
+        constraints,
+        inputs,
+        variables=None,
+        tol=1e-10,
+        max_iter=50,
+        name="equations",
+    ):
+        self.constraints = list(constraints)
+        self.inputs = list(inputs)
+        if variables is None:
+            inputs = ComponentSet(self.inputs)
+            variables = ComponentSet(
+                v
+                for c in self.constraints
+                for v in identify_variables(c.body, include_fixed=False)
+                if v not in inputs
+            )
+        self.variables = list(variables)
+        self.tol = tol
+        self.max_iter = max_iter
+        self.name = name
+        self._index = ComponentMap((v, i) for i, v in enumerate(self.variables))
+        self.compile()
+
+    def compile(self):
+        """
+        Compile the equations with the current values of their parameters and
+        fixed variables.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError if the constraints do not determine the variables from
+            the inputs
+        """
+        names = ComponentMap()
+        for i, v in enumerate(self.inputs):
+            names[v] = f"u[{i}]"
+        for i, v in enumerate(self.variables):
+            names[v] = f"y[{i}]"
+
+        with TemporarySubsystemManager(to_fix=self.inputs):
+            igraph = IncidenceGraphInterface()
+            n = len(self.variables)
+            if (
+                len(self.constraints) != n
+                or len(igraph.maximum_matching(self.variables, self.constraints)) != n
+            ):
+                raise ValueError(
+                    f"The equations of {self.name} do not determine its "
+                    f"variables from the inputs."
+                )
+            var_blocks, con_blocks = igraph.block_triangularize(
+                self.variables, self.constraints
+            )
+
+            lines = ["def _evaluate(u, y, solve):"]
+            self._implicit = []
+            for vb, cb in zip(var_blocks, con_blocks):
+                assignment = None
+                if len(vb) == 1:
+                    assignment = self._explicit_assignment(vb[0], cb[0], names)
+                if assignment is not None:
+                    lines.append(f"    {names[vb[0]]} = {assignment}")
+                else:
+                    lines.append(f"    solve({len(self._implicit)}, u, y)")
+                    self._implicit.append(self._compile_implicit(vb, cb, names))
+
+        self._evaluate = compile_numpy_function(
+            lines, "_evaluate", "<compiled_equations>"
+        )
+
+    def _explicit_assignment(self, var, con, names):
+        # Expression for var if it appears linearly in con, otherwise None.
+        # Nonlinear terms of the other variables, e.g. the Expr_if mappings of
+        # the translators, are part of the assigned expression.
+        with TemporarySubsystemManager(
+            to_fix=[v for v in self.variables if v is not var]
+        ):
+            repn = generate_standard_repn(
+                con.body - con.upper, compute_values=False, quadratic=False
+            )
+            if len(repn.linear_vars) != 1 or repn.linear_vars[0] is not var:
+                return None
+            if repn.nonlinear_expr is not None and any(
+                True
+                for _ in identify_variables(repn.nonlinear_expr, include_fixed=False)
+            ):
+                return None
+        visitor = NumPyCodeVisitor(names.get)
+        constant, _ = visitor.walk_expression(repn.constant)
+        if repn.nonlinear_expr is not None:
+            nonlinear, _ = visitor.walk_expression(repn.nonlinear_expr)
+            constant = f"({constant} + {nonlinear})"
+        coef, _ = visitor.walk_expression(repn.linear_coefs[0])
+        return f"-{constant} / {coef}"
+
+    def _compile_implicit(self, variables, constraints, names):
+        visitor = NumPyCodeVisitor(names.get)
+        residuals = [c.body - c.upper for c in constraints]
+        lines = ["def _residual(u, y):", "    return ["]
+        for r in residuals:
+            lines.append(f"        {visitor.walk_expression(r)[0]},")
+        lines += ["    ]", "def _jacobian(u, y):", "    return ["]
+        for r in residuals:
+            row = differentiate(r, wrt_list=variables, mode=Modes.reverse_symbolic)
+            lines.append(
+                "        ["
+                + ", ".join(visitor.walk_expression(d)[0] for d in row)
+                + "],"
+            )
+        lines.append("    ]")
+        residual = compile_numpy_function(lines, "_residual", "<compiled_equations>")
+        jacobian = compile_numpy_function(lines, "_jacobian", "<compiled_equations>")
+
+        index = [self._index[v] for v in variables]
+        lb = np.array([-np.inf if v.lb is None else v.lb for v in variables])
+        ub = np.array([np.inf if v.ub is None else v.ub for v in variables])
+        start = np.array([value(v) for v in variables])
+        return residual, jacobian, index, lb, ub, start
+
+    def _solve_implicit(self, k, u, y, n):
+        residual, jacobian, index, lb, ub, start = self._implicit[k]
+        x = np.tile(start[:, None], (1, n))
+        for i, j in enumerate(index):
+            if y[j] is not None:
+                x[i] = y[j]
+
+        for _ in range(self.max_iter):
+            for i, j in enumerate(index):
+                y[j] = x[i]
+            F = np.stack([np.broadcast_to(f, (n,)) for f in residual(u, y)], axis=-1)
+            J = np.stack(
+                [
+                    np.stack([np.broadcast_to(d, (n,)) for d in row], axis=-1)
+                    for row in jacobian(u, y)
+                ],
+                axis=-2,
+            )
+            dx = np.linalg.solve(J, -F[..., None])[..., 0].T
+            # Step at most 99% of the way to the variable bounds
+            with np.errstate(divide="ignore", invalid="ignore"):
+                to_bound = np.where(
+                    dx < 0,
+                    (lb[:, None] - x) / dx,
+                    np.where(dx > 0, (ub[:, None] - x) / dx, np.inf),
+                )
+            alpha = np.minimum(1, 0.99 * np.min(to_bound, axis=0, initial=np.inf))
+            x = x + alpha * dx
+            if np.all(np.abs(alpha * dx) <= self.tol * np.abs(x) + 1e-300):
+                break
+        else:
+            raise IterationLimitError(
+                f"Newton method for the implicit block {k} of {self.name} "
+                f"did not converge in {self.max_iter} iterations."
+            )
+        for i, j in enumerate(index):
+            y[j] = x[i]
+
+    def evaluate(self, u, n):
+        """
+        Evaluate the variables from the inputs.
+
+        Args:
+            u - list of arrays of shape (n,) with the values of each input
+            n - number of evaluation points
+
+        Returns:
+            list of arrays of shape (n,) with the values of each variable
+
+        Raises:
+            IterationLimitError if the Newton method for an implicit block
+            does not converge at all evaluation points
+        """
+        y = [None] * len(self.variables)
+        self._evaluate(u, y, lambda k, u, y: self._solve_implicit(k, u, y, n))
+        return [np.broadcast_to(x, (n,)) for x in y]
@@ -0,0 +1,333 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module compiles the rate expressions of a reaction package (e.g. the
+ASM and ADM packages) to a NumPy right-hand side, the product of the rate
+vector and the stoichiometry matrix, for time integration of reactors outside
+of Pyomo.
+
+A reaction block is built on a scratch state block, and its equations are
+compiled with the state variables as inputs (see compiled_equations), so
+that coupled or nonlinear blocks such as the pH and acid-base equilibria of
+ADM1 are solved by a vectorized Newton method. Parameters are
+taken at their values when compiling, so update_parameters must be called
+after changing them.
+
+Any reaction package whose rates are written as explicit equations of the
+state (e.g. ASM1, ASM2d, ASM3, ADM1 and their modified versions) is compiled
+by passing its parameter block::
+
+    kinetics = CompiledKinetics(m.fs.rxn_props)
+    dcdt = kinetics.rhs(conc)
+"""
+
+import numpy as np
+
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.common.dependencies import scipy
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import ConcreteModel, Constraint, Var, value
+from pyomo.repn import generate_standard_repn
+
+from watertap.core.util.compiled_equations import CompiledEquations
+
+
+class CompiledKinetics:
+    """
+    NumPy right-hand side of the rate expressions of a reaction package.
+
+    The state is given by the material density terms (mass concentrations)
+    of all solutes, in the order of component_list, together with any other
+    state variables used by the rate expressions (e.g. temperature). All
+    methods are vectorized over leading dimensions of the concentrations.
+
+    Args:
+        reaction_package - reaction parameter block, e.g. an
+                           ASM1ReactionParameterBlock
+        property_package (optional) - property parameter block, default is
+                                      the property package of
+                                      reaction_package
+        tol (optional) - relative tolerance of the Newton method for
+                         implicit blocks, default 1e-10
+        max_iter (optional) - maximum number of Newton iterations, default 50
+
+    Raises:
+        ValueError if the rate equations do not determine the variables of
+        the reaction block from the state
+    """
+
+    def __init__(self, reaction_package, property_package=None, tol=1e-10, max_iter=50):
+        self.reaction_package = reaction_package
+        if property_package is None:
+            property_package = reaction_package.config.property_package
+        self.property_package = property_package
+        self.tol = tol
+        self.max_iter = max_iter
+
+        self._model = m = ConcreteModel()
+        m.state = property_package.build_state_block([0], defined_state=True)
+        m.reactions = reaction_package.build_reaction_block(
+            [0], state_block=m.state, has_equilibrium=False
+        )
+        self._state = m.state[0]
+        self._block = m.reactions[0]
+        # Constructs the rate variables and constraints
+        self._block.reaction_rate
+
+        self.reaction_idx = list(reaction_package.rate_reaction_idx)
+        self.component_list = [
+            j
+            for j in property_package.component_list
+            if j not in property_package.solvent_set
+        ]
+        self._map_state()
+        self.update_parameters()
+
+    def _map_state(self):
+        # Map each material density term to a state variable
+        self._conc_vars = []
+        self._conc_factors = []
+        for j in self.component_list:
+            repn = generate_standard_repn(
+                self._state.get_material_density_terms("Liq", j), compute_values=True
+            )
+            if (
+                len(repn.linear_vars) != 1
+                or repn.nonlinear_expr is not None
+                or repn.constant != 0
+            ):
+                raise ValueError(
+                    f"The material density term of {j} is not proportional to "
+                    f"a single state variable."
+                )
+            self._conc_vars.append(repn.linear_vars[0])
+            self._conc_factors.append(repn.linear_coefs[0])
+
+        # Other state variables used by the reaction block
+        conc_vars = ComponentSet(self._conc_vars)
+        used = ComponentSet(
+            v
+            for c in self._block.component_data_objects(Constraint, active=True)
+            for v in identify_variables(c.body, include_fixed=False)
+        )
+        self.state_vars = {}
+        for v in self._state.component_data_objects(Var, descend_into=True):
+            if v in used and v not in conc_vars:
+                self.state_vars[v.name.split(".", 1)[1]] = v
+
+        # Variables of the reaction block, as determined by its equations
+        self._variables = [
+            v
+            for v in self._block.component_data_objects(Var, descend_into=True)
+            if not v.fixed
+        ]
+        self.variable_names = [v.name.split(".", 1)[1] for v in self._variables]
+        self._index = ComponentMap((v, i) for i, v in enumerate(self._variables))
+
+    def update_parameters(self):
+        """
+        Compile the rate expressions and stoichiometry with the current
+        parameter values of the reaction and property packages.
+
+        Returns:
+            None
+        """
+        stoich = np.zeros((len(self.reaction_idx), len(self.component_list)))
+        for (r, _, j), nu in self.reaction_package.rate_reaction_stoichiometry.items():
+            if j in self.component_list:
+                stoich[
+                    self.reaction_idx.index(r), self.component_list.index(j)
+                ] += value(nu)
+        self.stoichiometry = stoich
+
+        inputs = self._conc_vars + list(self.state_vars.values())
+        constraints = [
+            c
+            for c in self._block.component_data_objects(Constraint, active=True)
+            if c.equality
+        ]
+        self._equations = CompiledEquations(
+            constraints,
+            inputs,
+            variables=self._variables,
+            tol=self.tol,
+            max_iter=self.max_iter,
+            name=self._block.name,
+        )
+        self._rate_index = [
+            self._index[self._block.reaction_rate[r]] for r in self.reaction_idx
+        ]
+
+    def _inputs(self, conc, state):
+        conc = np.asarray(conc, dtype=float)
+        if conc.shape[-1] != len(self.component_list):
+            raise ValueError(
+                f"Expected concentrations of {len(self.component_list)} "
+                f"components ({', '.join(self.component_list)}), got "
+                f"{conc.shape[-1]}."
+            )
+        unknown = set(state) - set(self.state_vars)
+        if unknown:
+            raise KeyError(
+                f"Unknown state variables {', '.join(sorted(unknown))}, expected "
+                f"{', '.join(self.state_vars)}."
+            )
+        shape = conc.shape[:-1]
+        n = int(np.prod(shape))
+        conc = conc.reshape(n, -1)
+        u = [conc[:, i] / f for i, f in enumerate(self._conc_factors)]
+        for name, v in self.state_vars.items():
+            s = state.get(name, value(v))
+            u.append(np.broadcast_to(np.asarray(s, dtype=float), shape).reshape(n))
+        return u, shape, n
+
+    def evaluate(self, conc, **state):
+        """
+        Evaluate all variables of the reaction block, e.g. reaction rates,
+        inhibition terms and pH.
+
+        Args:
+            conc - array of mass concentrations in kg/m^3 with the components
+                   of component_list as the last dimension
+            state (keyword arguments) - values of other state variables in
+                                        state_vars (e.g. temperature), as
+                                        scalars or arrays, default is their
+                                        initial value
+
+        Returns:
+            dict of variable names (as in variable_names) and arrays of values
+
+        Raises:
+            ValueError if conc has the wrong number of components
+            KeyError if an unknown state variable is given
+        """
+        u, shape, n = self._inputs(conc, state)
+        y = self._equations.evaluate(u, n)
+        return {name: y[i].reshape(shape) for i, name in enumerate(self.variable_names)}
+
+    def rates(self, conc, **state):
+        """
+        Evaluate the reaction rates.
+
+        Args:
+            conc - array of mass concentrations in kg/m^3 with the components
+                   of component_list as the last dimension
+            state (keyword arguments) - values of other state variables in
+                                        state_vars (e.g. temperature)
+
+        Returns:
+            array of reaction rates in kg/m^3/s with the reactions of
+            reaction_idx as the last dimension
+        """
+        u, shape, n = self._inputs(conc, state)
+        y = self._equations.evaluate(u, n)
+        rates = np.stack([y[i] for i in self._rate_index], -1)
+        return rates.reshape(shape + (len(self.reaction_idx),))
+
+    def rhs(self, conc, **state):
+        """
+        Evaluate the generation of each component by reaction, i.e. the
+        product of the reaction rates and the stoichiometry matrix.
+
+        Args:
+            conc - array of mass concentrations in kg/m^3 with the components
+                   of component_list as the last dimension
+            state (keyword arguments) - values of other state variables in
+                                        state_vars (e.g. temperature)
+
+        Returns:
+            array of generation rates in kg/m^3/s with the same shape as conc
+        """
+        return self.rates(conc, **state) @ self.stoichiometry
+
+    def cstr_rhs(self, conc, conc_in, flow_vol, volume, hold=None, **state):
+        """
+        Evaluate the time derivatives of the concentrations in a CSTR.
+
+        Args:
+            conc - array of mass concentrations in kg/m^3 in the reactor
+            conc_in - array of inlet mass concentrations in kg/m^3
+            flow_vol - volumetric flow in m^3/s
+            volume - reactor volume in m^3
+            hold (optional) - list of components with fixed concentration,
+                              e.g. dissolved oxygen in an aerated tank
+            state (keyword arguments) - values of other state variables in
+                                        state_vars (e.g. temperature)
+
+        Returns:
+            array of derivatives in kg/m^3/s with the same shape as conc
+        """
+        conc = np.asarray(conc, dtype=float)
+        dcdt = np.asarray(flow_vol)[..., None] / np.asarray(volume)[..., None] * (
+            np.asarray(conc_in) - conc
+        ) + self.rhs(conc, **state)
+        if hold:
+            dcdt[..., [self.component_list.index(j) for j in hold]] = 0
+        return dcdt
+
+
+def simulate_cstr(
+    kinetics,
+    conc,
+    t_span,
+    conc_in,
+    flow_vol,
+    volume,
+    hold=None,
+    t_eval=None,
+    method="BDF",
+    state=None,
+    **kwargs,
+):
+    """
+    Integrate the concentrations in a CSTR over time with a stiff ODE solver.
+
+    Args:
+        kinetics - CompiledKinetics object
+        conc - initial mass concentrations in kg/m^3
+        t_span - tuple of initial and final time in s
+        conc_in - inlet mass concentrations in kg/m^3, or function of time
+                  returning them (e.g. for a diurnal influent)
+        flow_vol - volumetric flow in m^3/s, or function of time
+        volume - reactor volume in m^3
+        hold (optional) - list of components with fixed concentration
+        t_eval (optional) - times at which to store the solution
+        method (optional) - scipy.integrate.solve_ivp method, default "BDF"
+        state (optional) - dict of values of other state variables in
+                           state_vars (e.g. temperature)
+        kwargs - other arguments of scipy.integrate.solve_ivp (e.g. rtol)
+
+    Returns:
+        scipy.integrate.solve_ivp result, with the concentrations at each
+        time in y
+
+    Raises:
+        RuntimeError if the integration fails
+    """
+    state = state or {}
+
+    def _fun(t, c):
+        c_in = conc_in(t) if callable(conc_in) else conc_in
+        q = flow_vol(t) if callable(flow_vol) else flow_vol
+        return kinetics.cstr_rhs(c, c_in, q, volume, hold=hold, **state)
+
+    result = scipy.integrate.solve_ivp(
+        _fun,
+        t_span,
+        np.asarray(conc, dtype=float),
+        method=method,
+        t_eval=t_eval,
+        **kwargs,
+    )
+    if not result.success:
+        raise RuntimeError(f"CSTR simulation failed: {result.message}")
+    return result
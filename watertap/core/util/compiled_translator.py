@@ -0,0 +1,180 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module compiles the equations of a translator block (e.g. the ASM/ADM
+translators) to an explicit NumPy evaluation of the outlet state from the
+inlet state.
+
+With the inlet state fixed, the COD, nitrogen and phosphorus bookkeeping
+equations of the translators form a chain of assignments, so the outlet state
+is evaluated without a solver, either for a batch of inlet compositions or to
+propagate the inlet of a translator in a flowsheet to its outlet for
+initialization.
+
+Any translator with properties_in and properties_out state blocks whose
+equations are explicit in the inlet state (e.g. the ASM/ADM translators) is
+compiled by passing the translator block::
+
+    translator = CompiledTranslator(m.fs.asm_adm)
+    translator.propagate()
+    outlet = translator.evaluate(inlet)
+"""
+
+import numpy as np
+
+from pyomo.common.collections import ComponentMap
+from pyomo.dae.flatten import flatten_dae_components
+from pyomo.environ import Constraint, Var, value
+
+from watertap.core.util.compiled_equations import CompiledEquations
+
+
+def _state_vars(state_block):
+    # List of (name, index, variable) of the state variables of a state block
+    return [
+        (name, idx, v)
+        for name, var in state_block.define_state_vars().items()
+        for idx, v in var.items()
+    ]
+
+
+class CompiledTranslator:
+    """
+    Explicit NumPy evaluation of the outlet state of a translator block from
+    its inlet state.
+
+    The equations are compiled at the first time point, and the same
+    evaluation is used at all time points.
+
+    Args:
+        translator - translator block with properties_in and properties_out
+                     state blocks
+        tol (optional) - relative tolerance of the Newton method for
+                         implicit blocks, default 1e-10
+        max_iter (optional) - maximum number of Newton iterations, default 50
+
+    Raises:
+        ValueError if the translator equations do not determine the outlet
+        state from the inlet state
+    """
+
+    def __init__(self, translator, tol=1e-10, max_iter=50):
+        self.translator = translator
+        self.time = translator.flowsheet().time
+        t0 = self.time.first()
+        self._inlet = _state_vars(translator.properties_in[t0])
+        self._outlet = _state_vars(translator.properties_out[t0])
+
+        scalar_cons, dae_cons = flatten_dae_components(
+            translator, self.time, Constraint, active=True
+        )
+        constraints = [
+            c
+            for c in list(scalar_cons) + [ref[t0] for ref in dae_cons]
+            if c.active and c.equality
+        ]
+        self._equations = CompiledEquations(
+            constraints,
+            [v for _, _, v in self._inlet],
+            tol=tol,
+            max_iter=max_iter,
+            name=translator.name,
+        )
+
+        index = ComponentMap((v, i) for i, v in enumerate(self._equations.variables))
+        missing = [v.name for _, _, v in self._outlet if v not in index]
+        if missing:
+            raise ValueError(
+                f"The equations of {translator.name} do not determine the "
+                f"outlet state variables {', '.join(missing)}."
+            )
+        self._outlet_index = [index[v] for _, _, v in self._outlet]
+
+        # Time-indexed references to the inputs and variables
+        refs = ComponentMap(
+            (ref[t0], ref)
+            for ref in flatten_dae_components(translator, self.time, Var)[1]
+        )
+        self._input_refs = [refs.get(v) for _, _, v in self._inlet]
+        self._variable_refs = [refs.get(v) for v in self._equations.variables]
+
+    def _inputs(self, state):
+        # Broadcast the inlet state to a list of flat arrays
+        values = []
+        for name, idx, v in self._inlet:
+            x = state.get(name, value(v))
+            if idx is not None and isinstance(x, dict):
+                x = x.get(idx, value(v))
+            values.append(np.asarray(x, dtype=float))
+        shape = np.broadcast_shapes(*(x.shape for x in values))
+        n = int(np.prod(shape))
+        return [np.broadcast_to(x, shape).reshape(n) for x in values], shape, n
+
+    def evaluate(self, state=None):
+        """
+        Evaluate the outlet state from the inlet state.
+
+        Args:
+            state (optional) - dict of inlet state variables in the format of
+                               state_args, e.g. {"flow_vol": 0.2,
+                               "conc_mass_comp": {"S_I": 0.03, ...}}, with
+                               scalars or arrays of values which are
+                               broadcast together. Missing variables take
+                               their value at the first time point of the
+                               inlet.
+
+        Returns:
+            dict of outlet state variables in the format of state_args, with
+            arrays of the broadcast shape of the inlet values
+        """
+        u, shape, n = self._inputs(state or {})
+        y = self._equations.evaluate(u, n)
+        outlet = {}
+        for (name, idx, _), i in zip(self._outlet, self._outlet_index):
+            x = y[i].reshape(shape)
+            if idx is None:
+                outlet[name] = x
+            else:
+                outlet.setdefault(name, {})[idx] = x
+        return outlet
+
+    def propagate(self):
+        """
+        Set the outlet state and all other variables of the translator at
+        every time point from the current values of its inlet state, e.g. to
+        initialize the translator in a flowsheet without a solver.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError if a variable of the translator is not indexed by time
+            IterationLimitError if the Newton method for an implicit block
+            does not converge
+            ArithmeticError if the equations evaluate to non-finite values
+        """
+        if any(ref is None for ref in self._input_refs + self._variable_refs):
+            raise ValueError(
+                f"The variables of {self.translator.name} must be indexed by "
+                f"time to be propagated."
+            )
+        times = list(self.time)
+        u = [np.array([value(ref[t]) for t in times]) for ref in self._input_refs]
+        y = self._equations.evaluate(u, len(times))
+        if not all(np.all(np.isfinite(x)) for x in y):
+            raise ArithmeticError(
+                f"The equations of {self.translator.name} evaluate to "
+                f"non-finite values from its inlet state."
+            )
+        for ref, x in zip(self._variable_refs, y):
+            for t, xt in zip(times, x):
+                ref[t].set_value(float(xt), skip_validation=True)
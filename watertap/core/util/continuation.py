@@ -0,0 +1,287 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains a continuation (warm-start) sweep over a grid of
+parameter values.
+
+Grid points are visited along a serpentine path so that consecutive points are
+neighbors, and each point is solved starting from the nearest previously
+converged solution (primal values and, optionally, IPOPT duals). A cheap
+re-initialization is only performed when a warm-started solve fails.
+"""
+
+import itertools
+import time
+
+import numpy as np
+
+from pyomo.common.dependencies import pandas as pd
+from pyomo.environ import Suffix, Var, check_optimal_termination, value
+
+import idaes.logger as idaeslog
+
+from watertap.core.solvers import get_solver
+
+_log = idaeslog.getLogger(__name__)
+
+# IPOPT options used when warm-starting from stored duals
+_WARM_START_OPTIONS = {
+    "warm_start_init_point": "yes",
+    "warm_start_bound_push": 1e-8,
+    "warm_start_mult_bound_push": 1e-8,
+    "mu_init": 1e-6,
+}
+
+# Suffixes needed to import and export IPOPT duals, with their directions
+_DUAL_SUFFIXES = {
+    "dual": Suffix.IMPORT_EXPORT,
+    "ipopt_zL_out": Suffix.IMPORT,
+    "ipopt_zU_out": Suffix.IMPORT,
+    "ipopt_zL_in": Suffix.EXPORT,
+    "ipopt_zU_in": Suffix.EXPORT,
+}
+
+
+def serpentine_order(shape):
+    """
+    Get the indices of a grid in serpentine (boustrophedon) order, such that
+    consecutive indices differ by a single step along one axis.
+
+    Args:
+        shape - tuple of the number of points along each axis
+
+    Returns:
+        list of index tuples
+    """
+    if len(shape) == 0:
+        return [()]
+    inner = serpentine_order(shape[1:])
+    order = []
+    for i in range(shape[0]):
+        sub = inner if i % 2 == 0 else inner[::-1]
+        order.extend((i,) + idx for idx in sub)
+    return order
+
+
+def _default_optimize(model, solver=None):
+    return solver.solve(model)
+
+
+class ContinuationSweep:
+    """
+    Continuation sweep over a full-factorial grid of sweep parameters.
+
+    Args:
+        model - Pyomo model to sweep
+        sweep_params - dict of sweep parameter name to a parameter_sweep fixed
+                       sample (e.g., LinearSample) defining the Var or Param to
+                       set and its values
+        outputs (optional) - dict of output name to Pyomo Var, Param or
+                             Expression to record at each point
+        optimize_function (optional) - function called as
+                                       optimize_function(model, solver=solver,
+                                       **optimize_kwargs) to solve the model,
+                                       returning solver results. Defaults to
+                                       solver.solve(model)
+        optimize_kwargs (optional) - dict of keyword arguments for optimize_function
+        reinitialize_function (optional) - function called as
+                                           reinitialize_function(model,
+                                           **reinitialize_kwargs) before
+                                           re-solving a point whose warm-started
+                                           solve failed
+        reinitialize_kwargs (optional) - dict of keyword arguments for
+                                         reinitialize_function
+        solver (optional) - solver passed to optimize_function, defaults to get_solver()
+        warm_start_duals (optional) - if True (default), store IPOPT duals with
+                                      each converged solution and pass them
+                                      back to IPOPT when warm-starting
+    """
+
+    def __init__(
+        self,
+        model,
+        sweep_params,
+        outputs=None,
+        optimize_function=None,
+        optimize_kwargs=None,
+        reinitialize_function=None,
+        reinitialize_kwargs=None,
+        solver=None,
+        warm_start_duals=True,
+    ):
+        self.model = model
+        self.sweep_params = sweep_params
+        self.outputs = {} if outputs is None else outputs
+        self.optimize_function = (
+            _default_optimize if optimize_function is None else optimize_function
+        )
+        self.optimize_kwargs = {} if optimize_kwargs is None else optimize_kwargs
+        self.reinitialize_function = reinitialize_function
+        self.reinitialize_kwargs = (
+            {} if reinitialize_kwargs is None else reinitialize_kwargs
+        )
+        self.solver = get_solver() if solver is None else solver
+        self.warm_start_duals = warm_start_duals
+
+        self._variables = list(model.component_data_objects(Var, descend_into=True))
+        self._states = []
+        self._points = []
+
+        if warm_start_duals:
+            for name, direction in _DUAL_SUFFIXES.items():
+                if model.component(name) is None:
+                    model.add_component(name, Suffix(direction=direction))
+
+    def _get_state(self):
+        primal = np.array(
+            [np.nan if v.value is None else v.value for v in self._variables]
+        )
+        duals = None
+        if self.warm_start_duals:
+            duals = {
+                name: list(self.model.component(name).items())
+                for name in ("dual", "ipopt_zL_out", "ipopt_zU_out")
+            }
+        return primal, duals
+
+    def _set_state(self, state):
+        primal, duals = state
+        for v, val in zip(self._variables, primal):
+            if not v.fixed and not np.isnan(val):
+                v.set_value(val, skip_validation=True)
+        if duals is not None:
+            self.model.dual.clear()
+            self.model.dual.update(duals["dual"])
+            self.model.ipopt_zL_in.clear()
+            self.model.ipopt_zL_in.update(duals["ipopt_zL_out"])
+            self.model.ipopt_zU_in.clear()
+            self.model.ipopt_zU_in.update(duals["ipopt_zU_out"])
+
+    def _set_warm_start_options(self, warm_start):
+        for option, option_value in _WARM_START_OPTIONS.items():
+            if warm_start:
+                self.solver.options[option] = option_value
+            else:
+                self.solver.options.pop(option, None)
+
+    def _nearest_state(self, point):
+        if not self._points:
+            return None
+        distances = np.linalg.norm(np.array(self._points) - point, axis=1)
+        return self._states[int(np.argmin(distances))]
+
+    def _solve(self):
+        start = time.perf_counter()
+        try:
+            results = self.optimize_function(
+                self.model, solver=self.solver, **self.optimize_kwargs
+            )
+            converged = check_optimal_termination(results)
+        except Exception as err:
+            _log.warning(f"Solve failed with exception: {err}")
+            converged = False
+        return converged, time.perf_counter() - start
+
+    def run(self):
+        """
+        Run the continuation sweep.
+
+        Returns:
+            pandas DataFrame with one row per grid point, in grid order,
+            containing the sweep parameter values, outputs (NaN if the
+            point failed), whether the point converged, the order in which
+            it was solved, and the number of solves and total solve time
+            spent on it
+        """
+        names = list(self.sweep_params)
+        values = [np.asarray(self.sweep_params[n].sample()) for n in names]
+        lower = np.array([v.min() for v in values])
+        span = np.array([v.max() - v.min() for v in values])
+        span[span == 0] = 1.0
+
+        shape = tuple(len(v) for v in values)
+        n_points = int(np.prod(shape))
+        grid_index = {
+            idx: k for k, idx in enumerate(itertools.product(*map(range, shape)))
+        }
+
+        initial_state = self._get_state()
+        self._states = []
+        self._points = []
+
+        param_values = np.empty((n_points, len(names)))
+        output_values = {n: np.full(n_points, np.nan) for n in self.outputs}
+        converged = np.zeros(n_points, dtype=bool)
+        solve_order = np.empty(n_points, dtype=int)
+        solve_count = np.zeros(n_points, dtype=int)
+        solve_time = np.zeros(n_points)
+
+        for step, idx in enumerate(serpentine_order(shape)):
+            k = grid_index[idx]
+            point = np.array([values[j][i] for j, i in enumerate(idx)])
+            param_values[k] = point
+            solve_order[k] = step
+            for name, v in zip(names, point):
+                self._set_param(self.sweep_params[name].pyomo_object, v)
+
+            scaled_point = (point - lower) / span
+            state = self._nearest_state(scaled_point)
+            if state is not None:
+                self._set_state(state)
+            self._set_warm_start_options(
+                self.warm_start_duals and state is not None and bool(state[1]["dual"])
+            )
+            ok, elapsed = self._solve()
+            solve_count[k] += 1
+            solve_time[k] += elapsed
+
+            if not ok:
+                _log.info(
+                    f"Warm-started solve failed at {dict(zip(names, point))}, "
+                    f"re-initializing."
+                )
+                self._set_state((initial_state[0], None))
+                self._set_warm_start_options(False)
+                if self.reinitialize_function is not None:
+                    self.reinitialize_function(self.model, **self.reinitialize_kwargs)
+                ok, elapsed = self._solve()
+                solve_count[k] += 1
+                solve_time[k] += elapsed
+
+            converged[k] = ok
+            if ok:
+                self._points.append(scaled_point)
+                self._states.append(self._get_state())
+                for name, expr in self.outputs.items():
+                    output_values[name][k] = value(expr, exception=False)
+
+        self._set_warm_start_options(False)
+
+        _log.info(
+            f"Continuation sweep converged {converged.sum()} of {n_points} points "
+            f"using {solve_count.sum()} solves in {solve_time.sum():.2f} s."
+        )
+
+        data = {n: param_values[:, j] for j, n in enumerate(names)}
+        data.update(output_values)
+        data["converged"] = converged
+        data["solve_order"] = solve_order
+        data["solve_count"] = solve_count
+        data["solve_time"] = solve_time
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _set_param(pyomo_object, param_value):
+        if pyomo_object.is_variable_type():
+            pyomo_object.fix(param_value)
+        else:
+            pyomo_object.set_value(param_value)
@@ -15,13 +15,28 @@ This module contains utility functions for initialization of WaterTAP models.
 
 __author__ = "Adam Atia, Ben Knueven"
 
-from pyomo.environ import check_optimal_termination, ComponentMap, Var
+from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy as np, scipy
+from pyomo.common.errors import IterationLimitError
+from pyomo.contrib.incidence_analysis import IncidenceGraphInterface
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import (
+    check_optimal_termination,
+    ComponentMap,
+    Constraint,
+    value,
+    Var,
+)
 from pyomo.contrib.fbbt.fbbt import fbbt
+from pyomo.repn import generate_standard_repn
+from pyomo.util.calc_var_value import calculate_variable_from_constraint
+from pyomo.util.subsystems import TemporarySubsystemManager
 
 from idaes.core.util.exceptions import InitializationError
 from idaes.core.util.model_statistics import degrees_of_freedom
 import idaes.logger as idaeslog
 
+from watertap.core.solvers import get_solver
 from watertap.custom_exceptions import FrozenPipes
 
 _log = idaeslog.getLogger(__name__)
@@ -209,3 +224,173 @@ def interval_initializer(
         # restore the bounds before leaving this function
         for v, bounds in bound_cache.items():
             v.bounds = bounds
+
+
+def _violation(con):
+    body = value(con.body, exception=False)
+    if body is None:
+        return float("inf")
+    violation = 0.0
+    for bound, sign in ((con.lower, 1), (con.upper, -1)):
+        if bound is not None:
+            bound = value(bound)
+            violation = max(violation, sign * (bound - body) / max(1, abs(bound)))
+    return violation
+
+
+def _within_bounds(variables, tol):
+    for v in variables:
+        if v.lb is not None and v.value < v.lb - tol * max(1, abs(v.lb)):
+            return False
+        if v.ub is not None and v.value > v.ub + tol * max(1, abs(v.ub)):
+            return False
+    return True
+
+
+def _solve_linear_block(variables, constraints):
+    # Fix the variables of other blocks, which are either already solved or
+    # not part of the square system, so that the standard repn is linear in
+    # the variables of this block only
+    block_vars = ComponentSet(variables)
+    others = ComponentSet(
+        v
+        for c in constraints
+        for v in identify_variables(c.body, include_fixed=False)
+        if v not in block_vars
+    )
+    try:
+        with TemporarySubsystemManager(to_fix=list(others)):
+            repns = [
+                generate_standard_repn(c.body, compute_values=True, quadratic=False)
+                for c in constraints
+            ]
+    except (ValueError, ZeroDivisionError):
+        # Variables without values or evaluation errors
+        return False
+    if not all(repn.is_linear() for repn in repns):
+        return False
+
+    index = ComponentMap((v, i) for i, v in enumerate(variables))
+    rows, cols, coefs = [], [], []
+    rhs = np.empty(len(constraints))
+    for i, (c, repn) in enumerate(zip(constraints, repns)):
+        for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+            rows.append(i)
+            cols.append(index[v])
+            coefs.append(coef)
+        rhs[i] = value(c.upper) - repn.constant
+    A = scipy.sparse.csc_matrix(
+        (coefs, (rows, cols)), shape=(len(constraints), len(variables))
+    )
+    try:
+        x = scipy.sparse.linalg.splu(A).solve(rhs)
+    except RuntimeError:
+        # Singular matrix
+        return False
+    if not np.all(np.isfinite(x)):
+        return False
+    for v, val in zip(variables, x):
+        v.set_value(float(val), skip_validation=True)
+    return True
+
+
+def solve_linear_blocks(blk, tol=1e-8, logger=_log):
+    """
+    Solve the equality constraints of ``blk`` without an NLP solver where
+    possible, e.g. the material balances of zero-order flowsheets with fixed
+    recovery and removal fractions.
+
+    The square part of the active equality constraints is decomposed into
+    blocks in block triangular order, which for a flowsheet follows the flow
+    of material through the units, and each block is solved in turn from the
+    values of the previous ones. Linear blocks, including recycle loops, are
+    solved exactly with a sparse linear solve. Nonlinear blocks of one
+    variable are solved with calculate_variable_from_constraint, and larger
+    nonlinear blocks are left to a solver.
+
+    Keyword Arguments:
+        blk : block to solve
+        tol : relative tolerance on constraint residuals and variable bounds
+              (default: 1e-8)
+        logger : logger to use (default: watertap.core.util.initialization)
+
+    Returns:
+        list of active constraints of ``blk`` which are not satisfied, or
+        whose variables were solved outside their bounds (empty if ``blk``
+        was solved)
+    """
+    unsolved = ComponentSet()
+    igraph = IncidenceGraphInterface(blk, active=True, include_inequality=False)
+    if igraph.n_edges > 0:
+        var_dmp, con_dmp = igraph.dulmage_mendelsohn()
+        var_blocks, con_blocks = igraph.block_triangularize(
+            var_dmp.square, con_dmp.square
+        )
+        n_solved = 0
+        for variables, constraints in zip(var_blocks, con_blocks):
+            solved = _solve_linear_block(variables, constraints)
+            if not solved and len(variables) == 1:
+                try:
+                    calculate_variable_from_constraint(
+                        variables[0], constraints[0], eps=tol
+                    )
+                    solved = True
+                except (IterationLimitError, ValueError, ZeroDivisionError):
+                    pass
+            if solved and _within_bounds(variables, tol):
+                n_solved += len(variables)
+            else:
+                unsolved.update(constraints)
+        logger.debug(
+            f"Solved {n_solved} of {len(var_dmp.square)} variables of {blk.name} "
+            f"directly in {len(var_blocks)} blocks."
+        )
+
+    unsolved.update(
+        c
+        for c in blk.component_data_objects(Constraint, active=True, descend_into=True)
+        if _violation(c) > tol
+    )
+    return list(unsolved)
+
+
+def direct_initializer(
+    blk, solver=None, optarg=None, tol=1e-8, logger=_log, fail_flag=True
+):
+    """
+    Initialize ``blk`` by solving its equations directly with
+    solve_linear_blocks, and only call a solver if constraints remain
+    unsatisfied (e.g. nonlinear energy or costing constraints), starting
+    from the directly solved values.
+
+    Keyword Arguments:
+        blk : block to initialize
+        solver : solver object or name of the solver to use for the
+                 remaining constraints (default: None, use the WaterTAP
+                 default solver)
+        optarg : solver options dictionary (default: None)
+        tol : relative tolerance on constraint residuals and variable bounds
+              (default: 1e-8)
+        logger : logger to use (default: watertap.core.util.initialization)
+        fail_flag : Boolean argument to specify error or warning if the solve
+                    fails (Default: fail_flag=True raises an error)
+
+    Returns:
+        solver results, or None if no solve was needed
+    """
+    unsolved = solve_linear_blocks(blk, tol=tol, logger=logger)
+    if not unsolved:
+        logger.info(f"{blk.name} solved directly.")
+        return None
+
+    logger.info(
+        f"{len(unsolved)} constraints of {blk.name} are not solved directly, "
+        f"solving with {solver or 'the default solver'}."
+    )
+    if not hasattr(solver, "solve"):
+        solver = get_solver(solver, optarg)
+    results = solver.solve(blk)
+    check_solve(
+        results, checkpoint=f"Solve of {blk.name}", logger=logger, fail_flag=fail_flag
+    )
+    return results
@@ -0,0 +1,291 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains mesh continuation for models with 1D (length
+discretized) units, e.g. ReverseOsmosis1D, OsmoticallyAssistedReverseOsmosis1D,
+MembraneDistillation1D and Electrodialysis1D.
+
+A model is first solved with a coarse length discretization. The converged
+profiles are then interpolated onto the points of a model with more finite
+elements, which is solved starting from the interpolated values instead of
+being initialized from scratch. A mesh refinement study reports the solve
+time and the change of selected outputs against the number of finite
+elements, to choose the coarsest mesh which meets a tolerance.
+"""
+
+import time
+
+import numpy as np
+
+from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import pandas as pd
+from pyomo.dae import ContinuousSet
+from pyomo.environ import Set, Var, check_optimal_termination, value
+
+import idaes.logger as idaeslog
+
+from watertap.core.solvers import get_solver
+
+_log = idaeslog.getLogger(__name__)
+
+# Names of the sets indexing the length domain of 1D units
+_LENGTH_SET_NAMES = ("length_domain", "difference_elements")
+
+
+def get_length_sets(model):
+    """
+    Get the sets indexing the length domain of the 1D units in a model.
+
+    Args:
+        model - Pyomo model or block
+
+    Returns:
+        ComponentSet of the length_domain and difference_elements sets
+    """
+    return ComponentSet(
+        s
+        for s in model.component_objects((Set, ContinuousSet), descend_into=True)
+        if s.local_name in _LENGTH_SET_NAMES and s.dimen == 1
+    )
+
+
+def _profile_key(var_data, length_sets, top):
+    # Path from top to the variable with the length index removed, and the
+    # point of the length domain (None if not indexed by length)
+    key = []
+    x = None
+    obj = var_data
+    while obj is not None and obj is not top:
+        comp = obj.parent_component()
+        idx = obj.index()
+        if comp.is_indexed():
+            idx = idx if type(idx) is tuple else (idx,)
+            if x is None:
+                pos = 0
+                for s in comp.index_set().subsets(expand_all_set_operators=True):
+                    if s in length_sets:
+                        x = idx[pos]
+                        idx = idx[:pos] + (None,) + idx[pos + 1 :]
+                        break
+                    pos += s.dimen
+        key.append((comp.local_name, idx))
+        obj = obj.parent_block()
+    return tuple(reversed(key)), x
+
+
+def _get_profiles(model, length_sets):
+    profiles = {}
+    for v in model.component_data_objects(Var, descend_into=True):
+        if v.value is None:
+            continue
+        key, x = _profile_key(v, length_sets, model)
+        profiles.setdefault(key, {})[x] = v.value
+    return profiles
+
+
+def transfer_length_profiles(source, target, include_fixed=False):
+    """
+    Set the variable values of target from a solved model with a different
+    length discretization.
+
+    Variables are matched by their position in the model with the length
+    index removed, so target must have the same structure as source (e.g.
+    be built by the same function with a different number of finite
+    elements). Variables indexed by length are linearly interpolated
+    between the points of source, other variables are copied.
+
+    Args:
+        source - solved Pyomo model
+        target - Pyomo model to set the values of
+        include_fixed (optional) - if True, set the values of fixed variables
+                                   as well, default False
+
+    Returns:
+        number of variables of target which were set
+    """
+    profiles = _get_profiles(source, get_length_sets(source))
+    # Sort the points of each profile once, for interpolation
+    points = {}
+    for key, profile in profiles.items():
+        if None not in profile:
+            xs = sorted(profile)
+            points[key] = (np.array(xs), np.array([profile[x] for x in xs]))
+
+    target_sets = get_length_sets(target)
+    n_set = 0
+    for v in target.component_data_objects(Var, descend_into=True):
+        if v.fixed and not include_fixed:
+            continue
+        key, x = _profile_key(v, target_sets, target)
+        if x is None:
+            val = profiles.get(key, {}).get(None)
+        elif key in points:
+            xs, vals = points[key]
+            val = float(np.interp(x, xs, vals))
+        else:
+            val = None
+        if val is not None:
+            v.set_value(val, skip_validation=True)
+            n_set += 1
+    return n_set
+
+
+def solve_with_mesh_continuation(
+    build_model,
+    finite_elements,
+    initialize_model=None,
+    solver=None,
+    optarg=None,
+    tee=False,
+):
+    """
+    Solve a model on a sequence of increasingly fine length discretizations,
+    starting each solve from the interpolated solution of the previous one.
+
+    Args:
+        build_model - function taking the number of finite elements and
+                      returning a fully specified (and scaled) model
+        finite_elements - increasing sequence of numbers of finite elements
+        initialize_model (optional) - function initializing the model with
+                                      the first number of finite elements,
+                                      e.g. calling the unit initialize methods
+        solver (optional) - solver name, defaults to the WaterTAP default
+        optarg (optional) - dict of solver options
+        tee (optional) - if True, print the solver output, default False
+
+    Returns:
+        model with the last number of finite elements, and a list of dicts with
+        the number of finite elements, build, transfer and solve times in
+        seconds and solver termination of each step
+
+    Raises:
+        RuntimeError if a solve fails
+    """
+    opt = get_solver(solver, optarg)
+    previous = None
+    history = []
+    for nfe in finite_elements:
+        start = time.perf_counter()
+        m = build_model(nfe)
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if previous is None:
+            if initialize_model is not None:
+                initialize_model(m)
+        else:
+            transfer_length_profiles(previous, m)
+        init_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = opt.solve(m, tee=tee)
+        solve_time = time.perf_counter() - start
+
+        history.append(
+            {
+                "finite_elements": nfe,
+                "build_time": build_time,
+                "initialization_time": init_time,
+                "solve_time": solve_time,
+                "termination_condition": str(results.solver.termination_condition),
+            }
+        )
+        _log.info(
+            f"Solved with {nfe} finite elements in {solve_time:.2f} s "
+            f"({idaeslog.condition(results)})."
+        )
+        if not check_optimal_termination(results):
+            raise RuntimeError(
+                f"Mesh continuation failed to solve with {nfe} finite elements."
+            )
+        previous = m
+    return previous, history
+
+
+def mesh_refinement_study(
+    build_model,
+    finite_elements,
+    outputs,
+    initialize_model=None,
+    solver=None,
+    optarg=None,
+):
+    """
+    Compare the solve time and outputs of a model against the number of
+    finite elements.
+
+    The model is solved by mesh continuation over finite_elements, and each
+    output is compared to its value with the finest mesh (the last entry of
+    finite_elements), which is taken as the reference.
+
+    Args:
+        build_model - function taking the number of finite elements and
+                      returning a fully specified (and scaled) model
+        finite_elements - increasing sequence of numbers of finite elements
+        outputs - dict of output names and functions taking a solved model
+                  and returning a value, e.g. the recovery and pressure drop
+        initialize_model (optional) - function initializing the model with
+                                      the first number of finite elements
+        solver (optional) - solver name, defaults to the WaterTAP default
+        optarg (optional) - dict of solver options
+
+    Returns:
+        pandas DataFrame indexed by the number of finite elements, with the
+        solve times, the value of each output and its relative error to the
+        finest mesh (columns "<output>_rel_error")
+    """
+    # Keep the model of each step to evaluate the outputs once solved
+    solved = []
+
+    def _build_and_keep(nfe):
+        m = build_model(nfe)
+        solved.append(m)
+        return m
+
+    _, history = solve_with_mesh_continuation(
+        _build_and_keep,
+        finite_elements,
+        initialize_model=initialize_model,
+        solver=solver,
+        optarg=optarg,
+    )
+
+    data = []
+    for step, m in zip(history, solved):
+        row = dict(step)
+        for name, func in outputs.items():
+            row[name] = value(func(m))
+        data.append(row)
+    df = pd.DataFrame(data).set_index("finite_elements")
+    for name in outputs:
+        reference = df[name].iloc[-1]
+        df[f"{name}_rel_error"] = (df[name] - reference).abs() / max(
+            abs(reference), 1e-12
+        )
+    return df
+
+
+def select_mesh(study, rtol):
+    """
+    Get the smallest number of finite elements whose outputs are all within
+    a relative tolerance of the finest mesh of a mesh refinement study.
+
+    Args:
+        study - DataFrame returned by mesh_refinement_study
+        rtol - relative tolerance on the outputs
+
+    Returns:
+        number of finite elements
+    """
+    errors = study[[c for c in study.columns if c.endswith("_rel_error")]]
+    within = (errors <= rtol).all(axis=1)
+    return int(within[within].index.min())
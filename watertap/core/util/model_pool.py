@@ -0,0 +1,274 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains a pool of pre-built flowsheet UI interfaces.
+
+Building a flowsheet for the UI (build, initialize, solve and export) can take
+minutes. A FlowsheetModelPool pays this cost once per flowsheet, clones the
+converged model (together with its export registry) for each pool member and
+resets members to the converged baseline when they are returned, so that
+interactive solves start from a warm model.
+"""
+
+import copy
+import importlib
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from pyomo.environ import Block, Constraint, Objective, Param, Var
+
+import idaes.logger as idaeslog
+
+_log = idaeslog.getLogger(__name__)
+
+# Name of the function returning the FlowsheetInterface in UI modules
+_UI_HOOK = "export_to_ui"
+
+
+class _PoolMember:
+    """
+    Interface in the pool together with its baseline state.
+    """
+
+    def __init__(self, interface):
+        self.interface = interface
+        m = interface.fs_exp.m
+        self.variables = list(m.component_data_objects(Var, descend_into=True))
+        self.params = [
+            p
+            for p in m.component_data_objects(Param, descend_into=True)
+            if p.parent_component().mutable
+        ]
+        # Bounds are stored as given (possibly as expressions of Params)
+        self.var_baseline = [
+            (v.value, v.lower, v.upper, v.fixed) for v in self.variables
+        ]
+        self.param_baseline = [p.value for p in self.params]
+        # Include deactivated components, which may be reactivated by a solve
+        self.active_baseline = [
+            (c, c.active)
+            for c in m.component_data_objects(
+                (Constraint, Objective, Block), active=None, descend_into=True
+            )
+        ]
+        self.kpi_baseline = copy.deepcopy(interface.fs_exp.kpis)
+
+    def reset(self):
+        for v, (val, lower, upper, fixed) in zip(self.variables, self.var_baseline):
+            v.set_value(val, skip_validation=True)
+            v.lower = lower
+            v.upper = upper
+            v.fixed = fixed
+        for p, val in zip(self.params, self.param_baseline):
+            p.set_value(val)
+        for c, active in self.active_baseline:
+            if active:
+                c.activate()
+            else:
+                c.deactivate()
+        self.interface.export_values()
+        self.interface.fs_exp.kpis = copy.deepcopy(self.kpi_baseline)
+
+
+class FlowsheetModelPool:
+    """
+    Pool of built, initialized and solved flowsheet UI interfaces.
+
+    The flowsheet is built once through its FlowsheetInterface, after which
+    the converged state is recorded as the baseline. The remaining members of
+    the pool are clones of the built model, with the export registry mapped
+    onto each clone instead of being rebuilt. Members are handed out with
+    acquire (or the member context manager) and are reset to the baseline
+    values, bounds, fixed status and activation when released.
+
+    Args:
+        export_to_ui - function returning a new FlowsheetInterface, e.g. the
+                       export_to_ui function of a flowsheet UI module
+        size (optional) - number of interfaces in the pool, default 1
+        build_kwargs (optional) - dict of keyword arguments for
+                                  FlowsheetInterface.build
+        quiet (optional) - if True, suppress output of the build, default False
+    """
+
+    def __init__(self, export_to_ui, size=1, build_kwargs=None, quiet=False):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, but {size} was given.")
+        self.export_to_ui = export_to_ui
+        self.size = size
+        self.build_kwargs = {} if build_kwargs is None else build_kwargs
+
+        start = time.perf_counter()
+        base = export_to_ui()
+        base.build(quiet=quiet, **self.build_kwargs)
+        self.build_time = time.perf_counter() - start
+
+        self._members = {id(base): _PoolMember(base)}
+        self._available = queue.Queue()
+        self._available.put(base)
+        for _ in range(size - 1):
+            interface = self._clone(base)
+            self._members[id(interface)] = _PoolMember(interface)
+            self._available.put(interface)
+
+        _log.info(
+            f"Built pool of {size} flowsheet interfaces in "
+            f"{time.perf_counter() - start:.2f} s (build took "
+            f"{self.build_time:.2f} s)."
+        )
+
+    def _clone(self, base):
+        interface = self.export_to_ui()
+        base_exp = base.fs_exp
+
+        # Clone the model and map the exported objects onto the clone in the
+        # same deepcopy, so that the export registry does not need rebuilding
+        memo = {"__block_scope__": {id(base_exp.m): True, id(None): False}}
+        m = copy.deepcopy(base_exp.m, memo)
+
+        fs_exp = interface.fs_exp
+        fs_exp.m = m
+        fs_exp.obj = copy.deepcopy(base_exp.obj, memo)
+        fs_exp.exports = {
+            key: export.model_copy(update={"obj": copy.deepcopy(export.obj, memo)})
+            for key, export in base_exp.exports.items()
+        }
+        fs_exp.kpis = copy.deepcopy(base_exp.kpis)
+        fs_exp.kpi_order = list(base_exp.kpi_order)
+        fs_exp.build_options = copy.deepcopy(base_exp.build_options)
+        return interface
+
+    @property
+    def available(self):
+        """
+        Number of interfaces currently available in the pool.
+        """
+        return self._available.qsize()
+
+    def acquire(self, timeout=None):
+        """
+        Take an interface from the pool, waiting for one to be released if
+        none are available.
+
+        Args:
+            timeout (optional) - maximum time to wait in seconds. Waits
+                                 indefinitely if None
+
+        Returns:
+            FlowsheetInterface with a model at the baseline state
+
+        Raises:
+            TimeoutError if no interface became available within timeout
+        """
+        try:
+            return self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No flowsheet interface became available within {timeout} s."
+            )
+
+    def release(self, interface):
+        """
+        Reset an interface to the baseline state and return it to the pool.
+
+        Args:
+            interface - FlowsheetInterface obtained from acquire
+
+        Raises:
+            ValueError if the interface does not belong to this pool
+        """
+        try:
+            member = self._members[id(interface)]
+        except KeyError:
+            raise ValueError("The flowsheet interface does not belong to this pool.")
+        self.reset(member)
+        self._available.put(interface)
+
+    def reset(self, member):
+        """
+        Reset a pool member to the baseline state.
+
+        Args:
+            member - FlowsheetInterface belonging to this pool, or its _PoolMember
+        """
+        if not isinstance(member, _PoolMember):
+            member = self._members[id(member)]
+        member.reset()
+
+    @contextmanager
+    def member(self, timeout=None):
+        """
+        Context manager which acquires an interface from the pool and
+        releases it on exit.
+
+        Args:
+            timeout (optional) - maximum time to wait in seconds, see acquire
+        """
+        interface = self.acquire(timeout=timeout)
+        try:
+            yield interface
+        finally:
+            self.release(interface)
+
+
+_pools = {}
+# Pools are built under a lock per key, so that pools of different flowsheets
+# are built concurrently
+_pool_locks = {}
+_pools_lock = threading.Lock()
+
+
+def get_model_pool(ui_module, size=1, build_kwargs=None, quiet=False):
+    """
+    Get the shared model pool of a flowsheet UI module, building it on the
+    first call.
+
+    Args:
+        ui_module - flowsheet UI module or its import name, e.g.
+                    "watertap.flowsheets.gac.gac_ui"
+        size (optional) - number of interfaces in the pool, only used when the
+                          pool is built
+        build_kwargs (optional) - dict of keyword arguments for
+                                  FlowsheetInterface.build, a separate pool is
+                                  kept for each set of build arguments
+        quiet (optional) - if True, suppress output of the build, default False
+
+    Returns:
+        FlowsheetModelPool
+    """
+    if isinstance(ui_module, str):
+        ui_module = importlib.import_module(ui_module)
+    key = (ui_module.__name__, repr(sorted((build_kwargs or {}).items())))
+    with _pools_lock:
+        lock = _pool_locks.setdefault(key, threading.Lock())
+    with lock:
+        with _pools_lock:
+            pool = _pools.get(key)
+        if pool is None:
+            pool = FlowsheetModelPool(
+                getattr(ui_module, _UI_HOOK),
+                size=size,
+                build_kwargs=build_kwargs,
+                quiet=quiet,
+            )
+            with _pools_lock:
+                _pools[key] = pool
+        return pool
+
+
+def clear_model_pools():
+    """
+    Remove all shared model pools.
+    """
+    with _pools_lock:
+        _pools.clear()
@@ -0,0 +1,236 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains utilities to snapshot the variable values of a converged
+model and restore them on a later build, so that expensive initialization
+routines can be skipped.
+"""
+
+import hashlib
+import json
+import math
+import os
+
+from pyomo.environ import Var
+
+import idaes.logger as idaeslog
+
+_log = idaeslog.getLogger(__name__)
+
+
+def get_model_state(blk):
+    """
+    Get the values of all Vars in a block.
+
+    Args:
+        blk - Pyomo block to get the state of
+
+    Returns:
+        dict of Var name (relative to blk) to value, for all Vars with a value
+    """
+    return {
+        v.getname(fully_qualified=True, relative_to=blk): v.value
+        for v in blk.component_data_objects(Var, descend_into=True)
+        if v.value is not None
+    }
+
+
+def set_model_state(blk, state, scaling=None, include_fixed=False):
+    """
+    Set the values of the Vars in a block from a state returned by
+    get_model_state.
+
+    Args:
+        blk - Pyomo block to set the state of
+        state - dict of Var name (relative to blk) to value
+        scaling (optional) - dict of Var name substring to factor. The value
+                             of each Var whose name contains a substring is
+                             multiplied by the factor of the first match
+        include_fixed (optional) - if True, also set the values of fixed Vars.
+                                   Default is False, so that the inputs of the
+                                   model are preserved
+
+    Returns:
+        number of Vars set
+    """
+    scaling = {} if scaling is None else scaling
+
+    count = 0
+    for v in blk.component_data_objects(Var, descend_into=True):
+        if v.fixed and not include_fixed:
+            continue
+        name = v.getname(fully_qualified=True, relative_to=blk)
+        try:
+            val = state[name]
+        except KeyError:
+            continue
+        for pattern, factor in scaling.items():
+            if pattern in name:
+                val *= factor
+                break
+        v.set_value(val, skip_validation=True)
+        count += 1
+    return count
+
+
+class ModelStateStore:
+    """
+    Directory of converged model states, keyed by model configuration and
+    operating point.
+
+    Each configuration (e.g., number of stages and build flags) is stored as
+    one JSON file holding the states saved at different operating points.
+    Restoring a state picks the entry with the nearest operating point and
+    optionally scales the Vars which are proportional to an operating point
+    value, such as flow rates.
+
+    Args:
+        directory (optional) - path to directory to store states in, created
+                               if it does not exist
+        max_entries (optional) - maximum number of operating points stored per
+                                 configuration, the oldest entries are dropped
+                                 first. No limit if None
+    """
+
+    def __init__(self, directory="./model_states", max_entries=None):
+        self.directory = os.path.abspath(directory)
+        self.max_entries = max_entries
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(config):
+        """
+        Get the key for a model configuration.
+
+        Args:
+            config - JSON-serializable dict describing the model configuration
+
+        Returns:
+            string hex digest identifying the configuration
+        """
+        canonical = json.dumps(config, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _file_path(self, config):
+        return os.path.join(self.directory, self.make_key(config) + ".json")
+
+    def _load(self, config):
+        try:
+            with open(self._file_path(config), "r") as f:
+                return json.load(f)
+        except OSError:
+            return {"config": config, "entries": []}
+
+    def save(self, blk, config, operating_point):
+        """
+        Save the current state of a block.
+
+        An existing entry for the same configuration and operating point is
+        replaced.
+
+        Args:
+            blk - Pyomo block to save the state of
+            config - JSON-serializable dict describing the model configuration
+            operating_point - dict of operating point name to float value
+        """
+        data = self._load(config)
+        entries = [
+            e
+            for e in data["entries"]
+            if not _same_point(e["operating_point"], operating_point)
+        ]
+        entries.append(
+            {"operating_point": operating_point, "state": get_model_state(blk)}
+        )
+        if self.max_entries is not None:
+            entries = entries[-self.max_entries :]
+        data["entries"] = entries
+
+        # Write to a temporary file first so that concurrent readers never
+        # see a partially written file
+        file_path = self._file_path(config)
+        tmp_path = f"{file_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, file_path)
+
+    def nearest(self, config, operating_point):
+        """
+        Find the saved state with the nearest operating point.
+
+        Distances are computed from the relative differences of the operating
+        point values.
+
+        Args:
+            config - JSON-serializable dict describing the model configuration
+            operating_point - dict of operating point name to float value
+
+        Returns:
+            tuple of (operating point, state) for the nearest entry, or
+            (None, None) if no state is stored for the configuration
+        """
+        best = None
+        best_distance = math.inf
+        for entry in self._load(config)["entries"]:
+            distance = _distance(entry["operating_point"], operating_point)
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        if best is None:
+            return None, None
+        return best["operating_point"], best["state"]
+
+    def restore(self, blk, config, operating_point, scaled_vars=None):
+        """
+        Restore the state with the nearest operating point into a block.
+
+        Args:
+            blk - Pyomo block to restore the state into
+            config - JSON-serializable dict describing the model configuration
+            operating_point - dict of operating point name to float value
+            scaled_vars (optional) - dict of operating point name to a list of
+                                     Var name substrings. Values of matching Vars
+                                     are scaled by the ratio of the requested
+                                     and stored operating point values
+
+        Returns:
+            True if a state was restored, otherwise False
+        """
+        stored_point, state = self.nearest(config, operating_point)
+        if state is None:
+            return False
+
+        scaling = {}
+        for name, patterns in ({} if scaled_vars is None else scaled_vars).items():
+            if stored_point.get(name):
+                for pattern in patterns:
+                    scaling[pattern] = operating_point[name] / stored_point[name]
+
+        count = set_model_state(blk, state, scaling=scaling)
+        _log.info(
+            f"Restored {count} variables of {blk.name} from state at "
+            f"operating point {stored_point}."
+        )
+        return True
+
+
+def _same_point(a, b):
+    return a.keys() == b.keys() and all(
+        math.isclose(a[k], b[k], rel_tol=1e-9) for k in a
+    )
+
+
+def _distance(a, b):
+    if a.keys() != b.keys():
+        return math.inf
+    return math.sqrt(
+        sum(((a[k] - b[k]) / max(abs(a[k]), abs(b[k]), 1e-12)) ** 2 for k in a)
+    )
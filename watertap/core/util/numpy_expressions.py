@@ -0,0 +1,167 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module converts Pyomo expressions to Python source evaluating them with
+NumPy, so that many evaluations of the same expressions can be vectorized.
+It is used to compile costing expressions (see
+watertap.costing.costing_report) and systems of equations (see
+watertap.core.util.compiled_equations).
+"""
+
+import math
+
+import numpy as np
+
+from pyomo.common.numeric_types import native_types
+from pyomo.core.expr import numeric_expr, relational_expr
+from pyomo.core.expr.visitor import StreamBasedExpressionVisitor
+from pyomo.environ import value
+
+# Pyomo unary function names which differ from their NumPy equivalents
+_UNARY_FUNCTIONS = {
+    "asin": "arcsin",
+    "acos": "arccos",
+    "atan": "arctan",
+    "asinh": "arcsinh",
+    "acosh": "arccosh",
+    "atanh": "arctanh",
+}
+
+_BINARY_OPERATORS = (
+    (numeric_expr.ProductExpression, "*"),
+    (numeric_expr.DivisionExpression, "/"),
+    (numeric_expr.PowExpression, "**"),
+    (relational_expr.EqualityExpression, "=="),
+)
+_SUM_EXPRESSIONS = (numeric_expr.SumExpression, numeric_expr.LinearExpression)
+
+
+class NumPyCodeVisitor(StreamBasedExpressionVisitor):
+    """
+    Convert a Pyomo expression to Python source evaluating it with NumPy.
+
+    Variables are replaced by the code returned by var_code, and all subtrees
+    without such variables are folded to their current values. The visitor
+    returns a tuple of the code and whether the expression is constant.
+
+    Args:
+        var_code - function returning the code of a variable, or None if the
+                   variable is not an input of the expression, in which case
+                   it must be fixed and is taken at its value
+        named (optional) - ComponentMap of named expressions to the names of
+                           their temporaries. If given, each named expression
+                           is evaluated once to a temporary, otherwise named
+                           expressions are inlined
+        lines (optional) - list to which the assignments of the temporaries
+                           are appended, required with named
+    """
+
+    def __init__(self, var_code, named=None, lines=None):
+        super().__init__()
+        self.var_code = var_code
+        self.named = named
+        self.lines = lines
+
+    def initializeWalker(self, expr):
+        walk, result = self.beforeChild(None, expr, 0)
+        if not walk:
+            return False, result
+        return True, None
+
+    def beforeChild(self, node, child, child_idx):
+        if child.__class__ in native_types:
+            return False, (repr(float(child)), True)
+        if self.named is not None and child.is_named_expression_type():
+            if child not in self.named:
+                # Compile the named expression separately so that it is reused
+                code, const = NumPyCodeVisitor(
+                    self.var_code, self.named, self.lines
+                ).walk_expression(child.expr)
+                if not const:
+                    name = f"_e{len(self.named)}"
+                    self.lines.append(f"    {name} = {code}")
+                    code = name
+                self.named[child] = code, const
+            return False, self.named[child]
+        if child.is_variable_type():
+            code = self.var_code(child)
+            if code is not None:
+                return False, (code, False)
+            if not child.fixed:
+                raise ValueError(f"{child.name} is not an input of the expression.")
+            return False, (repr(float(value(child))), True)
+        if not child.is_potentially_variable():
+            # Parameters, units and terms without variables
+            return False, (repr(float(value(child))), True)
+        return True, None
+
+    def exitNode(self, node, data):
+        if all(const for _, const in data):
+            return repr(float(value(node))), True
+        args = [code for code, _ in data]
+        if node.is_named_expression_type():
+            return args[0], False
+        if isinstance(node, _SUM_EXPRESSIONS):
+            code = " + ".join(args)
+        elif isinstance(node, numeric_expr.NegationExpression):
+            code = f"-{args[0]}"
+        elif isinstance(node, numeric_expr.AbsExpression):
+            return f"np.abs({args[0]})", False
+        elif isinstance(node, numeric_expr.UnaryFunctionExpression):
+            name = node.getname()
+            return f"np.{_UNARY_FUNCTIONS.get(name, name)}({args[0]})", False
+        elif isinstance(node, (numeric_expr.MaxExpression, numeric_expr.MinExpression)):
+            # Pairwise fold so that constants broadcast against arrays
+            func = (
+                "np.maximum"
+                if isinstance(node, numeric_expr.MaxExpression)
+                else "np.minimum"
+            )
+            code = args[0]
+            for arg in args[1:]:
+                code = f"{func}({code}, {arg})"
+            return code, False
+        elif isinstance(node, numeric_expr.Expr_ifExpression):
+            return f"np.where({args[0]}, {args[1]}, {args[2]})", False
+        elif isinstance(node, relational_expr.RangedExpression):
+            lower = "<" if node.strict[0] else "<="
+            upper = "<" if node.strict[1] else "<="
+            code = f"({args[0]} {lower} {args[1]}) & ({args[1]} {upper} {args[2]})"
+        elif isinstance(node, relational_expr.InequalityExpression):
+            code = f"{args[0]} {'<' if node.strict else '<='} {args[1]}"
+        else:
+            for cls, operator in _BINARY_OPERATORS:
+                if isinstance(node, cls):
+                    return f"({f' {operator} '.join(args)})", False
+            raise TypeError(
+                f"Expressions of type {type(node).__name__} are not supported "
+                f"by the NumPy expression compiler."
+            )
+        return f"({code})", False
+
+
+def compile_numpy_function(lines, name, filename):
+    """
+    Compile the source of a function using NumPy, e.g. built from the code of
+    NumPyCodeVisitor.
+
+    Args:
+        lines - list of lines of the source
+        name - name of the function defined by the source
+        filename - file name shown in tracebacks
+
+    Returns:
+        compiled function
+    """
+    namespace = {"np": np, "inf": math.inf, "nan": math.nan}
+    exec(compile("\n".join(lines), filename, "exec"), namespace)
+    return namespace[name]
@@ -0,0 +1,279 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains a sequential decomposition which initializes independent
+units of a flowsheet in parallel.
+"""
+
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pyomo.common.collections import ComponentSet
+from pyomo.environ import Block, Constraint, Var
+from pyomo.network import Port, SequentialDecomposition
+
+import idaes.logger as idaeslog
+
+_log = idaeslog.getLogger(__name__)
+
+# Model and unit function held by each worker process
+_worker_model = None
+_worker_function = None
+
+
+def _init_worker(model, function):
+    global _worker_model, _worker_function
+    _worker_model = model
+    _worker_function = function
+
+
+def _get_unit_vars(unit):
+    return list(unit.component_data_objects(Var, descend_into=True))
+
+
+def _get_unit_components(unit):
+    # Constraints and blocks which the unit function may activate or deactivate
+    return list(
+        unit.component_objects((Constraint, Block), descend_into=True, active=None)
+    ) + list(
+        unit.component_data_objects((Constraint, Block), descend_into=True, active=None)
+    )
+
+
+def _get_unit_state(unit):
+    unit_vars = _get_unit_vars(unit)
+    return (
+        [v.value for v in unit_vars],
+        [v.fixed for v in unit_vars],
+        [c.active for c in _get_unit_components(unit)],
+    )
+
+
+def _set_unit_state(unit, values, fixed, active):
+    unit_vars = _get_unit_vars(unit)
+    components = _get_unit_components(unit)
+    if len(unit_vars) != len(values) or len(components) != len(active):
+        raise RuntimeError(
+            f"Unit {unit.name} has {len(unit_vars)} variables and "
+            f"{len(components)} constraints and blocks, but the state of "
+            f"{len(values)} variables and {len(active)} constraints and blocks "
+            f"was received."
+        )
+    for v, val, fx in zip(unit_vars, values, fixed):
+        v.set_value(val, skip_validation=True)
+        v.fixed = fx
+    for c, act in zip(components, active):
+        if act:
+            c.activate()
+        else:
+            c.deactivate()
+
+
+def _run_unit(name, state):
+    unit = _worker_model.find_component(name)
+    _set_unit_state(unit, *state)
+
+    start = time.perf_counter()
+    _worker_function(unit)
+    elapsed = time.perf_counter() - start
+
+    return _get_unit_state(unit), elapsed
+
+
+class ParallelSequentialDecomposition(SequentialDecomposition):
+    """
+    Sequential decomposition which runs the units of each level of the
+    calculation order at the same time in a process pool.
+
+    Units in the same level of the calculation order do not depend on each
+    other once the tear streams are guessed. For each level, the inlet values of
+    all units are loaded first, then the variable values of each unit are sent
+    to a worker process, the unit function is run there and the resulting values
+    are copied back before they are passed downstream, together with the fixed
+    flags of the variables and the activation of constraints and blocks. The
+    options and tear handling are the same as for Pyomo's
+    SequentialDecomposition.
+
+    Worker processes are forked from the current process where possible, so
+    the model and function do not need to be picklable. With other start
+    methods (the default on Windows and macOS) both are pickled once per
+    worker, and units are initialized serially with a warning if they cannot
+    be pickled, e.g. for a function defined inside another function.
+
+    Args:
+        max_workers (optional) - number of worker processes. If 1 (default),
+                                 units are run in the current process
+        mp_context (optional) - multiprocessing context for the process pool,
+                                defaults to fork where it is available
+        **kwds - options for SequentialDecomposition
+    """
+
+    def __init__(self, max_workers=1, mp_context=None, **kwds):
+        super().__init__(**kwds)
+        self.max_workers = max_workers
+        if mp_context is None and "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        self.mp_context = mp_context
+        self.unit_timings = {}
+        self._executor = None
+
+    def run(self, model, function):
+        """
+        Compute a Pyomo Network model using sequential decomposition,
+        running independent units in parallel.
+
+        Arguments
+        ---------
+            model
+                A Pyomo model
+            function
+                A function to be called on each block/node in the network
+        """
+        self.unit_timings = {}
+        if self.max_workers is not None and self.max_workers <= 1:
+            return super().run(model, function)
+        if not self._can_send_to_workers(model, function):
+            _log.warning(
+                "The model and unit function cannot be sent to worker processes "
+                "without the fork start method, as they cannot be pickled. "
+                "Initializing units serially."
+            )
+            return super().run(model, function)
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(model, function),
+        )
+        try:
+            return super().run(model, function)
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _can_send_to_workers(self, model, function):
+        if self.mp_context is None:
+            return False
+        if self.mp_context.get_start_method() == "fork":
+            return True
+        try:
+            pickle.dumps((model, function))
+        except Exception:
+            return False
+        return True
+
+    def run_order(self, G, order, function, ignore=None, use_guesses=False):
+        """
+        Run computations in the order provided by calling the function,
+        running the units of each level in parallel.
+
+        Arguments
+        ---------
+            G
+                A networkx graph corresponding to order
+            order
+                The order in which to run each node in the graph
+            function
+                The function to be called on each block/node
+            ignore
+                Edge indexes to ignore when passing values
+            use_guesses
+                If True, will check the guesses dict when fixing
+                free variables before calling function
+        """
+        fixed_inputs = self.fixed_inputs()
+        fixed_outputs = ComponentSet()
+        edge_map = self.edge_to_idx(G)
+        arc_map = self.arc_to_edge(G)
+        guesses = self.options["guesses"]
+        default = self.options["default_guess"]
+        for lev in order:
+            for unit in lev:
+                if unit not in fixed_inputs:
+                    fixed_inputs[unit] = ComponentSet()
+                fixed_ins = fixed_inputs[unit]
+
+                # make sure all inputs are fixed
+                for port in unit.component_data_objects(Port):
+                    if not len(port.sources()):
+                        continue
+                    if use_guesses and port in guesses:
+                        self.load_guesses(guesses, port, fixed_ins)
+                    self.load_values(port, default, fixed_ins, use_guesses)
+
+            self._run_level(lev, function)
+
+            for unit in lev:
+                # free the inputs that were not already fixed
+                fixed_ins = fixed_inputs[unit]
+                for var in fixed_ins:
+                    var.free()
+                fixed_ins.clear()
+
+                # pass the values downstream for all outlet ports
+                for port in unit.component_data_objects(Port):
+                    dests = port.dests()
+                    if not len(dests):
+                        continue
+                    for var in port.iter_vars(expr_vars=True, fixed=False):
+                        fixed_outputs.add(var)
+                        var.fix()
+                    for arc in dests:
+                        # arc might not be in the arc_map if
+                        # it is on a deactivated block
+                        if arc in arc_map and edge_map[arc_map[arc]] not in ignore:
+                            self.pass_values(arc, fixed_inputs)
+                    for var in fixed_outputs:
+                        var.free()
+                    fixed_outputs.clear()
+
+    def _run_level(self, lev, function):
+        if self._executor is None or len(lev) == 1:
+            for unit in lev:
+                start = time.perf_counter()
+                function(unit)
+                self._record_time(unit, time.perf_counter() - start)
+            return
+
+        futures = [
+            (unit, self._executor.submit(_run_unit, unit.name, _get_unit_state(unit)))
+            for unit in lev
+        ]
+        for unit, future in futures:
+            state, elapsed = future.result()
+            _set_unit_state(unit, *state)
+            self._record_time(unit, elapsed)
+
+    def _record_time(self, unit, elapsed):
+        self.unit_timings.setdefault(unit.name, []).append(elapsed)
+        _log.debug(f"Initialized {unit.name} in {elapsed:.3f} s.")
+
+    def timing_summary(self):
+        """
+        Get the total initialization time of each unit.
+
+        Returns:
+            dict of unit name to a dict with the number of runs and the total
+            time in seconds, sorted by decreasing total time
+        """
+        summary = {
+            name: {"runs": len(times), "total_time": sum(times)}
+            for name, times in self.unit_timings.items()
+        }
+        return dict(
+            sorted(
+                summary.items(), key=lambda item: item[1]["total_time"], reverse=True
+            )
+        )
@@ -10,13 +10,16 @@
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
 """
-This module contains a utility function for the scaling of WaterTAP property model constraints.
+This module contains utilities for the scaling of WaterTAP models.
 """
 
 import pyomo.environ as pyo
+from pyomo.core.base.suffix import SuffixFinder
 import idaes.core.util.scaling as iscale
 import idaes.logger as idaeslog
 
+from watertap.core.solvers import get_solver
+
 _log = idaeslog.getLogger(__name__)
 
 
@@ -56,3 +59,174 @@ def transform_property_constraints(self):
                         _log.warning(msg)
             else:
                 _log.warning(msg)
+
+
+class ScaledModelTwin:
+    """
+    Persistent scaled copy of a model for repeated solves.
+
+    The copy is created once with the core.scale_model transformation. Before
+    each solve the values, bounds, fixed status and activity of the original
+    model are copied into it in place (including mutable Param values), and
+    afterwards the solution is copied back, avoiding a new clone and
+    propagate_solution for every solve. The scaling factors are baked into the
+    copy, so it is rebuilt automatically if Vars, Constraints or Objectives
+    are added to or removed from the original model, or if their scaling
+    factors change (e.g. after rescaling the constraints).
+
+    Use get_scaled_model_twin to keep a single copy with the model across
+    solves.
+
+    Args:
+        model - Pyomo model with scaling_factor suffixes to solve
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.scaled_model = None
+        self.rebuild()
+
+    @staticmethod
+    def _components(blk):
+        return (
+            list(blk.component_data_objects(pyo.Var, descend_into=True)),
+            list(
+                blk.component_data_objects(
+                    (pyo.Constraint, pyo.Objective), descend_into=True
+                )
+            ),
+            [
+                p
+                for p in blk.component_data_objects(pyo.Param, descend_into=True)
+                if p.parent_component().mutable
+            ],
+            list(blk.block_data_objects(descend_into=True)),
+        )
+
+    def _scaled_components(self):
+        # Vars, Constraints and Objectives of the original model with their
+        # scaling factors, which determine the structure of the scaled copy
+        suffix_finder = SuffixFinder("scaling_factor", 1.0, self.model)
+        return [
+            (c, suffix_finder.find(c))
+            for c in self.model.component_data_objects(
+                (pyo.Var, pyo.Constraint, pyo.Objective), descend_into=True
+            )
+        ]
+
+    def _structure_changed(self):
+        scaled_components = self._scaled_components()
+        if len(scaled_components) != len(self._scaled_components_at_build):
+            return "Model structure changed"
+        for (c, sf), (c0, sf0) in zip(
+            scaled_components, self._scaled_components_at_build
+        ):
+            if c is not c0:
+                return "Model structure changed"
+            if sf != sf0:
+                return f"Scaling factor of {c.name} changed"
+        return None
+
+    def rebuild(self):
+        """
+        Create the scaled copy of the model.
+        """
+        self.scaled_model = pyo.TransformationFactory("core.scale_model").create_using(
+            self.model, rename=False
+        )
+
+        orig_vars, orig_cons, orig_params, orig_blocks = self._components(self.model)
+        scaled_vars, scaled_cons, scaled_params, scaled_blocks = self._components(
+            self.scaled_model
+        )
+        suffix_finder = SuffixFinder("scaling_factor", 1.0, self.model)
+        self._vars = [
+            (v, sv, suffix_finder.find(v)) for v, sv in zip(orig_vars, scaled_vars)
+        ]
+        self._constraints = list(zip(orig_cons, scaled_cons))
+        self._params = list(zip(orig_params, scaled_params))
+        self._blocks = list(zip(orig_blocks, scaled_blocks))
+        self._scaled_components_at_build = self._scaled_components()
+
+    def update_scaled_model(self):
+        """
+        Copy the state of the original model into the scaled copy, rebuilding
+        the copy if the structure or the scaling factors of the original model
+        have changed.
+        """
+        reason = self._structure_changed()
+        if reason is not None:
+            _log.info(f"{reason}, rebuilding scaled model.")
+            self.rebuild()
+            return
+
+        for v, sv, sf in self._vars:
+            lb, ub = v.lb, v.ub
+            lb = None if lb is None else lb * sf
+            ub = None if ub is None else ub * sf
+            if sf < 0:
+                lb, ub = ub, lb
+            sv.setlb(lb)
+            sv.setub(ub)
+            sv.set_value(
+                None if v.value is None else v.value * sf, skip_validation=True
+            )
+            sv.fixed = v.fixed
+        for p, sp in self._params:
+            sp.set_value(p.value)
+        for c, sc in self._constraints + self._blocks:
+            if c.active and not sc.active:
+                sc.activate()
+            elif sc.active and not c.active:
+                sc.deactivate()
+
+    def propagate_solution(self):
+        """
+        Copy the values of the Vars in the scaled copy back to the original model.
+        """
+        for v, sv, sf in self._vars:
+            if sv.value is not None:
+                v.set_value(sv.value / sf, skip_validation=True)
+
+    def solve(self, solver=None, **kwds):
+        """
+        Solve the scaled copy and copy the solution back to the original model.
+
+        Args:
+            solver - (optional) solver to use, defaults to get_solver()
+            **kwds - keyword arguments for solver.solve
+
+        Returns:
+            solver results
+        """
+        if solver is None:
+            solver = get_solver()
+        self.update_scaled_model()
+        results = solver.solve(self.scaled_model, **kwds)
+        self.propagate_solution()
+        return results
+
+    def __deepcopy__(self, memo):
+        # A clone of the model builds its own scaled copy when it is first
+        # solved through get_scaled_model_twin
+        return None
+
+
+def get_scaled_model_twin(model):
+    """
+    Get the persistent scaled copy of a model, creating it on first use.
+
+    The ScaledModelTwin is stored on the model, so repeated solves of the
+    same model (e.g. from a UI) reuse the scaled copy.
+
+    Args:
+        model - Pyomo model with scaling_factor suffixes to solve
+
+    Returns:
+        ScaledModelTwin of the model
+    """
+    twin = getattr(model, "_scaled_model_twin", None)
+    if twin is None or twin.model is not model:
+        twin = ScaledModelTwin(model)
+        model._scaled_model_twin = twin
+    return twin
@@ -0,0 +1,159 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains a process-wide registry of pre-trained surrogates, so
+that surrogate files used by many unit models are only loaded once, and
+vectorized evaluation of pre-trained surrogates.
+"""
+
+import os
+import threading
+import weakref
+
+import numpy as np
+
+from pyomo.common.dependencies import pandas as pd
+
+from idaes.core.surrogate.alamopy import AlamoSurrogate
+from idaes.core.surrogate.pysmo_surrogate import PysmoSurrogate
+
+# Maps (absolute path, surrogate class) to (mtime_ns, size, surrogate)
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def load_surrogate(file_path, surrogate_class=PysmoSurrogate):
+    """
+    Load a pre-trained surrogate through the process-wide registry.
+
+    Each file is loaded once per process and loaded again only if its
+    modification time or size changes. All callers share the same surrogate
+    object, which must therefore be treated as read-only (it may be passed
+    to SurrogateBlock.build_model and used with evaluate_surrogate).
+
+    Args:
+        file_path - path to the surrogate file
+        surrogate_class (optional) - surrogate class providing load_from_file,
+                                     defaults to PysmoSurrogate
+
+    Returns:
+        shared surrogate object
+
+    Raises:
+        OSError if the file could not be read
+    """
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    key = (file_path, surrogate_class)
+
+    with _registry_lock:
+        entry = _registry.get(key)
+        if entry is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+            entry = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                surrogate_class.load_from_file(file_path),
+            )
+            _registry[key] = entry
+
+    return entry[2]
+
+
+def clear_surrogate_registry():
+    """
+    Remove all surrogates from the process-wide registry.
+    """
+    with _registry_lock:
+        _registry.clear()
+
+
+# NumPy equivalents of the functions used in ALAMO surrogate expressions
+_ALAMO_NUMPY_FUNCS = {"sin": np.sin, "cos": np.cos, "ln": np.log, "exp": np.exp}
+
+# Vectorized ALAMO output functions, compiled on first use
+_alamo_functions = weakref.WeakKeyDictionary()
+
+
+def _get_alamo_functions(surrogate):
+    try:
+        return _alamo_functions[surrogate]
+    except KeyError:
+        pass
+    functions = []
+    for o in surrogate.output_labels():
+        rhs = surrogate._surrogate_expressions[o].split("==")[1]
+        # The expression string is produced by ALAMO, as in
+        # AlamoSurrogate.evaluate_surrogate
+        # pylint: disable=W0123
+        functions.append(
+            eval(
+                f"lambda {', '.join(surrogate.input_labels())}: {rhs}",
+                dict(_ALAMO_NUMPY_FUNCS),
+            )
+        )
+    _alamo_functions[surrogate] = functions
+    return functions
+
+
+def evaluate_surrogate_batch(surrogate, inputs):
+    """
+    Evaluate a pre-trained surrogate at many points in one call.
+
+    Unlike evaluate_surrogate, which evaluates PySMO and ALAMO surrogates one
+    point at a time, all points are evaluated together with NumPy. Other
+    surrogate types fall back to their evaluate_surrogate method.
+
+    Args:
+        surrogate - PysmoSurrogate, AlamoSurrogate or other IDAES surrogate
+        inputs - array of shape (number of points, number of inputs) with
+                 columns in the order of surrogate.input_labels(), or a
+                 pandas DataFrame with a column for each input label
+
+    Returns:
+        array of shape (number of points, number of outputs) with columns in
+        the order of surrogate.output_labels()
+
+    Raises:
+        ValueError if inputs does not have one column per surrogate input
+    """
+    input_labels = surrogate.input_labels()
+    if isinstance(inputs, pd.DataFrame):
+        inputs = inputs[input_labels].to_numpy()
+    inputs = np.atleast_2d(np.asarray(inputs, dtype=float))
+    if inputs.ndim != 2 or inputs.shape[1] != len(input_labels):
+        raise ValueError(
+            f"Expected inputs with {len(input_labels)} columns "
+            f"({', '.join(input_labels)}) but received an array of shape "
+            f"{inputs.shape}."
+        )
+    n_points = inputs.shape[0]
+
+    if isinstance(surrogate, PysmoSurrogate):
+        return np.column_stack(
+            [
+                np.asarray(
+                    surrogate._trained.get_result(o).model.predict_output(inputs),
+                    dtype=float,
+                ).reshape(n_points)
+                for o in surrogate.output_labels()
+            ]
+        )
+    if isinstance(surrogate, AlamoSurrogate):
+        return np.column_stack(
+            [
+                np.broadcast_to(np.asarray(f(*inputs.T), dtype=float), (n_points,))
+                for f in _get_alamo_functions(surrogate)
+            ]
+        )
+    return surrogate.evaluate_surrogate(
+        pd.DataFrame(inputs, columns=input_labels)
+    ).to_numpy()
@@ -17,7 +17,9 @@ from pyomo.util.check_units import assert_units_equivalent
 
 from watertap.core.util.chemistry import (
     get_charge,
+    get_charges,
     get_molar_mass,
+    get_molar_masses,
     get_molar_mass_quantity,
     get_periodic_table,
 )
@@ -70,6 +72,24 @@ def test_get_mw():
         assert get_molar_mass(solute_name) == mw_value
 
 
+@pytest.mark.unit
+def test_get_mw_and_charge_batch():
+    solutes = ["NaCl", "Na_+", "Cl_-", "Ca_2+", "SO4_2-"]
+    molar_masses = get_molar_masses(solutes)
+    charges = get_charges(solutes)
+    assert molar_masses.tolist() == [get_molar_mass(s) for s in solutes]
+    assert charges.tolist() == [0, 1, -1, 2, -2]
+    assert get_molar_masses([]).shape == (0,)
+
+
+@pytest.mark.unit
+def test_get_mw_matches_periodic_table(periodic_table):
+    for symbol, atomic_mass in zip(
+        periodic_table["Symbol"], periodic_table["AtomicMass"]
+    ):
+        assert get_molar_mass(symbol) == float(atomic_mass)
+
+
 @pytest.mark.unit
 def test_get_mw_exception():
     with pytest.raises(
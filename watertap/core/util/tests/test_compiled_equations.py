@@ -0,0 +1,38 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import numpy as np
+import pytest
+
+from pyomo.common.errors import IterationLimitError
+from pyomo.environ import ConcreteModel, Constraint, Var
+
+from watertap.core.util.compiled_equations import CompiledEquations
+
+
+@pytest.mark.unit
+def test_newton_not_converged():
+    m = ConcreteModel()
+    m.u = Var(initialize=2.0)
+    m.x = Var(initialize=1.0)
+    m.y = Var(initialize=1.0)
+    m.c1 = Constraint(expr=m.x**3 + m.y == m.u)
+    m.c2 = Constraint(expr=m.x - m.y**3 == 0)
+
+    u = [np.array([2.0, 10.0])]
+    equations = CompiledEquations([m.c1, m.c2], [m.u])
+    x, y = equations.evaluate(u, 2)
+    assert x**3 + y == pytest.approx(u[0], rel=1e-10)
+    assert x == pytest.approx(y**3, rel=1e-10)
+
+    equations = CompiledEquations([m.c1, m.c2], [m.u], max_iter=1, name="test")
+    with pytest.raises(IterationLimitError, match="block 0 of test did not"):
+        equations.evaluate(u, 2)
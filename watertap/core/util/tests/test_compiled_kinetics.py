@@ -0,0 +1,192 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import numpy as np
+import pytest
+
+from pyomo.environ import ConcreteModel, Constraint, value
+from pyomo.repn import generate_standard_repn
+
+from idaes.core import FlowsheetBlock
+
+from watertap.core.util.compiled_kinetics import CompiledKinetics, simulate_cstr
+from watertap.property_models.unit_specific.activated_sludge.asm1_properties import (
+    ASM1ParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.asm1_reactions import (
+    ASM1ReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.asm2d_properties import (
+    ASM2dParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.asm2d_reactions import (
+    ASM2dReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.asm3_properties import (
+    ASM3ParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.asm3_reactions import (
+    ASM3ReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.modified_asm2d_properties import (
+    ModifiedASM2dParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.modified_asm2d_reactions import (
+    ModifiedASM2dReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.adm1_properties import (
+    ADM1ParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.adm1_reactions import (
+    ADM1ReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.modified_adm1_properties import (
+    ModifiedADM1ParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.modified_adm1_reactions import (
+    ModifiedADM1ReactionParameterBlock,
+)
+
+packages = [
+    (ASM1ParameterBlock, ASM1ReactionParameterBlock),
+    (ASM2dParameterBlock, ASM2dReactionParameterBlock),
+    (ASM3ParameterBlock, ASM3ReactionParameterBlock),
+    (ModifiedASM2dParameterBlock, ModifiedASM2dReactionParameterBlock),
+    (ADM1ParameterBlock, ADM1ReactionParameterBlock),
+    (ModifiedADM1ParameterBlock, ModifiedADM1ReactionParameterBlock),
+]
+
+
+def build(props, rxn_props):
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.props = props()
+    m.fs.rxn_props = rxn_props(property_package=m.fs.props)
+    return m
+
+
+@pytest.mark.component
+@pytest.mark.parametrize("props, rxn_props", packages)
+def test_compiled_kinetics(props, rxn_props):
+    m = build(props, rxn_props)
+    kinetics = CompiledKinetics(m.fs.rxn_props)
+    assert kinetics.reaction_idx == list(m.fs.rxn_props.rate_reaction_idx)
+    assert "H2O" not in kinetics.component_list
+
+    rng = np.random.default_rng(42)
+    conc = rng.uniform(0.01, 1, (4, len(kinetics.component_list)))
+    state = {}
+    if "temperature" in kinetics.state_vars:
+        state["temperature"] = rng.uniform(283.15, 313.15, 4)
+    results = kinetics.evaluate(conc, **state)
+    rates = kinetics.rates(conc, **state)
+    assert rates.shape == (4, len(kinetics.reaction_idx))
+    assert kinetics.rhs(conc, **state) == pytest.approx(
+        rates @ kinetics.stoichiometry, rel=1e-12
+    )
+
+    # The compiled values satisfy the equations of a Pyomo reaction block
+    m.state = m.fs.props.build_state_block([0], defined_state=True)
+    m.rxn = m.fs.rxn_props.build_reaction_block(
+        [0], state_block=m.state, has_equilibrium=False
+    )
+    m.rxn[0].reaction_rate
+    for n in range(4):
+        for j, c in zip(kinetics.component_list, conc[n]):
+            repn = generate_standard_repn(
+                m.state[0].get_material_density_terms("Liq", j)
+            )
+            repn.linear_vars[0].set_value(c / repn.linear_coefs[0])
+        for name, v in state.items():
+            m.state[0].find_component(name).set_value(v[n])
+        for name, v in results.items():
+            m.rxn[0].find_component(name).set_value(v[n], skip_validation=True)
+        for i, r in enumerate(kinetics.reaction_idx):
+            assert value(m.rxn[0].reaction_rate[r]) == rates[n, i]
+        for c in m.rxn[0].component_data_objects(Constraint, active=True):
+            assert value(c.body) == pytest.approx(value(c.upper), abs=1e-12)
+
+    # Leading dimensions are preserved
+    batch = {name: v.reshape(2, 2) for name, v in state.items()}
+    assert kinetics.rates(conc.reshape(2, 2, -1), **batch) == pytest.approx(
+        rates.reshape(2, 2, -1), rel=1e-12
+    )
+
+
+@pytest.mark.component
+def test_errors():
+    m = build(ASM1ParameterBlock, ASM1ReactionParameterBlock)
+    kinetics = CompiledKinetics(m.fs.rxn_props)
+    assert kinetics.state_vars == {}
+    with pytest.raises(ValueError, match="Expected concentrations of 13 components"):
+        kinetics.rates(np.ones(3))
+    with pytest.raises(KeyError, match="Unknown state variables temperature"):
+        kinetics.rates(np.ones(13), temperature=300)
+
+
+@pytest.mark.component
+def test_update_parameters():
+    m = build(ASM1ParameterBlock, ASM1ReactionParameterBlock)
+    kinetics = CompiledKinetics(m.fs.rxn_props)
+    conc = np.full(len(kinetics.component_list), 0.1)
+    r1 = kinetics.rates(conc)[0]
+
+    m.fs.rxn_props.mu_H.fix(2 * value(m.fs.rxn_props.mu_H))
+    # Parameters are only updated when recompiling
+    assert kinetics.rates(conc)[0] == r1
+    kinetics.update_parameters()
+    assert kinetics.rates(conc)[0] == pytest.approx(2 * r1, rel=1e-12)
+
+
+@pytest.mark.component
+def test_simulate_cstr():
+    m = build(ASM1ParameterBlock, ASM1ReactionParameterBlock)
+    kinetics = CompiledKinetics(m.fs.rxn_props)
+
+    # BSM1 influent
+    influent = {
+        "S_I": 0.03,
+        "S_S": 0.0693,
+        "X_I": 0.0511,
+        "X_S": 0.202,
+        "X_BH": 0.0284,
+        "X_BA": 1e-6,
+        "X_P": 1e-6,
+        "S_O": 2e-3,
+        "S_NO": 1e-6,
+        "S_NH": 0.0315,
+        "S_ND": 0.0069,
+        "X_ND": 0.0106,
+        "S_ALK": 0.084,
+    }
+    conc_in = np.array([influent[j] for j in kinetics.component_list])
+    flow_vol = 0.2  # m^3/s
+    volume = 1e5  # m^3
+    t_end = 100 * volume / flow_vol
+
+    result = simulate_cstr(
+        kinetics,
+        conc_in,
+        (0, t_end),
+        conc_in,
+        flow_vol,
+        volume,
+        hold=["S_O"],
+        rtol=1e-8,
+        atol=1e-12,
+    )
+    conc = result.y[:, -1]
+    assert conc[kinetics.component_list.index("S_O")] == 2e-3
+    # Heterotrophs grow on the substrate
+    assert conc[kinetics.component_list.index("S_S")] < 0.1 * influent["S_S"]
+    # Near steady state
+    dcdt = kinetics.cstr_rhs(conc, conc_in, flow_vol, volume, hold=["S_O"])
+    assert np.max(np.abs(dcdt)) * volume / flow_vol < 1e-8
@@ -0,0 +1,218 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import numpy as np
+import pytest
+
+from pyomo.environ import ConcreteModel, Constraint, units as pyunits, value
+
+from idaes.core import FlowsheetBlock
+
+from watertap.core.util.compiled_translator import CompiledTranslator
+from watertap.property_models.unit_specific.activated_sludge.asm1_properties import (
+    ASM1ParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.modified_asm2d_properties import (
+    ModifiedASM2dParameterBlock,
+)
+from watertap.property_models.unit_specific.activated_sludge.modified_asm2d_reactions import (
+    ModifiedASM2dReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.adm1_properties import (
+    ADM1ParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.adm1_reactions import (
+    ADM1ReactionParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.modified_adm1_properties import (
+    ModifiedADM1ParameterBlock,
+)
+from watertap.property_models.unit_specific.anaerobic_digestion.modified_adm1_reactions import (
+    ModifiedADM1ReactionParameterBlock,
+)
+from watertap.unit_models.translators.translator_adm1_asm1 import (
+    Translator_ADM1_ASM1,
+)
+from watertap.unit_models.translators.translator_adm1_asm2d import (
+    Translator_ADM1_ASM2D,
+)
+from watertap.unit_models.translators.translator_asm1_adm1 import (
+    Translator_ASM1_ADM1,
+)
+from watertap.unit_models.translators.translator_asm2d_adm1 import (
+    Translator_ASM2d_ADM1,
+)
+
+
+def build_asm1_adm1(m):
+    m.fs.props_ASM1 = ASM1ParameterBlock()
+    m.fs.props_ADM1 = ADM1ParameterBlock()
+    m.fs.ADM1_rxn_props = ADM1ReactionParameterBlock(property_package=m.fs.props_ADM1)
+    m.fs.unit = Translator_ASM1_ADM1(
+        inlet_property_package=m.fs.props_ASM1,
+        outlet_property_package=m.fs.props_ADM1,
+        reaction_package=m.fs.ADM1_rxn_props,
+        has_phase_equilibrium=False,
+        outlet_state_defined=True,
+    )
+
+
+def build_adm1_asm1(m):
+    m.fs.props_ASM1 = ASM1ParameterBlock()
+    m.fs.props_ADM1 = ADM1ParameterBlock()
+    m.fs.ADM1_rxn_props = ADM1ReactionParameterBlock(property_package=m.fs.props_ADM1)
+    m.fs.unit = Translator_ADM1_ASM1(
+        inlet_property_package=m.fs.props_ADM1,
+        outlet_property_package=m.fs.props_ASM1,
+        reaction_package=m.fs.ADM1_rxn_props,
+        has_phase_equilibrium=False,
+        outlet_state_defined=True,
+    )
+
+
+def build_modified_packages(m):
+    m.fs.props_ASM2d = ModifiedASM2dParameterBlock()
+    m.fs.ASM2d_rxn_props = ModifiedASM2dReactionParameterBlock(
+        property_package=m.fs.props_ASM2d
+    )
+    m.fs.props_ADM1 = ModifiedADM1ParameterBlock()
+    m.fs.ADM1_rxn_props = ModifiedADM1ReactionParameterBlock(
+        property_package=m.fs.props_ADM1
+    )
+
+
+def build_asm2d_adm1(m, bio_P=False):
+    build_modified_packages(m)
+    m.fs.unit = Translator_ASM2d_ADM1(
+        inlet_property_package=m.fs.props_ASM2d,
+        outlet_property_package=m.fs.props_ADM1,
+        inlet_reaction_package=m.fs.ASM2d_rxn_props,
+        outlet_reaction_package=m.fs.ADM1_rxn_props,
+        has_phase_equilibrium=False,
+        outlet_state_defined=True,
+        bio_P=bio_P,
+    )
+
+
+def build_adm1_asm2d(m):
+    build_modified_packages(m)
+    m.fs.unit = Translator_ADM1_ASM2D(
+        inlet_property_package=m.fs.props_ADM1,
+        outlet_property_package=m.fs.props_ASM2d,
+        inlet_reaction_package=m.fs.ADM1_rxn_props,
+        outlet_reaction_package=m.fs.ASM2d_rxn_props,
+        has_phase_equilibrium=False,
+        outlet_state_defined=True,
+    )
+
+
+translators = [
+    (build_asm1_adm1, {}),
+    (build_adm1_asm1, {}),
+    (build_asm2d_adm1, {"bio_P": False}),
+    (build_asm2d_adm1, {"bio_P": True}),
+    (build_adm1_asm2d, {}),
+]
+
+
+def build(builder, options, time_set=None):
+    m = ConcreteModel()
+    if time_set is None:
+        m.fs = FlowsheetBlock(dynamic=False)
+    else:
+        m.fs = FlowsheetBlock(dynamic=False, time_set=time_set, time_units=pyunits.s)
+    builder(m, **options)
+    return m
+
+
+def random_inlet(unit, rng, n):
+    # Random inlet state in the format of state_args
+    state = {}
+    for name, var in unit.properties_in[0].define_state_vars().items():
+        if name == "flow_vol":
+            values = rng.uniform(0.001, 0.1, n)
+        elif name == "temperature":
+            values = rng.uniform(283.15, 313.15, n)
+        elif name == "pressure":
+            values = np.full(n, 101325.0)
+        elif var.is_indexed():
+            state[name] = {j: rng.uniform(0.001, 5, n) for j in var}
+            continue
+        else:
+            values = rng.uniform(0.001, 0.1, n)
+        state[name] = values
+    return state
+
+
+def assert_residuals(unit, t):
+    for c in unit.component_data_objects(Constraint, active=True):
+        if c.equality and t in (
+            c.index() if isinstance(c.index(), tuple) else (c.index(),)
+        ):
+            assert value(c.body) == pytest.approx(
+                value(c.upper), rel=1e-10, abs=1e-12
+            ), c.name
+
+
+@pytest.mark.component
+@pytest.mark.parametrize("builder, options", translators)
+def test_evaluate(builder, options):
+    m = build(builder, options)
+    unit = m.fs.unit
+    compiled = CompiledTranslator(unit)
+
+    rng = np.random.default_rng(42)
+    inlet = random_inlet(unit, rng, 4)
+    outlet = compiled.evaluate(inlet)
+    assert list(outlet) == list(unit.properties_out[0].define_state_vars())
+
+    # The compiled outlet state satisfies the translator equations
+    for n in range(4):
+        for name, var in unit.properties_in[0].define_state_vars().items():
+            for idx, v in var.items():
+                x = inlet[name] if idx is None else inlet[name][idx]
+                v.set_value(x[n])
+        compiled.propagate()
+        assert_residuals(unit, 0)
+        for name, var in unit.properties_out[0].define_state_vars().items():
+            for idx, v in var.items():
+                x = outlet[name] if idx is None else outlet[name][idx]
+                assert value(v) == pytest.approx(x[n], rel=1e-12, abs=1e-300)
+
+    # Batches keep their shape, and missing values are taken from the model
+    batch = {"flow_vol": inlet["flow_vol"].reshape(2, 2)}
+    outlet = compiled.evaluate(batch)
+    assert outlet["flow_vol"].shape == (2, 2)
+    assert outlet["flow_vol"] == pytest.approx(batch["flow_vol"], rel=1e-12)
+    assert outlet["temperature"] == pytest.approx(
+        value(unit.properties_in[0].temperature), rel=1e-12
+    )
+
+
+@pytest.mark.component
+def test_propagate_time():
+    m = build(build_asm1_adm1, {}, time_set=[0, 10, 20])
+    unit = m.fs.unit
+    for t in m.fs.time:
+        unit.inlet.flow_vol[t].set_value(0.1 + t / 100)
+        unit.inlet.conc_mass_comp[t, "S_S"].set_value(0.1 * (1 + t))
+    CompiledTranslator(unit).propagate()
+    for t in m.fs.time:
+        assert value(unit.outlet.flow_vol[t]) == pytest.approx(0.1 + t / 100)
+        assert_residuals(unit, t)
+
+
+@pytest.mark.component
+def test_errors():
+    m = build(build_adm1_asm1, {})
+    m.fs.unit.properties_out[0].flow_vol.fix(1)
+    with pytest.raises(ValueError, match="do not determine its variables"):
+        CompiledTranslator(m.fs.unit)
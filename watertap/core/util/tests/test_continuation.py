@@ -0,0 +1,158 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+
+import numpy as np
+import pytest
+
+from pyomo.environ import ConcreteModel, Param, Var, Expression
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
+from parameter_sweep import LinearSample
+
+from watertap.core.util.continuation import ContinuationSweep, serpentine_order
+
+
+def _results(optimal):
+    results = SolverResults()
+    results.solver.status = SolverStatus.ok
+    results.solver.termination_condition = (
+        TerminationCondition.optimal if optimal else TerminationCondition.maxIterations
+    )
+    return results
+
+
+class _FakeSolver:
+    def __init__(self):
+        self.options = {}
+
+
+@pytest.fixture
+def model():
+    m = ConcreteModel()
+    m.a = Var(initialize=1.0)
+    m.b = Param(initialize=1.0, mutable=True)
+    m.x = Var(initialize=0.0)
+    m.y = Expression(expr=2 * m.x)
+    return m
+
+
+@pytest.mark.unit
+def test_serpentine_order():
+    assert serpentine_order((2, 3)) == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (1, 2),
+        (1, 1),
+        (1, 0),
+    ]
+
+    order = serpentine_order((3, 2, 2))
+    assert len(order) == len(set(order)) == 12
+    for i, j in zip(order[:-1], order[1:]):
+        assert np.abs(np.subtract(i, j)).sum() == 1
+
+
+@pytest.mark.unit
+def test_continuation_sweep(model):
+    starts = []
+    warm_options = []
+
+    def optimize(m, solver=None):
+        # Record the starting point and "solve" x = a * b
+        starts.append(m.x.value)
+        warm_options.append("warm_start_init_point" in solver.options)
+        m.x.value = m.a.value * m.b.value
+        return _results(True)
+
+    sweep = ContinuationSweep(
+        model,
+        {
+            "a": LinearSample(model.a, 1, 3, 3),
+            "b": LinearSample(model.b, 10, 20, 2),
+        },
+        {"x": model.x, "y": model.y},
+        optimize_function=optimize,
+        solver=_FakeSolver(),
+    )
+    df = sweep.run()
+
+    assert list(df["a"]) == [1, 1, 2, 2, 3, 3]
+    assert list(df["b"]) == [10, 20, 10, 20, 10, 20]
+    assert list(df["x"]) == pytest.approx(df["a"] * df["b"])
+    assert list(df["y"]) == pytest.approx(2 * df["a"] * df["b"])
+    assert df["converged"].all()
+    assert list(df["solve_count"]) == [1] * 6
+    assert list(df["solve_order"]) == [0, 1, 3, 2, 4, 5]
+    assert (df["solve_time"] >= 0).all()
+
+    # Each point starts from its nearest converged neighbor, with distances
+    # scaled by the range of each sweep parameter
+    assert starts == [0, 10, 20, 10, 20, 40]
+    # No duals were imported by the fake solver, so no warm start options
+    assert not any(warm_options)
+    assert "warm_start_init_point" not in sweep.solver.options
+    assert model.component("dual") is not None
+
+
+@pytest.mark.unit
+def test_continuation_sweep_reinitialize(model):
+    reinitialized = []
+
+    def optimize(m, solver=None):
+        # Fail whenever the starting point has not been re-initialized
+        if m.x.value != -1:
+            return _results(False)
+        m.x.value = m.a.value
+        return _results(True)
+
+    def reinitialize(m, guess=None):
+        reinitialized.append(m.a.value)
+        m.x.value = guess
+
+    sweep = ContinuationSweep(
+        model,
+        {"a": LinearSample(model.a, 1, 2, 2)},
+        {"x": model.x},
+        optimize_function=optimize,
+        reinitialize_function=reinitialize,
+        reinitialize_kwargs={"guess": -1},
+        solver=_FakeSolver(),
+        warm_start_duals=False,
+    )
+    df = sweep.run()
+
+    assert reinitialized == [1, 2]
+    assert list(df["solve_count"]) == [2, 2]
+    assert list(df["x"]) == [1, 2]
+    assert model.component("dual") is None
+
+
+@pytest.mark.unit
+def test_continuation_sweep_failure(model):
+    def optimize(m, solver=None):
+        if m.a.value > 1:
+            raise RuntimeError("Solver failed")
+        return _results(True)
+
+    sweep = ContinuationSweep(
+        model,
+        {"a": LinearSample(model.a, 1, 2, 2)},
+        {"x": model.x},
+        optimize_function=optimize,
+        solver=_FakeSolver(),
+    )
+    df = sweep.run()
+
+    assert list(df["converged"]) == [True, False]
+    assert list(df["solve_count"]) == [1, 2]
+    assert df["x"][0] == 0
+    assert np.isnan(df["x"][1])
@@ -13,7 +13,8 @@
 import re
 import pytest
 from pyomo.common.errors import InfeasibleConstraintException
-from pyomo.environ import ConcreteModel, Var, Constraint, ConstraintList
+from pyomo.environ import ConcreteModel, Var, Constraint, ConstraintList, value
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
 from idaes.core.util.exceptions import InitializationError
 from watertap.core.solvers import get_solver
 from watertap.core.util.initialization import (
@@ -21,8 +22,11 @@ from watertap.core.util.initialization import (
     assert_degrees_of_freedom,
     assert_no_degrees_of_freedom,
     check_solve,
+    direct_initializer,
     interval_initializer,
+    solve_linear_blocks,
 )
+from watertap.core.util import initialization
 import idaes.logger as idaeslog
 
 __author__ = "Adam Atia"
@@ -259,3 +263,78 @@ class TestIntervalImproveInitial:
         assert m.y.ub == None
         assert m.z.lb == None
         assert m.z.ub == None
+
+
+def _build_recycle():
+    m = ConcreteModel()
+    m.feed = Var(initialize=10)
+    m.feed.fix()
+    m.split_frac = Var(initialize=0.3)
+    m.split_frac.fix()
+    m.x = Var(range(4), initialize=1, bounds=(0, None))
+    # Mixer, unit with 80 % recovery and split of the byproduct to a recycle
+    m.mixer = Constraint(expr=m.x[0] == m.feed + m.x[3])
+    m.recovery = Constraint(expr=m.x[1] == 0.8 * m.x[0])
+    m.byproduct = Constraint(expr=m.x[2] == m.x[0] - m.x[1])
+    m.recycle = Constraint(expr=m.x[3] == m.split_frac * m.x[2])
+    m.power = Var(initialize=1)
+    m.power_eq = Constraint(expr=m.power == 2 * m.x[1] ** 2)
+    return m
+
+
+class TestSolveLinearBlocks:
+    @pytest.mark.unit
+    def test_recycle(self):
+        m = _build_recycle()
+
+        assert solve_linear_blocks(m) == []
+        x0 = 10 / (1 - 0.3 * 0.2)
+        assert value(m.x[0]) == pytest.approx(x0, rel=1e-12)
+        assert value(m.x[1]) == pytest.approx(0.8 * x0, rel=1e-12)
+        assert value(m.x[3]) == pytest.approx(0.3 * 0.2 * x0, rel=1e-12)
+        assert value(m.power) == pytest.approx(2 * (0.8 * x0) ** 2, rel=1e-12)
+
+    @pytest.mark.unit
+    def test_unsolved(self):
+        m = _build_recycle()
+        m.y = Var(range(2), initialize=1)
+        m.n1 = Constraint(expr=m.y[0] ** 2 + m.y[1] == 3)
+        m.n2 = Constraint(expr=m.y[0] - m.y[1] ** 2 == 0)
+
+        # Nonlinear blocks of several variables are left unsolved
+        assert solve_linear_blocks(m) == [m.n1, m.n2]
+        assert value(m.x[0]) == pytest.approx(10 / (1 - 0.3 * 0.2), rel=1e-12)
+
+        # Solutions outside the variable bounds are not accepted
+        m = _build_recycle()
+        m.feed.fix(-10)
+        unsolved = solve_linear_blocks(m)
+        assert m.mixer in unsolved and m.recycle in unsolved
+        assert m.power_eq not in unsolved
+
+    @pytest.mark.unit
+    def test_direct_initializer(self, monkeypatch):
+        class _Solver:
+            calls = 0
+
+            def solve(self, blk):
+                _Solver.calls += 1
+                results = SolverResults()
+                results.solver.status = SolverStatus.ok
+                results.solver.termination_condition = TerminationCondition.optimal
+                return results
+
+        monkeypatch.setattr(
+            initialization, "get_solver", lambda solver, optarg: _Solver()
+        )
+
+        m = _build_recycle()
+        assert direct_initializer(m) is None
+        assert _Solver.calls == 0
+
+        m.y = Var(range(2), initialize=1)
+        m.n1 = Constraint(expr=m.y[0] ** 2 + m.y[1] == 3)
+        m.n2 = Constraint(expr=m.y[0] - m.y[1] ** 2 == 0)
+        results = direct_initializer(m)
+        assert results.solver.termination_condition == TerminationCondition.optimal
+        assert _Solver.calls == 1
@@ -0,0 +1,150 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import pandas as pd
+import pytest
+
+from pyomo.environ import ConcreteModel, value
+
+from idaes.core import FlowsheetBlock
+import idaes.core.util.scaling as iscale
+
+import watertap.property_models.NaCl_prop_pack as props
+from watertap.core.util.mesh_continuation import (
+    get_length_sets,
+    mesh_refinement_study,
+    select_mesh,
+    transfer_length_profiles,
+)
+from watertap.unit_models.reverse_osmosis_1D import (
+    ConcentrationPolarizationType,
+    MassTransferCoefficient,
+    PressureChangeType,
+    ReverseOsmosis1D,
+)
+
+
+def build_RO(finite_elements):
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.properties = props.NaClParameterBlock()
+    m.fs.unit = ReverseOsmosis1D(
+        property_package=m.fs.properties,
+        has_pressure_change=True,
+        concentration_polarization_type=ConcentrationPolarizationType.calculated,
+        mass_transfer_coefficient=MassTransferCoefficient.calculated,
+        pressure_change_type=PressureChangeType.calculated,
+        transformation_scheme="BACKWARD",
+        transformation_method="dae.finite_difference",
+        finite_elements=finite_elements,
+    )
+
+    feed_flow_mass = 1
+    feed_mass_frac_NaCl = 0.035
+    m.fs.unit.inlet.flow_mass_phase_comp[0, "Liq", "NaCl"].fix(
+        feed_flow_mass * feed_mass_frac_NaCl
+    )
+    m.fs.unit.inlet.flow_mass_phase_comp[0, "Liq", "H2O"].fix(
+        feed_flow_mass * (1 - feed_mass_frac_NaCl)
+    )
+    m.fs.unit.inlet.pressure[0].fix(50e5)
+    m.fs.unit.inlet.temperature[0].fix(298.15)
+    m.fs.unit.A_comp.fix(4.2e-12)
+    m.fs.unit.B_comp.fix(3.5e-8)
+    m.fs.unit.permeate.pressure[0].fix(101325)
+    m.fs.unit.length.fix(8)
+    m.fs.unit.recovery_vol_phase[0, "Liq"].fix(0.4)
+    m.fs.unit.feed_side.spacer_porosity.fix(0.97)
+    m.fs.unit.feed_side.channel_height.fix(0.001)
+
+    m.fs.properties.set_default_scaling("flow_mass_phase_comp", 1, index=("Liq", "H2O"))
+    m.fs.properties.set_default_scaling(
+        "flow_mass_phase_comp", 1e2, index=("Liq", "NaCl")
+    )
+    iscale.calculate_scaling_factors(m)
+    return m
+
+
+@pytest.mark.component
+def test_transfer_length_profiles():
+    coarse = build_RO(4)
+    fine = build_RO(8)
+
+    assert len(get_length_sets(coarse.fs.unit)) == 2
+
+    def pressure(x):
+        return 50e5 - 2e5 * x
+
+    def flux(x):
+        return 0.01 - 0.005 * x
+
+    unit = coarse.fs.unit
+    for x in unit.length_domain:
+        unit.feed_side.properties[0, x].pressure.set_value(pressure(x))
+    for x in unit.difference_elements:
+        unit.flux_mass_phase_comp[0, x, "Liq", "H2O"].set_value(flux(x))
+    unit.width.set_value(12.3)
+
+    n_set = transfer_length_profiles(coarse, fine)
+    assert n_set > 0
+
+    unit = fine.fs.unit
+    # Profiles are interpolated onto the new points
+    for x in unit.length_domain:
+        if x == unit.length_domain.first():
+            # Inlet state is fixed and not changed
+            assert value(unit.feed_side.properties[0, x].pressure) == 50e5
+        else:
+            assert value(unit.feed_side.properties[0, x].pressure) == pytest.approx(
+                pressure(x), rel=1e-12
+            )
+    # Values before the first coarse point are held at its value
+    x_coarse = coarse.fs.unit.difference_elements.first()
+    assert unit.difference_elements.first() < x_coarse
+    for x in unit.difference_elements:
+        assert value(unit.flux_mass_phase_comp[0, x, "Liq", "H2O"]) == pytest.approx(
+            flux(max(x, x_coarse)), rel=1e-12
+        )
+    # Variables not indexed by length are copied, fixed variables are kept
+    assert value(unit.width) == 12.3
+    assert value(unit.length) == 8
+
+
+@pytest.mark.unit
+def test_select_mesh():
+    study = pd.DataFrame(
+        {
+            "recovery_rel_error": [1e-2, 2e-3, 4e-4, 0],
+            "deltaP_rel_error": [5e-2, 8e-3, 1e-3, 0],
+        },
+        index=pd.Index([5, 10, 20, 40], name="finite_elements"),
+    )
+    assert select_mesh(study, 1e-2) == 10
+    assert select_mesh(study, 1e-3) == 20
+    assert select_mesh(study, 0) == 40
+
+
+@pytest.mark.component
+def test_mesh_refinement_study():
+    study = mesh_refinement_study(
+        build_RO,
+        [5, 10, 20],
+        outputs={
+            "recovery": lambda m: m.fs.unit.recovery_mass_phase_comp[0, "Liq", "H2O"],
+            "deltaP": lambda m: m.fs.unit.deltaP[0],
+        },
+        initialize_model=lambda m: m.fs.unit.initialize(),
+    )
+    assert list(study.index) == [5, 10, 20]
+    assert (study["termination_condition"] == "optimal").all()
+    assert study["recovery_rel_error"].iloc[-1] == 0
+    assert study["deltaP_rel_error"].iloc[0] < 0.05
+    assert select_mesh(study, 1) == 5
@@ -0,0 +1,179 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import threading
+import types
+
+import pytest
+
+import pyomo.environ as pyo
+from pyomo.common.dependencies import attempt_import
+
+from watertap.core.util.model_pool import (
+    FlowsheetModelPool,
+    clear_model_pools,
+    get_model_pool,
+)
+
+api, api_available = attempt_import("idaes_flowsheet_processor.api")
+
+build_count = 0
+
+
+def build_flowsheet(build_options=None, **kwargs):
+    global build_count
+    build_count += 1
+    m = pyo.ConcreteModel()
+    m.fs = pyo.Block()
+    m.fs.x = pyo.Var(initialize=2.0, bounds=(0, 10))
+    m.fs.y = pyo.Var(initialize=4.0)
+    m.fs.x.fix()
+    m.fs.k = pyo.Param(initialize=3.0, mutable=True)
+    m.fs.eq = pyo.Constraint(expr=m.fs.y == 2 * m.fs.x)
+    m.fs.obj = pyo.Objective(expr=m.fs.y)
+    m.fs.sub = pyo.Block()
+    m.fs.sub.eq = pyo.Constraint(expr=m.fs.y <= 100)
+    m.fs.sub.deactivate()
+    m.fs.z = pyo.Expression(expr=m.fs.k * m.fs.y)
+    return m
+
+
+def export_variables(flowsheet=None, exports=None, build_options=None, **kwargs):
+    fs = flowsheet
+    exports.add(obj=fs.x, name="x", ui_units=pyo.units.dimensionless, is_input=True)
+    exports.add(obj=fs.y, name="y", ui_units=pyo.units.dimensionless, is_output=True)
+    exports.add(obj=fs.z, name="z", ui_units=pyo.units.dimensionless, is_output=True)
+
+
+def solve_flowsheet(flowsheet=None):
+    pass
+
+
+def export_to_ui():
+    return api.FlowsheetInterface(
+        name="test",
+        do_export=export_variables,
+        do_build=build_flowsheet,
+        do_solve=solve_flowsheet,
+    )
+
+
+@pytest.mark.skipif(not api_available, reason="idaes-flowsheet-processor not available")
+@pytest.mark.unit
+def test_model_pool():
+    global build_count
+    build_count = 0
+    pool = FlowsheetModelPool(export_to_ui, size=3)
+
+    # Only one build, the other members are clones
+    assert build_count == 1
+    assert pool.available == 3
+
+    members = [pool.acquire() for _ in range(3)]
+    assert pool.available == 0
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.01)
+
+    models = [fi.fs_exp.m for fi in members]
+    assert len(set(map(id, models))) == 3
+    for fi in members:
+        # Exports refer to the model of their own interface
+        exports = fi.fs_exp.exports
+        assert exports["fs.x"].obj is fi.fs_exp.obj.x
+        assert exports["fs.z"].obj is fi.fs_exp.obj.z
+        assert exports["fs.x"].value == pytest.approx(2.0)
+
+    # Changing one member does not affect the others
+    fs = members[1].fs_exp.obj
+    fs.x.fix(5.0)
+    fs.y.set_value(10.0)
+    fs.y.fix()
+    fs.x.setub(20)
+    fs.k.set_value(1.5)
+    fs.eq.deactivate()
+    fs.obj.deactivate()
+    fs.sub.activate()
+    members[1].export_values()
+    assert members[1].fs_exp.exports["fs.z"].value == pytest.approx(15.0)
+    assert pyo.value(members[0].fs_exp.obj.x) == pytest.approx(2.0)
+    assert pyo.value(members[2].fs_exp.obj.z) == pytest.approx(12.0)
+
+    # Releasing resets to the baseline
+    for fi in members:
+        pool.release(fi)
+    assert pool.available == 3
+    assert fs.x.value == pytest.approx(2.0)
+    assert fs.x.fixed
+    assert fs.x.ub == 10
+    assert fs.y.value == pytest.approx(4.0)
+    assert not fs.y.fixed
+    assert pyo.value(fs.k) == pytest.approx(3.0)
+    assert fs.eq.active
+    assert fs.obj.active
+    assert not fs.sub.active
+    assert members[1].fs_exp.exports["fs.z"].value == pytest.approx(12.0)
+
+    with pool.member() as fi:
+        assert pool.available == 2
+        fi.fs_exp.obj.x.fix(1.0)
+    assert pool.available == 3
+    assert fi.fs_exp.obj.x.value == pytest.approx(2.0)
+
+    with pytest.raises(ValueError, match="does not belong to this pool"):
+        pool.release(export_to_ui())
+
+    with pytest.raises(ValueError, match="Pool size must be at least 1"):
+        FlowsheetModelPool(export_to_ui, size=0)
+
+
+@pytest.mark.skipif(not api_available, reason="idaes-flowsheet-processor not available")
+@pytest.mark.unit
+def test_get_model_pool():
+    # The build of one flowsheet does not block building another
+    slow_started = threading.Event()
+    other_built = threading.Event()
+    waited = []
+
+    def build_slow(build_options=None, **kwargs):
+        slow_started.set()
+        waited.append(other_built.wait(timeout=30))
+        return build_flowsheet()
+
+    def build_other(build_options=None, **kwargs):
+        other_built.set()
+        return build_flowsheet()
+
+    def ui_module(name, do_build):
+        module = types.ModuleType(name)
+        module.export_to_ui = lambda: api.FlowsheetInterface(
+            name=name,
+            do_export=export_variables,
+            do_build=do_build,
+            do_solve=solve_flowsheet,
+        )
+        return module
+
+    slow = ui_module("slow_ui", build_slow)
+    other = ui_module("other_ui", build_other)
+    try:
+        pools = {}
+        thread = threading.Thread(
+            target=lambda: pools.setdefault("slow", get_model_pool(slow))
+        )
+        thread.start()
+        assert slow_started.wait(timeout=30)
+        pool = get_model_pool(other)
+        thread.join()
+        assert waited == [True]
+        assert get_model_pool(other) is pool
+        assert get_model_pool(slow) is pools["slow"]
+    finally:
+        clear_model_pools()
@@ -0,0 +1,98 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+
+import os
+import pytest
+
+from pyomo.environ import Block, ConcreteModel, Var
+
+from watertap.core.util.model_state import (
+    ModelStateStore,
+    get_model_state,
+    set_model_state,
+)
+
+
+def _build():
+    m = ConcreteModel()
+    m.fs = Block()
+    m.fs.flow = Var([1, 2], initialize=1.0)
+    m.fs.conc = Var(initialize=2.0)
+    m.fs.inlet = Var(initialize=3.0)
+    m.fs.inlet.fix()
+    m.fs.empty = Var()
+    return m
+
+
+@pytest.mark.unit
+def test_get_set_model_state():
+    m = _build()
+    m.fs.flow[2].value = 5.0
+
+    state = get_model_state(m.fs)
+    assert state == {"flow[1]": 1.0, "flow[2]": 5.0, "conc": 2.0, "inlet": 3.0}
+
+    m2 = _build()
+    m2.fs.inlet.fix(4.0)
+    assert set_model_state(m2.fs, state, scaling={"flow": 2}) == 3
+    assert m2.fs.flow[1].value == 2.0
+    assert m2.fs.flow[2].value == 10.0
+    assert m2.fs.conc.value == 2.0
+    # fixed Vars are not changed by default
+    assert m2.fs.inlet.value == 4.0
+
+    assert set_model_state(m2.fs, state, include_fixed=True) == 4
+    assert m2.fs.inlet.value == 3.0
+
+
+@pytest.mark.unit
+def test_model_state_store(tmp_path):
+    store = ModelStateStore(tmp_path, max_entries=2)
+    config = {"stages": 2, "flag": True}
+
+    m = _build()
+    assert not store.restore(m.fs, config, {"Q": 1.0})
+    assert store.nearest(config, {"Q": 1.0}) == (None, None)
+
+    store.save(m.fs, config, {"Q": 1.0, "C": 10.0})
+    m.fs.conc.value = 20.0
+    store.save(m.fs, config, {"Q": 1.0, "C": 20.0})
+    assert len(os.listdir(tmp_path)) == 1
+    assert ModelStateStore.make_key(config) == ModelStateStore.make_key(
+        {"flag": True, "stages": 2}
+    )
+
+    point, state = store.nearest(config, {"Q": 1.0, "C": 18.0})
+    assert point == {"Q": 1.0, "C": 20.0}
+    assert state["conc"] == 20.0
+
+    # saving the same operating point replaces the entry
+    m.fs.conc.value = 21.0
+    store.save(m.fs, config, {"Q": 1.0, "C": 20.0})
+    assert store.nearest(config, {"Q": 1.0, "C": 18.0})[1]["conc"] == 21.0
+    assert store.nearest(config, {"Q": 1.0, "C": 11.0})[1]["conc"] == 2.0
+
+    # oldest entries are dropped beyond max_entries
+    store.save(m.fs, config, {"Q": 1.0, "C": 30.0})
+    assert store.nearest(config, {"Q": 1.0, "C": 11.0})[0]["C"] == 20.0
+
+    # other configurations are stored separately
+    assert store.nearest({"stages": 3, "flag": True}, {"Q": 1.0, "C": 20.0}) == (
+        None,
+        None,
+    )
+
+    m2 = _build()
+    assert store.restore(m2.fs, config, {"Q": 3.0, "C": 30.0}, {"Q": ["flow"]})
+    assert m2.fs.flow[1].value == pytest.approx(3.0)
+    assert m2.fs.conc.value == 21.0
+    assert m2.fs.empty.value is None
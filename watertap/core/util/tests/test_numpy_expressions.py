@@ -0,0 +1,81 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import numpy as np
+import pytest
+
+from pyomo.common.collections import ComponentMap
+from pyomo.core.expr import numeric_expr
+from pyomo.environ import (
+    ConcreteModel,
+    Expression,
+    Expr_if,
+    Param,
+    Var,
+    asin,
+    exp,
+    value,
+)
+
+from watertap.core.util.numpy_expressions import (
+    NumPyCodeVisitor,
+    compile_numpy_function,
+)
+
+
+def compile_expression(expr, variables, named=None):
+    names = ComponentMap((v, f"x[{i}]") for i, v in enumerate(variables))
+    lines = ["def _f(x):"]
+    code, const = NumPyCodeVisitor(names.get, named, lines).walk_expression(expr)
+    lines.append(f"    return {code}")
+    return compile_numpy_function(lines, "_f", "<test>"), lines, const
+
+
+@pytest.mark.unit
+def test_numpy_code_visitor():
+    m = ConcreteModel()
+    m.x = Var(initialize=0.2)
+    m.y = Var(initialize=3.0)
+    m.z = Var(initialize=2.0)
+    m.z.fix()
+    m.p = Param(initialize=4.0, mutable=True)
+    m.e = Expression(expr=m.x * m.p + 1)
+
+    exprs = [
+        m.e + m.e**2,
+        asin(m.x) + exp(-m.y) / m.z,
+        numeric_expr.MaxExpression((m.x, 0.5, m.y - 2)),
+        numeric_expr.MinExpression((m.x, 0.1)),
+        Expr_if(IF=m.x <= m.y, THEN=m.x, ELSE=m.y),
+        abs(m.x - m.y),
+    ]
+    x = np.array([[0.2, 0.5, -0.3], [3.0, 1.0, 2.5]])
+    for expr in exprs:
+        f, _, const = compile_expression(expr, [m.x, m.y])
+        assert not const
+        for n in range(3):
+            m.x.set_value(x[0, n])
+            m.y.set_value(x[1, n])
+            assert f(x)[n] == pytest.approx(value(expr), rel=1e-12)
+
+    # Named expressions are evaluated once to temporaries
+    named = ComponentMap()
+    f, lines, _ = compile_expression(m.e + m.e**2, [m.x, m.y], named)
+    assert lines[1] == "    _e0 = ((4.0 * x[0]) + 1.0)"
+    assert named[m.e] == ("_e0", False)
+
+    # Fixed variables and parameters are folded to constants
+    f, _, const = compile_expression(m.z * m.p + 1, [m.x, m.y])
+    assert const
+    assert f(x) == 9.0
+
+    with pytest.raises(ValueError, match="y is not an input"):
+        compile_expression(m.x + m.y, [m.x])
@@ -0,0 +1,137 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from pyomo.environ import (
+    Block,
+    ConcreteModel,
+    Constraint,
+    TransformationFactory,
+    Var,
+)
+from pyomo.network import Arc, Port
+
+from watertap.core.util.parallel_initialization import (
+    ParallelSequentialDecomposition,
+)
+
+
+def _add_unit(m, name, inlets, outlets, gain):
+    b = Block()
+    m.add_component(name, b)
+    b.gain = gain
+    b.flag = Var(initialize=0)
+    b.flag_eq = Constraint(expr=b.flag == 0)
+    for p in inlets + outlets:
+        b.add_component(p + "_x", Var(initialize=0))
+        b.add_component(p, Port(initialize={"x": b.component(p + "_x")}))
+    return b
+
+
+def _build():
+    # src -> (a, b) -> mix -> recycle back to a
+    m = ConcreteModel()
+    _add_unit(m, "src", [], ["out_a", "out_b"], 1)
+    _add_unit(m, "a", ["inlet", "recycle"], ["outlet"], 2)
+    _add_unit(m, "b", ["inlet"], ["outlet"], 3)
+    _add_unit(m, "mix", ["in_a", "in_b"], ["outlet"], 1)
+    m.src.out_a_x.fix(1)
+    m.src.out_b_x.fix(1)
+    m.s1 = Arc(source=m.src.out_a, destination=m.a.inlet)
+    m.s2 = Arc(source=m.src.out_b, destination=m.b.inlet)
+    m.s3 = Arc(source=m.a.outlet, destination=m.mix.in_a)
+    m.s4 = Arc(source=m.b.outlet, destination=m.mix.in_b)
+    m.s5 = Arc(source=m.mix.outlet, destination=m.a.recycle)
+    TransformationFactory("network.expand_arcs").apply_to(m)
+    return m
+
+
+def _unit_function(unit):
+    time.sleep(0.2)
+    inlets = [
+        v
+        for v in unit.component_objects(Var, descend_into=False)
+        if not v.local_name.startswith("out")
+    ]
+    total = sum(v.value for v in inlets if v.local_name != "outlet_x")
+    for name in ("outlet_x", "out_a_x", "out_b_x"):
+        v = unit.component(name)
+        if v is not None and not v.fixed:
+            v.set_value(unit.gain * total)
+    # changes to fixed flags and activation are kept
+    unit.flag.fix(1)
+    unit.flag_eq.deactivate()
+    # record which process ran the unit
+    unit.pid = os.getpid()
+
+
+def _run(max_workers, function=_unit_function, mp_context=None):
+    m = _build()
+    seq = ParallelSequentialDecomposition(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        tear_set=[m.s5],
+        solve_tears=False,
+    )
+    seq.set_guesses_for(m.a.recycle, {"x": 0.5})
+    seq.run(m, function)
+    return m, seq
+
+
+@pytest.mark.unit
+def test_serial():
+    m, seq = _run(1)
+
+    assert m.a.outlet_x.value == pytest.approx(2 * (1 + 0.5))
+    assert m.b.outlet_x.value == pytest.approx(3)
+    assert m.mix.outlet_x.value == pytest.approx(6)
+    assert set(seq.unit_timings) == {"src", "a", "b", "mix"}
+    assert m.a.pid == os.getpid()
+
+
+@pytest.mark.component
+@pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="Test relies on the fork start method"
+)
+def test_parallel():
+    m_serial, _ = _run(1)
+    m, seq = _run(2)
+
+    for v_serial, v in zip(
+        m_serial.component_data_objects(Var), m.component_data_objects(Var)
+    ):
+        assert v.value == pytest.approx(v_serial.value)
+
+    # a and b are in the same level and are run in worker processes
+    assert not hasattr(m.a, "pid")
+    for unit in (m.a, m.b):
+        assert unit.flag.fixed
+        assert not unit.flag_eq.active
+    summary = seq.timing_summary()
+    assert set(summary) == {"src", "a", "b", "mix"}
+    assert all(s["runs"] == 1 for s in summary.values())
+
+
+@pytest.mark.component
+def test_spawn_falls_back_to_serial():
+    def function(unit):
+        # a nested function cannot be pickled for spawned workers
+        _unit_function(unit)
+
+    m, seq = _run(2, function, multiprocessing.get_context("spawn"))
+    assert m.mix.outlet_x.value == pytest.approx(6)
+    assert m.a.pid == os.getpid()
@@ -23,6 +23,7 @@ from idaes.core.util.scaling import (
 import idaes.core.util.scaling as iscale
 from watertap.core.solvers import get_solver
 
+from watertap.core.util.scaling import ScaledModelTwin, get_scaled_model_twin
 import watertap.property_models.NaCl_prop_pack as props
 
 import idaes.logger as idaeslog
@@ -146,3 +147,110 @@ class TestScaling:
             "If there was a property constraint written for the variable"
             not in caplog.text
         )
+
+
+class _FakeSolver:
+    """Sets every free Var of the scaled model to a known scaled value"""
+
+    def __init__(self):
+        self.models = []
+
+    def solve(self, blk, **kwds):
+        self.models.append(blk)
+        for v in blk.component_data_objects(pyo.Var, descend_into=True):
+            if not v.fixed:
+                v.set_value(42.0, skip_validation=True)
+        return "results"
+
+
+@pytest.mark.unit
+def test_scaled_model_twin():
+    m = ConcreteModel()
+    m.b = pyo.Block()
+    m.b.x = pyo.Var(initialize=1.0, bounds=(0, 10))
+    m.b.y = pyo.Var(initialize=2.0)
+    m.b.p = pyo.Param(initialize=3.0, mutable=True)
+    m.b.c = pyo.Constraint(expr=m.b.x == m.b.p * m.b.y)
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.b.x] = 10
+    m.scaling_factor[m.b.y] = -2
+
+    twin = ScaledModelTwin(m)
+    scaled = twin.scaled_model
+    assert scaled.b.x.value == pytest.approx(10)
+    assert scaled.b.x.bounds == (0, 100)
+
+    solver = _FakeSolver()
+    assert twin.solve(solver=solver) == "results"
+    assert solver.models == [scaled]
+    assert m.b.x.value == pytest.approx(4.2)
+    assert m.b.y.value == pytest.approx(-21)
+
+    # changes to the original model are copied into the same scaled model
+    m.b.y.fix(1.0)
+    m.b.x.setub(5)
+    m.b.p.set_value(7.0)
+    m.b.c.deactivate()
+    twin.update_scaled_model()
+    assert twin.scaled_model is scaled
+    assert scaled.b.y.fixed
+    assert scaled.b.y.value == pytest.approx(-2)
+    assert scaled.b.x.bounds == (0, 50)
+    assert scaled.b.p.value == 7.0
+    assert not scaled.b.c.active
+
+    twin.solve(solver=solver)
+    assert m.b.y.value == pytest.approx(1.0)
+    assert m.b.x.value == pytest.approx(4.2)
+
+    # adding a constraint rebuilds the scaled model
+    m.b.c.activate()
+    m.b.c2 = pyo.Constraint(expr=m.b.x <= 4)
+    twin.solve(solver=solver)
+    assert twin.scaled_model is not scaled
+    assert twin.scaled_model.b.component("c2") is not None
+
+    # changing a scaling factor rebuilds the scaled model
+    scaled = twin.scaled_model
+    twin.solve(solver=solver)
+    assert twin.scaled_model is scaled
+    m.scaling_factor[m.b.c2] = 0.5
+    twin.solve(solver=solver)
+    assert twin.scaled_model is not scaled
+
+
+@pytest.mark.unit
+def test_get_scaled_model_twin(monkeypatch):
+    m = ConcreteModel()
+    m.x = pyo.Var(initialize=1.0)
+    m.c = pyo.Constraint(expr=m.x == 2)
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.x] = 10
+
+    rebuilds = []
+    rebuild = ScaledModelTwin.rebuild
+    monkeypatch.setattr(
+        ScaledModelTwin,
+        "rebuild",
+        lambda self: rebuilds.append(self) or rebuild(self),
+    )
+
+    solver = _FakeSolver()
+    twin = get_scaled_model_twin(m)
+    twin.solve(solver=solver)
+    m.x.setub(5)
+    get_scaled_model_twin(m).solve(solver=solver)
+    # the second solve reuses the scaled copy without cloning the model
+    assert get_scaled_model_twin(m) is twin
+    assert rebuilds == [twin]
+    assert solver.models == [twin.scaled_model] * 2
+
+    # a clone of the model gets its own scaled copy
+    m2 = m.clone()
+    twin2 = get_scaled_model_twin(m2)
+    assert twin2 is not twin
+    assert twin2.model is m2
+    twin2.solve(solver=solver)
+    assert m2.x.value == pytest.approx(4.2)
+    assert m.x.value == pytest.approx(4.2)
+    assert solver.models[-1] is twin2.scaled_model
@@ -0,0 +1,156 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from idaes.core.surrogate.alamopy import AlamoSurrogate
+
+from watertap.core.util import surrogate_registry
+from watertap.core.util.surrogate_registry import (
+    clear_surrogate_registry,
+    evaluate_surrogate_batch,
+    load_surrogate,
+)
+from watertap.unit_models.gac import min_N_St_surr_path, throughput_surr_path
+
+metab_surr_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "..",
+    "flowsheets",
+    "METAB",
+    "alamo_surrogate.json",
+)
+
+
+class _CountingSurrogate:
+    loads = 0
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    @classmethod
+    def load_from_file(cls, file_path):
+        cls.loads += 1
+        return cls(file_path)
+
+
+@pytest.mark.unit
+def test_load_surrogate(tmp_path):
+    clear_surrogate_registry()
+    _CountingSurrogate.loads = 0
+    file_path = tmp_path / "surrogate.json"
+    file_path.write_text("{}")
+
+    surr = load_surrogate(file_path, surrogate_class=_CountingSurrogate)
+    assert _CountingSurrogate.loads == 1
+    assert load_surrogate(str(file_path), surrogate_class=_CountingSurrogate) is surr
+    assert _CountingSurrogate.loads == 1
+
+    # Concurrent callers share one load
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                load_surrogate(file_path, surrogate_class=_CountingSurrogate)
+            )
+        )
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(r is surr for r in results)
+    assert _CountingSurrogate.loads == 1
+
+    # A modified file is loaded again
+    file_path.write_text("{ }")
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    new_surr = load_surrogate(file_path, surrogate_class=_CountingSurrogate)
+    assert new_surr is not surr
+    assert _CountingSurrogate.loads == 2
+
+    clear_surrogate_registry()
+    assert load_surrogate(file_path, surrogate_class=_CountingSurrogate) is not new_surr
+    assert _CountingSurrogate.loads == 3
+
+    with pytest.raises(OSError):
+        load_surrogate(tmp_path / "missing.json", surrogate_class=_CountingSurrogate)
+    clear_surrogate_registry()
+
+
+@pytest.mark.component
+def test_load_pysmo_surrogate(tmp_path):
+    clear_surrogate_registry()
+    file_path = tmp_path / "min_N_St_surrogate.json"
+    shutil.copy(min_N_St_surr_path, file_path)
+
+    surr = load_surrogate(file_path)
+    assert surr.input_labels() == ["freund_ninv", "N_Bi"]
+    assert surr.output_labels() == ["min_N_St"]
+    assert load_surrogate(file_path) is surr
+    assert len(surrogate_registry._registry) == 1
+    clear_surrogate_registry()
+
+
+@pytest.mark.component
+@pytest.mark.parametrize("file_path", [min_N_St_surr_path, throughput_surr_path])
+def test_evaluate_pysmo_surrogate_batch(file_path):
+    surr = load_surrogate(file_path)
+    labels = surr.input_labels()
+    inputs = np.random.default_rng(0).uniform(0.2, 0.9, size=(20, len(labels)))
+    expected = surr.evaluate_surrogate(pd.DataFrame(inputs, columns=labels))
+
+    outputs = evaluate_surrogate_batch(surr, inputs)
+    assert outputs.shape == (20, len(surr.output_labels()))
+    np.testing.assert_allclose(outputs, expected.to_numpy(), rtol=1e-8)
+
+    # DataFrame inputs are selected by label
+    df = pd.DataFrame(inputs[:, ::-1], columns=labels[::-1])
+    df["unused"] = 1.0
+    np.testing.assert_allclose(
+        evaluate_surrogate_batch(surr, df), expected.to_numpy(), rtol=1e-8
+    )
+
+    # A single point may be given as a 1D array
+    np.testing.assert_allclose(
+        evaluate_surrogate_batch(surr, inputs[0]), expected.to_numpy()[:1], rtol=1e-8
+    )
+
+    with pytest.raises(ValueError, match=f"Expected inputs with {len(labels)}"):
+        evaluate_surrogate_batch(surr, np.ones((3, len(labels) + 1)))
+
+
+@pytest.mark.component
+def test_evaluate_alamo_surrogate_batch():
+    surr = load_surrogate(metab_surr_path, surrogate_class=AlamoSurrogate)
+    labels = surr.input_labels()
+    bounds = surr.input_bounds()
+    lower = np.array([bounds[k][0] for k in labels])
+    upper = np.array([bounds[k][1] for k in labels])
+    inputs = lower + (upper - lower) * np.random.default_rng(1).uniform(
+        size=(30, len(labels))
+    )
+    expected = surr.evaluate_surrogate(pd.DataFrame(inputs, columns=labels))
+
+    outputs = evaluate_surrogate_batch(surr, inputs)
+    assert outputs.shape == (30, len(surr.output_labels()))
+    np.testing.assert_allclose(outputs, expected.to_numpy(), rtol=1e-10)
+    clear_surrogate_registry()
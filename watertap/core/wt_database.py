@@ -15,9 +15,136 @@ with zero-order model parameter data.
 """
 
 import os
+import pickle
+import threading
 import yaml
 from copy import deepcopy
 
+# Use the C-accelerated YAML loader when libyaml is available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Process-wide cache of parsed YAML files, shared by all Database instances.
+# Maps absolute file path to a tuple of (mtime_ns, size, parsed data).
+_shared_cache = {}
+_shared_cache_lock = threading.Lock()
+
+_SNAPSHOT_VERSION = 1
+
+
+def _file_key(file_path):
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_yaml(file_path):
+    """
+    Load a YAML file through the process-wide shared cache.
+
+    Files are parsed once per process and re-parsed only if their modification
+    time or size changes. A deep copy of the parsed data is returned so that
+    callers may modify it freely.
+
+    Args:
+        file_path - path to YAML file to load
+
+    Returns:
+        parsed contents of the YAML file
+
+    Raises:
+        OSError if the file could not be read
+    """
+    file_path = os.path.abspath(file_path)
+    key = _file_key(file_path)
+
+    entry = _shared_cache.get(file_path)
+    if entry is None or entry[:2] != key:
+        with open(file_path, "r") as f:
+            data = yaml.load(f.read(), _YAML_LOADER)
+        entry = (*key, data)
+        with _shared_cache_lock:
+            _shared_cache[file_path] = entry
+
+    return deepcopy(entry[2])
+
+
+def clear_shared_cache():
+    """
+    Remove all entries from the process-wide YAML cache.
+    """
+    with _shared_cache_lock:
+        _shared_cache.clear()
+
+
+def save_snapshot(file_path, dbpath=None):
+    """
+    Parse every YAML file in a database folder and write them to a pickle
+    snapshot which can be loaded with load_snapshot.
+
+    Args:
+        file_path - path of snapshot file to write
+        dbpath - (optional) path to database folder, defaults to the WaterTAP
+                 techno-economic database
+
+    Returns:
+        number of files stored in the snapshot
+    """
+    dbpath = os.path.abspath(_default_dbpath() if dbpath is None else dbpath)
+
+    entries = {}
+    for fname in sorted(os.listdir(dbpath)):
+        if not fname.endswith(".yaml"):
+            continue
+        fpath = os.path.join(dbpath, fname)
+        load_yaml(fpath)
+        entries[fpath] = _shared_cache[fpath]
+
+    with open(file_path, "wb") as f:
+        pickle.dump(
+            {"version": _SNAPSHOT_VERSION, "entries": entries},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    return len(entries)
+
+
+def load_snapshot(file_path):
+    """
+    Load a snapshot written by save_snapshot into the process-wide YAML cache.
+
+    Entries are only used while the modification time and size of the source
+    file still match those recorded in the snapshot, otherwise the file is
+    parsed again on first use. Only load snapshots from trusted sources.
+
+    Args:
+        file_path - path of snapshot file to load
+
+    Returns:
+        number of entries loaded into the cache
+
+    Raises:
+        ValueError if the file is not a compatible snapshot
+    """
+    with open(file_path, "rb") as f:
+        snapshot = pickle.load(f)
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != _SNAPSHOT_VERSION:
+        raise ValueError(f"{file_path} is not a compatible WaterTAP database snapshot.")
+
+    with _shared_cache_lock:
+        _shared_cache.update(snapshot["entries"])
+
+    return len(snapshot["entries"])
+
+
+def _default_dbpath():
+    return os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "data",
+        "techno_economic",
+    )
+
 
 class Database:
     """
@@ -37,12 +164,7 @@ class Database:
         self._cached_files = {}
 
         if dbpath is None:
-            self._dbpath = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)),
-                "..",
-                "data",
-                "techno_economic",
-            )
+            self._dbpath = _default_dbpath()
         else:
             self._dbpath = dbpath
 
@@ -76,14 +198,12 @@ class Database:
         else:
             # Else load data from required file
             try:
-                with open(os.path.join(self._dbpath, "water_sources.yaml"), "r") as f:
-                    lines = f.read()
-                    f.close()
+                source_data = load_yaml(
+                    os.path.join(self._dbpath, "water_sources.yaml")
+                )
             except OSError:
                 raise KeyError("Could not find water_sources.yaml in database.")
 
-            source_data = yaml.load(lines, yaml.Loader)
-
             # Store data in cache and return
             self._cached_files["water_sources"] = source_data
 
@@ -179,6 +299,9 @@ class Database:
     def flush_cache(self):
         """
         Method to flush cached files in database object.
+
+        The process-wide YAML cache is not affected, use clear_shared_cache
+        to force files to be parsed again.
         """
         self._cached_files = {}
 
@@ -198,14 +321,10 @@ class Database:
         else:
             # Else load data from required file
             try:
-                with open(os.path.join(self._dbpath, technology + ".yaml"), "r") as f:
-                    lines = f.read()
-                    f.close()
+                fdata = load_yaml(os.path.join(self._dbpath, technology + ".yaml"))
             except OSError:
                 raise KeyError(f"Could not find entry for {technology} in database.")
 
-            fdata = yaml.load(lines, yaml.Loader)
-
             # Store data in cache and return
             self._cached_files[technology] = fdata
             return fdata
@@ -219,10 +338,8 @@ class Database:
             None
         """
         try:
-            with open(os.path.join(self._dbpath, "component_list.yaml"), "r") as f:
-                lines = f.read()
-                f.close()
+            self._component_list = load_yaml(
+                os.path.join(self._dbpath, "component_list.yaml")
+            )
         except OSError:
             raise KeyError("Could not find component_list.yaml in database.")
-
-        self._component_list = yaml.load(lines, yaml.Loader)
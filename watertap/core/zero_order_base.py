@@ -22,6 +22,8 @@ from idaes.core.util.tables import create_stream_table_dataframe
 from pyomo.common.config import ConfigBlock, ConfigValue, In, Bool
 import pyomo.environ as pyo
 
+from watertap.core.util.initialization import solve_linear_blocks
+
 # Some more information about this module
 __author__ = "Andrew Lee, Adam Atia"
 
@@ -182,6 +184,25 @@ class ZeroOrderBaseData(UnitModelBlockData):
             state_args=state_args, outlvl=outlvl, solver=solver, optarg=optarg
         )
 
+    def _solve_unit(self, solver_obj, solve_log):
+        """
+        Solve the unit during initialization. The material balances of units
+        with fixed recovery and removal fractions are linear, so these (and
+        any other constraints which can be) are solved directly, and the
+        solver is only called if constraints remain unsatisfied.
+
+        Args:
+            solver_obj - solver to use for the remaining constraints
+            solve_log - logger for the solver output
+
+        Returns:
+            solver results, or None if the unit was solved directly
+        """
+        if not solve_linear_blocks(self):
+            return None
+        with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
+            return solver_obj.solve(self, tee=slc.tee)
+
     def calculate_scaling_factors(self):
         """
         Placeholder scaling routine, should be overloaded by derived classes
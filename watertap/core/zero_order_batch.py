@@ -0,0 +1,477 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains a batched evaluator for trains of zero-order units in
+series, e.g. to screen many water sources against candidate treatment trains.
+
+With fixed recovery and removal fractions, the material balances of
+zero-order units are linear and their capital costs are power laws of the
+inlet flow, so a train can be evaluated for many feed scenarios at once with
+NumPy instead of fixing the feed and solving a Pyomo model per scenario.
+
+The evaluator follows the single inlet-double outlet material balances
+(zero_order_sido), the constant intensity electricity demand
+(zero_order_electricity) and the cost_power_law_flow capital costs,
+aggregated as in ZeroOrderCosting. For single outlet units the byproduct is
+the mass removed. Technologies with other electricity or costing methods are
+not supported.
+"""
+
+import numpy as np
+
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_variables
+from idaes.core import FlowsheetBlock, UnitModelCostingBlock
+from idaes.core.base.costing_base import register_idaes_currency_units
+import idaes.logger as idaeslog
+
+from watertap.core.zero_order_base import ZeroOrderBaseData
+from watertap.core.zero_order_properties import WaterParameterBlock
+from watertap.costing.zero_order_costing import (
+    ZeroOrderCosting,
+    load_case_study_definition,
+)
+import watertap.unit_models.zero_order as zo
+
+# Set up logger
+_log = idaeslog.getLogger(__name__)
+
+# Mass density of water assumed by the zero-order property package
+_DENS_MASS = 1000  # kg/m^3
+
+
+def _convert(data, to_units):
+    return pyo.units.convert_value(
+        float(data["value"]),
+        from_units=getattr(pyo.units, data["units"]),
+        to_units=to_units,
+    )
+
+
+def _unit_model_classes(tech):
+    # Zero-order unit models for a technology live in <tech>_zo modules
+    module = tech.replace("_", "").lower() + "zo"
+    return [
+        cls
+        for cls in vars(zo).values()
+        if isinstance(cls, type)
+        and issubclass(getattr(cls, "_ComponentDataClass", object), ZeroOrderBaseData)
+        and cls.__module__.rsplit(".", 1)[-1].replace("_", "").lower() == module
+    ]
+
+
+class ZeroOrderTrainEvaluator:
+    """
+    Batched evaluation of a train of zero-order units in series, where the
+    treated stream of each unit is the inlet of the next.
+
+    Args:
+        database - WaterTAP Database to load technology parameters from
+        technologies - list of technology names, or (technology, subtype)
+                       tuples, in the order of the train
+        solutes - list of solutes in the feed
+        case_study_definition (optional) - path to YAML file defining global
+                                           costing parameters, as for
+                                           ZeroOrderCosting
+        use_default_removal (optional) - indicate whether to use the default
+                                         removal fraction of a technology for
+                                         solutes without a specific value,
+                                         default False
+
+    Raises:
+        KeyError if parameters are missing from the database
+        ValueError if a technology defines reactions, or its unit model
+        does not use constant intensity electricity and power law capital
+        costs
+    """
+
+    def __init__(
+        self,
+        database,
+        technologies,
+        solutes,
+        case_study_definition=None,
+        use_default_removal=False,
+    ):
+        self.database = database
+        self.solutes = list(solutes)
+        self.component_list = ["H2O"] + self.solutes
+        self.technologies = [
+            (t, None) if isinstance(t, str) else tuple(t) for t in technologies
+        ]
+
+        self._load_global_parameters(case_study_definition)
+
+        n_units = len(self.technologies)
+        self.recovery_frac_mass_H2O = np.ones(n_units)
+        self.removal_frac_mass_comp = np.zeros((n_units, len(self.solutes)))
+        # Electricity intensity in kW per m^3/s of inlet flow
+        self._intensity = np.zeros(n_units)
+        self._capital_a = np.zeros(n_units)
+        self._capital_b = np.zeros(n_units)
+        self._reference_state = np.zeros(n_units)
+        self._flow_vol_basis = np.zeros(n_units, dtype=bool)
+        self._cost_factor = np.ones(n_units)
+        for i, (tech, subtype) in enumerate(self.technologies):
+            self._load_technology_parameters(i, tech, subtype, use_default_removal)
+
+    def _load_global_parameters(self, case_study_definition):
+        cs_def = load_case_study_definition(case_study_definition)
+        if "currency_definitions" in cs_def:
+            pyo.units.load_definitions_from_strings(cs_def["currency_definitions"])
+        else:
+            register_idaes_currency_units()
+
+        self.base_currency = getattr(pyo.units, cs_def["base_currency"])
+        self.base_period = getattr(pyo.units, cs_def["base_period"])
+
+        try:
+            gp = cs_def["global_parameters"]
+            per_period = 1 / self.base_period
+            self._TIC = _convert(gp["TIC"], pyo.units.dimensionless)
+            self._TPEC = _convert(gp["TPEC"], pyo.units.dimensionless)
+            self.utilization_factor = _convert(
+                gp["utilization_factor"], pyo.units.dimensionless
+            )
+            salaries = _convert(gp["salaries_percent_FCI"], per_period)
+            self.total_investment_factor = (
+                1
+                + _convert(gp["working_capital_percent_FCI"], pyo.units.dimensionless)
+                + _convert(gp["land_cost_percent_FCI"], pyo.units.dimensionless)
+            )
+            self.maintenance_labor_chemical_factor = (
+                salaries
+                + _convert(gp["benefit_percent_of_salary"], pyo.units.dimensionless)
+                * salaries
+                + _convert(gp["maintenance_costs_percent_FCI"], per_period)
+                + _convert(gp["laboratory_fees_percent_FCI"], per_period)
+                + _convert(gp["insurance_and_taxes_percent_FCI"], per_period)
+            )
+            wacc = _convert(gp["wacc"], pyo.units.dimensionless)
+            lifetime = _convert(gp["plant_lifetime"], pyo.units.year)
+            electricity = cs_def["defined_flows"]["electricity"]
+        except KeyError as err:
+            raise KeyError(
+                f"Invalid case study definition file - no entry found for {err}, "
+                f"or entry lacks value and units."
+            )
+
+        # Capital recovery factor as in WaterTAPCostingBlockData, per base period
+        self.capital_recovery_factor = pyo.units.convert_value(
+            wacc / (1 - 1 / (1 + wacc) ** lifetime),
+            from_units=1 / pyo.units.year,
+            to_units=1 / self.base_period,
+        )
+        # Cost of 1 kW of electricity over one base period
+        self._electricity_cost = pyo.units.convert_value(
+            float(electricity["value"]),
+            from_units=getattr(pyo.units, electricity["units"]) * pyo.units.kW,
+            to_units=self.base_currency / self.base_period,
+        )
+
+    def _load_technology_parameters(self, i, tech, subtype, use_default_removal):
+        pdict = self.database.get_unit_operation_parameters(tech, subtype=subtype)
+        if "reactions" in pdict:
+            raise ValueError(
+                f"{tech} defines reactions, which are not supported by the "
+                f"batched zero-order evaluator."
+            )
+        capital = pdict.get("capital_cost", {})
+        if capital.get("cost_method", "cost_power_law_flow") != "cost_power_law_flow":
+            raise ValueError(
+                f"{tech} uses cost method {capital['cost_method']}, only "
+                f"cost_power_law_flow is supported by the batched zero-order "
+                f"evaluator."
+            )
+        self._check_unit_model(tech, subtype)
+
+        # Technologies without a recovery fraction are pass-through units
+        if "recovery_frac_mass_H2O" in pdict:
+            self.recovery_frac_mass_H2O[i] = _convert(
+                pdict["recovery_frac_mass_H2O"], pyo.units.dimensionless
+            )
+            removal = pdict.get("removal_frac_mass_comp", {})
+            for k, j in enumerate(self.solutes):
+                if j in removal:
+                    data = removal[j]
+                elif use_default_removal and "default_removal_frac_mass_comp" in pdict:
+                    data = pdict["default_removal_frac_mass_comp"]
+                else:
+                    raise KeyError(
+                        f"{tech} - database provided does not contain an entry "
+                        f"for removal_frac_mass_comp with index {j} for "
+                        f"technology."
+                    )
+                self.removal_frac_mass_comp[i, k] = _convert(
+                    data, pyo.units.dimensionless
+                )
+
+        missing = [
+            k
+            for k in ("capital_a_parameter", "capital_b_parameter", "reference_state")
+            if k not in capital
+        ]
+        if "energy_electric_flow_vol_inlet" not in pdict or missing:
+            raise ValueError(
+                f"{tech} is not supported by the batched zero-order evaluator, "
+                f"which requires constant intensity electricity and power law "
+                f"capital costs."
+            )
+
+        self._intensity[i] = _convert(
+            pdict["energy_electric_flow_vol_inlet"],
+            pyo.units.kW * pyo.units.s / pyo.units.m**3,
+        )
+        self._capital_a[i] = _convert(
+            capital["capital_a_parameter"], self.base_currency
+        )
+        self._capital_b[i] = _convert(
+            capital["capital_b_parameter"], pyo.units.dimensionless
+        )
+        basis = capital["basis"]
+        if basis == "flow_vol":
+            self._flow_vol_basis[i] = True
+            self._reference_state[i] = _convert(
+                capital["reference_state"], pyo.units.m**3 / pyo.units.s
+            )
+        elif basis == "flow_mass":
+            self._reference_state[i] = _convert(
+                capital["reference_state"], pyo.units.kg / pyo.units.s
+            )
+        else:
+            raise ValueError(
+                f"{tech} - unrecognized basis in parameter declaration: {basis}."
+            )
+        factor = capital.get("cost_factor")
+        if factor == "TIC":
+            self._cost_factor[i] = self._TIC
+        elif factor == "TPEC":
+            self._cost_factor[i] = self._TPEC
+
+    def _check_unit_model(self, tech, subtype):
+        # Build and cost the unit model on a scratch flowsheet, as electricity
+        # and costing methods are defined by the unit model class rather than
+        # the database
+        m = pyo.ConcreteModel()
+        m.fs = FlowsheetBlock(dynamic=False)
+        m.fs.params = WaterParameterBlock(solute_list=self.solutes)
+        m.fs.costing = ZeroOrderCosting()
+        unit = None
+        for k, cls in enumerate(_unit_model_classes(tech)):
+            block = cls(
+                property_package=m.fs.params,
+                database=self.database,
+                process_subtype=subtype,
+            )
+            m.fs.add_component(f"unit{k}", block)
+            if block._tech_type == tech:
+                unit = block
+                break
+        if unit is None:
+            raise ValueError(f"{tech} - no zero-order unit model found.")
+
+        # Constant intensity electricity fixes the intensity from the database
+        intensity = getattr(unit, "energy_electric_flow_vol_inlet", None)
+        supported = any(v is intensity for v in unit._fixed_perf_vars)
+        if supported:
+            unit.costing = UnitModelCostingBlock(flowsheet_costing_block=m.fs.costing)
+            # Power law capital costs are sized on the inlet flow only, and
+            # electricity is the only costed flow
+            t0 = m.fs.time.first()
+            try:
+                sblock = unit.properties_in[t0]
+            except AttributeError:
+                # Pass-through case
+                sblock = unit.properties[t0]
+            supported = all(
+                v is unit.costing.capital_cost or v.parent_block() is sblock
+                for v in identify_variables(
+                    unit.costing.capital_cost_constraint.body, include_fixed=False
+                )
+            ) and all(
+                f == "electricity" or not flows
+                for f, flows in m.fs.costing._registered_flows.items()
+            )
+        if not supported:
+            raise ValueError(
+                f"{tech} is not supported by the batched zero-order evaluator, "
+                f"which requires constant intensity electricity and power law "
+                f"capital costs."
+            )
+
+    def feed_from_sources(self, water_sources, flow_vol=None):
+        """
+        Get the feed mass flows of water sources defined in the database, as
+        FeedZO.load_feed_data_from_database.
+
+        Args:
+            water_sources - list of water sources
+            flow_vol (optional) - volumetric flow in m^3/s of each source, as
+                                  a scalar or array, default is the
+                                  default_flow of each source
+
+        Returns:
+            array of mass flows in kg/s with shape (number of sources, number
+            of components), solutes not defined for a source are zero
+
+        Raises:
+            KeyError if flow_vol is not provided and a source has no default_flow
+        """
+        flow_vol = np.broadcast_to(
+            np.nan if flow_vol is None else np.asarray(flow_vol, dtype=float),
+            (len(water_sources),),
+        )
+        flows = np.zeros((len(water_sources), len(self.component_list)))
+        for i, source in enumerate(water_sources):
+            data = self.database.get_source_data(source)
+            Q = flow_vol[i]
+            if np.isnan(Q):
+                try:
+                    Q = _convert(data["default_flow"], pyo.units.m**3 / pyo.units.s)
+                except KeyError:
+                    raise KeyError(f"Water source {source} has no default_flow.")
+            for k, j in enumerate(self.solutes, start=1):
+                if j in data["solutes"]:
+                    flows[i, k] = Q * _convert(
+                        data["solutes"][j], pyo.units.kg / pyo.units.m**3
+                    )
+            flows[i, 0] = Q * _DENS_MASS - flows[i, 1:].sum()
+        return flows
+
+    def evaluate(
+        self, flow_mass_comp, recovery_frac_mass_H2O=None, removal_frac_mass_comp=None
+    ):
+        """
+        Evaluate the train for a batch of feed scenarios.
+
+        Args:
+            flow_mass_comp - array of feed mass flows in kg/s with shape
+                             (number of scenarios, number of components), in
+                             the order of component_list (H2O first)
+            recovery_frac_mass_H2O (optional) - water recovery of each unit,
+                                                with shape (number of units,)
+                                                or (number of scenarios,
+                                                number of units), default
+                                                from the database
+            removal_frac_mass_comp (optional) - solute removal of each unit,
+                                                with shape (number of units,
+                                                number of solutes) or with a
+                                                leading scenario dimension,
+                                                default from the database
+
+        Returns:
+            dict of arrays with a leading scenario dimension:
+                inlet, treated, byproduct - mass flows in kg/s of each unit
+                    and component
+                product - mass flows in kg/s of the treated stream of the
+                    last unit
+                electricity - electricity demand in kW of each unit
+                capital_cost - capital cost of each unit in base_currency
+                aggregate_flow_electricity - total electricity demand in kW
+                aggregate_capital_cost, total_capital_cost - in base_currency
+                total_operating_cost, total_annualized_cost - in
+                    base_currency per base_period
+                LCOW - levelized cost of water based on the product flow, in
+                    base_currency per m^3
+                electricity_intensity - electricity per product flow in
+                    kWh/m^3
+
+        Raises:
+            ValueError if the inputs have inconsistent shapes
+        """
+        feed = np.atleast_2d(np.asarray(flow_mass_comp, dtype=float))
+        n_scen = feed.shape[0]
+        n_units = len(self.technologies)
+        if feed.shape[1] != len(self.component_list):
+            raise ValueError(
+                f"Expected feed flows with {len(self.component_list)} components "
+                f"({', '.join(self.component_list)}), got {feed.shape[1]}."
+            )
+        recovery = np.broadcast_to(
+            (
+                self.recovery_frac_mass_H2O
+                if recovery_frac_mass_H2O is None
+                else np.asarray(recovery_frac_mass_H2O, dtype=float)
+            ),
+            (n_scen, n_units),
+        )
+        removal = np.broadcast_to(
+            (
+                self.removal_frac_mass_comp
+                if removal_frac_mass_comp is None
+                else np.asarray(removal_frac_mass_comp, dtype=float)
+            ),
+            (n_scen, n_units, len(self.solutes)),
+        )
+
+        # Fraction of each component passing to the treated stream
+        split = np.concatenate([recovery[:, :, None], 1 - removal], axis=2)
+        inlet = np.empty((n_scen, n_units, len(self.component_list)))
+        treated = np.empty_like(inlet)
+        flow = feed
+        for i in range(n_units):
+            inlet[:, i] = flow
+            treated[:, i] = flow * split[:, i]
+            flow = treated[:, i]
+        byproduct = inlet - treated
+
+        flow_mass_in = inlet.sum(axis=2)
+        flow_vol_in = flow_mass_in / _DENS_MASS
+        electricity = self._intensity * flow_vol_in
+        sizing = np.where(self._flow_vol_basis, flow_vol_in, flow_mass_in)
+        capital_cost = (
+            self._cost_factor
+            * self._capital_a
+            * (sizing / self._reference_state) ** self._capital_b
+        )
+
+        aggregate_flow_electricity = electricity.sum(axis=1)
+        aggregate_capital_cost = capital_cost.sum(axis=1)
+        total_capital_cost = self.total_investment_factor * aggregate_capital_cost
+        total_operating_cost = (
+            self.maintenance_labor_chemical_factor * aggregate_capital_cost
+            + aggregate_flow_electricity
+            * self._electricity_cost
+            * self.utilization_factor
+        )
+        total_annualized_cost = (
+            total_capital_cost * self.capital_recovery_factor + total_operating_cost
+        )
+
+        product = treated[:, -1]
+        product_flow_vol = product.sum(axis=1) / _DENS_MASS
+        period = pyo.units.convert_value(
+            1, from_units=self.base_period, to_units=pyo.units.s
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            LCOW = total_annualized_cost / (
+                product_flow_vol * period * self.utilization_factor
+            )
+            electricity_intensity = aggregate_flow_electricity / (
+                product_flow_vol * 3600
+            )
+
+        return {
+            "inlet": inlet,
+            "treated": treated,
+            "byproduct": byproduct,
+            "product": product,
+            "electricity": electricity,
+            "capital_cost": capital_cost,
+            "aggregate_flow_electricity": aggregate_flow_electricity,
+            "aggregate_capital_cost": aggregate_capital_cost,
+            "total_capital_cost": total_capital_cost,
+            "total_operating_cost": total_operating_cost,
+            "total_annualized_cost": total_annualized_cost,
+            "LCOW": LCOW,
+            "electricity_intensity": electricity_intensity,
+        }
@@ -262,19 +262,19 @@ def initialize_sido(
     init_log.info_high("Initialization Step 1 Complete.")
 
     # ---------------------------------------------------------------------
-    # Solve unit
-    with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
-        results = solver_obj.solve(blk, tee=slc.tee)
+    # Solve unit, directly if possible
+    results = blk._solve_unit(solver_obj, solve_log)
+    status = "Solved Directly" if results is None else idaeslog.condition(results)
 
-    init_log.info_high("Initialization Step 2 {}.".format(idaeslog.condition(results)))
+    init_log.info_high("Initialization Step 2 {}.".format(status))
 
     # ---------------------------------------------------------------------
     # Release Inlet state
     blk.properties_in.release_state(flags, outlvl)
 
-    init_log.info("Initialization Complete: {}".format(idaeslog.condition(results)))
+    init_log.info("Initialization Complete: {}".format(status))
 
-    if not check_optimal_termination(results):
+    if results is not None and not check_optimal_termination(results):
         raise InitializationError(
             f"{blk.name} failed to initialize successfully. Please check "
             f"the output logs for more information."
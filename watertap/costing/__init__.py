@@ -13,6 +13,7 @@
 from .watertap_costing_package import WaterTAPCosting, WaterTAPCostingDetailed
 from .zero_order_costing import ZeroOrderCosting
 from .multiple_choice_costing_block import MultiUnitModelCostingBlock
+from .costing_report import CostingReport
 
 from .util import (
     register_costing_parameter_block,
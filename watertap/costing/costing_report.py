@@ -0,0 +1,190 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+Vectorized evaluation of costing expressions over many model states.
+
+A CostingReport compiles the Expressions on a costing block (e.g., LCOW and its
+breakdowns, specific energy consumption) into a single straight-line NumPy
+function of the Vars they depend on. This allows costing results for every
+point of a parameter sweep to be computed in one pass from an array of
+solved variable values, rather than calling value() on each Expression for
+each sample.
+"""
+
+import numpy as np
+import pyomo.environ as pyo
+
+from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import pandas as pd
+
+from watertap.core.util.numpy_expressions import (
+    NumPyCodeVisitor,
+    compile_numpy_function,
+)
+
+
+class CostingReport:
+    """
+    Compiled, vectorized evaluator for costing Expressions.
+
+    Args:
+        costing_block - costing block whose Expressions should be reported
+        expressions (optional) - list of Expression components or component
+                                 data to compile. If not provided, all active
+                                 Expressions declared on costing_block are
+                                 used.
+
+    Note that Params and other terms without Vars are evaluated when the
+    report is built, so the report must be rebuilt if they are changed.
+    """
+
+    def __init__(self, costing_block, expressions=None):
+        self._costing_block = costing_block
+
+        if expressions is None:
+            expressions = costing_block.component_data_objects(
+                pyo.Expression, active=True, descend_into=False
+            )
+        expression_data = []
+        for expr in expressions:
+            if expr.is_indexed():
+                expression_data.extend(expr.values())
+            else:
+                expression_data.append(expr)
+
+        self.names = [self._get_name(e) for e in expression_data]
+        self.variables = []
+
+        var_map = ComponentMap()
+
+        def var_code(var):
+            # Each Var is a column of the state array x
+            if var not in var_map:
+                var_map[var] = len(self.variables)
+                self.variables.append(var)
+            return f"x[:, {var_map[var]}]"
+
+        named = ComponentMap()
+        lines = ["def _evaluate(x):"]
+        outputs = [
+            NumPyCodeVisitor(var_code, named, lines).walk_expression(e)[0]
+            for e in expression_data
+        ]
+        lines.append("    return (" + "".join(o + ", " for o in outputs) + ")")
+
+        self._source = "\n".join(lines)
+        self._evaluate = compile_numpy_function(
+            lines, "_evaluate", f"<CostingReport {costing_block.name}>"
+        )
+
+    def _get_name(self, expr):
+        blk = expr.parent_block()
+        while blk is not None:
+            if blk is self._costing_block:
+                return expr.getname(fully_qualified=True, relative_to=blk)
+            blk = blk.parent_block()
+        return expr.name
+
+    @property
+    def variable_names(self):
+        """
+        Names of the Vars matching the columns of the state array.
+        """
+        return [v.name for v in self.variables]
+
+    def get_states(self):
+        """
+        Get the current values of the report variables from the model.
+
+        Returns:
+            array of shape (1, number of variables), with NaN for Vars without
+            a value
+        """
+        return np.array(
+            [[np.nan if v.value is None else v.value for v in self.variables]],
+            dtype=float,
+        )
+
+    def evaluate(self, states, variables=None):
+        """
+        Evaluate all compiled Expressions for each row of states.
+
+        Args:
+            states - array of shape (number of samples, number of variables)
+                     holding values of the Vars in the order of
+                     self.variables, or of the order given by variables
+            variables (optional) - list of Vars or Var names matching the
+                                   columns of states. Report variables not
+                                   in this list take their current value in
+                                   the model.
+
+        Returns:
+            dict mapping Expression names to arrays of shape (number of samples,)
+
+        Raises:
+            ValueError if states does not have the expected shape
+            KeyError if a name in variables is not a report variable
+        """
+        states = np.asarray(states, dtype=float)
+        if states.ndim == 1:
+            states = states[np.newaxis, :]
+        if states.ndim != 2:
+            raise ValueError(
+                f"Expected a 2-dimensional array of states but received an "
+                f"array with {states.ndim} dimensions."
+            )
+
+        if variables is not None:
+            if states.shape[1] != len(variables):
+                raise ValueError(
+                    f"Expected {len(variables)} columns in states but received "
+                    f"{states.shape[1]}."
+                )
+            full_states = np.repeat(self.get_states(), states.shape[0], axis=0)
+            columns = {n: i for i, n in enumerate(self.variable_names)}
+            for j, v in enumerate(variables):
+                name = v if isinstance(v, str) else v.name
+                try:
+                    full_states[:, columns[name]] = states[:, j]
+                except KeyError:
+                    raise KeyError(
+                        f"{name} is not used by any Expression in the costing report."
+                    )
+            states = full_states
+        elif states.shape[1] != len(self.variables):
+            raise ValueError(
+                f"Expected {len(self.variables)} columns in states but received "
+                f"{states.shape[1]}."
+            )
+
+        n_samples = states.shape[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            results = self._evaluate(states)
+        return {
+            name: np.broadcast_to(np.asarray(r, dtype=float), (n_samples,)).copy()
+            for name, r in zip(self.names, results)
+        }
+
+    def to_dataframe(self, states, variables=None):
+        """
+        Evaluate all compiled Expressions and return the results as a
+        pandas DataFrame with one column per Expression and one row per sample.
+
+        Args:
+            states - array of variable values, see evaluate
+            variables (optional) - list of Vars or Var names matching the
+                                   columns of states, see evaluate
+
+        Returns:
+            pandas DataFrame of results
+        """
+        return pd.DataFrame(self.evaluate(states, variables=variables))
@@ -0,0 +1,123 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import numpy as np
+import pytest
+
+import pyomo.environ as pyo
+from pyomo.core.expr import numeric_expr
+
+from watertap.costing import CostingReport
+import watertap.flowsheets.lsrro.lsrro as lsrro
+
+
+@pytest.fixture
+def model():
+    m = pyo.ConcreteModel()
+    m.b = pyo.Block()
+    m.b.x = pyo.Var(initialize=2.0, units=pyo.units.m)
+    m.b.y = pyo.Var(initialize=3.0)
+    m.b.p = pyo.Param(initialize=4.0, mutable=True)
+    m.b.e1 = pyo.Expression(
+        expr=pyo.units.convert(m.b.x, to_units=pyo.units.km) * m.b.p + m.b.y**2
+    )
+    m.b.e2 = pyo.Expression(
+        [1, 2], rule=lambda b, i: i * pyo.exp(b.e1) / (1 + pyo.sqrt(b.y))
+    )
+    m.b.e3 = pyo.Expression(
+        expr=pyo.Expr_if(IF=m.b.y >= 2.5, THEN=m.b.e1, ELSE=-m.b.e1)
+    )
+    m.b.constant = pyo.Expression(expr=m.b.p * 2)
+    return m
+
+
+@pytest.mark.unit
+def test_costing_report(model):
+    report = CostingReport(model.b)
+
+    assert report.names == ["e1", "e2[1]", "e2[2]", "e3", "constant"]
+    assert report.variable_names == ["b.x", "b.y"]
+
+    states = np.array([[2.0, 3.0], [1.0, 2.0], [0.5, 1.0]])
+    results = report.evaluate(states)
+
+    for k, (x, y) in enumerate(states):
+        model.b.x.value = x
+        model.b.y.value = y
+        for name in report.names:
+            assert results[name][k] == pytest.approx(
+                pyo.value(model.b.find_component(name))
+            )
+    assert results["constant"].shape == (3,)
+
+
+@pytest.mark.unit
+def test_costing_report_max_min(model):
+    model.b.e_max = pyo.Expression(
+        expr=numeric_expr.MaxExpression((model.b.x, 0.0, model.b.y - 2))
+    )
+    model.b.e_min = pyo.Expression(expr=numeric_expr.MinExpression((model.b.x, 1.5)))
+    report = CostingReport(model.b, expressions=[model.b.e_max, model.b.e_min])
+
+    states = np.array([[2.0, 3.0], [-1.0, 1.0], [0.5, 4.0]])
+    results = report.evaluate(states)
+    assert results["e_max"] == pytest.approx([2.0, 0.0, 2.0])
+    assert results["e_min"] == pytest.approx([1.5, -1.0, 0.5])
+
+
+@pytest.mark.unit
+def test_costing_report_partial_states(model):
+    report = CostingReport(model.b, expressions=[model.b.e1])
+
+    df = report.to_dataframe(np.array([[1.0], [2.0]]), variables=["b.y"])
+    assert list(df.columns) == ["e1"]
+    assert df["e1"].to_list() == pytest.approx([2e-3 * 4 + 1, 2e-3 * 4 + 4])
+
+    with pytest.raises(
+        KeyError, match="foo is not used by any Expression in the costing report."
+    ):
+        report.evaluate(np.array([[1.0]]), variables=["foo"])
+
+    with pytest.raises(
+        ValueError, match="Expected 2 columns in states but received 1."
+    ):
+        report.evaluate(np.array([[1.0]]))
+
+
+@pytest.mark.component
+def test_costing_report_lsrro():
+    m = lsrro.build()
+
+    m.fs.BoosterPumps[:].control_volume.work[0.0].value = 42e6
+    m.fs.EnergyRecoveryDevices[:].control_volume.work[0.0].value = -42e6
+    m.fs.costing.initialize()
+
+    report = CostingReport(m.fs.costing)
+    assert "LCOW" in report.names
+    assert "specific_energy_consumption" in report.names
+
+    states = np.repeat(report.get_states(), 4, axis=0)
+    states[:, report.variable_names.index("fs.costing.total_capital_cost")] *= [
+        1,
+        2,
+        3,
+        4,
+    ]
+    df = report.to_dataframe(states)
+
+    for k in range(4):
+        m.fs.costing.total_capital_cost.value = states[
+            k, report.variable_names.index("fs.costing.total_capital_cost")
+        ]
+        for name in report.names:
+            assert df[name][k] == pytest.approx(
+                pyo.value(m.fs.costing.find_component(name)), nan_ok=True
+            )
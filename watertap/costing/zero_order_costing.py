@@ -14,7 +14,6 @@ General costing package for zero-order processes.
 """
 
 import os
-import yaml
 
 import pyomo.environ as pyo
 from pyomo.common.config import ConfigValue
@@ -22,6 +21,7 @@ from pyomo.util.calc_var_value import calculate_variable_from_constraint
 
 from idaes.core import declare_process_block_class
 from idaes.core.base.costing_base import register_idaes_currency_units
+from watertap.core.wt_database import load_yaml
 from watertap.costing.watertap_costing_package import WaterTAPCostingDetailedData
 
 # NOTE: some of these are defined in WaterTAPCostingBlockData
@@ -116,7 +116,24 @@ def _load_case_study_definition(self):
     If users did not provide a definition file as a config argument, the
     default definition from the WaterTap techno-economic database is used.
     """
-    source_file = self.config.case_study_definition
+    return load_case_study_definition(self.config.case_study_definition)
+
+
+def load_case_study_definition(source_file=None):
+    """
+    Load data from a case study definition file into a Python dict.
+
+    Args:
+        source_file (optional) - path to YAML file defining global parameters
+                                 for case study, default is the definition
+                                 from the WaterTap techno-economic database
+
+    Returns:
+        dict of case study definition
+
+    Raises:
+        OSError if the file could not be found
+    """
     if source_file is None:
         source_file = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
@@ -127,13 +144,9 @@ def _load_case_study_definition(self):
         )
 
     try:
-        with open(source_file, "r") as f:
-            lines = f.read()
-            f.close()
+        return load_yaml(source_file)
     except OSError:
         raise OSError(
             "Could not find specified case study definition file. "
             "Please check the path provided."
         )
-
-    return yaml.load(lines, yaml.Loader)
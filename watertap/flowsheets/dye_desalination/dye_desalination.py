@@ -60,7 +60,10 @@ from idaes.core import UnitModelCostingBlock
 
 from watertap.unit_models.pressure_exchanger import PressureExchanger
 from watertap.unit_models.pressure_changer import Pump
-from watertap.core.util.initialization import assert_degrees_of_freedom
+from watertap.core.util.initialization import (
+    assert_degrees_of_freedom,
+    direct_initializer,
+)
 
 import watertap.property_models.seawater_prop_pack as prop_SW
 from watertap.unit_models.reverse_osmosis_0D import (
@@ -105,6 +108,7 @@ def main(
     include_gac=False,
     dye_revenue=False,
     brine_revenue=False,
+    direct_initialization=False,
 ):
     m = build(
         RO_1D=RO_1D,
@@ -113,15 +117,20 @@ def main(
         include_dewatering=include_dewatering,
         include_gac=include_gac,
     )
-    set_operating_conditions(m)
+    set_operating_conditions(m, direct_initialization=direct_initialization)
 
     assert_units_consistent(m)
 
-    initialize_system(m)
+    initialize_system(m, direct_initialization=direct_initialization)
     assert_degrees_of_freedom(m, 0)
 
-    results = solve(m, checkpoint="solve flowsheet after initializing system")
-    assert_optimal_termination(results)
+    results = solve(
+        m,
+        checkpoint="solve flowsheet after initializing system",
+        direct=direct_initialization,
+    )
+    if results is not None:
+        assert_optimal_termination(results)
 
     add_costing(m, dye_revenue=dye_revenue, brine_revenue=brine_revenue)
     initialize_costing(m)
@@ -392,7 +401,7 @@ def build(
     return m
 
 
-def set_operating_conditions(m):
+def set_operating_conditions(m, direct_initialization=False):
     if hasattr(m.fs, "pretreatment"):
         prtrt = m.fs.pretreatment
     else:
@@ -410,7 +419,7 @@ def set_operating_conditions(m):
     m.fs.feed.flow_vol[0].fix(flow_vol)
     m.fs.feed.conc_mass_comp[0, "dye"].fix(conc_mass_dye)
     m.fs.feed.conc_mass_comp[0, "tds"].fix(conc_mass_tds)
-    solve(m.fs.feed, checkpoint="solve feed block")
+    solve(m.fs.feed, checkpoint="solve feed block", direct=direct_initialization)
 
     # pretreatment
     if hasattr(m.fs, "pretreatment"):
@@ -499,7 +508,7 @@ def set_operating_conditions(m):
     return
 
 
-def initialize_system(m):
+def initialize_system(m, direct_initialization=False):
     if hasattr(m.fs, "pretreatment"):
         prtrt = m.fs.pretreatment
     else:
@@ -508,7 +517,11 @@ def initialize_system(m):
     dye_sep = m.fs.dye_separation
 
     # initialize feed
-    solve(m.fs.feed, checkpoint="solve flowsheet after initializing feed")
+    solve(
+        m.fs.feed,
+        checkpoint="solve flowsheet after initializing feed",
+        direct=direct_initialization,
+    )
 
     # initialize pretreatment
     propagate_state(m.fs.s_feed)
@@ -616,7 +629,12 @@ def optimize_operation(m):
     return
 
 
-def solve(blk, solver=None, checkpoint=None, tee=False, fail_flag=True):
+def solve(blk, solver=None, checkpoint=None, tee=False, fail_flag=True, direct=False):
+    if direct:
+        # Solve the equations directly, only calling the solver for
+        # constraints which remain unsatisfied; returns None if no solve
+        # was needed
+        return direct_initializer(blk, solver=solver, fail_flag=fail_flag)
     if solver is None:
         solver = get_solver()
     results = solver.solve(blk, tee=tee)
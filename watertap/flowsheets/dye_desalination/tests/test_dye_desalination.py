@@ -537,3 +537,31 @@ class TestDyewithROFlowsheetwithGAC:
         m = system_frame
         display_results(m)
         display_costing(m)
+
+
+@pytest.mark.component
+def test_direct_initialization(monkeypatch):
+    def no_solve(*args, **kwargs):
+        raise AssertionError("The solver was called.")
+
+    # The zero-order flowsheet is initialized and solved without a solver
+    monkeypatch.setattr(type(solver), "solve", no_solve)
+
+    m = build(include_RO=False, include_pretreatment=True)
+    set_operating_conditions(m, direct_initialization=True)
+    initialize_system(m, direct_initialization=True)
+    assert solve(m, direct=True) is None
+    assert_degrees_of_freedom(m, 0)
+
+    assert pytest.approx(77.607, rel=1e-3) == value(m.fs.feed.flow_mass_comp[0, "H2O"])
+    assert pytest.approx(1259.18, rel=1e-5) == value(
+        m.fs.dye_separation.nanofiltration.area
+    )
+    assert pytest.approx(0, abs=1e-8) == value(
+        m.fs.wwt_retentate.flow_mass_comp[0, "dye"]
+    )
+
+    add_costing(m)
+    initialize_costing(m)
+    assert solve(m, direct=True) is None
+    assert pytest.approx(11.2423, rel=1e-4) == value(m.fs.LCOT)
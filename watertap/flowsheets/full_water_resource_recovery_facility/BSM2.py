@@ -21,8 +21,14 @@ but comprises different specifications for default values than BSM2.
 __author__ = "Alejandro Garciadiego, Adam Atia, Marcus Holly, Chenyu Wang, Ben Knueven, Xinhong Liu,"
 
 import pyomo.environ as pyo
+from pyomo.common.errors import IterationLimitError
 
-from pyomo.network import Arc, SequentialDecomposition
+from pyomo.network import Arc
+from watertap.core.util.compiled_translator import CompiledTranslator
+from watertap.core.util.parallel_initialization import (
+    ParallelSequentialDecomposition,
+)
+from watertap.core.util.scaling import get_scaled_model_twin
 from watertap.unit_models.anaerobic_digester import AD, ADScaler
 from watertap.unit_models.thickener import Thickener, ThickenerScaler
 from watertap.unit_models.dewatering import DewateringUnit, DewatererScaler
@@ -97,10 +103,9 @@ def main(reactor_volume_equalities=True):
     m.fs.costing.initialize()
 
     scale_system(m)
-    scaling = pyo.TransformationFactory("core.scale_model")
-    scaled_model = scaling.create_using(m, rename=False)
-    solve(scaled_model)
-    scaling.propagate_solution(scaled_model, m)
+    scaled = get_scaled_model_twin(m)
+    solve(scaled.scaled_model)
+    scaled.propagate_solution()
 
     print("\n\n=============SIMULATION RESULTS=============\n\n")
     # display_results(m)
@@ -108,24 +113,41 @@ def main(reactor_volume_equalities=True):
 
     setup_optimization(m, reactor_volume_equalities=reactor_volume_equalities)
     rescale_system(m)
-    rescaling = pyo.TransformationFactory("core.scale_model")
-    rescaled_model = rescaling.create_using(m, rename=False)
-    solve(rescaled_model, tee=True)
-
-    results = rescaling.propagate_solution(rescaled_model, m)
+    # The scaled model is rebuilt once here, as the optimization adds new
+    # components and changes the constraint scaling
+    scaled.update_scaled_model()
+    results = solve(scaled.scaled_model, tee=True)
+    scaled.propagate_solution()
 
     print("\n\n=============OPTIMIZATION RESULTS=============\n\n")
     # display_results(m)
     display_costing(m)
     display_performance_metrics(m)
 
-    return m, results, rescaled_model
+    return m, results, scaled.scaled_model
+
 
+def build(dynamic=False, horizon=86400, time_nfe=24):
+    """
+    Build the BSM2 flowsheet.
 
-def build():
+    Args:
+        dynamic (optional) - build a dynamic flowsheet over [0, horizon]
+        horizon (optional) - length of the time horizon in seconds when dynamic
+        time_nfe (optional) - number of finite elements used to discretize time
+            when dynamic
+
+    Returns:
+        model
+    """
     m = pyo.ConcreteModel()
 
-    m.fs = FlowsheetBlock(dynamic=False)
+    if dynamic:
+        m.fs = FlowsheetBlock(
+            dynamic=True, time_set=[0, horizon], time_units=pyo.units.s
+        )
+    else:
+        m.fs = FlowsheetBlock(dynamic=False)
 
     m.fs.props_ASM1 = ASM1ParameterBlock()
     m.fs.props_ADM1 = ADM1ParameterBlock()
@@ -197,7 +219,7 @@ def build():
     m.fs.Treated = Product(property_package=m.fs.props_ASM1)
     m.fs.Sludge = Product(property_package=m.fs.props_ASM1)
     # Recycle pressure changer - use a simple isothermal unit for now
-    m.fs.P1 = PressureChanger(property_package=m.fs.props_ASM1)
+    m.fs.P1 = PressureChanger(property_package=m.fs.props_ASM1, dynamic=False)
 
     # Link units
     m.fs.stream2 = Arc(source=m.fs.MX1.outlet, destination=m.fs.R1.inlet)
@@ -294,6 +316,11 @@ def build():
 
     pyo.TransformationFactory("network.expand_arcs").apply_to(m)
 
+    if dynamic:
+        pyo.TransformationFactory("dae.finite_difference").apply_to(
+            m.fs, nfe=time_nfe, wrt=m.fs.time, scheme="BACKWARD"
+        )
+
     # keep handy all the mixers
     m.fs.mixers = (m.fs.MX1, m.fs.MX2, m.fs.MX3, m.fs.MX4, m.fs.MX6)
 
@@ -305,18 +332,18 @@ def set_operating_conditions(m):
     m.fs.FeedWater.flow_vol.fix(20648 * pyo.units.m**3 / pyo.units.day)
     m.fs.FeedWater.temperature.fix(308.15 * pyo.units.K)
     m.fs.FeedWater.pressure.fix(1 * pyo.units.atm)
-    m.fs.FeedWater.conc_mass_comp[0, "S_I"].fix(27 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_S"].fix(58 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_I"].fix(92 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_S"].fix(363 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_BH"].fix(50 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_BA"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_P"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_O"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_NO"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_NH"].fix(23 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_ND"].fix(5 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_ND"].fix(16 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_I"].fix(27 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_S"].fix(58 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_I"].fix(92 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_S"].fix(363 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_BH"].fix(50 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_BA"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_P"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_O"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_NO"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_NH"].fix(23 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_ND"].fix(5 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_ND"].fix(16 * pyo.units.g / pyo.units.m**3)
     m.fs.FeedWater.alkalinity.fix(7 * pyo.units.mol / pyo.units.m**3)
 
     # Reactor sizing in activated sludge process
@@ -334,29 +361,32 @@ def set_operating_conditions(m):
             m.fs.R4.injection[:, :, j].fix(0)
             m.fs.R5.injection[:, :, j].fix(0)
     # Then set injections rates for O2
-    m.fs.R3.outlet.conc_mass_comp[:, "S_O"].fix(1.72e-3)
-    m.fs.R4.outlet.conc_mass_comp[:, "S_O"].fix(2.43e-3)
-    m.fs.R5.outlet.conc_mass_comp[:, "S_O"].fix(4.49e-4)
+    # KLa is not time-indexed, so the oxygen setpoints fix the aeration at the
+    # start of the horizon and dissolved oxygen is free afterwards
+    t0 = m.fs.time.first()
+    m.fs.R3.outlet.conc_mass_comp[t0, "S_O"].fix(1.72e-3)
+    m.fs.R4.outlet.conc_mass_comp[t0, "S_O"].fix(2.43e-3)
+    m.fs.R5.outlet.conc_mass_comp[t0, "S_O"].fix(4.49e-4)
 
     # Set fraction of outflow from reactor 5 that goes to recycle
     m.fs.SP5.split_fraction[:, "underflow"].fix(0.6)
 
     # Secondary clarifier
     # TODO: Update once secondary clarifier with more detailed model available
-    m.fs.CL1.split_fraction[0, "effluent", "H2O"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "S_I"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "S_S"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "X_I"].fix(0.00187)
-    m.fs.CL1.split_fraction[0, "effluent", "X_S"].fix(0.00187)
-    m.fs.CL1.split_fraction[0, "effluent", "X_BH"].fix(0.00187)
-    m.fs.CL1.split_fraction[0, "effluent", "X_BA"].fix(0.00187)
-    m.fs.CL1.split_fraction[0, "effluent", "X_P"].fix(0.00187)
-    m.fs.CL1.split_fraction[0, "effluent", "S_O"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "S_NO"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "S_NH"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "S_ND"].fix(0.48956)
-    m.fs.CL1.split_fraction[0, "effluent", "X_ND"].fix(0.00187)
-    m.fs.CL1.split_fraction[0, "effluent", "S_ALK"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "H2O"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "S_I"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "S_S"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "X_I"].fix(0.00187)
+    m.fs.CL1.split_fraction[:, "effluent", "X_S"].fix(0.00187)
+    m.fs.CL1.split_fraction[:, "effluent", "X_BH"].fix(0.00187)
+    m.fs.CL1.split_fraction[:, "effluent", "X_BA"].fix(0.00187)
+    m.fs.CL1.split_fraction[:, "effluent", "X_P"].fix(0.00187)
+    m.fs.CL1.split_fraction[:, "effluent", "S_O"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "S_NO"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "S_NH"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "S_ND"].fix(0.48956)
+    m.fs.CL1.split_fraction[:, "effluent", "X_ND"].fix(0.00187)
+    m.fs.CL1.split_fraction[:, "effluent", "S_ALK"].fix(0.48956)
 
     m.fs.CL1.surface_area.fix(1500 * pyo.units.m**2)
 
@@ -368,20 +398,20 @@ def set_operating_conditions(m):
 
     # Primary Clarifier
     # TODO: Update primary clarifier once more detailed model available
-    m.fs.CL.split_fraction[0, "effluent", "H2O"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_I"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_S"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "X_I"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_S"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_BH"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_BA"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_P"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "S_O"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_NO"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_NH"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_ND"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "X_ND"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "S_ALK"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "H2O"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_I"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_S"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "X_I"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_S"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_BH"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_BA"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_P"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "S_O"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_NO"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_NH"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_ND"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "X_ND"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "S_ALK"].fix(0.993)
 
     # Anaerobic digester
     m.fs.RADM.volume_liquid.fix(3400)
@@ -392,10 +422,11 @@ def set_operating_conditions(m):
     m.fs.DU.hydraulic_retention_time.fix(1800 * pyo.units.s)
 
     # Set specific energy consumption averaged for centrifuge
-    m.fs.DU.energy_electric_flow_vol_inlet[0] = 0.069 * pyo.units.kWh / pyo.units.m**3
+    m.fs.DU.energy_electric_flow_vol_inlet[:] = 0.069 * pyo.units.kWh / pyo.units.m**3
 
     # Thickener unit
-    m.fs.TU.hydraulic_retention_time.fix(86400 * pyo.units.s)
+    # Height is sized by the retention time at the start of the horizon
+    m.fs.TU.hydraulic_retention_time[t0].fix(86400 * pyo.units.s)
     m.fs.TU.diameter.fix(10 * pyo.units.m)
 
     # Mixers - fix outlet pressures since MomentumMixingType.none and isobaric assumption
@@ -981,10 +1012,16 @@ def scale_system(m):
         )
 
 
-def initialize_system(m):
+def initialize_system(m, max_workers=1):
+    """
+    Initialize the flowsheet using sequential decomposition.
+
+    Units which do not depend on each other are initialized in parallel when
+    max_workers is greater than 1.
+    """
     # Initialize flowsheet
     # Apply sequential decomposition - 1 iteration should suffice
-    seq = SequentialDecomposition()
+    seq = ParallelSequentialDecomposition(max_workers=max_workers)
     seq.options.tear_method = "Direct"
     seq.options.iterLim = 1
     seq.options.tear_set = [m.fs.stream2, m.fs.stream10adm]
@@ -1047,7 +1084,21 @@ def initialize_system(m):
         calculate_variable_options={"eps": 2e-8}, skip_final_solve=True
     )
 
+    # The translators are explicit in their inlet state and need no solver
+    translators = {
+        unit.name: CompiledTranslator(unit) for unit in (m.fs.asm_adm, m.fs.adm_asm)
+    }
+
     def function(unit):
+        if unit.name in translators:
+            try:
+                translators[unit.name].propagate()
+                return
+            except (ArithmeticError, ValueError, IterationLimitError) as err:
+                _log.warning(
+                    f"Could not evaluate {unit.name} from its inlet ({err}), "
+                    f"initializing it instead."
+                )
         try:
             initializer.initialize(unit, output_level=_log.debug)
         except InitializationError:
@@ -1055,6 +1106,12 @@ def initialize_system(m):
 
     seq.run(m, function)
 
+    for name, timing in seq.timing_summary().items():
+        _log.debug(
+            f"Initialized {name} {timing['runs']} time(s) in "
+            f"{timing['total_time']:.2f} s"
+        )
+
 
 def add_costing(m):
     m.fs.costing = WaterTAPCosting()
@@ -1143,28 +1200,28 @@ def add_effluent_violations(m):
 
     @m.fs.Constraint(m.fs.time)
     def eq_TSS_max(self, t):
-        return m.fs.CL1.effluent_state[0].TSS <= m.fs.TSS_max
+        return m.fs.CL1.effluent_state[t].TSS <= m.fs.TSS_max
 
     m.fs.COD_max = pyo.Var(initialize=0.1, units=pyo.units.kg / pyo.units.m**3)
     m.fs.COD_max.fix()
 
     @m.fs.Constraint(m.fs.time)
     def eq_COD_max(self, t):
-        return m.fs.CL1.effluent_state[0].COD <= m.fs.COD_max
+        return m.fs.CL1.effluent_state[t].COD <= m.fs.COD_max
 
     m.fs.totalN_max = pyo.Var(initialize=0.018, units=pyo.units.kg / pyo.units.m**3)
     m.fs.totalN_max.fix()
 
     @m.fs.Constraint(m.fs.time)
     def eq_totalN_max(self, t):
-        return m.fs.CL1.effluent_state[0].Total_N <= m.fs.totalN_max
+        return m.fs.CL1.effluent_state[t].Total_N <= m.fs.totalN_max
 
     m.fs.BOD5_max = pyo.Var(initialize=0.01, units=pyo.units.kg / pyo.units.m**3)
     m.fs.BOD5_max.fix()
 
     @m.fs.Constraint(m.fs.time)
     def eq_BOD5_max(self, t):
-        return m.fs.CL1.effluent_state[0].BOD5["effluent"] <= m.fs.BOD5_max
+        return m.fs.CL1.effluent_state[t].BOD5["effluent"] <= m.fs.BOD5_max
 
 
 def add_reactor_volume_equalities(m):
@@ -27,7 +27,8 @@ J.P. Steyer and P. Vanrolleghem, "Benchmark Simulation Model no. 1 (BSM1)", 2018
 __author__ = "Chenyu Wang, Adam Atia, Alejandro Garciadiego, Marcus Holly"
 
 import pyomo.environ as pyo
-from pyomo.network import Arc, SequentialDecomposition
+from pyomo.common.errors import IterationLimitError
+from pyomo.network import Arc
 
 from idaes.core import (
     FlowsheetBlock,
@@ -42,6 +43,11 @@ from idaes.models.unit_models import (
     PressureChanger,
 )
 from idaes.models.unit_models.separator import SplittingType
+from watertap.core.util.compiled_translator import CompiledTranslator
+from watertap.core.util.parallel_initialization import (
+    ParallelSequentialDecomposition,
+)
+from watertap.core.util.scaling import get_scaled_model_twin
 from watertap.core.solvers import get_solver
 from idaes.core.initialization import BlockTriangularizationInitializer
 from idaes.core.util.model_statistics import degrees_of_freedom
@@ -126,25 +132,25 @@ def main(bio_P=False):
     m.fs.costing.initialize()
 
     scale_system(m, bio_P=bio_P)
-    scaling = pyo.TransformationFactory("core.scale_model")
-    scaled_model = scaling.create_using(m, rename=False)
-
-    solve(scaled_model)
+    scaled = get_scaled_model_twin(m)
+    solve(scaled.scaled_model)
+    scaled.propagate_solution()
 
     # Switch to fixed KLa in R5, R6, and R7 (S_O concentration is controlled in R5)
     # KLa for R5 and R6 taken from [1], and KLa for R7 taken from [2]
-    scaled_model.fs.R5.KLa.fix(24.0 / 24)
-    scaled_model.fs.R6.KLa.fix(24.0 / 24)
-    scaled_model.fs.R7.KLa.fix(8.4 / 24)
-    scaled_model.fs.R5.outlet.conc_mass_comp[:, "S_O2"].unfix()
-    scaled_model.fs.R6.outlet.conc_mass_comp[:, "S_O2"].unfix()
-    scaled_model.fs.R7.outlet.conc_mass_comp[:, "S_O2"].unfix()
-
-    # Re-solve with controls in place
-    scaled_results = solve(scaled_model)
+    m.fs.R5.KLa.fix(24.0 / 24)
+    m.fs.R6.KLa.fix(24.0 / 24)
+    m.fs.R7.KLa.fix(8.4 / 24)
+    m.fs.R5.outlet.conc_mass_comp[:, "S_O2"].unfix()
+    m.fs.R6.outlet.conc_mass_comp[:, "S_O2"].unfix()
+    m.fs.R7.outlet.conc_mass_comp[:, "S_O2"].unfix()
+
+    # Re-solve with controls in place, reusing the scaled model
+    scaled.update_scaled_model()
+    scaled_results = solve(scaled.scaled_model)
     pyo.assert_optimal_termination(scaled_results)
 
-    scaling.propagate_solution(scaled_model, m)
+    scaled.propagate_solution()
 
     display_costing(m)
     display_performance_metrics(m)
@@ -152,14 +158,19 @@ def main(bio_P=False):
     return (
         m,
         scaled_results,
-        scaled_model,
+        scaled.scaled_model,
     )
 
 
-def build(bio_P=False):
+def build(bio_P=False, dynamic=False, horizon=86400, time_nfe=24):
     m = pyo.ConcreteModel()
 
-    m.fs = FlowsheetBlock(dynamic=False)
+    if dynamic:
+        m.fs = FlowsheetBlock(
+            dynamic=True, time_set=[0, horizon], time_units=pyo.units.s
+        )
+    else:
+        m.fs = FlowsheetBlock(dynamic=False)
 
     # Properties
     m.fs.props_ASM2D = ModifiedASM2dParameterBlock()
@@ -248,7 +259,7 @@ def build(bio_P=False):
         property_package=m.fs.props_ASM2D, outlet_list=["waste", "recycle"]
     )
     # Recycle pressure changer - use a simple isothermal unit for now
-    m.fs.P1 = PressureChanger(property_package=m.fs.props_ASM2D)
+    m.fs.P1 = PressureChanger(property_package=m.fs.props_ASM2D, dynamic=False)
 
     # ======================================================================
     # Thickener
@@ -367,6 +378,11 @@ def build(bio_P=False):
 
     pyo.TransformationFactory("network.expand_arcs").apply_to(m)
 
+    if dynamic:
+        pyo.TransformationFactory("dae.finite_difference").apply_to(
+            m.fs, nfe=time_nfe, wrt=m.fs.time, scheme="BACKWARD"
+        )
+
     return m
 
 
@@ -376,48 +392,48 @@ def set_operating_conditions(m, bio_P=False):
     m.fs.FeedWater.flow_vol.fix(20935.15 * pyo.units.m**3 / pyo.units.day)
     m.fs.FeedWater.temperature.fix(308.15 * pyo.units.K)
     m.fs.FeedWater.pressure.fix(1 * pyo.units.atm)
-    m.fs.FeedWater.conc_mass_comp[0, "S_O2"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_F"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_A"].fix(70 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_NH4"].fix(26.6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_NO3"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_PO4"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_I"].fix(57.45 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_N2"].fix(25.19 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_I"].fix(84 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_S"].fix(94.1 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_H"].fix(370 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_PAO"].fix(
+    m.fs.FeedWater.conc_mass_comp[:, "S_O2"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_F"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_A"].fix(70 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_NH4"].fix(26.6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_NO3"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_PO4"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_I"].fix(57.45 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_N2"].fix(25.19 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_I"].fix(84 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_S"].fix(94.1 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_H"].fix(370 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_PAO"].fix(
         51.5262 * pyo.units.g / pyo.units.m**3
     )
-    m.fs.FeedWater.conc_mass_comp[0, "X_PP"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_PHA"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "X_AUT"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_IC"].fix(5.652 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_K"].fix(374.6925 * pyo.units.g / pyo.units.m**3)
-    m.fs.FeedWater.conc_mass_comp[0, "S_Mg"].fix(20 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_PP"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_PHA"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "X_AUT"].fix(1e-6 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_IC"].fix(5.652 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_K"].fix(374.6925 * pyo.units.g / pyo.units.m**3)
+    m.fs.FeedWater.conc_mass_comp[:, "S_Mg"].fix(20 * pyo.units.g / pyo.units.m**3)
 
     # Primary Clarifier
     # TODO: Update primary clarifier once more detailed model available
-    m.fs.CL.split_fraction[0, "effluent", "H2O"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_A"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_F"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_I"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_N2"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_NH4"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_NO3"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_O2"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_PO4"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_IC"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_K"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "S_Mg"].fix(0.993)
-    m.fs.CL.split_fraction[0, "effluent", "X_AUT"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_H"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_I"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_PAO"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_PHA"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_PP"].fix(0.5192)
-    m.fs.CL.split_fraction[0, "effluent", "X_S"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "H2O"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_A"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_F"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_I"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_N2"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_NH4"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_NO3"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_O2"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_PO4"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_IC"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_K"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "S_Mg"].fix(0.993)
+    m.fs.CL.split_fraction[:, "effluent", "X_AUT"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_H"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_I"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_PAO"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_PHA"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_PP"].fix(0.5192)
+    m.fs.CL.split_fraction[:, "effluent", "X_S"].fix(0.5192)
 
     # Reactor sizing
     m.fs.R1.volume.fix(1000 * pyo.units.m**3)
@@ -436,9 +452,12 @@ def set_operating_conditions(m, bio_P=False):
             m.fs.R6.injection[:, :, j].fix(0)
             m.fs.R7.injection[:, :, j].fix(0)
     # Then set injections rates for O2
-    m.fs.R5.outlet.conc_mass_comp[:, "S_O2"].fix(1.91e-3)
-    m.fs.R6.outlet.conc_mass_comp[:, "S_O2"].fix(2.60e-3)
-    m.fs.R7.outlet.conc_mass_comp[:, "S_O2"].fix(3.20e-3)
+    # KLa is not time-indexed, so the oxygen setpoints fix the aeration at the
+    # start of the horizon and dissolved oxygen is free afterwards
+    t0 = m.fs.time.first()
+    m.fs.R5.outlet.conc_mass_comp[t0, "S_O2"].fix(1.91e-3)
+    m.fs.R6.outlet.conc_mass_comp[t0, "S_O2"].fix(2.60e-3)
+    m.fs.R7.outlet.conc_mass_comp[t0, "S_O2"].fix(3.20e-3)
 
     m.fs.R5.KLa = 10 * pyo.units.hour**-1
     m.fs.R6.KLa = 10 * pyo.units.hour**-1
@@ -449,25 +468,25 @@ def set_operating_conditions(m, bio_P=False):
 
     # Secondary Clarifier
     # TODO: Update once more detailed model available
-    m.fs.CL2.split_fraction[0, "effluent", "H2O"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_A"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_F"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_I"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_N2"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_NH4"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_NO3"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_O2"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_PO4"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_IC"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_K"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "S_Mg"].fix(0.48956)
-    m.fs.CL2.split_fraction[0, "effluent", "X_AUT"].fix(0.00187)
-    m.fs.CL2.split_fraction[0, "effluent", "X_H"].fix(0.00187)
-    m.fs.CL2.split_fraction[0, "effluent", "X_I"].fix(0.00187)
-    m.fs.CL2.split_fraction[0, "effluent", "X_PAO"].fix(0.00187)
-    m.fs.CL2.split_fraction[0, "effluent", "X_PHA"].fix(0.00187)
-    m.fs.CL2.split_fraction[0, "effluent", "X_PP"].fix(0.00187)
-    m.fs.CL2.split_fraction[0, "effluent", "X_S"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "H2O"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_A"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_F"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_I"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_N2"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_NH4"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_NO3"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_O2"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_PO4"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_IC"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_K"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "S_Mg"].fix(0.48956)
+    m.fs.CL2.split_fraction[:, "effluent", "X_AUT"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "X_H"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "X_I"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "X_PAO"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "X_PHA"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "X_PP"].fix(0.00187)
+    m.fs.CL2.split_fraction[:, "effluent", "X_S"].fix(0.00187)
 
     m.fs.CL2.surface_area.fix(1500 * pyo.units.m**2)
 
@@ -486,7 +505,8 @@ def set_operating_conditions(m, bio_P=False):
     m.fs.dewater.hydraulic_retention_time.fix(1800 * pyo.units.s)
 
     # Thickener unit
-    m.fs.thickener.hydraulic_retention_time.fix(86400 * pyo.units.s)
+    # Height is sized by the retention time at the start of the horizon
+    m.fs.thickener.hydraulic_retention_time[t0].fix(86400 * pyo.units.s)
     m.fs.thickener.diameter.fix(10 * pyo.units.m)
 
     # Mixers - fix outlet pressures since MomentumMixingType.none and isobaric assumption
@@ -609,10 +629,16 @@ def scale_system(m, bio_P=False):
         )
 
 
-def initialize_system(m, bio_P=False, solver=None):
+def initialize_system(m, bio_P=False, solver=None, max_workers=1):
+    """
+    Initialize the flowsheet using sequential decomposition.
+
+    Units which do not depend on each other are initialized in parallel when
+    max_workers is greater than 1.
+    """
     # Initialize flowsheet
     # Apply sequential decomposition - 1 iteration should suffice
-    seq = SequentialDecomposition()
+    seq = ParallelSequentialDecomposition(max_workers=max_workers)
     seq.options.tear_method = "Direct"
     seq.options.iterLim = 1
     seq.options.tear_set = [m.fs.stream5, m.fs.stream10adm]
@@ -736,7 +762,22 @@ def initialize_system(m, bio_P=False, solver=None):
 
     initializer = BlockTriangularizationInitializer()
 
+    # The translators are explicit in their inlet state and need no solver
+    translators = {
+        unit.name: CompiledTranslator(unit)
+        for unit in (m.fs.translator_asm2d_adm1, m.fs.translator_adm1_asm2d)
+    }
+
     def function(unit):
+        if unit.name in translators:
+            try:
+                translators[unit.name].propagate()
+                return
+            except (ArithmeticError, ValueError, IterationLimitError) as err:
+                _log.warning(
+                    f"Could not evaluate {unit.name} from its inlet ({err}), "
+                    f"initializing it instead."
+                )
         # TODO: Resolve why bio_P=True does not work with the BTInitializer
         if bio_P:
             unit.initialize(outlvl=idaeslog.DEBUG)
@@ -745,6 +786,12 @@ def initialize_system(m, bio_P=False, solver=None):
 
     seq.run(m, function)
 
+    for name, timing in seq.timing_summary().items():
+        _log.debug(
+            f"Initialized {name} {timing['runs']} time(s) in "
+            f"{timing['total_time']:.2f} s"
+        )
+
 
 def solve(m, solver=None):
     if solver is None:
@@ -755,6 +802,40 @@ def solve(m, solver=None):
     return results
 
 
+def add_effluent_violations(m):
+    m.fs.TSS_max = pyo.Var(initialize=0.03, units=pyo.units.kg / pyo.units.m**3)
+    m.fs.TSS_max.fix()
+
+    @m.fs.Constraint(m.fs.time)
+    def eq_TSS_max(self, t):
+        return m.fs.Treated.properties[t].TSS <= m.fs.TSS_max
+
+    m.fs.COD_max = pyo.Var(initialize=0.1, units=pyo.units.kg / pyo.units.m**3)
+    m.fs.COD_max.fix()
+
+    @m.fs.Constraint(m.fs.time)
+    def eq_COD_max(self, t):
+        return m.fs.Treated.properties[t].COD <= m.fs.COD_max
+
+    m.fs.totalN_max = pyo.Var(initialize=0.018, units=pyo.units.kg / pyo.units.m**3)
+    m.fs.totalN_max.fix()
+
+    @m.fs.Constraint(m.fs.time)
+    def eq_totalN_max(self, t):
+        # Total nitrogen is Kjeldahl nitrogen plus nitrate
+        return (
+            m.fs.Treated.properties[t].TKN + m.fs.Treated.properties[t].SNOX
+            <= m.fs.totalN_max
+        )
+
+    m.fs.BOD5_max = pyo.Var(initialize=0.01, units=pyo.units.kg / pyo.units.m**3)
+    m.fs.BOD5_max.fix()
+
+    @m.fs.Constraint(m.fs.time)
+    def eq_BOD5_max(self, t):
+        return m.fs.Treated.properties[t].BOD5["effluent"] <= m.fs.BOD5_max
+
+
 def add_costing(m):
     m.fs.costing = WaterTAPCosting()
     m.fs.costing.base_currency = pyo.units.USD_2020
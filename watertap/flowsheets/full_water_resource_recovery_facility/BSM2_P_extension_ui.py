@@ -14,12 +14,12 @@ GUI configuration for the extended BSM2 flowsheet.
 """
 
 from pyomo.environ import units as pyunits
-from pyomo.environ import TransformationFactory
 
 import idaes.logger as idaeslog
 
 from idaes_flowsheet_processor.api import FlowsheetInterface
 
+from watertap.core.util.scaling import get_scaled_model_twin
 from watertap.flowsheets.full_water_resource_recovery_facility.BSM2_P_extension import (
     build,
     set_operating_conditions,
@@ -3857,6 +3857,33 @@ def export_variables(flowsheet=None, exports=None, build_options=None, **kwargs)
     )
 
 
+def _solve_with_fixed_KLa(m):
+    """
+    Solves the flowsheet with fixed KLa in R5, R6, and R7 instead of fixed
+    S_O concentrations, and restores the S_O specification afterwards so that
+    the exported model keeps it.
+    """
+    reactors = (m.fs.R5, m.fs.R6, m.fs.R7)
+
+    # Switch to fixed KLa in R5, R6, and R7 (S_O concentration is controlled in R5)
+    m.fs.R5.KLa.fix(24.0 / 24)
+    m.fs.R6.KLa.fix(24.0 / 24)
+    m.fs.R7.KLa.fix(8.4 / 24)
+    for r in reactors:
+        r.outlet.conc_mass_comp[:, "S_O2"].unfix()
+
+    # Resolve with controls in place, reusing the scaled model
+    scaled = get_scaled_model_twin(m)
+    scaled.update_scaled_model()
+    solve(scaled.scaled_model)
+    scaled.propagate_solution()
+
+    # Fix S_O at the solution with KLa in place
+    for r in reactors:
+        r.KLa.unfix()
+        r.outlet.conc_mass_comp[:, "S_O2"].fix()
+
+
 def build_flowsheet(build_options=None, **kwargs):
     """
     Builds the initial flowsheet.
@@ -3878,23 +3905,11 @@ def build_flowsheet(build_options=None, **kwargs):
         m.fs.costing.initialize()
 
         scale_system(m, bio_P=bioP)
-        scaling = TransformationFactory("core.scale_model")
-        scaled_model = scaling.create_using(m, rename=False)
+        scaled = get_scaled_model_twin(m)
+        solve(scaled.scaled_model)
+        scaled.propagate_solution()
 
-        solve(scaled_model)
-
-        # Switch to fixed KLa in R5, R6, and R7 (S_O concentration is controlled in R5)
-        scaled_model.fs.R5.KLa.fix(24.0 / 24)
-        scaled_model.fs.R6.KLa.fix(24.0 / 24)
-        scaled_model.fs.R7.KLa.fix(8.4 / 24)
-        scaled_model.fs.R5.outlet.conc_mass_comp[:, "S_O2"].unfix()
-        scaled_model.fs.R6.outlet.conc_mass_comp[:, "S_O2"].unfix()
-        scaled_model.fs.R7.outlet.conc_mass_comp[:, "S_O2"].unfix()
-
-        # Resolve with controls in place
-        solve(scaled_model)
-
-        scaling.propagate_solution(scaled_model, m)
+        _solve_with_fixed_KLa(m)
 
     else:
         m = build(bio_P=False)
@@ -3907,23 +3922,11 @@ def build_flowsheet(build_options=None, **kwargs):
         m.fs.costing.initialize()
 
         scale_system(m, bio_P=False)
-        scaling = TransformationFactory("core.scale_model")
-        scaled_model = scaling.create_using(m, rename=False)
-
-        solve(scaled_model)
-
-        # Switch to fixed KLa in R5, R6, and R7 (S_O concentration is controlled in R5)
-        scaled_model.fs.R5.KLa.fix(24.0 / 24)
-        scaled_model.fs.R6.KLa.fix(24.0 / 24)
-        scaled_model.fs.R7.KLa.fix(8.4 / 24)
-        scaled_model.fs.R5.outlet.conc_mass_comp[:, "S_O2"].unfix()
-        scaled_model.fs.R6.outlet.conc_mass_comp[:, "S_O2"].unfix()
-        scaled_model.fs.R7.outlet.conc_mass_comp[:, "S_O2"].unfix()
-
-        # Resolve with controls in place
-        solve(scaled_model)
+        scaled = get_scaled_model_twin(m)
+        solve(scaled.scaled_model)
+        scaled.propagate_solution()
 
-        scaling.propagate_solution(scaled_model, m)
+        _solve_with_fixed_KLa(m)
 
     return m
 
@@ -3933,5 +3936,10 @@ def solve_flowsheet(flowsheet=None):
     Solves the initial flowsheet.
     """
     fs = flowsheet
-    results = solve(fs)
+    # Solve through the scaled copy kept with the model, which is only
+    # rebuilt if the structure or scaling of the model changes
+    scaled = get_scaled_model_twin(fs)
+    scaled.update_scaled_model()
+    results = solve(scaled.scaled_model)
+    scaled.propagate_solution()
     return results
@@ -13,10 +13,11 @@
 GUI configuration for the base BSM2 flowsheet.
 """
 
-from pyomo.environ import units as pyunits, TransformationFactory
+from pyomo.environ import units as pyunits
 
 from idaes_flowsheet_processor.api import FlowsheetInterface
 
+from watertap.core.util.scaling import get_scaled_model_twin
 from watertap.flowsheets.full_water_resource_recovery_facility.BSM2 import (
     build,
     set_operating_conditions,
@@ -3064,10 +3065,9 @@ def build_flowsheet(build_options=None, **kwargs):
 
     # Handle scaling transformations
     scale_system(m)
-    scaling = TransformationFactory("core.scale_model")
-    scaled_model = scaling.create_using(m, rename=False)
-    solve(scaled_model)
-    scaling.propagate_solution(scaled_model, m)
+    scaled = get_scaled_model_twin(m)
+    solve(scaled.scaled_model)
+    scaled.propagate_solution()
 
     # Set up optimization with additional scaling
     setup_optimization(m, reactor_volume_equalities=True)
@@ -3080,5 +3080,10 @@ def solve_flowsheet(flowsheet=None):
     Solves the initial flowsheet.
     """
     fs = flowsheet
-    results = solve(fs)
+    # Solve through the scaled copy kept with the model, which is only
+    # rebuilt if the structure or scaling of the model changes
+    scaled = get_scaled_model_twin(fs)
+    scaled.update_scaled_model()
+    results = solve(scaled.scaled_model)
+    scaled.propagate_solution()
     return results
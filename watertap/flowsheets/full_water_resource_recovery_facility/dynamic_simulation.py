@@ -0,0 +1,481 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+Rolling horizon dynamic simulation of the full Water Resource Recovery Facility
+flowsheets (BSM2 and BSM2_P_extension) driven by an influent time series.
+
+A single window of the flowsheet is built and discretized in time. After each
+window is solved its end state becomes the initial state of the next window,
+so long horizons are simulated with the memory of one window, and the effluent
+quality of every time point is appended to a CSV file as the simulation runs.
+
+The influent file is a CSV file with a ``time`` column in seconds and one
+column per FeedWater variable in SI units, e.g. ``flow_vol`` in m^3/s,
+``temperature`` in K, ``alkalinity`` in mol/m^3 and the name of each
+component for its mass concentration in kg/m^3. Variables without a column
+keep the values from ``set_operating_conditions``.
+"""
+
+import csv
+import inspect
+import math
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.common.collections import ComponentSet
+from pyomo.contrib.incidence_analysis import IncidenceGraphInterface
+from pyomo.dae import DerivativeVar
+from pyomo.dae.flatten import flatten_dae_components
+from pyomo.util.subsystems import create_subsystem_block
+
+from idaes.core.util.exceptions import ConfigurationError
+import idaes.logger as idaeslog
+
+from watertap.core.solvers import get_solver
+
+# Set up logger
+_log = idaeslog.getLogger(__name__)
+
+# Effluent quality metrics with the limit and constraint added by
+# add_effluent_violations
+effluent_limits = {
+    "TSS": "TSS_max",
+    "COD": "COD_max",
+    "Total_N": "totalN_max",
+    "BOD5": "BOD5_max",
+}
+
+
+def _total_nitrogen(state):
+    # ASM1 defines total nitrogen, ASM2d Kjeldahl nitrogen and nitrogen oxides
+    if state.find_component("Total_N") is not None:
+        return state.Total_N
+    return state.TKN + state.SNOX
+
+
+# Effluent quality metrics as expressions of the treated water state
+_effluent_metrics = {
+    "TSS": lambda state: state.TSS,
+    "COD": lambda state: state.COD,
+    "Total_N": _total_nitrogen,
+    "BOD5": lambda state: state.BOD5["effluent"],
+}
+
+
+def _split_options(flowsheet, options, functions):
+    """
+    Split flowsheet options by the flowsheet functions accepting them.
+    """
+    split = {}
+    used = set()
+    for name in functions:
+        params = inspect.signature(getattr(flowsheet, name)).parameters
+        split[name] = {k: v for k, v in options.items() if k in params}
+        used.update(split[name])
+    unused = set(options) - used
+    if unused:
+        raise ConfigurationError(
+            f"Options {sorted(unused)} are not accepted by any of "
+            f"{', '.join(functions)} of {flowsheet.__name__}."
+        )
+    return split
+
+
+def load_influent(filename):
+    """
+    Read an influent time series from a CSV file.
+
+    Args:
+        filename - path of the CSV file
+
+    Returns:
+        dict of numpy arrays keyed by column name
+    """
+    with open(filename, newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader)]
+        data = np.array([[float(x) for x in row] for row in reader if row])
+
+    if "time" not in header:
+        raise ConfigurationError(f"Influent file {filename} has no time column.")
+    if data.ndim != 2 or data.shape[0] < 1:
+        raise ConfigurationError(f"Influent file {filename} has no data.")
+    influent = {name: data[:, i] for i, name in enumerate(header)}
+    if np.any(np.diff(influent["time"]) <= 0):
+        raise ConfigurationError(
+            f"Time in influent file {filename} must be strictly increasing."
+        )
+    return influent
+
+
+def set_influent(m, influent, start=0):
+    """
+    Fix the FeedWater of a dynamic flowsheet to the influent time series.
+
+    Values are linearly interpolated at ``start`` plus each time point of the
+    flowsheet, and held constant outside of the time series.
+
+    Args:
+        m - dynamic flowsheet model
+        influent - dict of numpy arrays returned by load_influent
+        start (optional) - time of the influent series at the start of the window
+
+    Returns:
+        None
+    """
+    feed = m.fs.FeedWater
+    component_list = feed.config.property_package.component_list
+    times = list(m.fs.time)
+    shifted = start + np.array(times)
+
+    for name, values in influent.items():
+        if name == "time":
+            continue
+        interp = np.interp(shifted, influent["time"], values)
+        if name in component_list:
+            var = [feed.conc_mass_comp[t, name] for t in times]
+        elif isinstance(feed.component(name), pyo.Var):
+            var = [feed.component(name)[t] for t in times]
+        else:
+            raise ConfigurationError(
+                f"Influent column {name} is not a component or a variable of "
+                f"{feed.name}."
+            )
+        for v, x in zip(var, interp):
+            v.fix(x)
+
+
+def _initial_states(m):
+    """
+    Differential variables and their derivatives at the first time point, in
+    model order.
+    """
+    time = m.fs.time
+    t0 = time.first()
+    states = []
+    derivatives = []
+    for var in m.component_objects(pyo.Var, descend_into=True):
+        if not isinstance(var, DerivativeVar):
+            continue
+        state = var.get_state_var()
+        # Position of time in the index of the state variable
+        sets = list(state.index_set().subsets())
+        pos = next(i for i, s in enumerate(sets) if s is time)
+        for idx, v in state.items():
+            tidx = idx[pos] if len(sets) > 1 else idx
+            if tidx == t0:
+                states.append(v)
+                derivatives.append(var[idx])
+    return states, derivatives
+
+
+def _redundant_initial_states(m, states):
+    """
+    Find states whose initial condition is already implied by the algebraic
+    equations at the first time point, e.g. dissolved oxygen setpoints or a
+    fixed digester temperature.
+
+    Each structurally redundant initial condition lies in the overconstrained
+    part of the Dulmage-Mendelsohn decomposition of the first time point, and
+    is dropped until the system is no longer overconstrained.
+    """
+    t0 = m.fs.time.first()
+    scalar_cons, dae_cons = flatten_dae_components(
+        m, m.fs.time, pyo.Constraint, active=True
+    )
+    cons = list(scalar_cons) + [ref[t0] for ref in dae_cons if t0 in ref]
+    cons = [c for c in cons if c.active and c.equality]
+
+    blk = create_subsystem_block(cons)
+    blk.initial_conditions = pyo.Constraint(
+        range(len(states)), rule=lambda b, i: states[i] == 0
+    )
+
+    redundant = ComponentSet()
+    while True:
+        igraph = IncidenceGraphInterface(blk, include_inequality=False)
+        con_partition = igraph.dulmage_mendelsohn()[1]
+        if not con_partition.unmatched:
+            return redundant
+        overconstrained = ComponentSet(
+            con_partition.unmatched + con_partition.overconstrained
+        )
+        for i, con in blk.initial_conditions.items():
+            if con.active and con in overconstrained:
+                con.deactivate()
+                redundant.add(states[i])
+                break
+        else:
+            raise ConfigurationError(
+                "The flowsheet is structurally overconstrained at the first "
+                "time point independently of the initial conditions."
+            )
+
+
+def fix_initial_states(m):
+    """
+    Replace the steady-state initial conditions by fixed initial states.
+
+    The differential variables at the first time point are fixed at their
+    current values, except those which are already determined by the
+    algebraic equations. The time derivative of the latter is fixed to zero at
+    the first time point instead, as it does not affect later time points.
+
+    Args:
+        m - dynamic flowsheet model
+
+    Returns:
+        list of initial states which are fixed
+    """
+    m.fs.unfix_initial_conditions()
+    states, derivatives = _initial_states(m)
+    redundant = _redundant_initial_states(m, states)
+    initial_states = []
+    for v, dv in zip(states, derivatives):
+        if v in redundant:
+            dv.fix(0)
+        else:
+            v.fix()
+            initial_states.append(v)
+    _log.debug(
+        f"Fixed {len(initial_states)} initial states, {len(redundant)} initial "
+        f"conditions are redundant."
+    )
+    return initial_states
+
+
+def shift_window(m, initial_states, time_vars=None):
+    """
+    Warm-start the next window from the end of the current one.
+
+    Every variable which is not fixed is set to its value at the last time
+    point, and so are the fixed initial states.
+
+    Args:
+        m - dynamic flowsheet model
+        initial_states - initial states returned by fix_initial_states
+        time_vars (optional) - time-indexed references returned by
+            flatten_dae_components; computed when not provided
+
+    Returns:
+        None
+    """
+    time = m.fs.time
+    t0 = time.first()
+    t_end = time.last()
+    initial_states = ComponentSet(initial_states)
+    if time_vars is None:
+        time_vars = flatten_dae_components(m, time, pyo.Var)[1]
+    for ref in time_vars:
+        end = ref[t_end].value
+        for t in time:
+            v = ref[t]
+            if not v.fixed or (t == t0 and v in initial_states):
+                v.set_value(end)
+
+
+def copy_steady_state(m, steady_state, time_vars=None):
+    """
+    Set the variables of a dynamic flowsheet which are not fixed to their
+    values in a steady-state model of the same flowsheet at every time point.
+
+    Holdups and time derivatives, which only exist in the dynamic model, are
+    left unchanged.
+
+    Args:
+        m - dynamic flowsheet model
+        steady_state - solved steady-state flowsheet model
+        time_vars (optional) - time-indexed references returned by
+            flatten_dae_components; computed when not provided
+
+    Returns:
+        None
+    """
+    t0 = m.fs.time.first()
+    if time_vars is None:
+        time_vars = flatten_dae_components(m, m.fs.time, pyo.Var)[1]
+    for ref in time_vars:
+        # Both models start at the same time point, so the names match
+        source = steady_state.find_component(ref[t0].name)
+        if source is None:
+            continue
+        for t in m.fs.time:
+            if not ref[t].fixed:
+                ref[t].set_value(source.value)
+
+
+def effluent_quality(m):
+    """
+    Effluent quality metrics and limit violations at each time point.
+
+    Args:
+        m - flowsheet model with effluent limits from add_effluent_violations
+
+    Returns:
+        dict of lists keyed by metric, ``<metric>_violation`` and ``time``
+    """
+    times = list(m.fs.time)
+    results = {"time": times}
+    for metric, limit in effluent_limits.items():
+        bound = pyo.value(m.fs.component(limit))
+        values = [
+            pyo.value(_effluent_metrics[metric](m.fs.Treated.properties[t]))
+            for t in times
+        ]
+        results[metric] = values
+        results[metric + "_violation"] = [int(x > bound) for x in values]
+    return results
+
+
+def solve_steady_state(flowsheet, solver=None, tee=False, **flowsheet_options):
+    """
+    Build, initialize and solve the steady-state flowsheet, e.g. for the
+    initial state of a dynamic simulation.
+
+    Args:
+        flowsheet - flowsheet module, e.g. BSM2 or BSM2_P_extension
+        solver (optional) - solver to use, the WaterTAP default otherwise
+        tee (optional) - display the solver log
+        flowsheet_options (optional) - passed to those of the flowsheet's
+            build, set_operating_conditions and initialize_system which
+            accept them, e.g. bio_P or max_workers
+
+    Returns:
+        solved steady-state flowsheet model
+
+    Raises:
+        ConfigurationError if an option is not accepted by any of them
+    """
+    options = _split_options(
+        flowsheet,
+        flowsheet_options,
+        ("build", "set_operating_conditions", "initialize_system"),
+    )
+    if solver is None:
+        solver = get_solver()
+    m = flowsheet.build(**options["build"])
+    flowsheet.set_operating_conditions(m, **options["set_operating_conditions"])
+    flowsheet.initialize_system(m, **options["initialize_system"])
+    results = solver.solve(m, tee=tee)
+    pyo.assert_optimal_termination(results)
+    return m
+
+
+def simulate(
+    flowsheet,
+    influent,
+    results_file,
+    horizon=None,
+    window=86400,
+    time_nfe=24,
+    steady_state=None,
+    solver=None,
+    tee=False,
+    **flowsheet_options,
+):
+    """
+    Simulate a flowsheet over an influent time series in rolling windows.
+
+    The first window starts at steady state, and the solution of the
+    steady-state flowsheet is used as the initial guess at every time point of
+    the first window. When ``steady_state`` is not given, it is built and
+    solved with solve_steady_state.
+
+    Args:
+        flowsheet - flowsheet module, e.g. BSM2 or BSM2_P_extension
+        influent - influent file name, or dict returned by load_influent
+        results_file - CSV file the effluent quality is written to
+        horizon (optional) - simulated time in seconds, the length of the
+            influent time series by default
+        window (optional) - length of each window in seconds
+        time_nfe (optional) - number of finite elements in each window
+        steady_state (optional) - solved steady-state model of the
+            flowsheet, built and solved with the same options by default
+        solver (optional) - solver to use, the WaterTAP default otherwise
+        tee (optional) - display the solver log
+        flowsheet_options (optional) - passed to those of the flowsheet's
+            build, set_operating_conditions, scale_system and (for the
+            steady state) initialize_system which accept them, e.g. bio_P
+
+    Returns:
+        dynamic flowsheet model of the last window
+
+    Raises:
+        ConfigurationError if an option is not accepted by any of them
+    """
+    options = _split_options(
+        flowsheet,
+        flowsheet_options,
+        ("build", "set_operating_conditions", "scale_system", "initialize_system"),
+    )
+    if not isinstance(influent, dict):
+        influent = load_influent(influent)
+    start = influent["time"][0]
+    if horizon is None:
+        horizon = influent["time"][-1] - start
+    n_windows = max(1, math.ceil(horizon / window - 1e-9))
+    if solver is None:
+        solver = get_solver()
+
+    m = flowsheet.build(
+        dynamic=True, horizon=window, time_nfe=time_nfe, **options["build"]
+    )
+    flowsheet.set_operating_conditions(m, **options["set_operating_conditions"])
+    flowsheet.add_effluent_violations(m)
+    # Limits are only reported during simulation
+    for limit in effluent_limits.values():
+        m.fs.component("eq_" + limit).deactivate()
+    set_influent(m, influent, start=start)
+    m.fs.fix_initial_conditions()
+
+    if steady_state is None:
+        steady_options = {
+            **options["build"],
+            **options["set_operating_conditions"],
+            **options["initialize_system"],
+        }
+        steady_state = solve_steady_state(
+            flowsheet, solver=solver, tee=tee, **steady_options
+        )
+    time_vars = flatten_dae_components(m, m.fs.time, pyo.Var)[1]
+    copy_steady_state(m, steady_state, time_vars)
+    flowsheet.scale_system(m, **options["scale_system"])
+
+    with open(results_file, "w", newline="") as f:
+        writer = None
+        for k in range(n_windows):
+            t_start = start + k * window
+            if k == 1:
+                # Later windows start from the end state of the previous one
+                initial_states = fix_initial_states(m)
+            if k > 0:
+                shift_window(m, initial_states, time_vars)
+                set_influent(m, influent, start=t_start)
+
+            results = solver.solve(m, tee=tee)
+            pyo.assert_optimal_termination(results)
+
+            quality = effluent_quality(m)
+            if writer is None:
+                writer = csv.writer(f)
+                writer.writerow(quality.keys())
+            for i, row in enumerate(zip(*quality.values())):
+                # The first point repeats the end of the previous window
+                if k > 0 and i == 0:
+                    continue
+                if t_start + row[0] > start + horizon + 1e-9:
+                    break
+                writer.writerow((t_start + row[0],) + row[1:])
+            f.flush()
+            _log.info(f"Solved window {k + 1} of {n_windows}.")
+
+    return m
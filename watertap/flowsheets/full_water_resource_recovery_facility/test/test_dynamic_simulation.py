@@ -0,0 +1,248 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+Tests for rolling horizon dynamic simulation of the full Water Resource Recovery
+Facility flowsheets.
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from pyomo.environ import value
+from idaes.core.util.exceptions import ConfigurationError
+from idaes.core.util.model_statistics import degrees_of_freedom
+
+import watertap.flowsheets.full_water_resource_recovery_facility.BSM2 as BSM2
+import watertap.flowsheets.full_water_resource_recovery_facility.BSM2_P_extension as BSM2_P
+from watertap.flowsheets.full_water_resource_recovery_facility.dynamic_simulation import (
+    copy_steady_state,
+    effluent_limits,
+    effluent_quality,
+    fix_initial_states,
+    load_influent,
+    set_influent,
+    shift_window,
+    simulate,
+    solve_steady_state,
+)
+
+
+def write_influent(filename, rows, header=("time", "flow_vol", "S_S")):
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+    return filename
+
+
+def build_window(flowsheet, **options):
+    m = flowsheet.build(dynamic=True, horizon=3600, time_nfe=4, **options)
+    flowsheet.set_operating_conditions(m, **options)
+    flowsheet.add_effluent_violations(m)
+    for limit in effluent_limits.values():
+        m.fs.component("eq_" + limit).deactivate()
+    return m
+
+
+@pytest.mark.unit
+def test_load_influent(tmp_path):
+    filename = write_influent(
+        tmp_path / "influent.csv", [(0, 0.2, 0.05), (3600, 0.3, 0.07)]
+    )
+    influent = load_influent(filename)
+    assert list(influent) == ["time", "flow_vol", "S_S"]
+    assert influent["flow_vol"] == pytest.approx([0.2, 0.3])
+
+    filename = write_influent(
+        tmp_path / "no_time.csv", [(0, 0.2)], header=("t", "flow_vol")
+    )
+    with pytest.raises(ConfigurationError, match="has no time column"):
+        load_influent(filename)
+
+    filename = write_influent(
+        tmp_path / "unsorted.csv", [(3600, 0.2, 0.05), (0, 0.3, 0.07)]
+    )
+    with pytest.raises(ConfigurationError, match="must be strictly increasing"):
+        load_influent(filename)
+
+
+class TestDynamicBSM2:
+    @pytest.fixture(scope="class")
+    def window(self):
+        return build_window(BSM2)
+
+    @pytest.mark.component
+    def test_build(self, window):
+        m = window
+        assert m.fs.config.dynamic
+        assert list(m.fs.time) == pytest.approx([0, 900, 1800, 2700, 3600])
+        # Steady-state initial conditions for the first window
+        m.fs.fix_initial_conditions()
+        assert degrees_of_freedom(m) == 0
+
+    @pytest.mark.component
+    def test_set_influent(self, window):
+        m = window
+        influent = {
+            "time": np.array([0, 7200]),
+            "flow_vol": np.array([0.2, 0.4]),
+            "S_S": np.array([0.05, 0.09]),
+        }
+        set_influent(m, influent, start=1800)
+        assert value(m.fs.FeedWater.flow_vol[0]) == pytest.approx(0.25)
+        assert value(m.fs.FeedWater.flow_vol[3600]) == pytest.approx(0.35)
+        assert value(m.fs.FeedWater.conc_mass_comp[1800, "S_S"]) == pytest.approx(0.07)
+        # Influent is held constant after the end of the time series
+        set_influent(m, influent, start=7200)
+        assert value(m.fs.FeedWater.flow_vol[3600]) == pytest.approx(0.4)
+        assert degrees_of_freedom(m) == 0
+
+        with pytest.raises(ConfigurationError, match="Influent column foo"):
+            set_influent(m, {"time": np.array([0]), "foo": np.array([1])})
+
+    @pytest.mark.component
+    def test_fix_initial_states(self, window):
+        m = window
+        initial_states = fix_initial_states(m)
+        assert degrees_of_freedom(m) == 0
+
+        holdup = m.fs.R3.control_volume.material_holdup
+        assert holdup[0, "Liq", "S_S"].fixed
+        # Dissolved oxygen and water are determined by the setpoint and volume
+        assert not holdup[0, "Liq", "S_O"].fixed
+        assert not holdup[0, "Liq", "H2O"].fixed
+        assert m.fs.R3.control_volume.material_accumulation[0, "Liq", "S_O"].fixed
+        assert not m.fs.RADM.liquid_phase.energy_holdup[0, "Liq"].fixed
+
+        holdup[3600, "Liq", "S_S"].set_value(7)
+        m.fs.R3.outlet.conc_mass_comp[3600, "S_O"].set_value(3e-3)
+        shift_window(m, initial_states)
+        assert holdup[0, "Liq", "S_S"].value == 7
+        assert holdup[0, "Liq", "S_S"].fixed
+        assert m.fs.R3.outlet.conc_mass_comp[1800, "S_O"].value == 3e-3
+        # Fixed operating conditions are not changed
+        assert m.fs.R3.outlet.conc_mass_comp[0, "S_O"].value == 1.72e-3
+        assert degrees_of_freedom(m) == 0
+
+    @pytest.mark.component
+    def test_effluent_quality(self, window):
+        m = window
+        quality = effluent_quality(m)
+        assert list(quality) == [
+            "time",
+            "TSS",
+            "TSS_violation",
+            "COD",
+            "COD_violation",
+            "Total_N",
+            "Total_N_violation",
+            "BOD5",
+            "BOD5_violation",
+        ]
+        assert quality["time"] == list(m.fs.time)
+        assert quality["TSS"][0] == pytest.approx(
+            value(m.fs.Treated.properties[0].TSS), rel=1e-12
+        )
+        assert quality["Total_N"][2] == pytest.approx(
+            value(m.fs.Treated.properties[1800].Total_N), rel=1e-12
+        )
+        assert quality["TSS_violation"][0] == int(
+            quality["TSS"][0] > value(m.fs.TSS_max)
+        )
+
+
+@pytest.mark.component
+def test_copy_steady_state(caplog):
+    steady_state = BSM2.build()
+    BSM2.set_operating_conditions(steady_state)
+    steady_state.fs.R3.outlet.conc_mass_comp[0, "S_S"].set_value(0.123)
+    m = build_window(BSM2)
+
+    with caplog.at_level("WARNING"):
+        copy_steady_state(m, steady_state)
+    assert not caplog.records
+    for t in m.fs.time:
+        assert value(m.fs.R3.outlet.conc_mass_comp[t, "S_S"]) == 0.123
+    # Fixed variables are not changed
+    assert value(m.fs.R3.outlet.conc_mass_comp[0, "S_O"]) == 1.72e-3
+
+
+@pytest.mark.unit
+def test_steady_state_options():
+    with pytest.raises(ConfigurationError, match=r"Options \['foo'\] are not"):
+        solve_steady_state(BSM2, max_workers=2, foo=1)
+
+
+@pytest.mark.component
+@pytest.mark.parametrize("bio_P", [False, True])
+def test_dynamic_BSM2_P_extension(bio_P):
+    m = build_window(BSM2_P, bio_P=bio_P)
+    m.fs.fix_initial_conditions()
+    assert degrees_of_freedom(m) == 0
+    fix_initial_states(m)
+    assert degrees_of_freedom(m) == 0
+    assert not m.fs.AD.liquid_phase.energy_holdup[0, "Liq"].fixed
+    assert m.fs.R1.control_volume.material_holdup[0, "Liq", "S_A"].fixed
+
+
+@pytest.mark.requires_idaes_solver
+@pytest.mark.integration
+def test_simulate(tmp_path):
+    steady_state = solve_steady_state(BSM2)
+
+    # Daily flow with a 20% increase in the second half of each day
+    flow = value(steady_state.fs.FeedWater.flow_vol[0])
+    time = np.arange(0, 2 * 86400 + 1, 3600)
+    rows = [(t, flow * (1.2 if (t // 43200) % 2 else 1)) for t in time]
+    influent = write_influent(tmp_path / "influent.csv", rows, ("time", "flow_vol"))
+    results_file = tmp_path / "effluent.csv"
+
+    simulate(
+        BSM2,
+        influent,
+        results_file,
+        window=86400,
+        time_nfe=8,
+        steady_state=steady_state,
+    )
+    with open(results_file, newline="") as f:
+        results = list(csv.DictReader(f))
+    assert len(results) == 17
+    assert float(results[-1]["time"]) == pytest.approx(2 * 86400)
+    assert all(float(row["TSS"]) > 0 for row in results)
+    assert float(results[0]["TSS"]) == pytest.approx(
+        value(steady_state.fs.CL1.effluent_state[0].TSS), rel=1e-4
+    )
+
+
+@pytest.mark.requires_idaes_solver
+@pytest.mark.integration
+def test_simulate_from_steady_state(tmp_path):
+    m = BSM2_P.build(bio_P=True)
+    BSM2_P.set_operating_conditions(m, bio_P=True)
+    flow = value(m.fs.FeedWater.flow_vol[0])
+    influent = write_influent(
+        tmp_path / "influent.csv", [(0, flow), (7200, flow)], ("time", "flow_vol")
+    )
+    results_file = tmp_path / "effluent.csv"
+
+    # The steady state of the first window is built and solved internally
+    m = simulate(BSM2_P, influent, results_file, window=3600, time_nfe=2, bio_P=True)
+    assert m.fs.config.dynamic
+    with open(results_file, newline="") as f:
+        results = list(csv.DictReader(f))
+    assert len(results) == 5
+    # A constant influent stays at steady state
+    for row in results:
+        assert float(row["TSS"]) == pytest.approx(float(results[0]["TSS"]), rel=1e-4)
@@ -26,6 +26,7 @@ Department of Industrial Electrical Engineering and Automation, Lund University,
 # Some more information about this module
 __author__ = "Alejandro Garciadiego, Xinhong Liu, Adam Atia, Marcus Holly"
 
+import multiprocessing
 import platform
 import pytest
 
@@ -33,7 +34,9 @@ from pyomo.environ import (
     assert_optimal_termination,
     TransformationFactory,
     value,
+    Var,
 )
+from pyomo.network import Arc
 from pyomo.util.check_units import assert_units_consistent
 
 from idaes.core.util.model_statistics import degrees_of_freedom
@@ -43,6 +46,9 @@ from idaes.core.util.scaling import (
 )
 
 import watertap.flowsheets.full_water_resource_recovery_facility.BSM2 as BSM2
+from watertap.core.util.parallel_initialization import (
+    ParallelSequentialDecomposition,
+)
 
 is_reference_platform = (
     platform.system() == "Windows" and platform.python_version_tuple()[0] == "3"
@@ -66,6 +72,51 @@ linux_platform_only = pytest.mark.xfail(
 )
 
 
+def _decomposition(m, max_workers):
+    # Same decomposition as initialize_system
+    seq = ParallelSequentialDecomposition(max_workers=max_workers)
+    seq.options.tear_method = "Direct"
+    seq.options.iterLim = 1
+    seq.options.tear_set = [m.fs.stream2, m.fs.stream10adm]
+    return seq
+
+
+@pytest.mark.component
+def test_initialization_levels():
+    m = BSM2.build()
+    BSM2.set_operating_conditions(m)
+
+    seq = _decomposition(m, max_workers=2)
+    order = seq.calculation_order(seq.create_graph(m))
+    levels = [[u.name for u in lev] for lev in order]
+
+    units = set()
+    for arc in m.fs.component_data_objects(Arc):
+        units.add(arc.source.parent_block().name)
+        units.add(arc.destination.parent_block().name)
+    assert sorted(u for lev in levels for u in lev) == sorted(units)
+
+    # The tear streams make the first reactor and the anaerobic digester
+    # branch independent, so both are initialized at the same time
+    assert levels[0] == ["fs.R1", "fs.FeedWater", "fs.asm_adm"]
+    assert levels[1] == ["fs.R2", "fs.RADM"]
+    assert max(len(lev) for lev in levels) > 1
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return
+
+    # Running the levels in worker processes gives the same values and
+    # specification as running them serially
+    serial = m.clone()
+    seq.run(m, lambda unit: None)
+    _decomposition(serial, max_workers=1).run(serial, lambda unit: None)
+    for v in serial.component_data_objects(Var):
+        parallel_v = m.find_component(v.name)
+        assert parallel_v.fixed == v.fixed, v.name
+        assert parallel_v.value == v.value, v.name
+    assert degrees_of_freedom(m) == degrees_of_freedom(serial)
+
+
 class TestFullFlowsheet:
     @pytest.fixture(scope="class")
     @classmethod
@@ -858,7 +858,81 @@ def do_backward_initialization_pass(m, optarg):
             propagate_state(m.fs.booster_pump_to_mixer[stage])
 
 
-def initialize(m, verbose=True, solver=None):
+def get_state_config(m):
+    """
+    Get the configuration of an LSRRO flowsheet used to key saved states.
+    """
+    stage = m.fs.ROUnits[m.fs.FirstStage]
+    return {
+        "number_of_stages": value(m.fs.NumberOfStages),
+        "RO_model": type(stage).__name__,
+        "finite_elements": (
+            stage.config.finite_elements if "finite_elements" in stage.config else None
+        ),
+        "pressure_change_type": str(stage.config.pressure_change_type),
+        "concentration_polarization_type": str(
+            stage.config.concentration_polarization_type
+        ),
+        "mass_transfer_coefficient": str(stage.config.mass_transfer_coefficient),
+        "has_B_max": m.fs.component("B_max") is not None,
+    }
+
+
+def get_state_operating_point(m):
+    """
+    Get the feed concentration and flow rate of an LSRRO flowsheet used to
+    find the nearest saved state.
+    """
+    return {
+        "Cin": value(m.fs.feed.properties[0].conc_mass_phase_comp["Liq", "NaCl"]),
+        "Qin": value(m.fs.feed.properties[0].flow_vol_phase["Liq"]),
+    }
+
+
+# Vars which scale linearly with the feed flow rate when restoring a state
+_flow_scaled_vars = {
+    "Qin": [
+        "flow_mass_phase_comp",
+        "flow_vol",
+        "mass_transfer_term",
+        "work",
+        "area",
+        "width",
+        "capital_cost",
+        "operating_cost",
+    ]
+}
+
+
+def save_state(m, state_store):
+    """
+    Save the state of a converged LSRRO flowsheet to a ModelStateStore.
+    """
+    state_store.save(m, get_state_config(m), get_state_operating_point(m))
+
+
+def restore_state(m, state_store):
+    """
+    Restore the saved state of the nearest operating point from a
+    ModelStateStore, scaling flow-proportional variables by the feed flow rate.
+
+    Returns:
+        True if a state was restored, otherwise False
+    """
+    return state_store.restore(
+        m,
+        get_state_config(m),
+        get_state_operating_point(m),
+        scaled_vars=_flow_scaled_vars,
+    )
+
+
+def initialize(m, verbose=True, solver=None, state_store=None):
+
+    # try a saved state first, skipping the initialization passes
+    if state_store is not None and restore_state(m, state_store):
+        m.fs.costing.initialize()
+        return
 
     # ---initializing---
     # set up solvers
@@ -891,13 +965,15 @@ def initialize(m, verbose=True, solver=None):
     m.fs.costing.initialize()
 
 
-def solve(model, solver=None, tee=False, raise_on_failure=False):
+def solve(model, solver=None, tee=False, raise_on_failure=False, state_store=None):
     # ---solving---
     if solver is None:
         solver = get_solver()
 
     results = solver.solve(model, tee=tee)
     if check_optimal_termination(results):
+        if state_store is not None:
+            save_state(model, state_store)
         return results
     msg = (
         "The current configuration is infeasible. Please adjust the decision variables."
@@ -1841,9 +1917,14 @@ def _lsrro_presweep(
     permeate_quality_limit=1000e-6,
     has_CP=True,
     quick_start=False,
+    state_store=None,
 ):
     """
     Set up model for optimization, unfix feed mass flowrates, and fix mass concentration and volumetric flowrate for anticipated parameter sensitivity
+
+    If a ModelStateStore is provided as state_store, the initialization is
+    replaced by the nearest saved state when one exists, and the converged
+    simulation state is saved to it.
     """
     m = build(
         number_of_stages=number_of_stages,
@@ -1853,8 +1934,8 @@ def _lsrro_presweep(
     )
     set_operating_conditions(m)
     if not quick_start:
-        initialize(m)
-    solve(m)
+        initialize(m, state_store=state_store)
+    solve(m, state_store=state_store)
     m.fs.feed.flow_mass_phase_comp.unfix()
     m.fs.feed.properties[0].conc_mass_phase_comp["Liq", "NaCl"].fix()
     m.fs.feed.properties[0].flow_vol_phase["Liq"].fix()
@@ -10,12 +10,16 @@
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
 
+import os
+
 from pyomo.environ import (
     units as pyunits,
     Expression,
 )
 
 from parameter_sweep import LinearSample, parameter_sweep
+from watertap.core.solvers import get_solver
+from watertap.core.util.continuation import ContinuationSweep
 from watertap.flowsheets.lsrro import lsrro
 
 
@@ -46,14 +50,100 @@ def run_case(number_of_stages, nx, output_filename=None, quick_start=False):
             f"param_sweep_output/{number_of_stages}_stage/results_LSRRO.csv"
         )
 
-    sweep_params = {}
-    outputs = {}
+    m = lsrro._lsrro_presweep(
+        number_of_stages=number_of_stages, quick_start=quick_start
+    )
+    sweep_params = _build_sweep_params(m, nx)
+    outputs = _build_outputs(m)
+
+    global_results = parameter_sweep(
+        m,
+        sweep_params,
+        outputs,
+        csv_results_file_name=output_filename,
+        optimize_function=lsrro.solve,
+        interpolate_nan_outputs=True,
+    )
+
+    return global_results, sweep_params, m
+
+
+def run_continuation_case(
+    number_of_stages, nx, output_filename=None, quick_start=False, solver=None
+):
+    """
+    Run a continuation sweep on the LSRRO flowsheet over the same feed
+    concentration and water recovery grid as run_case.
+
+    Grid points are visited along a serpentine path and each point is
+    warm-started from the nearest converged point (primal values and IPOPT
+    duals). A single forward initialization pass is only run for points whose
+    warm-started solve fails.
+
+    Arguments
+    ---------
+    number_of_stages (int) : The number of LSRRO Stages (including the initial RO stage).
+    nx (int) : The number of points for both feed concentration and water recovery. The
+               total number of points swept will be nx^2.
+    output_filename (str, optional): The place to write the sweep results csv file. By
+               default it is
+               ./param_sweep_output/{number_of_stages}_stage/results_LSRRO_continuation.csv
+    quick_start (bool, optional): Skip the full initialization before the first solve.
+    solver (optional): The solver to use, by default get_solver() is used.
+
+    Returns
+    -------
+    results (pandas DataFrame) : The sweep parameters, outputs and the number of solves
+                                 and solve time for each point
+    sweep_params (dict) : The dictionary of samples
+    model (Pyomo ConcreteModel) : The LSRRO flowsheet used for the sweep
+
+    """
+
+    if output_filename is None:
+        output_filename = (
+            f"param_sweep_output/{number_of_stages}_stage/"
+            "results_LSRRO_continuation.csv"
+        )
+    if solver is None:
+        solver = get_solver()
 
     m = lsrro._lsrro_presweep(
         number_of_stages=number_of_stages, quick_start=quick_start
     )
+    sweep_params = _build_sweep_params(m, nx)
+    outputs = _build_outputs(m)
+
+    sweep = ContinuationSweep(
+        m,
+        sweep_params,
+        outputs,
+        optimize_function=lsrro.solve,
+        reinitialize_function=_reinitialize,
+        reinitialize_kwargs={"solver": solver},
+        solver=solver,
+    )
+    results = sweep.run()
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_filename)), exist_ok=True)
+    results.to_csv(output_filename, index=False)
+
+    return results, sweep_params, m
+
+
+def _reinitialize(m, solver=None):
+    """
+    Cheap re-initialization used when a warm-started solve fails: a single
+    forward pass through the stages instead of the full lsrro.initialize.
+    """
+    if solver is None:
+        solver = get_solver()
+    lsrro.do_forward_initialization_pass(m, optarg=solver.options, guess_mixers=True)
+    m.fs.costing.initialize()
 
-    # Sweep parameters ------------------------------------------------------------------------
+
+def _build_sweep_params(m, nx):
+    sweep_params = {}
 
     sweep_params["Feed Concentration"] = LinearSample(
         m.fs.feed.properties[0].conc_mass_phase_comp["Liq", "NaCl"], 5, 250, nx
@@ -63,7 +153,12 @@ def run_case(number_of_stages, nx, output_filename=None, quick_start=False):
         m.fs.water_recovery, 0.3, 0.9, nx
     )
 
-    # Outputs  -------------------------------------------------------------------------------
+    return sweep_params
+
+
+def _build_outputs(m):
+    outputs = {}
+
     outputs["LCOW"] = m.fs.costing.LCOW
     outputs["LCOW wrt Feed Flow"] = m.fs.costing.LCOW_feed
     outputs["SEC"] = m.fs.costing.specific_energy_consumption
@@ -335,16 +430,7 @@ def run_case(number_of_stages, nx, output_filename=None, quick_start=False):
         }
     )
 
-    global_results = parameter_sweep(
-        m,
-        sweep_params,
-        outputs,
-        csv_results_file_name=output_filename,
-        optimize_function=lsrro.solve,
-        interpolate_nan_outputs=True,
-    )
-
-    return global_results, sweep_params, m
+    return outputs
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+
+import pytest
+
+from watertap.core.util.model_state import ModelStateStore
+from watertap.flowsheets.lsrro import lsrro
+
+
+def _build(number_of_stages, Qin, RO_1D=False):
+    m = lsrro.build(number_of_stages=number_of_stages, RO_1D=RO_1D)
+    m.fs.feed.properties[0].conc_mass_phase_comp["Liq", "NaCl"].value = 70
+    m.fs.feed.properties[0].flow_vol_phase["Liq"].value = Qin
+    return m
+
+
+@pytest.mark.component
+def test_state_config():
+    m = _build(2, 1e-3)
+    assert lsrro.get_state_config(m) == {
+        "number_of_stages": 2,
+        "RO_model": "ReverseOsmosisData",
+        "finite_elements": None,
+        "pressure_change_type": "PressureChangeType.calculated",
+        "concentration_polarization_type": "ConcentrationPolarizationType.calculated",
+        "mass_transfer_coefficient": "MassTransferCoefficient.calculated",
+        "has_B_max": False,
+    }
+    assert lsrro.get_state_operating_point(m) == {"Cin": 70, "Qin": 1e-3}
+
+
+@pytest.mark.component
+def test_save_restore_state(tmp_path):
+    store = ModelStateStore(tmp_path)
+
+    m = _build(2, 1e-3)
+    m.fs.ROUnits[2].area.value = 42
+    m.fs.PrimaryPumps[1].control_volume.work[0].value = 1e4
+    lsrro.save_state(m, store)
+
+    # a different number of stages does not match the saved state
+    assert not lsrro.restore_state(_build(3, 1e-3), store)
+
+    m2 = _build(2, 2e-3)
+    assert lsrro.restore_state(m2, store)
+    assert m2.fs.ROUnits[2].area.value == pytest.approx(84)
+    assert m2.fs.PrimaryPumps[1].control_volume.work[0].value == pytest.approx(2e4)
+
+    # initialize uses the saved state and skips the initialization passes
+    m3 = _build(2, 1e-3)
+    lsrro.initialize(m3, state_store=store)
+    assert m3.fs.ROUnits[2].area.value == pytest.approx(42)
@@ -16,7 +16,7 @@ import pytest
 
 import pandas as pd
 
-from watertap.flowsheets.lsrro.multi_sweep import run_case
+from watertap.flowsheets.lsrro.multi_sweep import run_case, run_continuation_case
 
 _this_file_path = os.path.dirname(os.path.abspath(__file__))
 
@@ -53,3 +53,30 @@ def test_against_multisweep(number_of_stages, tmp_path):
                 break
         else:  # no break
             assert pytest.approx(base, nan_ok=True, rel=1e-02, abs=1e-07) == test[k]
+
+
+@pytest.mark.integration
+def test_continuation_against_multisweep(tmp_path):
+    number_of_stages = 2
+    csv_baseline_file_name = os.path.join(
+        _this_file_path,
+        "parameter_sweep_baselines",
+        f"{number_of_stages}_stage_results_LSRRO.csv",
+    )
+    results, _, _ = run_continuation_case(
+        number_of_stages,
+        2,
+        output_filename=os.path.join(tmp_path, "results.csv"),
+        quick_start=True,
+    )
+
+    baseline = pd.read_csv(csv_baseline_file_name).astype(float)
+
+    assert len(results) == len(baseline)
+    assert (results["solve_count"] >= 1).all()
+    assert list(results["Feed Concentration"]) == list(baseline["# Feed Concentration"])
+    for k, row in baseline.iterrows():
+        if math.isnan(row["LCOW"]):
+            continue
+        assert results["converged"][k]
+        assert results["LCOW"][k] == pytest.approx(row["LCOW"], rel=1e-2)
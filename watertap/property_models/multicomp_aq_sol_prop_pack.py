@@ -24,8 +24,11 @@ nanofiltration.
 #  -add viscosity as func of temp and concentration
 
 # Import Python libraries
+import math
 from enum import Enum, auto
 
+import numpy as np
+
 # Import Pyomo libraries
 from pyomo.environ import (
     Constraint,
@@ -44,6 +47,7 @@ from pyomo.environ import (
     exp,
 )
 from pyomo.common.config import ConfigValue, In, Bool
+from pyomo.common.errors import IterationLimitError
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
 
 # Import IDAES cores
@@ -1020,6 +1024,69 @@ class MCASParameterData(PhysicalParameterBlock):
         )
 
 
+def electroneutral_flows(params, flows, adjust_by_ion):
+    """
+    Adjust the flow of one ion so that many compositions satisfy
+    electroneutrality, without solving a model.
+
+    The charge balance sum(z_j * conc_mol_j) = 0 is equivalent to
+    sum(z_j * flow_mol_j) = 0 for any density, so the flow of the adjusted ion
+    is calculated directly from the flows of the other ions.
+
+    Args:
+        params - MCAS parameter block
+        flows - dict of component name to array of flows in the material
+                flow basis of params (flow_mol_phase_comp for molar,
+                flow_mass_phase_comp for mass basis). Components which are not
+                given are treated as having zero flow
+        adjust_by_ion - name of the ion in params.ion_set to adjust
+
+    Returns:
+        copy of flows with the flows of adjust_by_ion replaced by the adjusted
+        values. Compositions which cannot be balanced by adjust_by_ion (i.e.,
+        requiring a negative flow) are set to NaN
+
+    Raises:
+        ValueError if adjust_by_ion is not in params.ion_set
+    """
+    if adjust_by_ion not in params.ion_set:
+        raise ValueError(
+            "adjust_by_ion must be set to the name of an ion in the ion_set."
+        )
+    molar_basis = params.config.material_flow_basis == MaterialFlowBasis.molar
+
+    def to_molar(j, flow):
+        flow = np.asarray(flow, dtype=float)
+        return flow if molar_basis else flow / value(params.mw_comp[j])
+
+    charge_flow = sum(
+        value(params.charge_comp[j]) * to_molar(j, flows[j])
+        for j in params.ion_set
+        if j != adjust_by_ion and j in flows
+    )
+    adjusted = -np.asarray(charge_flow, dtype=float) / value(
+        params.charge_comp[adjust_by_ion]
+    )
+    if not molar_basis:
+        adjusted = adjusted * value(params.mw_comp[adjust_by_ion])
+    adjusted = np.where(adjusted >= 0, adjusted, np.nan)
+
+    result = dict(flows)
+    result[adjust_by_ion] = adjusted if adjusted.ndim else float(adjusted)
+    return result
+
+
+def _value(obj):
+    val = value(obj, exception=False)
+    return np.nan if val is None else val
+
+
+def _set_if_finite(var, val):
+    val = float(val)
+    if math.isfinite(val):
+        var.set_value(val)
+
+
 class _MCASStateBlock(StateBlock):
     """
     This Class contains methods which should be applied to Property Blocks as a whole, rather
@@ -1094,148 +1161,9 @@ class _MCASStateBlock(StateBlock):
         flags = fix_state_vars(self, state_args)
 
         # initialize vars calculated from state vars
-        for k in self.keys():
-            # Vars indexed by phase and component_list
-            for j in self[k].params.component_list:
-                if self[k].params.config.material_flow_basis == MaterialFlowBasis.molar:
-                    if self[k].is_property_constructed("flow_mass_phase_comp"):
-                        self[k].flow_mass_phase_comp["Liq", j].set_value(
-                            self[k].flow_mol_phase_comp["Liq", j]
-                            * self[k].params.mw_comp[j]
-                        )
-                elif (
-                    self[k].params.config.material_flow_basis == MaterialFlowBasis.mass
-                ):
-                    if self[k].is_property_constructed("flow_mol_phase_comp"):
-                        self[k].flow_mol_phase_comp["Liq", j].set_value(
-                            self[k].flow_mass_phase_comp["Liq", j]
-                            / self[k].params.mw_comp[j]
-                        )
-                else:
-                    pass
-
-                if self[k].is_property_constructed("mass_frac_phase_comp"):
-                    self[k].mass_frac_phase_comp["Liq", j].set_value(
-                        self[k].flow_mass_phase_comp["Liq", j]
-                        / sum(
-                            self[k].flow_mass_phase_comp["Liq", j]
-                            for j in self[k].params.component_list
-                        )
-                    )
-                if self[k].is_property_constructed("conc_mass_phase_comp"):
-                    self[k].conc_mass_phase_comp["Liq", j].set_value(
-                        self[k].dens_mass_phase["Liq"]
-                        * self[k].mass_frac_phase_comp["Liq", j]
-                    )
-
-                if self[k].is_property_constructed("conc_mol_phase_comp"):
-                    self[k].conc_mol_phase_comp["Liq", j].set_value(
-                        self[k].conc_mass_phase_comp["Liq", j]
-                        / self[k].params.mw_comp[j]
-                    )
-
-                if self[k].is_property_constructed("mole_frac_phase_comp"):
-                    self[k].mole_frac_phase_comp["Liq", j].set_value(
-                        self[k].flow_mol_phase_comp["Liq", j]
-                        / sum(
-                            self[k].flow_mol_phase_comp["Liq", j]
-                            for j in self[k].params.component_list
-                        )
-                    )
-
-            # Vars indexed by solute_set
-            for j in self[k].params.solute_set:
-                if self[k].is_property_constructed("molality_phase_comp"):
-                    self[k].molality_phase_comp["Liq", j].set_value(
-                        self[k].flow_mol_phase_comp["Liq", j]
-                        / self[k].flow_mol_phase_comp["Liq", "H2O"]
-                        / self[k].params.mw_comp["H2O"]
-                    )
-
-            # Vars indexed by ion_set
-            for j in self[k].params.ion_set:
-                if (
-                    self[k].is_property_constructed("elec_mobility_phase_comp")
-                    and self[k].params.config.elec_mobility_calculation
-                    == ElectricalMobilityCalculation.EinsteinRelation
-                ):
-                    self[k].elec_mobility_phase_comp["Liq", j].set_value(
-                        self[k].diffus_phase_comp["Liq", j]
-                        * abs(self[k].charge_comp[j])
-                        * Constants.faraday_constant
-                        / (Constants.gas_constant * self[k].temperature)
-                    )
-                if self[k].is_property_constructed("conc_equiv_phase_comp"):
-                    self[k].conc_equiv_phase_comp["Liq", j].set_value(
-                        self[k].conc_mol_phase_comp["Liq", j]
-                        / abs(self[k].params.charge_comp[j])
-                    )
-                if self[k].is_property_constructed("flow_equiv_phase_comp"):
-                    self[k].flow_equiv_phase_comp["Liq", j].set_value(
-                        self[k].flow_mol_phase_comp["Liq", j]
-                        * abs(self[k].params.charge_comp[j])
-                    )
-            # Vars not indexed or indexed only by phase
-            if self[k].is_property_constructed("flow_vol_phase"):
-                self[k].flow_vol_phase["Liq"].set_value(
-                    sum(
-                        self[k].flow_mol_phase_comp["Liq", j]
-                        * self[k].params.mw_comp[j]
-                        for j in self[k].params.component_list
-                    )
-                    / self[k].dens_mass_phase["Liq"]
-                )
-            if self[k].is_property_constructed("visc_k_phase"):
-                self[k].visc_k_phase["Liq"].set_value(
-                    self[k].visc_d_phase["Liq"] / self[k].dens_mass_phase["Liq"]
-                )
-            if self[k].is_property_constructed("ionic_strength_molal"):
-                self[k].ionic_strength_molal.set_value(
-                    0.5
-                    * sum(
-                        self[k].charge_comp[j] ** 2
-                        * self[k].molality_phase_comp["Liq", j]
-                        for j in self[k].params.solute_set
-                    )
-                )
-            if self[k].is_property_constructed("pressure_osm_phase"):
-                self[k].pressure_osm_phase["Liq"].set_value(
-                    sum(
-                        self[k].conc_mol_phase_comp["Liq", j]
-                        for j in self[k].params.solute_set
-                    )
-                    * Constants.gas_constant
-                    * self[k].temperature
-                )
+        self._initialize_property_values()
 
-            if (
-                self[k].is_property_constructed("equiv_conductivity_phase")
-                and self[k].params.config.equiv_conductivity_calculation
-                == EquivalentConductivityCalculation.ElectricalMobility
-            ):
-                self[k].equiv_conductivity_phase["Liq"].set_value(
-                    sum(
-                        Constants.faraday_constant
-                        * abs(self[k].charge_comp[j])
-                        * self[k].elec_mobility_phase_comp["Liq", j]
-                        * self[k].conc_mol_phase_comp["Liq", j]
-                        for j in self[k].params.ion_set
-                    )
-                    / sum(
-                        abs(self[k].charge_comp[j])
-                        * self[k].conc_mol_phase_comp["Liq", j]
-                        for j in self[k].params.cation_set
-                    )
-                )
-            if self[k].is_property_constructed("elec_cond_phase"):
-                self[k].elec_cond_phase["Liq"].set_value(
-                    self[k].equiv_conductivity_phase["Liq"]
-                    * sum(
-                        abs(self[k].charge_comp[j])
-                        * self[k].conc_mol_phase_comp["Liq", j]
-                        for j in self[k].params.cation_set
-                    )
-                )
+        for k in self.keys():
             if self[k].is_property_constructed("total_hardness"):
                 if hasattr(self[k], "eq_total_hardness"):
                     calculate_variable_from_constraint(
@@ -1305,6 +1233,165 @@ class _MCASStateBlock(StateBlock):
                 f"check the output logs for more information."
             )
 
+    def _initialize_property_values(self):
+        """
+        Set initial values of the properties which are calculated directly from
+        the state variables, for all indices of the state block at once.
+
+        The state variable values of all indices are gathered into arrays and
+        the property values are calculated with NumPy, instead of building and
+        evaluating Pyomo expressions for every index and component. Only
+        properties which have been constructed are set, and values which
+        cannot be calculated (e.g., for zero flows) are left unchanged.
+        """
+        blks = list(self.values())
+        if len(blks) == 0:
+            return
+        params = blks[0].params
+        comps = list(params.component_list)
+        col = {j: i for i, j in enumerate(comps)}
+        solutes = [col[j] for j in params.solute_set]
+        ions = [col[j] for j in params.ion_set]
+        cations = [col[j] for j in params.cation_set]
+        i_h2o = col["H2O"]
+
+        mw = np.array([value(params.mw_comp[j]) for j in comps])
+        charge = np.zeros(len(comps))
+        for j in params.solute_set:
+            charge[col[j]] = abs(value(params.charge_comp[j]))
+        faraday = value(Constants.faraday_constant)
+        gas_constant = value(Constants.gas_constant)
+
+        def get_values(blk, name, index):
+            var = getattr(blk, name)
+            return [_value(var[i]) for i in index]
+
+        def is_constructed(name):
+            return np.array([b.is_property_constructed(name) for b in blks])
+
+        # State variables
+        temperature = np.array([_value(b.temperature) for b in blks])
+        if params.config.material_flow_basis == MaterialFlowBasis.molar:
+            flow_mol = np.array(
+                [
+                    get_values(b, "flow_mol_phase_comp", [("Liq", j) for j in comps])
+                    for b in blks
+                ]
+            )
+            flow_mass = flow_mol * mw
+        else:
+            flow_mass = np.array(
+                [
+                    get_values(b, "flow_mass_phase_comp", [("Liq", j) for j in comps])
+                    for b in blks
+                ]
+            )
+            flow_mol = flow_mass / mw
+
+        # Density and viscosity are only read where a property depends on them,
+        # so that they are not constructed otherwise
+        uses_dens = (
+            is_constructed("conc_mass_phase_comp")
+            | is_constructed("flow_vol_phase")
+            | is_constructed("visc_k_phase")
+        )
+        dens = np.array(
+            [
+                _value(b.dens_mass_phase["Liq"]) if used else np.nan
+                for b, used in zip(blks, uses_dens)
+            ]
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mass_frac = flow_mass / flow_mass.sum(axis=1, keepdims=True)
+            mole_frac = flow_mol / flow_mol.sum(axis=1, keepdims=True)
+            conc_mass = dens[:, np.newaxis] * mass_frac
+            conc_mol = conc_mass / mw
+            molality = flow_mol / flow_mol[:, [i_h2o]] / mw[i_h2o]
+            conc_equiv = conc_mol * charge
+            flow_equiv = flow_mol * charge
+            flow_vol = flow_mass.sum(axis=1) / dens
+            ionic_strength = 0.5 * (charge[solutes] ** 2 * molality[:, solutes]).sum(
+                axis=1
+            )
+            pressure_osm = conc_mol[:, solutes].sum(axis=1) * gas_constant * temperature
+            cation_equiv = (charge[cations] * conc_mol[:, cations]).sum(axis=1)
+
+        phase_comp = {
+            "flow_mass_phase_comp": (flow_mass, range(len(comps))),
+            "flow_mol_phase_comp": (flow_mol, range(len(comps))),
+            "mass_frac_phase_comp": (mass_frac, range(len(comps))),
+            "conc_mass_phase_comp": (conc_mass, range(len(comps))),
+            "conc_mol_phase_comp": (conc_mol, range(len(comps))),
+            "mole_frac_phase_comp": (mole_frac, range(len(comps))),
+            "molality_phase_comp": (molality, solutes),
+            "conc_equiv_phase_comp": (conc_equiv, ions),
+            "flow_equiv_phase_comp": (flow_equiv, ions),
+        }
+        # The state variables themselves are not overwritten
+        if params.config.material_flow_basis == MaterialFlowBasis.molar:
+            del phase_comp["flow_mol_phase_comp"]
+        else:
+            del phase_comp["flow_mass_phase_comp"]
+
+        einstein_mobility = (
+            params.config.elec_mobility_calculation
+            == ElectricalMobilityCalculation.EinsteinRelation
+        )
+        mobility_conductivity = (
+            params.config.equiv_conductivity_calculation
+            == EquivalentConductivityCalculation.ElectricalMobility
+        )
+
+        for n, b in enumerate(blks):
+            for name, (data, columns) in phase_comp.items():
+                if b.is_property_constructed(name):
+                    var = getattr(b, name)
+                    for i in columns:
+                        _set_if_finite(var["Liq", comps[i]], data[n, i])
+
+            if b.is_property_constructed("elec_mobility_phase_comp") and (
+                einstein_mobility
+            ):
+                for i in ions:
+                    j = comps[i]
+                    _set_if_finite(
+                        b.elec_mobility_phase_comp["Liq", j],
+                        _value(b.diffus_phase_comp["Liq", j])
+                        * charge[i]
+                        * faraday
+                        / (gas_constant * temperature[n]),
+                    )
+
+            if b.is_property_constructed("flow_vol_phase"):
+                _set_if_finite(b.flow_vol_phase["Liq"], flow_vol[n])
+            if b.is_property_constructed("visc_k_phase"):
+                _set_if_finite(
+                    b.visc_k_phase["Liq"], _value(b.visc_d_phase["Liq"]) / dens[n]
+                )
+            if b.is_property_constructed("ionic_strength_molal"):
+                _set_if_finite(b.ionic_strength_molal, ionic_strength[n])
+            if b.is_property_constructed("pressure_osm_phase"):
+                _set_if_finite(b.pressure_osm_phase["Liq"], pressure_osm[n])
+
+            if b.is_property_constructed("equiv_conductivity_phase") and (
+                mobility_conductivity
+            ):
+                mobility = np.array(
+                    [_value(b.elec_mobility_phase_comp["Liq", comps[i]]) for i in ions]
+                )
+                _set_if_finite(
+                    b.equiv_conductivity_phase["Liq"],
+                    faraday
+                    * np.sum(charge[ions] * mobility * conc_mol[n, ions])
+                    / cation_equiv[n],
+                )
+            if b.is_property_constructed("elec_cond_phase"):
+                _set_if_finite(
+                    b.elec_cond_phase["Liq"],
+                    _value(b.equiv_conductivity_phase["Liq"]) * cation_equiv[n],
+                )
+
     def release_state(self, flags, outlvl=idaeslog.NOTSET):
         """
         Method to release state variables fixed during initialisation.
@@ -2628,6 +2715,67 @@ class MCASStateBlockData(StateBlockData):
                 f"{self.name} MCAS Property Package set to use unsupported material flow basis: {self.get_material_flow_basis()}"
             )
 
+    def _solve_charge_balance_directly(self, adjust_by_ion=None):
+        """
+        Adjust the flow of adjust_by_ion (if given) to satisfy the charge
+        balance and calculate the concentrations it depends on, without a
+        solver.
+
+        Only the properties which the charge balance depends on are
+        calculated, other constructed properties keep their values.
+
+        Returns:
+            True if successful, or False if the state block needs to be
+            solved instead (e.g., it is not square or the required adjusted
+            flow is negative)
+        """
+        if degrees_of_freedom(self) != 0:
+            return False
+
+        if self.params.config.material_flow_basis == MaterialFlowBasis.molar:
+            state_name = "flow_mol_phase_comp"
+        else:
+            state_name = "flow_mass_phase_comp"
+        state_var = getattr(self, state_name)
+
+        if adjust_by_ion is not None:
+            flows = {
+                j: state_var["Liq", j].value
+                for j in self.params.ion_set
+                if j != adjust_by_ion
+            }
+            if any(v is None for v in flows.values()):
+                return False
+            adjusted = electroneutral_flows(self.params, flows, adjust_by_ion)[
+                adjust_by_ion
+            ]
+            if not math.isfinite(adjusted):
+                return False
+            state_var["Liq", adjust_by_ion].set_value(adjusted)
+
+        # Evaluate the properties needed for the charge balance in order, each
+        # from its own constraint (a scalar Newton solve where nonlinear)
+        for name in (
+            "flow_mol_phase_comp",
+            "flow_mass_phase_comp",
+            "mass_frac_phase_comp",
+            "dens_mass_solvent",
+            "dens_mass_phase",
+            "conc_mass_phase_comp",
+            "conc_mol_phase_comp",
+        ):
+            if name == state_name or not self.is_property_constructed(name):
+                continue
+            con = getattr(self, "eq_" + name)
+            for idx, var in getattr(self, name).items():
+                if var.fixed:
+                    continue
+                try:
+                    calculate_variable_from_constraint(var, con[idx])
+                except (ValueError, ArithmeticError, IterationLimitError):
+                    return False
+        return True
+
     def assert_electroneutrality(
         self,
         tol=None,
@@ -2636,9 +2784,33 @@ class MCASStateBlockData(StateBlockData):
         adjust_by_ion=None,
         get_property=None,
         solve=True,
+        direct=True,
     ):
         """
-        TODO: add descriptions of args and what is returned
+        Check that the state block satisfies electroneutrality, optionally
+        adjusting the flow of one ion to satisfy it.
+
+        Args:
+            tol (optional) - tolerance on the charge balance, default 1e-8
+            tee (optional) - if True (default), print the result
+            defined_state (optional) - if True (default), the solute flows are
+                                       expected to be fixed
+            adjust_by_ion (optional) - name of the ion whose flow is adjusted
+                                       to satisfy electroneutrality
+            get_property (optional) - name or list of names of on-demand
+                                      properties to construct and solve for
+                                      after the adjustment
+            solve (optional) - if True (default), compute the concentrations
+                               before checking the charge balance, otherwise
+                               use their current values
+            direct (optional) - if True (default), compute the adjustment and
+                                the concentrations without a solver where
+                                possible, falling back to solving the state
+                                block otherwise. Only used if solve and
+                                defined_state are True
+
+        Raises:
+            AssertionError if electroneutrality is violated
         """
         if self.params.config.material_flow_basis == MaterialFlowBasis.molar:
             state_var = self.flow_mol_phase_comp
@@ -2697,6 +2869,14 @@ class MCASStateBlockData(StateBlockData):
         if solve:
             if adjust_by_ion is not None:
                 ion_before_adjust = state_var["Liq", adjust_by_ion].value
+        if solve and direct and defined_state:
+            # Adjust the ion and compute the concentrations without a solver,
+            # falling back to a solve if this is not possible
+            solve_directly = self._solve_charge_balance_directly(adjust_by_ion)
+        else:
+            solve_directly = False
+
+        if solve and not solve_directly:
             solve = get_solver()
             solve.solve(self)
             results = solve.solve(self)
@@ -2737,7 +2917,7 @@ class MCASStateBlockData(StateBlockData):
                             raise TypeError(
                                 "get_property must be a string or list/tuple of strings."
                             )
-                        res_with_prop = solve.solve(self)
+                        res_with_prop = get_solver().solve(self)
                         if not check_optimal_termination(res_with_prop):
                             raise ValueError(
                                 f"The stateblock failed to solve while solving with on-demand property"
@@ -11,6 +11,7 @@
 #################################################################################
 import re
 
+import numpy as np
 import pytest
 
 from pyomo.environ import (
@@ -24,6 +25,7 @@ from pyomo.environ import (
     Var,
     Constraint,
 )
+from pyomo.util.calc_var_value import calculate_variable_from_constraint
 from pyomo.util.check_units import assert_units_consistent, assert_units_equivalent
 
 # Imports from idaes core
@@ -79,6 +81,7 @@ from watertap.property_models.multicomp_aq_sol_prop_pack import (
     EquivalentConductivityCalculation,
     TransportNumberCalculation,
     MCASScaler,
+    electroneutral_flows,
 )
 from watertap.core.util.initialization import check_dof
 from watertap.property_models.tests.property_test_harness import PropertyAttributeError
@@ -3244,3 +3247,207 @@ def test_list_and_print_properties():
     m.fs.properties = MCASParameterBlock(solute_list=["Na+", "Cl-"])
     m.fs.properties.list_properties()
     m.fs.properties.print_properties()
+
+
+@pytest.mark.component
+@pytest.mark.parametrize(
+    "flow_basis", [MaterialFlowBasis.molar, MaterialFlowBasis.mass]
+)
+def test_initialize_property_values(flow_basis):
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.properties = MCASParameterBlock(
+        solute_list=["Na_+", "Cl_-", "Ca_2+", "SO4_2-", "N"],
+        mw_data={
+            "H2O": 18e-3,
+            "Na_+": 23e-3,
+            "Cl_-": 35.5e-3,
+            "Ca_2+": 40e-3,
+            "SO4_2-": 96e-3,
+            "N": 10e-3,
+        },
+        charge={"Na_+": 1, "Cl_-": -1, "Ca_2+": 2, "SO4_2-": -2, "N": 0},
+        diffusivity_data={
+            ("Liq", "Na_+"): 1.33e-9,
+            ("Liq", "Cl_-"): 2.03e-9,
+            ("Liq", "Ca_2+"): 0.792e-9,
+            ("Liq", "SO4_2-"): 1.06e-9,
+            ("Liq", "N"): 1.5e-9,
+        },
+        elec_mobility_calculation=ElectricalMobilityCalculation.EinsteinRelation,
+        equiv_conductivity_calculation=EquivalentConductivityCalculation.ElectricalMobility,
+        material_flow_basis=flow_basis,
+    )
+    m.fs.stream = m.fs.properties.build_state_block(range(20), defined_state=True)
+
+    properties = [
+        "flow_mol_phase_comp",
+        "flow_mass_phase_comp",
+        "mass_frac_phase_comp",
+        "mole_frac_phase_comp",
+        "conc_mass_phase_comp",
+        "conc_mol_phase_comp",
+        "molality_phase_comp",
+        "conc_equiv_phase_comp",
+        "flow_equiv_phase_comp",
+        "flow_vol_phase",
+        "visc_k_phase",
+        "ionic_strength_molal",
+        "pressure_osm_phase",
+        "elec_mobility_phase_comp",
+        "equiv_conductivity_phase",
+        "elec_cond_phase",
+    ]
+    state_var = (
+        "flow_mol_phase_comp"
+        if flow_basis == MaterialFlowBasis.molar
+        else "flow_mass_phase_comp"
+    )
+    for k, sb in m.fs.stream.items():
+        sb.temperature.fix(288.15 + k)
+        for n, j in enumerate(m.fs.properties.component_list):
+            flow = 1 if j == "H2O" else 1e-3 * (n + 1) * (k + 1)
+            getattr(sb, state_var)["Liq", j].fix(flow)
+        for prop in properties:
+            getattr(sb, prop)
+
+    m.fs.stream._initialize_property_values()
+
+    # The initial values satisfy the constraints defining each property
+    for k, sb in m.fs.stream.items():
+        for prop in properties:
+            if prop == state_var:
+                continue
+            var = getattr(sb, prop)
+            con = getattr(sb, "eq_" + prop)
+            for idx, v in var.items():
+                initial = value(v)
+                calculate_variable_from_constraint(v, con[idx])
+                assert initial == pytest.approx(value(v), rel=1e-10)
+
+
+def _build_seawater_stream(flow_basis):
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.properties = MCASParameterBlock(
+        solute_list=["Ca_2+", "SO4_2-", "Na_+", "Cl_-", "Mg_2+"],
+        mw_data={
+            "H2O": 0.018,
+            "Na_+": 0.023,
+            "Ca_2+": 0.04,
+            "Mg_2+": 0.024,
+            "Cl_-": 0.035,
+            "SO4_2-": 0.096,
+        },
+        charge={"Na_+": 1, "Ca_2+": 2, "Mg_2+": 2, "Cl_-": -1, "SO4_2-": -2},
+        density_calculation=DensityCalculation.seawater,
+        material_flow_basis=flow_basis,
+    )
+    m.fs.stream = m.fs.properties.build_state_block([0], defined_state=True)
+    sb = m.fs.stream[0]
+
+    feed_mass_frac = {
+        "Na_+": 11122e-6,
+        "Ca_2+": 382e-6,
+        "Mg_2+": 1394e-6,
+        "SO4_2-": 2136e-6,
+        "Cl_-": 25000e-6,
+    }
+    feed_mass_frac["H2O"] = 1 - sum(feed_mass_frac.values())
+    for j, x in feed_mass_frac.items():
+        if flow_basis == MaterialFlowBasis.molar:
+            sb.flow_mol_phase_comp["Liq", j].fix(x / value(sb.mw_comp[j]))
+        else:
+            sb.flow_mass_phase_comp["Liq", j].fix(x)
+    sb.temperature.fix(298.15)
+    sb.pressure.fix(101325)
+    return m
+
+
+@pytest.mark.component
+@pytest.mark.parametrize(
+    "flow_basis", [MaterialFlowBasis.molar, MaterialFlowBasis.mass]
+)
+def test_assert_electroneutrality_direct(flow_basis, monkeypatch):
+    m = _build_seawater_stream(flow_basis)
+    sb = m.fs.stream[0]
+
+    # The direct path does not need a solver
+    def no_solver(*args, **kwargs):
+        raise AssertionError("solver should not be used")
+
+    monkeypatch.setattr(
+        "watertap.property_models.multicomp_aq_sol_prop_pack.get_solver", no_solver
+    )
+
+    sb.assert_electroneutrality(defined_state=True, adjust_by_ion="Cl_-", tee=False)
+
+    assert not hasattr(sb, "charge_balance")
+    if flow_basis == MaterialFlowBasis.molar:
+        state_var = sb.flow_mol_phase_comp
+        mw = {j: 1 for j in m.fs.properties.ion_set}
+    else:
+        state_var = sb.flow_mass_phase_comp
+        mw = {j: value(sb.mw_comp[j]) for j in m.fs.properties.ion_set}
+    assert state_var["Liq", "Cl_-"].fixed
+    charge_flow = sum(
+        value(sb.charge_comp[j] * state_var["Liq", j]) / mw[j]
+        for j in m.fs.properties.ion_set
+    )
+    assert charge_flow == pytest.approx(0, abs=1e-12)
+    # Concentrations are consistent with the adjusted flows and the
+    # composition dependent density
+    for name in ("dens_mass_phase", "conc_mol_phase_comp"):
+        for idx, v in getattr(sb, name).items():
+            current = value(v)
+            calculate_variable_from_constraint(v, getattr(sb, "eq_" + name)[idx])
+            assert current == pytest.approx(value(v), rel=1e-8)
+    assert value(sb.dens_mass_phase["Liq"]) > 1000
+    assert value(
+        sum(
+            sb.charge_comp[j] * sb.conc_mol_phase_comp["Liq", j]
+            for j in m.fs.properties.ion_set
+        )
+    ) == pytest.approx(0, abs=1e-8)
+
+    # Already balanced compositions are checked without a solver as well
+    sb.assert_electroneutrality(defined_state=True, tee=False)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "flow_basis", [MaterialFlowBasis.molar, MaterialFlowBasis.mass]
+)
+def test_electroneutral_flows(flow_basis):
+    m = _build_seawater_stream(flow_basis)
+    params = m.fs.properties
+    mw = {j: value(params.mw_comp[j]) for j in params.component_list}
+
+    flows_mol = {
+        "Na_+": np.array([0.5, 0.1, 0.01]),
+        "Ca_2+": np.array([0.01, 0.02, 0.01]),
+        "SO4_2-": np.array([0.02, 0.01, 0.2]),
+        "Cl_-": np.array([1.0, 1.0, 1.0]),
+    }
+    if flow_basis == MaterialFlowBasis.molar:
+        flows = flows_mol
+    else:
+        flows = {j: f * mw[j] for j, f in flows_mol.items()}
+
+    result = electroneutral_flows(params, flows, "Cl_-")
+    assert result["Na_+"] is flows["Na_+"]
+    assert "Mg_2+" not in result
+
+    expected_mol = np.array([0.5 + 0.02 - 0.04, 0.1 + 0.04 - 0.02, np.nan])
+    expected = (
+        expected_mol
+        if flow_basis == MaterialFlowBasis.molar
+        else (expected_mol * mw["Cl_-"])
+    )
+    np.testing.assert_allclose(result["Cl_-"], expected, rtol=1e-12)
+
+    scalar = electroneutral_flows(params, {j: f[0] for j, f in flows.items()}, "Cl_-")
+    assert scalar["Cl_-"] == pytest.approx(expected[0], rel=1e-12)
+
+    with pytest.raises(ValueError, match="adjust_by_ion must be set"):
+        electroneutral_flows(params, flows, "H2O")
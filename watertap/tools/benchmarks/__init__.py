@@ -0,0 +1,25 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+from .harness import (
+    BenchmarkCase,
+    SolveRecorder,
+    compare_results,
+    format_differences,
+    format_results,
+    load_results,
+    model_size,
+    parse_ipopt_log,
+    run_benchmarks,
+    run_case,
+    write_results,
+)
+from .cases import get_cases
@@ -0,0 +1,102 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+Run the flowsheet benchmark cases, e.g.
+
+    python -m watertap.tools.benchmarks --case lsrro_2_stages --output results.json
+    python -m watertap.tools.benchmarks --baseline baseline.json
+
+The exit code is 1 if a case fails or regresses against the baseline.
+"""
+
+import argparse
+import sys
+
+from watertap.tools.benchmarks.cases import get_cases
+from watertap.tools.benchmarks.harness import (
+    compare_results,
+    format_differences,
+    format_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def main(argv=None):
+    cases = get_cases()
+    parser = argparse.ArgumentParser(
+        prog="python -m watertap.tools.benchmarks",
+        description="Time the phases of WaterTAP flowsheet benchmark cases.",
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(cases),
+        help="case to run, may be repeated (default: all cases)",
+    )
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--baseline", help="JSON file of results to compare to")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="write the results to the baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="record the peak Python memory of each phase (slower)",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="show the output of the cases"
+    )
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--iteration-tolerance", type=float, default=0.1)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, case in cases.items():
+            print(f"{name:<40} {case.description}")
+        return 0
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline requires --baseline")
+
+    selected = [cases[name] for name in args.case] if args.case else cases.values()
+    results = run_benchmarks(
+        selected, trace_memory=args.trace_memory, quiet=not args.verbose
+    )
+    print(format_results(results))
+    if args.output:
+        write_results(results, args.output)
+
+    failed = any(res["status"] != "ok" for res in results["cases"].values())
+    if args.save_baseline:
+        write_results(results, args.baseline)
+    elif args.baseline:
+        differences = compare_results(
+            results,
+            load_results(args.baseline),
+            time_tolerance=args.time_tolerance,
+            memory_tolerance=args.memory_tolerance,
+            iteration_tolerance=args.iteration_tolerance,
+            min_time=args.min_time,
+        )
+        print(format_differences(differences))
+        failed = failed or any(d["kind"] == "regression" for d in differences)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains the benchmark cases for representative flowsheets.
+
+Each case splits the main function of a flowsheet into the phases build,
+scaling, initialization, costing, solve and optimization, as far as the
+flowsheet separates them. Flowsheets which compute scaling factors or add
+costing while building include that time in the build phase. Flowsheet
+modules are only imported when a case is run.
+"""
+
+import importlib
+
+from watertap.tools.benchmarks.harness import BenchmarkCase
+
+# Stage counts of the LSRRO cases
+LSRRO_STAGES = (2, 3, 5)
+
+
+def _module(name):
+    return importlib.import_module(f"watertap.flowsheets.{name}")
+
+
+def lsrro_case(number_of_stages):
+    """
+    LSRRO flowsheet (as in run_lsrro_case) with 1D RO stages.
+    """
+    lsrro = "lsrro.lsrro"
+
+    def build(ctx):
+        fs = _module(lsrro)
+        ctx["model"] = fs.build(
+            number_of_stages=number_of_stages,
+            has_NaCl_solubility_limit=True,
+            has_calculated_concentration_polarization=True,
+            has_calculated_ro_pressure_drop=True,
+            number_of_RO_finite_elements=10,
+        )
+        fs.set_operating_conditions(ctx["model"])
+
+    def initialize(ctx):
+        _module(lsrro).initialize(ctx["model"], verbose=False)
+
+    def solve(ctx):
+        _module(lsrro).solve(ctx["model"], raise_on_failure=True)
+
+    def optimize(ctx):
+        fs = _module(lsrro)
+        fs.optimize_set_up(
+            ctx["model"],
+            water_recovery=0.5,
+            A_value=5 / 3.6e11,
+            permeate_quality_limit=1000e-6,
+        )
+        fs.solve(ctx["model"], raise_on_failure=True)
+
+    return BenchmarkCase(
+        f"lsrro_{number_of_stages}_stages",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("solve", solve),
+            ("optimization", optimize),
+        ],
+        description=f"LSRRO with {number_of_stages} stages",
+    )
+
+
+def bsm2_case():
+    """
+    BSM2 wastewater resource recovery facility (as in BSM2.main).
+    """
+    bsm2 = "full_water_resource_recovery_facility.BSM2"
+
+    def build(ctx):
+        fs = _module(bsm2)
+        ctx["model"] = fs.build()
+        fs.set_operating_conditions(ctx["model"])
+
+    def initialize(ctx):
+        _module(bsm2).initialize_system(ctx["model"])
+
+    def costing(ctx):
+        _module(bsm2).add_costing(ctx["model"])
+        ctx["model"].fs.costing.initialize()
+
+    def scaling(ctx):
+        _module(bsm2).scale_system(ctx["model"])
+
+    def solve(ctx):
+        from watertap.core.util.scaling import ScaledModelTwin
+
+        scaled = ScaledModelTwin(ctx["model"])
+        _module(bsm2).solve(scaled.scaled_model, tee=False)
+        scaled.propagate_solution()
+
+    return BenchmarkCase(
+        "bsm2",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("costing", costing),
+            ("scaling", scaling),
+            ("solve", solve),
+        ],
+        description="BSM2 simulation with costing",
+    )
+
+
+def seawater_ro_case():
+    """
+    Seawater RO desalination with zero-order pretreatment (as in
+    seawater_RO_desalination.main).
+    """
+    swro = "seawater_RO_desalination.seawater_RO_desalination"
+
+    def build(ctx):
+        fs = _module(swro)
+        ctx["model"] = fs.build(erd_type="pressure_exchanger")
+        fs.set_operating_conditions(ctx["model"])
+
+    def initialize(ctx):
+        _module(swro).initialize_system(ctx["model"])
+
+    def solve(ctx):
+        _module(swro).solve(ctx["model"])
+
+    def costing(ctx):
+        fs = _module(swro)
+        fs.add_costing(ctx["model"])
+        fs.initialize_costing(ctx["model"])
+
+    def solve_costing(ctx):
+        _module(swro).solve(ctx["model"])
+
+    return BenchmarkCase(
+        "seawater_RO_desalination",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("solve", solve),
+            ("costing", costing),
+            ("solve_costing", solve_costing),
+        ],
+        description="Seawater RO with pressure exchanger and costing",
+    )
+
+
+def oaro_multi_case(number_of_stages=3):
+    """
+    Multi-stage OARO (as in oaro_multi.main).
+    """
+    oaro = "oaro.oaro_multi"
+
+    def build(ctx):
+        fs = _module(oaro)
+        ctx["model"] = fs.build(number_of_stages=number_of_stages)
+        fs.set_operating_conditions(ctx["model"])
+
+    def initialize(ctx):
+        _module(oaro).initialize_system(
+            ctx["model"],
+            number_of_stages,
+            solvent_multiplier=0.5,
+            solute_multiplier=0.7,
+        )
+
+    def optimize(ctx):
+        fs = _module(oaro)
+        fs.optimize_set_up(
+            ctx["model"], number_of_stages=number_of_stages, water_recovery=0.5
+        )
+        fs.solve(ctx["model"], raise_on_failure=True)
+
+    return BenchmarkCase(
+        f"oaro_multi_{number_of_stages}_stages",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("optimization", optimize),
+        ],
+        description=f"OARO with {number_of_stages} stages",
+    )
+
+
+def electrodialysis_case():
+    """
+    1D electrodialysis stack with concentrate recirculation (as in
+    electrodialysis_1stack_conc_recirc.main).
+    """
+    ed = "electrodialysis.electrodialysis_1stack_conc_recirc"
+
+    def build(ctx):
+        fs = _module(ed)
+        m = fs.build(ED_1D=True)
+        m.fs.feed.properties.calculate_state(
+            {
+                ("flow_vol_phase", ("Liq")): 5.2e-4,
+                ("conc_mol_phase_comp", ("Liq", "Na_+")): 34.188,
+                ("conc_mol_phase_comp", ("Liq", "Cl_-")): 34.188,
+            },
+            hold_state=True,
+        )
+        m.fs.EDstack.voltage_applied[0].fix(10)
+        m.fs.recovery_vol_H2O.fix(0.7)
+        fs._condition_base(m, ED_1D=True)
+        ctx["model"] = m
+
+    def initialize(ctx):
+        _module(ed).initialize_system(ctx["model"], ED_1D=True)
+
+    def solve(ctx):
+        _module(ed).solve(ctx["model"], tee=False)
+
+    return BenchmarkCase(
+        "electrodialysis_1stack_conc_recirc",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("solve", solve),
+        ],
+        description="1D electrodialysis with concentrate recirculation",
+    )
+
+
+def generic_train_case():
+    """
+    Generic desalination train (as in generic_train.main).
+    """
+    gt = "generic_desalination_train.generic_train"
+
+    def build(ctx):
+        ctx["model"] = _module(gt).build()
+
+    def initialize(ctx):
+        _module(gt).initialize(ctx["model"])
+
+    def optimize(ctx):
+        m = ctx["model"]
+        m.fs.Pretreatment.separator.component_removal_percent["X"].fix(50)
+        m.fs.Pretreatment.separator.separation_cost["X"].fix(0.5)
+        m.fs.Valorizer.separator.product_value["X"].fix(1)
+        m.fs.Valorizer.separator.component_removal_percent["X"].fix(50)
+        m.fs.Desal_1.desalter.water_recovery.fix(80)
+        m.fs.Desal_2.desalter.water_recovery.fix(50)
+        m.fs.Desal_2.desalter.recovery_cost.fix(0.01)
+        m.fs.Desal_2.desalter.recovery_cost_offset.fix(35)
+        m.fs.Desal_3.desalter.water_recovery.unfix()
+        m.fs.Desal_3.desalter.brine_water_mass_percent.fix(80)
+        _module(gt).solve(m)
+
+    return BenchmarkCase(
+        "generic_train",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("optimization", optimize),
+        ],
+        description="Generic desalination train",
+    )
+
+
+def dye_desalination_case():
+    """
+    Dye desalination with zero-order units and 1D RO (as in
+    dye_desalination.main).
+    """
+    dye = "dye_desalination.dye_desalination"
+
+    def build(ctx):
+        fs = _module(dye)
+        ctx["model"] = fs.build(RO_1D=True, include_RO=True)
+        fs.set_operating_conditions(ctx["model"])
+
+    def initialize(ctx):
+        _module(dye).initialize_system(ctx["model"])
+
+    def solve(ctx):
+        _module(dye).solve(ctx["model"])
+
+    def costing(ctx):
+        fs = _module(dye)
+        fs.add_costing(ctx["model"])
+        fs.initialize_costing(ctx["model"])
+
+    def optimize(ctx):
+        fs = _module(dye)
+        fs.optimize_operation(ctx["model"])
+        fs.solve(ctx["model"])
+
+    return BenchmarkCase(
+        "dye_desalination",
+        [
+            ("build", build),
+            ("initialization", initialize),
+            ("solve", solve),
+            ("costing", costing),
+            ("optimization", optimize),
+        ],
+        description="Dye desalination zero-order case study",
+    )
+
+
+def get_cases():
+    """
+    Get all benchmark cases.
+
+    Returns:
+        dict of case names and BenchmarkCase objects
+    """
+    cases = [lsrro_case(n) for n in LSRRO_STAGES]
+    cases += [
+        bsm2_case(),
+        seawater_ro_case(),
+        oaro_multi_case(),
+        electrodialysis_case(),
+        generic_train_case(),
+        dye_desalination_case(),
+    ]
+    return {case.name: case for case in cases}
@@ -0,0 +1,481 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+"""
+This module contains a harness to time the phases (build, scaling,
+initialization, costing and solve) of flowsheet benchmark cases, record
+peak memory, model size and IPOPT iteration counts, and compare the results
+to a stored baseline.
+"""
+
+import datetime
+import importlib.metadata
+import json
+import platform
+import re
+import sys
+import time
+import tracemalloc
+import traceback
+from contextlib import contextmanager, nullcontext
+
+from pyomo.common.tee import capture_output
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.environ import Constraint, Var
+from pyomo.solvers.plugins.solvers.IPOPT import IPOPT
+
+import idaes.logger as idaeslog
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+_log = idaeslog.getLogger(__name__)
+
+# Version of the results format, increased when it changes
+RESULTS_VERSION = 1
+
+_ITERATIONS_RE = re.compile(r"Number of Iterations\.*:\s*(\d+)")
+_IPOPT_TIME_RE = re.compile(
+    r"Total (?:seconds|CPU secs) in IPOPT[^=]*=\s*([0-9.eE+-]+)"
+)
+
+
+class BenchmarkCase:
+    """
+    Benchmark case made of named phases, which are run in order.
+
+    Each phase is a function taking a dict shared by all phases of the case,
+    in which the first phase should store the model under the key "model".
+
+    Args:
+        name - name of the case
+        phases - list of (phase name, function) tuples
+        description (optional) - description of the case
+    """
+
+    def __init__(self, name, phases, description=""):
+        self.name = name
+        self.phases = list(phases)
+        self.description = description
+
+    def __repr__(self):
+        return f"BenchmarkCase({self.name!r})"
+
+
+def parse_ipopt_log(log):
+    """
+    Get the number of iterations and solver time from an IPOPT log.
+
+    Args:
+        log - IPOPT output
+
+    Returns:
+        tuple of the number of iterations and the time in IPOPT in seconds,
+        either of which is None if not found in the log
+    """
+    iterations = _ITERATIONS_RE.search(log)
+    ipopt_time = _IPOPT_TIME_RE.search(log)
+    return (
+        int(iterations.group(1)) if iterations else None,
+        float(ipopt_time.group(1)) if ipopt_time else None,
+    )
+
+
+class SolveRecorder:
+    """
+    Context manager recording the IPOPT solves made while it is active,
+    including solves made inside flowsheet and unit model functions.
+
+    Attributes:
+        solves - list of dicts with the iterations, IPOPT time and
+                 termination condition of each solve
+    """
+
+    def __init__(self):
+        self.solves = []
+        self._original = None
+
+    def __enter__(self):
+        self._original = IPOPT.__dict__.get("_postsolve")
+        original = IPOPT._postsolve
+        recorder = self
+
+        def _postsolve(solver):
+            results = original(solver)
+            iterations, ipopt_time = parse_ipopt_log(getattr(solver, "_log", "") or "")
+            recorder.solves.append(
+                {
+                    "iterations": iterations,
+                    "ipopt_time": ipopt_time,
+                    "termination_condition": str(results.solver.termination_condition),
+                }
+            )
+            return results
+
+        IPOPT._postsolve = _postsolve
+        return self
+
+    def __exit__(self, *args):
+        if self._original is None:
+            # IPOPT inherits _postsolve from SystemCallSolver
+            del IPOPT._postsolve
+        else:
+            IPOPT._postsolve = self._original
+
+    @property
+    def iterations(self):
+        """
+        Total number of IPOPT iterations of the recorded solves.
+        """
+        return sum(s["iterations"] or 0 for s in self.solves)
+
+
+def model_size(model):
+    """
+    Get the size of the active part of a model.
+
+    Args:
+        model - Pyomo model or block
+
+    Returns:
+        dict with the number of variables, fixed variables, active constraints
+        and Jacobian nonzeros (unfixed variables in active constraints)
+    """
+    variables = 0
+    fixed = 0
+    for v in model.component_data_objects(Var, active=True, descend_into=True):
+        variables += 1
+        if v.fixed:
+            fixed += 1
+    constraints = 0
+    nonzeros = 0
+    for c in model.component_data_objects(Constraint, active=True, descend_into=True):
+        constraints += 1
+        nonzeros += sum(1 for _ in identify_variables(c.body, include_fixed=False))
+    return {
+        "variables": variables,
+        "fixed_variables": fixed,
+        "constraints": constraints,
+        "nonzeros": nonzeros,
+    }
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def _trace_memory(enabled):
+    if not enabled:
+        yield
+        return
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def run_case(case, trace_memory=False, quiet=True):
+    """
+    Run a benchmark case and record its performance.
+
+    The peak resident memory is that of the whole process, so it only
+    increases from case to case. With trace_memory, the peak memory
+    allocated by Python in each phase is recorded as well, at the cost of
+    slower phases.
+
+    Args:
+        case - BenchmarkCase
+        trace_memory (optional) - if True, trace Python memory allocations,
+                                  default False
+        quiet (optional) - if True, suppress the output of the case, default
+                           True
+
+    Returns:
+        dict with the status, time and memory of each phase, total time,
+        model size, number of solves and IPOPT iterations of the case
+    """
+    ctx = {}
+    phases = {}
+    result = {"status": "ok", "phases": phases}
+
+    with SolveRecorder() as recorder, _trace_memory(trace_memory):
+        for phase_name, func in case.phases:
+            n_solves = len(recorder.solves)
+            if trace_memory:
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                with capture_output() if quiet else nullcontext():
+                    func(ctx)
+            except Exception as err:  # pylint: disable=broad-except
+                result["status"] = "error"
+                result["error"] = f"{phase_name}: {type(err).__name__}: {err}"
+                _log.error(
+                    f"Benchmark case {case.name} failed in phase {phase_name}:\n"
+                    f"{traceback.format_exc()}"
+                )
+                break
+            finally:
+                phase = {
+                    "time": time.perf_counter() - start,
+                    "peak_rss_mb": _peak_rss_mb(),
+                    "solves": len(recorder.solves) - n_solves,
+                    "ipopt_iterations": sum(
+                        s["iterations"] or 0 for s in recorder.solves[n_solves:]
+                    ),
+                }
+                if trace_memory:
+                    phase["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+                phases[phase_name] = phase
+
+    result["total_time"] = sum(p["time"] for p in phases.values())
+    result["solves"] = len(recorder.solves)
+    result["ipopt_iterations"] = recorder.iterations
+    result["solve_details"] = recorder.solves
+    if "model" in ctx:
+        result["model_size"] = model_size(ctx["model"])
+    return result
+
+
+def _metadata(trace_memory):
+    versions = {}
+    for name in ("watertap", "pyomo", "idaes-pse"):
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return {
+        "results_version": RESULTS_VERSION,
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "python": platform.python_version(),
+        "versions": versions,
+        "trace_memory": trace_memory,
+    }
+
+
+def run_benchmarks(cases, trace_memory=False, quiet=True):
+    """
+    Run benchmark cases.
+
+    Args:
+        cases - iterable of BenchmarkCase
+        trace_memory (optional) - if True, trace Python memory allocations,
+                                  default False
+        quiet (optional) - if True, suppress the output of the cases, default
+                           True
+
+    Returns:
+        dict with the metadata of the run and the results of each case
+    """
+    results = {"metadata": _metadata(trace_memory), "cases": {}}
+    for case in cases:
+        _log.info(f"Running benchmark case {case.name}")
+        results["cases"][case.name] = run_case(
+            case, trace_memory=trace_memory, quiet=quiet
+        )
+        _log.info(
+            f"Finished {case.name} in {results['cases'][case.name]['total_time']:.2f} s"
+        )
+    return results
+
+
+def write_results(results, file_path):
+    """
+    Write benchmark results to a JSON file.
+    """
+    with open(file_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(file_path):
+    """
+    Load benchmark results from a JSON file.
+    """
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+def _relative_change(current, baseline):
+    if not isinstance(current, (int, float)) or not isinstance(baseline, (int, float)):
+        return None
+    if baseline == 0:
+        return None
+    return (current - baseline) / abs(baseline)
+
+
+def compare_results(
+    results,
+    baseline,
+    time_tolerance=0.25,
+    memory_tolerance=0.25,
+    iteration_tolerance=0.1,
+    min_time=0.5,
+):
+    """
+    Compare benchmark results to a baseline.
+
+    Phase times, total IPOPT iterations and peak traced memory which
+    increase by more than the tolerances are regressions. Phases faster than
+    min_time in both runs are not compared, as their timing is mostly noise.
+    Model size changes, failing cases and cases missing from either run are
+    reported as well.
+
+    Args:
+        results - benchmark results
+        baseline - benchmark results to compare to
+        time_tolerance (optional) - allowed relative increase of phase
+                                    times, default 0.25
+        memory_tolerance (optional) - allowed relative increase of peak
+                                      traced memory, default 0.25
+        iteration_tolerance (optional) - allowed relative increase of IPOPT
+                                         iterations, default 0.1
+        min_time (optional) - minimum phase time in seconds to compare,
+                              default 0.5
+
+    Returns:
+        list of dicts with the case, metric, baseline and current values,
+        relative change and kind ("regression", "improvement" or "changed")
+        of each difference
+    """
+    differences = []
+
+    def _add(case, metric, base, current, kind):
+        differences.append(
+            {
+                "case": case,
+                "metric": metric,
+                "baseline": base,
+                "current": current,
+                "change": _relative_change(current, base),
+                "kind": kind,
+            }
+        )
+
+    def _compare(case, metric, base, current, tolerance):
+        change = _relative_change(current, base)
+        if change is None:
+            return
+        if change > tolerance:
+            _add(case, metric, base, current, "regression")
+        elif change < -tolerance:
+            _add(case, metric, base, current, "improvement")
+
+    base_cases = baseline.get("cases", {})
+    for name, res in results.get("cases", {}).items():
+        if name not in base_cases:
+            _add(name, "case", None, res["status"], "changed")
+            continue
+        base = base_cases[name]
+        if res["status"] != base["status"]:
+            _add(
+                name,
+                "status",
+                base["status"],
+                res["status"],
+                "regression" if res["status"] != "ok" else "improvement",
+            )
+            continue
+        if res["status"] != "ok":
+            continue
+
+        for phase_name, phase in res["phases"].items():
+            base_phase = base["phases"].get(phase_name)
+            if base_phase is None:
+                continue
+            if max(phase["time"], base_phase["time"]) >= min_time:
+                _compare(
+                    name,
+                    f"{phase_name} time",
+                    base_phase["time"],
+                    phase["time"],
+                    time_tolerance,
+                )
+            if "peak_traced_mb" in phase and "peak_traced_mb" in base_phase:
+                _compare(
+                    name,
+                    f"{phase_name} peak traced memory",
+                    base_phase["peak_traced_mb"],
+                    phase["peak_traced_mb"],
+                    memory_tolerance,
+                )
+        _compare(
+            name,
+            "ipopt_iterations",
+            base["ipopt_iterations"],
+            res["ipopt_iterations"],
+            iteration_tolerance,
+        )
+        for key, value in res.get("model_size", {}).items():
+            base_value = base.get("model_size", {}).get(key)
+            if base_value is not None and value != base_value:
+                _add(name, key, base_value, value, "changed")
+
+    for name in base_cases:
+        if name not in results.get("cases", {}):
+            _add(name, "case", base_cases[name]["status"], None, "changed")
+    return differences
+
+
+def format_results(results):
+    """
+    Format benchmark results as a table of the phase times of each case.
+    """
+    lines = []
+    for name, res in results["cases"].items():
+        lines.append(
+            f"{name}: {res['status']}, {res['total_time']:.2f} s, "
+            f"{res['solves']} solves, {res['ipopt_iterations']} IPOPT iterations"
+        )
+        if "model_size" in res:
+            size = res["model_size"]
+            lines.append(
+                f"    {size['variables']} variables, {size['constraints']} "
+                f"constraints, {size['nonzeros']} nonzeros"
+            )
+        for phase_name, phase in res["phases"].items():
+            line = f"    {phase_name:<16} {phase['time']:10.3f} s"
+            if phase.get("peak_rss_mb") is not None:
+                line += f" {phase['peak_rss_mb']:10.1f} MB peak RSS"
+            if "peak_traced_mb" in phase:
+                line += f" {phase['peak_traced_mb']:10.1f} MB traced"
+            lines.append(line)
+        if res["status"] != "ok":
+            lines.append(f"    {res['error']}")
+    return "\n".join(lines)
+
+
+def format_differences(differences):
+    """
+    Format the differences returned by compare_results.
+    """
+    if not differences:
+        return "No differences to the baseline."
+    lines = []
+    for d in differences:
+        change = "" if d["change"] is None else f" ({d['change']:+.1%})"
+        lines.append(
+            f"{d['kind'].upper():<12} {d['case']}: {d['metric']} "
+            f"{d['baseline']} -> {d['current']}{change}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,201 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import pytest
+
+from pyomo.environ import ConcreteModel, Constraint, Var
+from pyomo.solvers.plugins.solvers.IPOPT import IPOPT
+
+from watertap.tools.benchmarks import (
+    BenchmarkCase,
+    SolveRecorder,
+    compare_results,
+    format_differences,
+    format_results,
+    get_cases,
+    load_results,
+    model_size,
+    parse_ipopt_log,
+    run_benchmarks,
+    run_case,
+    write_results,
+)
+from watertap.tools.benchmarks.__main__ import main
+
+IPOPT_LOG = """
+Number of Iterations....: 23
+
+                                   (scaled)                 (unscaled)
+Objective...............:   0.0000000000000000e+00    0.0000000000000000e+00
+
+Total seconds in IPOPT (w/o function evaluations)    =      0.123
+Total seconds in NLP function evaluations            =      0.045
+
+EXIT: Optimal Solution Found.
+"""
+
+
+def _build(ctx):
+    m = ConcreteModel()
+    m.x = Var(range(3), initialize=1)
+    m.y = Var()
+    m.y.fix(2)
+    m.c1 = Constraint(expr=m.x[0] + m.x[1] == m.y)
+    m.c2 = Constraint(expr=m.x[2] == 2 * m.x[1])
+    ctx["model"] = m
+
+
+def _fail(ctx):
+    raise RuntimeError("Initialization failed")
+
+
+@pytest.mark.unit
+def test_parse_ipopt_log():
+    assert parse_ipopt_log(IPOPT_LOG) == (23, 0.123)
+    assert parse_ipopt_log("") == (None, None)
+
+
+@pytest.mark.unit
+def test_solve_recorder_restores_ipopt():
+    original = IPOPT._postsolve
+    with SolveRecorder() as recorder:
+        assert IPOPT._postsolve is not original
+    assert IPOPT._postsolve is original
+    assert "_postsolve" not in IPOPT.__dict__
+    assert recorder.solves == []
+    assert recorder.iterations == 0
+
+
+@pytest.mark.unit
+def test_model_size():
+    ctx = {}
+    _build(ctx)
+    assert model_size(ctx["model"]) == {
+        "variables": 4,
+        "fixed_variables": 1,
+        "constraints": 2,
+        "nonzeros": 4,
+    }
+
+
+@pytest.mark.unit
+def test_run_case():
+    result = run_case(
+        BenchmarkCase("test", [("build", _build), ("check", lambda ctx: None)])
+    )
+    assert result["status"] == "ok"
+    assert list(result["phases"]) == ["build", "check"]
+    for phase in result["phases"].values():
+        assert phase["time"] >= 0
+        assert phase["solves"] == 0
+        assert "peak_traced_mb" not in phase
+    assert result["total_time"] == pytest.approx(
+        sum(p["time"] for p in result["phases"].values())
+    )
+    assert result["model_size"]["constraints"] == 2
+
+    result = run_case(
+        BenchmarkCase(
+            "test",
+            [("build", _build), ("initialization", _fail), ("solve", _build)],
+        ),
+        trace_memory=True,
+    )
+    assert result["status"] == "error"
+    assert result["error"] == "initialization: RuntimeError: Initialization failed"
+    # Phases after the failure are not run
+    assert list(result["phases"]) == ["build", "initialization"]
+    assert result["phases"]["build"]["peak_traced_mb"] > 0
+    assert "test: error" in format_results({"cases": {"test": result}})
+
+
+def _results(**cases):
+    return {"metadata": {}, "cases": cases}
+
+
+def _case(build_time, solve_time, iterations=10, status="ok", variables=100):
+    return {
+        "status": status,
+        "phases": {
+            "build": {"time": build_time},
+            "solve": {"time": solve_time},
+        },
+        "total_time": build_time + solve_time,
+        "solves": 1,
+        "ipopt_iterations": iterations,
+        "model_size": {"variables": variables},
+    }
+
+
+@pytest.mark.unit
+def test_compare_results():
+    baseline = _results(a=_case(2, 10), b=_case(1, 0.1), c=_case(1, 1))
+    results = _results(
+        a=_case(3, 5, iterations=12, variables=110),
+        b=_case(1, 0.4),
+        c=_case(1, 1, status="error"),
+        d=_case(1, 1),
+    )
+    differences = {
+        (d["case"], d["metric"]): d for d in compare_results(results, baseline)
+    }
+    assert set(differences) == {
+        ("a", "build time"),
+        ("a", "solve time"),
+        ("a", "ipopt_iterations"),
+        ("a", "variables"),
+        ("c", "status"),
+        ("d", "case"),
+    }
+    assert differences["a", "build time"]["kind"] == "regression"
+    assert differences["a", "build time"]["change"] == pytest.approx(0.5)
+    assert differences["a", "solve time"]["kind"] == "improvement"
+    assert differences["a", "ipopt_iterations"]["kind"] == "regression"
+    assert differences["a", "variables"]["kind"] == "changed"
+    assert differences["c", "status"]["kind"] == "regression"
+    assert differences["d", "case"]["kind"] == "changed"
+
+    # Short phases are compared with a lower minimum time
+    differences = compare_results(results, baseline, min_time=0)
+    assert any(d["case"] == "b" and d["kind"] == "regression" for d in differences)
+
+    assert compare_results(baseline, baseline) == []
+    assert format_differences([]) == "No differences to the baseline."
+    assert "REGRESSION" in format_differences(differences)
+
+
+@pytest.mark.unit
+def test_write_results(tmp_path):
+    results = run_benchmarks([BenchmarkCase("test", [("build", _build)])])
+    assert results["metadata"]["results_version"] == 1
+    file_path = tmp_path / "results.json"
+    write_results(results, file_path)
+    assert load_results(file_path) == results
+
+
+@pytest.mark.unit
+def test_cases(capsys):
+    cases = get_cases()
+    for name in [
+        "lsrro_2_stages",
+        "lsrro_5_stages",
+        "bsm2",
+        "seawater_RO_desalination",
+        "oaro_multi_3_stages",
+        "electrodialysis_1stack_conc_recirc",
+        "generic_train",
+        "dye_desalination",
+    ]:
+        assert name in cases
+        assert cases[name].phases[0][0] == "build"
+
+    assert main(["--list"]) == 0
+    assert "lsrro_3_stages" in capsys.readouterr().out
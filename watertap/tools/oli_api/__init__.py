@@ -13,3 +13,4 @@ from . import credentials
 from . import client
 from .client import OLIApi
 from .credentials import CredentialManager
+from .util.result_cache import OLIResultCache
@@ -51,7 +51,12 @@ import logging
 
 import sys
 import json
+import random
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from pyomo.common.dependencies import attempt_import
 
 requests, requests_available = attempt_import("requests", defer_import=False)
@@ -66,22 +71,64 @@ handler.setFormatter(formatter)
 _logger.addHandler(handler)
 _logger.setLevel(logging.DEBUG)
 
+# HTTP status codes worth retrying (rate limiting and transient server errors)
+_TRANSIENT_STATUS_CODES = (429, 500, 502, 503, 504)
+# HTTP methods which can be repeated without side effects, e.g. polling a result link
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
 
 class OLIApi:
     """
     A class to wrap OLI Cloud API calls and access functions for interfacing with WaterTAP.
     """
 
-    def __init__(self, credential_manager, interactive_mode=True, debug_level="INFO"):
+    def __init__(
+        self,
+        credential_manager,
+        interactive_mode=True,
+        debug_level="INFO",
+        result_cache=None,
+        max_retries=3,
+        backoff_factor=1.0,
+        poll_backoff=1.5,
+        max_poll_time=10.0,
+        pool_maxsize=10,
+        retry_post=False,
+        max_call_timings=10000,
+    ):
         """
         Construct all necessary attributes for OLIApi class.
 
         :param credential_manager_class: class used to manage credentials
         :param interactive_mode: enables direct interaction with user through prompts
         :param debug_level: string defining level of logging activity
+        :param result_cache: OLIResultCache used to reuse results of identical flash calls, if any
+        :param max_retries: integer for number of retries after connection errors, invalid JSON, or 429/5xx responses.
+            POST requests (flash submissions, DBS file generation and uploads) are not idempotent, so they are only
+            retried after failures to connect or 429 responses, which the server has not acted on, unless retry_post is set
+        :param backoff_factor: float for seconds before the first retry, doubled for each subsequent retry
+        :param poll_backoff: float multiplying the time between consecutive polls of a result link
+        :param max_poll_time: float for maximum seconds between polls of a result link
+        :param pool_maxsize: integer for number of connections kept open to OLI Cloud
+        :param retry_post: bool to retry POST requests after any transient failure, at the risk of duplicate jobs
+        :param max_call_timings: integer for number of most recent flash call timings kept in call_timings
         """
 
         self.credential_manager = credential_manager
+        self.result_cache = result_cache
+        self.max_retries = max_retries
+        self.retry_post = retry_post
+        self.backoff_factor = backoff_factor
+        self.poll_backoff = poll_backoff
+        self.max_poll_time = max_poll_time
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_maxsize, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.call_timings = deque(maxlen=max_call_timings)
+        self._timing_lock = threading.Lock()
         self.interactive_mode = interactive_mode
         if self.interactive_mode:
             _logger.info(
@@ -107,8 +154,16 @@ class OLIApi:
             f"Exiting: deleting {len(self.session_dbs_files)} remaining DBS files created during the session that were not marked by keep_file=True."
         )
         self.dbs_file_cleanup(self.session_dbs_files)
+        self.close()
         return False
 
+    def close(self):
+        """
+        Close pooled connections to OLI Cloud.
+        """
+
+        self.session.close()
+
     def _prompt(self, msg, default=""):
         if self.interactive_mode:
             msg = msg + "Enter [y]/n to proceed."
@@ -128,13 +183,17 @@ class OLIApi:
         :return dbs_file_id: string name for DBS file ID
         """
 
+        # read contents up front so the upload can be retried
         with open(dbs_file_path, "rb") as file:
-            req = requests.post(
-                self.credential_manager.upload_dbs_url,
-                headers=self.credential_manager.headers,
-                files={"files": file},
-            )
-        dbs_file_id = _request_status_test(req, ["UPLOADED"])["file"][0]["id"]
+            contents = file.read()
+        req_json = self._request(
+            "POST",
+            self.credential_manager.upload_dbs_url,
+            ["UPLOADED"],
+            headers=self.credential_manager.headers,
+            files={"files": (Path(dbs_file_path).name, contents)},
+        )
+        dbs_file_id = req_json["file"][0]["id"]
         if bool(dbs_file_id):
             if not keep_file:
                 self.session_dbs_files.append(dbs_file_id)
@@ -222,14 +281,16 @@ class OLIApi:
             "params": {k: v for k, v in dbs_file_inputs.items() if v is not None},
         }
         _logger.debug(f"DBS input dictionary: {dbs_dict}")
-        req = requests.post(
+        req_json = self._request(
+            "POST",
             self.credential_manager.dbs_url,
+            ["SUCCESS"],
             headers=self.credential_manager.update_headers(
                 {"Content-Type": "application/json"}
             ),
             data=json.dumps(dbs_dict),
         )
-        dbs_file_id = _request_status_test(req, ["SUCCESS"])["data"]["id"]
+        dbs_file_id = req_json["data"]["id"]
         if bool(dbs_file_id):
             if not keep_file:
                 self.session_dbs_files.append(dbs_file_id)
@@ -249,11 +310,12 @@ class OLIApi:
 
         _logger.info(f"Getting summary for {dbs_file_id} ...")
         chemistry_info = self.call("chemistry-info", dbs_file_id)
-        req_flash_hist = requests.get(
+        flash_history = self._request(
+            "GET",
             f"{self.credential_manager.engine_url}/flash/history/{dbs_file_id}",
+            None,
             headers=self.credential_manager.headers,
-        )
-        flash_history = _request_status_test(req_flash_hist, None)["data"]
+        )["data"]
         dbs_file_summary = {
             "chemistry_info": chemistry_info,
             "flash_history": flash_history,
@@ -274,13 +336,13 @@ class OLIApi:
         """
 
         _logger.info("Getting DBS file IDs for user ...")
-        req = requests.get(
+        req_json = self._request(
+            "GET",
             self.credential_manager.dbs_url,
+            None,
             headers=self.credential_manager.headers,
         )
-        user_dbs_file_ids = [
-            k["fileId"] for k in _request_status_test(req, None)["data"]
-        ]
+        user_dbs_file_ids = [k["fileId"] for k in req_json["data"]]
         _logger.info(f"{len(user_dbs_file_ids)} DBS files found for user")
         return user_dbs_file_ids
 
@@ -304,12 +366,12 @@ class OLIApi:
         if (r.lower() == "y") or (r == ""):
             for dbs_file_id in dbs_file_ids:
                 _logger.info(f"Deleting {dbs_file_id} ...")
-                req = requests.request(
+                req = self._request(
                     "DELETE",
                     f"{self.credential_manager._delete_dbs_url}{dbs_file_id}",
+                    ["SUCCESS"],
                     headers=self.credential_manager.headers,
                 )
-                req = _request_status_test(req, ["SUCCESS"])
 
                 if req["status"] == "SUCCESS":
                     # Remove the file from session_dbs_files list if it is there, otherwise an error will occur upon exit when this method is called again and already deleted files will remain on the list for deletion. Thus, an error can occur if there is no existing ID to delete.
@@ -398,28 +460,90 @@ class OLIApi:
             )
         return mode, url, headers
 
-    def process_request_list(self, requests, **kwargs):
+    def process_request_list(
+        self,
+        requests,
+        burst_job_tag=None,
+        max_concurrent_processes=1,
+        batch_size=None,
+        **kwargs,
+    ):
         """
         Process a list of flash calculation requests for OLI.
 
         :param requests: list of request dictionaries containing flash_method, dbs_file_id, and json_input
+        :param burst_job_tag: string tag to submit POST flash requests as an OLI burst job
+        :param max_concurrent_processes: integer for maximum number of requests in flight at once, serial if 1
+        :param batch_size: integer for number of requests submitted per batch, all requests if None
+
+        :return result_list: list of results, ordered as submitted
         """
 
-        _logger.info("Collecting requested samples in serial mode ...")
-        result_list = []
+        num_samples = len(requests)
+        # timings are summarized for each request list
+        with self._timing_lock:
+            self.call_timings.clear()
         acquire_timer = time.time()
-        for idx, request in enumerate(requests):
-            _logger.info(f"Submitting sample #{idx+1} of {len(requests)} ...")
-            result = self.call(**request)
-            result["submitted_requests"] = request
-            result_list.append(result)
+        if max_concurrent_processes is None or max_concurrent_processes <= 1:
+            _logger.info("Collecting requested samples in serial mode ...")
+            result_list = []
+            for idx, request in enumerate(requests):
+                _logger.info(f"Submitting sample #{idx+1} of {num_samples} ...")
+                result = self.call(**request, burst_job_tag=burst_job_tag)
+                result["submitted_requests"] = request
+                result_list.append(result)
+        else:
+            _logger.info(
+                "Collecting requested samples in concurrent mode "
+                + f"({max_concurrent_processes} processes) ..."
+            )
+            result_list = self._process_concurrent(
+                requests, burst_job_tag, max_concurrent_processes, batch_size
+            )
         acquire_time = time.time() - acquire_timer
-        num_samples = len(requests)
         _logger.info(
             f"Finished all {num_samples} jobs from OLI. "
             + f"Total: {acquire_time} s, "
-            + f"Rate: {acquire_time/num_samples} s/sample"
+            + f"Rate: {acquire_time/max(num_samples, 1)} s/sample"
         )
+        _logger.info("Flash call timings: " + f"{self.summarize_call_timings()}")
+        return result_list
+
+    def _process_concurrent(
+        self, request_list, burst_job_tag, max_concurrent_processes, batch_size
+    ):
+        """
+        Submit and poll flash calculation requests from a bounded pool of workers.
+
+        :param request_list: list of request dictionaries containing flash_method, dbs_file_id, and json_input
+        :param burst_job_tag: string tag to submit POST flash requests as an OLI burst job
+        :param max_concurrent_processes: integer for maximum number of requests in flight at once
+        :param batch_size: integer for number of requests submitted per batch, all requests if None
+
+        :return result_list: list of results, ordered as submitted
+        """
+
+        def _call_request(request):
+            result = self.call(**request, burst_job_tag=burst_job_tag)
+            result["submitted_requests"] = request
+            return result
+
+        num_samples = len(request_list)
+        if not batch_size:
+            batch_size = max(num_samples, 1)
+        result_list = []
+        executor = ThreadPoolExecutor(max_workers=max_concurrent_processes)
+        try:
+            for start in range(0, num_samples, batch_size):
+                batch = request_list[start : start + batch_size]
+                _logger.info(
+                    f"Submitting samples #{start+1} to #{start+len(batch)} "
+                    + f"of {num_samples} ..."
+                )
+                # map preserves submission order regardless of completion order
+                result_list.extend(executor.map(_call_request, batch))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
         return result_list
 
     def call(
@@ -429,6 +553,7 @@ class OLIApi:
         input_params=None,
         poll_time=0.5,
         max_request=100,
+        burst_job_tag=None,
         **kwargs,
     ):
         """
@@ -437,31 +562,175 @@ class OLIApi:
         :param flash_method: string indicating flash method
         :param dbs_file_id: string indicating DBS file
         :param input_params: dictionary for flash calculation inputs
-        :param poll_time: seconds between each poll
+        :param poll_time: initial seconds between polls
         :param max_request: maximum number of times to try request before failure
+        :param burst_job_tag: string tag to submit POST flash requests as an OLI burst job
 
         :return result: dictionary for JSON output result
         """
 
-        mode, url, headers = self._get_flash_mode(dbs_file_id, flash_method)
-        try:
-            req = requests.request(
-                mode, url, headers=headers, data=json.dumps(input_params)
+        timing = {
+            "flash_method": flash_method,
+            "dbs_file_id": dbs_file_id,
+            "cached": False,
+            "submit_latency": 0.0,
+            "queue_time": 0.0,
+            "poll_count": 0,
+        }
+        call_timer = time.time()
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(
+                dbs_file_id, flash_method, input_params
             )
-            req_json = _request_status_test(req, ["SUCCESS"])
-        except requests.JSONDecodeError:
-            delay = 1
-            time.sleep(delay)
+            result = self.result_cache.get(cache_key)
+            if result is not None:
+                _logger.debug(f"Using cached {flash_method} result {cache_key}")
+                timing["cached"] = True
+                self._record_timing(timing, call_timer)
+                return result
+
+        mode, url, headers = self._get_flash_mode(
+            dbs_file_id, flash_method, burst_job_tag
+        )
+        submit_timer = time.time()
+        req_json = self._request(
+            mode, url, ["SUCCESS"], headers=headers, data=json.dumps(input_params)
+        )
+        timing["submit_latency"] = time.time() - submit_timer
+        result_link = _get_result_link(req_json)
+        queue_timer = time.time()
+        status, result, timing["poll_count"] = self._poll_result_link(
+            result_link, headers, max_request, poll_time
+        )
+        timing["queue_time"] = time.time() - queue_timer
+        # failed calculations are not cached so that they are retried
+        if self.result_cache is not None and status == "PROCESSED":
+            self.result_cache.set(cache_key, result)
+        self._record_timing(timing, call_timer)
+        return result
+
+    def _record_timing(self, timing, call_timer):
+        timing["total_time"] = time.time() - call_timer
+        with self._timing_lock:
+            self.call_timings.append(timing)
+
+    def summarize_call_timings(self, call_timings=None):
+        """
+        Summarize timing of flash calls.
+
+        :param call_timings: list of timing dictionaries to summarize, the most recent calls made by this instance
+            (since the start of the last process_request_list) if None
+
+        :return summary: dictionary with call counts, mean submit latency and queue time in seconds, and total polls
+        """
+
+        if call_timings is None:
+            with self._timing_lock:
+                call_timings = list(self.call_timings)
+        timings = [t for t in call_timings if not t["cached"]]
+        num_cached = len(call_timings) - len(timings)
+        num_calls = max(len(timings), 1)
+        return {
+            "calls": len(timings),
+            "cached_calls": num_cached,
+            "mean_submit_latency": sum(t["submit_latency"] for t in timings)
+            / num_calls,
+            "mean_queue_time": sum(t["queue_time"] for t in timings) / num_calls,
+            "total_polls": sum(t["poll_count"] for t in timings),
+        }
+
+    def _request(self, mode, url, target_keys, return_response=False, **kwargs):
+        """
+        Send a request to OLI Cloud, retrying transient failures with backoff.
+
+        Requests which are not idempotent (POST unless retry_post) are only retried when the server cannot
+        have acted on them, i.e. after failures to connect and 429 responses.
+
+        :param mode: string for HTTP method
+        :param url: string for request URL
+        :param target_keys: list containing key(s) that indicate successful request
+        :param return_response: bool to also return the response object
+        :param kwargs: keyword arguments passed to requests.Session.request
+
+        :return req_json: response object converted to JSON, followed by the response object if return_response
+        """
+
+        func_name = sys._getframe(1).f_code.co_name
+        idempotent = self.retry_post or mode.upper() in _IDEMPOTENT_METHODS
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                req = self.session.request(mode, url, **kwargs)
+                if req.status_code in _TRANSIENT_STATUS_CODES and (
+                    idempotent or req.status_code == 429
+                ):
+                    retry_after = _get_retry_after(req)
+                    reason = f"Status code {req.status_code}"
+                else:
+                    req_json = _request_status_test(req, target_keys, func_name)
+                    if return_response:
+                        return req_json, req
+                    return req_json
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.JSONDecodeError,
+            ) as e:
+                if attempt == self.max_retries or not (
+                    idempotent or _is_connect_error(e)
+                ):
+                    raise
+                reason = type(e).__name__
+            if attempt == self.max_retries:
+                break
+            if retry_after is None:
+                retry_after = _backoff_delay(self.backoff_factor, 2, attempt)
             _logger.debug(
-                f"JSONDecodeError occurred. Trying to convert response object to JSON again."
+                f"{reason} in {func_name}. Retrying in {retry_after:.2f} s "
+                + f"({attempt+1} of {self.max_retries}) ..."
             )
-            req = requests.request(
-                mode, url, headers=headers, data=json.dumps(input_params)
+            time.sleep(retry_after)
+        raise RuntimeError(
+            f"Failure in {func_name}. {reason} after {self.max_retries} retries."
+        )
+
+    def _poll_result_link(self, result_link, headers, max_request, poll_time):
+        """
+        Poll result link from OLI Flash calculation request.
+
+        The time between polls grows by poll_backoff (with jitter) up to max_poll_time,
+        unless the server provides a Retry-After header.
+
+        :param result_link: string indicating URL to access call results
+        :param headers: dictionary for OLI Cloud headers
+        :param max_request: integer for number of requests before poll limit error
+        :param poll_time: float for initial time in between poll requests
+
+        :return status: string for final job status
+        :return result: JSON containing results from Flash calculation
+        :return poll_count: integer for number of polls made
+        """
+
+        delay = poll_time
+        for poll_count in range(1, max_request + 1):
+            time.sleep(delay)
+            result_req, response = self._request(
+                "GET",
+                result_link,
+                ["IN QUEUE", "IN PROGRESS", "PROCESSED", "FAILED"],
+                return_response=True,
+                headers=headers,
             )
-            req_json = _request_status_test(req, ["SUCCESS"])
-        result_link = _get_result_link(req_json)
-        result = _poll_result_link(result_link, headers, max_request, poll_time)
-        return result
+            _logger.info(f"Polling result link: {result_req['status']}")
+            if result_req["status"] in ["PROCESSED", "FAILED"]:
+                if result_req["data"]:
+                    return result_req["status"], result_req["data"], poll_count
+            delay = _get_retry_after(response)
+            if delay is None:
+                delay = _backoff_delay(
+                    poll_time, self.poll_backoff, poll_count, self.max_poll_time
+                )
+        raise RuntimeError("Poll limit exceeded.")
 
 
 def _get_result_link(req_json):
@@ -486,18 +755,20 @@ def _get_result_link(req_json):
     return result_link
 
 
-def _request_status_test(req, target_keys):
+def _request_status_test(req, target_keys, func_name=None):
     """
     Check result of OLI request (except async).
 
     :param req: response object
     :param target_keys: list containing key(s) that indicate successful request
+    :param func_name: string name of requesting function for messages, caller if None
 
     :return req_json: response object converted to JSON
     """
     req_json = req.json()
 
-    func_name = sys._getframe().f_back.f_code.co_name
+    if func_name is None:
+        func_name = sys._getframe().f_back.f_code.co_name
     _logger.debug(f"{func_name} response: {req_json}")
 
     if req.status_code == 200:
@@ -512,27 +783,51 @@ def _request_status_test(req, target_keys):
     )
 
 
-def _poll_result_link(result_link, headers, max_request, poll_time):
+def _is_connect_error(error):
     """
-    Poll result link from OLI Flash calculation request.
+    Check whether a request failed before it was sent, so that it is safe to repeat.
 
-    :param result_link: string indicating URL to access call results
-    :param headers: dictionary for OLI Cloud headers
-    :param max_request: integer for number of requests before poll limit error
-    :param poll_time: float for time in between poll requests
+    :param error: exception raised by requests
 
-    return result: JSON containing results from successful Flash calculation
+    :return connect_error: bool indicating failure to connect to the server
     """
 
-    for _ in range(max_request):
-        time.sleep(poll_time)
-        result_req = requests.get(result_link, headers=headers)
-        result_req = _request_status_test(
-            result_req, ["IN QUEUE", "IN PROGRESS", "PROCESSED", "FAILED"]
-        )
-        _logger.info(f"Polling result link: {result_req['status']}")
-        if result_req["status"] in ["PROCESSED", "FAILED"]:
-            if result_req["data"]:
-                result = result_req["data"]
-                return result
-    raise RuntimeError("Poll limit exceeded.")
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(error, requests.ConnectionError) and isinstance(
+        reason, requests.urllib3.exceptions.NewConnectionError
+    )
+
+
+def _get_retry_after(response):
+    """
+    Get server hint for when to retry a request.
+
+    :param response: response object
+
+    :return retry_after: float for seconds to wait, or None if no valid hint was given
+    """
+
+    try:
+        return max(float(response.headers["Retry-After"]), 0.0)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(base, factor, attempt, max_delay=None):
+    """
+    Get an exponentially increasing delay with jitter.
+
+    :param base: float for delay of first attempt in seconds
+    :param factor: float multiplying the delay for each attempt
+    :param attempt: integer for number of previous attempts
+    :param max_delay: float for maximum delay before jitter, if any
+
+    :return delay: float for seconds to wait, between half and all of the exponential delay
+    """
+
+    delay = base * factor**attempt
+    if max_delay is not None:
+        delay = min(delay, max_delay)
+    return delay * random.uniform(0.5, 1.0)
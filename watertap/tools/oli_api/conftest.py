@@ -45,8 +45,13 @@
 # or derivative works thereof, in binary and source code form.
 ###############################################################################
 import contextlib
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
 
 import pytest
 
@@ -141,3 +146,141 @@ def flash_instance(scope="session"):
 @pytest.fixture
 def source_water(scope="session"):
     return {"Cl_-": 1000, "Na_+": 1000}
+
+
+class StubOLIServer:
+    """
+    Local stand-in for the OLI Cloud flash endpoints.
+
+    Flash jobs are accepted immediately and only report as processed once
+    ``latency`` seconds have passed since submission. Results echo the submitted
+    input so callers can check ordering. Setting ``fail_submits`` rejects that many
+    submissions with a transient ``fail_status`` error (503 by default), and ``poll_retry_after`` adds a
+    Retry-After hint to unfinished poll responses.
+    """
+
+    def __init__(self, latency=0.2):
+        self.latency = latency
+        self.fail_submits = 0
+        self.fail_status = 503
+        self.rejected = 0
+        self.poll_retry_after = None
+        self.lock = threading.Lock()
+        self.jobs = {}
+        self.burst_tags = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.submitted = 0
+        self.polled = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, body, status=200, headers=None):
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                input_params = json.loads(self.rfile.read(length) or "null")
+                with server.lock:
+                    reject = server.rejected < server.fail_submits
+                    if reject:
+                        server.rejected += 1
+                if reject:
+                    self._reply(
+                        {}, status=server.fail_status, headers={"Retry-After": "0"}
+                    )
+                    return
+                with server.lock:
+                    server.submitted += 1
+                    job_id = str(server.submitted)
+                    server.jobs[job_id] = (time.time(), input_params)
+                    server.burst_tags.extend(parse_qs(url.query).get("burst", []))
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                self._reply(
+                    {
+                        "status": "SUCCESS",
+                        "data": {
+                            "status": "IN QUEUE",
+                            "resultsLink": f"{server.url}/result/{job_id}",
+                        },
+                    }
+                )
+
+            def do_GET(self):
+                job_id = urlparse(self.path).path.rsplit("/", 1)[-1]
+                with server.lock:
+                    server.polled += 1
+                    submit_time, input_params = server.jobs[job_id]
+                    done = time.time() - submit_time >= server.latency
+                    if done:
+                        server.in_flight -= 1
+                if done:
+                    body = {
+                        "status": "PROCESSED",
+                        "data": {"result": {"echo": input_params}},
+                    }
+                    self._reply(body)
+                elif server.poll_retry_after is not None:
+                    self._reply(
+                        {"status": "IN PROGRESS", "data": {}},
+                        headers={"Retry-After": str(server.poll_retry_after)},
+                    )
+                else:
+                    self._reply({"status": "IN PROGRESS", "data": {}})
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+        return False
+
+
+class StubCredentialManager:
+    """
+    Minimal credential manager pointing OLIApi at a StubOLIServer.
+    """
+
+    def __init__(self, root_url):
+        self.headers = {"authorization": "API-KEY stub"}
+        self.engine_url = root_url + "/engine"
+
+    def update_headers(self, new_header):
+        return {**self.headers, **new_header}
+
+
+@pytest.fixture(scope="function")
+def stub_oli_server():
+    with StubOLIServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def stub_oliapi_instance(stub_oli_server: StubOLIServer) -> OLIApi:
+    oliapi = OLIApi(
+        StubCredentialManager(stub_oli_server.url),
+        interactive_mode=False,
+        backoff_factor=0.01,
+    )
+    yield oliapi
+    oliapi.close()
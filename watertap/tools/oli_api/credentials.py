@@ -112,6 +112,7 @@ class CredentialManager:
         """
 
         self.test = test
+        self.session = requests.Session()
         self.access_key = ""
         self.encryption_key = encryption_key
         self.config_file = Path(config_file).resolve()
@@ -131,6 +132,13 @@ class CredentialManager:
         )
         self.set_headers()
 
+    def close(self):
+        """
+        Close pooled connections to OLI Cloud.
+        """
+
+        self.session.close()
+
     def set_headers(self):
         """
         Creates OLI Cloud API headers and performs initial login.
@@ -319,7 +327,7 @@ class CredentialManager:
             unix_timestamp_ms = int(expiry_timestamp * 1000)
             return unix_timestamp_ms
 
-        response = requests.post(
+        response = self.session.post(
             self.access_key_url,
             headers=self.update_headers({"Content-Type": "application/json"}),
             data=json.dumps({"expiry": _set_expiry_timestamp(key_lifetime)}),
@@ -340,7 +348,7 @@ class CredentialManager:
         :return string: Response text containing the success message or an error message
         """
 
-        response = requests.delete(
+        response = self.session.delete(
             self.access_key_url,
             headers=self.update_headers({"Content-Type": "application/json"}),
             data=json.dumps({"apiKey": api_key}),
@@ -358,7 +366,7 @@ class CredentialManager:
         req_result = ""
         if self.access_key:
             _logger.info("Logging into OLI API using access key")
-            req_result = requests.get(
+            req_result = self.session.get(
                 self.dbs_url,
                 headers=self.update_headers(
                     {"Content-Type": "application/x-www-form-urlencoded"}
@@ -402,7 +410,7 @@ class CredentialManager:
         """
 
         if not req_result:
-            req_result = requests.post(
+            req_result = self.session.post(
                 self.credentials["auth_url"],
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
                 data=body,
@@ -52,8 +52,7 @@ import logging
 import json
 from pathlib import Path
 
-from copy import deepcopy
-from itertools import product
+from collections.abc import Sequence
 
 from watertap.custom_exceptions import FrozenPipes
 from watertap.tools.oli_api.util.watertap_to_oli_helper_functions import (
@@ -67,7 +66,9 @@ from watertap.tools.oli_api.util.fixed_keys_dict import (
     output_unit_set,
 )
 
+import numpy as np
 from numpy import reshape, sqrt
+from pyomo.common.dependencies import pandas, pandas_available
 
 _logger = logging.getLogger(__name__)
 handler = logging.StreamHandler()
@@ -102,6 +103,8 @@ class Flash:
         self.input_unit_set = input_unit_set
         self.output_unit_set = output_unit_set
         self.relative_inflows = relative_inflows
+        # survey compiled by the last get_clone call, reused for later indices
+        self._clone_survey = None
 
         if debug_level == "INFO":
             _logger.setLevel(logging.INFO)
@@ -862,9 +865,9 @@ class Flash:
         json_input,
         survey=None,
         file_name=None,
-        # max_concurrent_processes=1000,
-        # burst_job_tag=None,
-        # batch_size=None,
+        max_concurrent_processes=1,
+        burst_job_tag=None,
+        batch_size=None,
     ):
         """
         Conduct single point analysis with initial JSON input, or conduct a survey on that input.
@@ -874,7 +877,10 @@ class Flash:
         :param dbs_file_id: string ID of DBS file
         :param json_input: JSON input for flash calculation
         :param survey: dictionary containing names and input values to modify in JSON
-        :param file_name: string for file to write, if any
+        :param file_name: string for file to write, if any; columnar formats are used for ".npz" and ".parquet" files
+        :param max_concurrent_processes: integer for maximum number of OLI requests in flight at once, serial if 1
+        :param burst_job_tag: string tag to submit requests as an OLI burst job
+        :param batch_size: integer for number of requests submitted per batch, all requests if None
 
         :return processed_requests: results from processed OLI flash requests
         """
@@ -889,44 +895,56 @@ class Flash:
                 + " surveys will add values to initial state"
             )
 
-        if survey is None:
-            survey = {}
-        num_samples = None
-        for k, v in survey.items():
-            if num_samples is None:
-                num_samples = len(v)
-            elif num_samples != len(v):
-                raise RuntimeError(f"Length of list for key {k} differs from prior key")
-        if num_samples is None:
-            num_samples = 1
-        requests_to_process = []
-        for idx in range(num_samples):
-            _logger.info(f"Flash sample #{idx+1} of {num_samples}")
-            requests_to_process.append(
-                {
-                    "flash_method": flash_method,
-                    "dbs_file_id": dbs_file_id,
-                    "input_params": self.get_clone(
-                        flash_method, json_input, idx, survey
-                    ),
-                }
-            )
+        clones = self.compile_survey(flash_method, json_input, survey)
+        _logger.info(f"Preparing {len(clones)} flash samples")
+        requests_to_process = [
+            {
+                "flash_method": flash_method,
+                "dbs_file_id": dbs_file_id,
+                "input_params": clone,
+            }
+            for clone in clones
+        ]
         processed_requests = oliapi_instance.process_request_list(
             requests_to_process,
-            # burst_job_tag=burst_job_tag,
-            # max_concurrent_processes=max_concurrent_processes,
-            # batch_size=batch_size,
+            burst_job_tag=burst_job_tag,
+            max_concurrent_processes=max_concurrent_processes,
+            batch_size=batch_size,
         )
         _logger.info("Completed running flash calculations")
-        result = flatten_results(processed_requests)
+        table = flatten_results(processed_requests, as_table=True)
+        result = table.to_dict()
         if file_name:
-            write_output(result, file_name)
+            suffix = Path(file_name).suffix
+            if suffix == ".npz":
+                table.write_npz(file_name)
+            elif suffix == ".parquet":
+                table.write_parquet(file_name)
+            else:
+                write_output(result, file_name)
         return result
 
+    def compile_survey(self, flash_method, json_input, survey=None):
+        """
+        Resolve survey keys in JSON input once, to generate inputs for each survey index.
+
+        :param flash_method: string for flash calculation name
+        :param json_input: JSON input for flash calculation
+        :param survey: dictionary containing names and input values to modify in JSON
+
+        :return clones: CompiledSurvey sequence of JSON inputs for each survey index
+        """
+
+        return CompiledSurvey(flash_method, json_input, survey, self.relative_inflows)
+
     def get_clone(self, flash_method, json_input, index, survey=None):
         """
         Iterate over a survey to create a modified clone from JSON input.
 
+        The survey is compiled once and reused while get_clone is called with the same
+        flash_method, json_input and survey objects. As with compile_survey, content which
+        is not modified by the survey is shared with json_input rather than copied.
+
         :param flash_method: string for flash calculation name
         :param json_input: JSON input for flash calculation
         :param index: integer for index of incoming data
@@ -937,68 +955,21 @@ class Flash:
 
         if survey is None:
             return json_input
-
-        valid_flashes = [
-            "wateranalysis",
-            "isothermal",
-            "isenthalpic",
-            "bubblepoint",
-            "dewpoint",
-            "vapor-amount",
-            "vapor-fraction",
-            "isochoric",
-            "setph",
-            "precipitation-point",
-            "corrosion-rates",
-        ]
-        if flash_method not in valid_flashes:
-            raise RuntimeError(
-                "Invalid flash_method: {flash_method}. Use one of {', '.join(valid_flashes)}"
+        cached = self._clone_survey
+        if (
+            cached is None
+            or cached[0] != flash_method
+            or cached[1] is not json_input
+            or cached[2] is not survey
+        ):
+            cached = (
+                flash_method,
+                json_input,
+                survey,
+                self.compile_survey(flash_method, json_input, survey),
             )
-
-        clone = deepcopy(json_input)
-        for k, v in survey.items():
-            d = clone["params"]
-            if flash_method == "wateranalysis":
-                d = d["waterAnalysisInputs"]
-                for param in d:
-                    if param["name"].lower() == k.lower():
-                        if self.relative_inflows:
-                            param["value"] += v[index]
-                        else:
-                            param["value"] = v[index]
-                        _logger.info(
-                            f"Updating {k} for sample #{index} clone: new value = {param['value']}"
-                        )
-            else:
-                if k in d:
-                    pass
-                elif k in d["inflows"]["values"]:
-                    d = d["inflows"]["values"]
-                elif hasattr(d, "corrosionParameters") and (
-                    k in d["corrosionParameters"]
-                ):
-                    d = d["corrosionParameters"]
-                else:
-                    _logger.warning(f"Survey key {k} not found in JSON input.")
-                if self.relative_inflows:
-                    if isinstance(d[k], dict):
-                        d[k]["value"] += v[index]
-                        val = d[k]["value"]
-                    else:
-                        d[k] += v[index]
-                        val = d[k]
-                else:
-                    if isinstance(d[k], dict):
-                        d[k]["value"] = v[index]
-                        val = d[k]["value"]
-                    else:
-                        d[k] = v[index]
-                        val = d[k]
-                _logger.info(
-                    f"Updating {k} for sample #{index} clone: new value = {val}"
-                )
-        return clone
+            self._clone_survey = cached
+        return cached[3][index]
 
     def get_apparent_species_from_true(
         self,
@@ -1039,183 +1010,708 @@ class Flash:
         return inflows
 
 
-def flatten_results(processed_requests):
+_VALID_SURVEY_FLASHES = [
+    "wateranalysis",
+    "isothermal",
+    "isenthalpic",
+    "bubblepoint",
+    "dewpoint",
+    "vapor-amount",
+    "vapor-fraction",
+    "isochoric",
+    "setph",
+    "precipitation-point",
+    "corrosion-rates",
+]
 
-    _logger.info("Flattening OLI stream output ... ")
 
-    props = []
-    terminal_keys = ["unit", "value", "found", "fullVersion", "values"]
+class CompiledSurvey(Sequence):
+    """
+    Sequence of flash calculation inputs for each index of a survey.
 
-    def _find_props(data, path=None):
-        """
-        Get the path to all nested items in input data (recursive search).
+    Survey keys are resolved to locations in the JSON input once. Each input is then
+    generated by copying only the containers along those locations, so all other
+    content is shared with the original JSON input and must not be modified.
 
-        :param data: dictionary containing OLI flash output
-        :param path: list of paths to endpoint
+    :param flash_method: string for flash calculation name
+    :param json_input: JSON input for flash calculation
+    :param survey: dictionary containing names and input values to modify in JSON
+    :param relative_inflows: bool switch for surveys - true to add specified value to initial value, false to replace initial value with specified value
+    """
 
-        :return props: list of nested path lists
-        """
-        path = path if path is not None else []
-        if isinstance(data, dict):
-            for k, v in data.items():
-                if isinstance(v, (str, bool)):
-                    props.append([*path, k])
-                elif isinstance(v, list):
-                    if all(k not in terminal_keys for k in v):
-                        _find_props(v, [*path, k])
-                elif isinstance(v, dict):
-                    if all(k not in terminal_keys for k in v):
-                        _find_props(v, [*path, k])
-                    else:
-                        props.append([*path, k])
-        elif isinstance(data, list):
-            for idx, v in enumerate(data):
-                if isinstance(v, (dict, list)):
-                    if all(k not in terminal_keys for k in v):
-                        _find_props(v, [*path, idx])
-                    else:
-                        props.append([*path, idx])
+    def __init__(self, flash_method, json_input, survey=None, relative_inflows=True):
+        if flash_method not in _VALID_SURVEY_FLASHES:
+            raise RuntimeError(
+                f"Invalid flash_method: {flash_method}. Use one of {', '.join(_VALID_SURVEY_FLASHES)}"
+            )
+        self.json_input = json_input
+        self.survey = survey if survey is not None else {}
+        self.relative_inflows = relative_inflows
+
+        self.num_samples = None
+        for k, v in self.survey.items():
+            if self.num_samples is None:
+                self.num_samples = len(v)
+            elif self.num_samples != len(v):
+                raise RuntimeError(f"Length of list for key {k} differs from prior key")
+        if self.num_samples is None:
+            self.num_samples = 1
+
+        # each target is (survey key, path to container, field in container)
+        self.targets = []
+        for k in self.survey:
+            self.targets.extend(self._resolve(flash_method, k))
+        _logger.info(
+            f"Compiled survey of {self.num_samples} samples "
+            + f"modifying {len(self.targets)} input value(s) for keys {list(self.survey)}"
+        )
+
+    def _resolve(self, flash_method, k):
+        d = self.json_input["params"]
+        path = ("params",)
+        if flash_method == "wateranalysis":
+            path = (*path, "waterAnalysisInputs")
+            return [
+                (k, (*path, idx), "value")
+                for idx, param in enumerate(d["waterAnalysisInputs"])
+                if param["name"].lower() == k.lower()
+            ]
+        if k in d:
+            pass
+        elif k in d["inflows"]["values"]:
+            d = d["inflows"]["values"]
+            path = (*path, "inflows", "values")
+        elif k in d.get("corrosionParameters", {}):
+            d = d["corrosionParameters"]
+            path = (*path, "corrosionParameters")
         else:
-            raise RuntimeError(f"Unexpected type for data: {type(data)}")
+            _logger.warning(f"Survey key {k} not found in JSON input.")
+            raise KeyError(k)
+        if isinstance(d[k], dict):
+            return [(k, (*path, k), "value")]
+        return [(k, path, k)]
+
+    def __len__(self):
+        return self.num_samples
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Survey index {index} out of range")
+        if not self.targets:
+            return self.json_input
+
+        clone = dict(self.json_input)
+        copies = {(): clone}
+
+        def _copy(path):
+            if path not in copies:
+                parent = _copy(path[:-1])
+                child = parent[path[-1]]
+                child = dict(child) if isinstance(child, dict) else list(child)
+                parent[path[-1]] = child
+                copies[path] = child
+            return copies[path]
+
+        for k, path, field in self.targets:
+            d = _copy(path)
+            if self.relative_inflows:
+                d[field] = d[field] + self.survey[k][index]
+            else:
+                d[field] = self.survey[k][index]
+            _logger.debug(
+                f"Updating {k} for sample #{index} clone: new value = {d[field]}"
+            )
+        return clone
+
+
+_TERMINAL_KEYS = ["unit", "value", "found", "fullVersion", "values"]
+# keys holding a single string shared by all samples, rather than a column
+_CONSTANT_KEYS = ["fullVersion", "units"]
+
+
+class _SchemaMismatch(Exception):
+    pass
+
+
+def _find_props(data, path=None, props=None):
+    """
+    Get the path to all nested items in input data (recursive search).
+
+    :param data: dictionary containing OLI flash output
+    :param path: list of paths to endpoint
+    :param props: list to add paths to
+
+    :return props: list of nested path lists
+    """
+
+    path = path if path is not None else []
+    props = props if props is not None else []
+    if isinstance(data, dict):
+        for k, v in data.items():
+            if isinstance(v, (str, bool)):
+                props.append([*path, k])
+            elif isinstance(v, list):
+                if all(k not in _TERMINAL_KEYS for k in v):
+                    _find_props(v, [*path, k], props)
+            elif isinstance(v, dict):
+                if all(k not in _TERMINAL_KEYS for k in v):
+                    _find_props(v, [*path, k], props)
+                else:
+                    props.append([*path, k])
+    elif isinstance(data, list):
+        for idx, v in enumerate(data):
+            if isinstance(v, (dict, list)):
+                if all(k not in _TERMINAL_KEYS for k in v):
+                    _find_props(v, [*path, idx], props)
+                else:
+                    props.append([*path, idx])
+    else:
+        raise RuntimeError(f"Unexpected type for data: {type(data)}")
+    return props
+
+
+def _get_nested_data(data, keys):
+
+    for key in keys:
+        data = data[key]
+    return data
+
+
+def _get_unit(values):
+    return values["unit"] if values["unit"] else "dimensionless"
 
-    def _get_nested_data(data, keys):
 
-        for key in keys:
-            data = data[key]
-        return data
+def _extract_values(data, keys):
+    values = _get_nested_data(data, keys)
+    extracted_values = {}
+    if isinstance(values, str):
+        extracted_values = values
+    elif isinstance(values, bool):
+        extracted_values = bool(values)
+    elif isinstance(values, dict):
+        if any(k in values for k in ["group", "name", "fullVersion"]):
+            if "value" in values:
+                extracted_values.update({"values": values["value"]})
+            if "unit" in values:
+                extracted_values.update({"units": _get_unit(values)})
 
-    def _extract_values(data, keys):
-        values = _get_nested_data(data, keys)
-        extracted_values = {}
-        if isinstance(values, str):
+        elif all(k in values for k in ["found", "phase"]):
             extracted_values = values
-        elif isinstance(values, bool):
-            extracted_values = bool(values)
-        elif isinstance(values, dict):
-            if any(k in values for k in ["group", "name", "fullVersion"]):
-                if "value" in values:
-                    extracted_values.update({"values": values["value"]})
-                if "unit" in values:
-                    unit = values["unit"] if values["unit"] else "dimensionless"
-                    extracted_values.update({"units": unit})
-
-            elif all(k in values for k in ["found", "phase"]):
-                extracted_values = values
-            else:
-                unit = values["unit"] if values["unit"] else "dimensionless"
-                if "value" in values:
-                    extracted_values = {
+        else:
+            unit = _get_unit(values)
+            if "value" in values:
+                extracted_values = {
+                    "units": unit,
+                    "values": values["value"],
+                }
+            elif "values" in values:
+                extracted_values = {
+                    k: {
                         "units": unit,
-                        "values": values["value"],
-                    }
-                elif "values" in values:
-                    extracted_values = {
-                        k: {
-                            "units": unit,
-                            "values": values["values"][k],
-                        }
-                        for k, v in values["values"].items()
+                        "values": values["values"][k],
                     }
-                elif "data" in values:
-                    # intended for vaporDiffusivityMatrix
-                    mat_dim = int(sqrt(len(values["data"])))
-                    diffmat = reshape(values["data"], shape=(mat_dim, mat_dim))
-                    extracted_values = {
-                        f'({values["speciesNames"][i]},{values["speciesNames"][j]})': {
-                            "units": values["unit"],
-                            "values": diffmat[i][j],
-                        }
-                        for i in range(len(diffmat))
-                        for j in range(i, len(diffmat))
+                    for k, v in values["values"].items()
+                }
+            elif "data" in values:
+                # intended for vaporDiffusivityMatrix
+                mat_dim = int(sqrt(len(values["data"])))
+                diffmat = reshape(values["data"], shape=(mat_dim, mat_dim))
+                extracted_values = {
+                    f'({values["speciesNames"][i]},{values["speciesNames"][j]})': {
+                        "units": values["unit"],
+                        "values": diffmat[i][j],
                     }
-                else:
-                    raise NotImplementedError(
-                        f"results structure not accounted for. results:\n{values}"
-                    )
+                    for i in range(len(diffmat))
+                    for j in range(i, len(diffmat))
+                }
+            else:
+                raise NotImplementedError(
+                    f"results structure not accounted for. results:\n{values}"
+                )
+    else:
+        raise RuntimeError(f"Unexpected type for data: {type(values)}")
+    return extracted_values
+
+
+def _get_prop_label(prop, result):
+    """
+    Get the output label for a property path.
+
+    :param prop: list for path to property in result
+    :param result: dictionary for OLI flash result
+
+    :return label: string for output label, or None if the path is not recognized
+    """
+
+    phase_tag = ""
+    if "metaData" in prop:
+        prop_tag = prop[-1]
+    elif "result" in prop:
+        # get property tag
+        if isinstance(prop[-1], int):
+            prop_tag = prop[-2]
         else:
-            raise RuntimeError(f"Unexpected type for data: {type(values)}")
-        return extracted_values
+            prop_tag = prop[-1]
+        # get phase tag
+        if any(k in prop for k in ["phases", "total"]):
+            if "total" in prop:
+                phase_tag = "total"
+            else:
+                phase_tag = prop[prop.index("phases") + 1]
+    elif "submitted_requests" in prop:
+        prop_tag = prop[-1]
+        if "params" in prop:
+            if isinstance(prop[-1], int):
+                prop_tag = _get_nested_data(result, prop)["name"]
+    else:
+        _logger.warning(f"Unexpected result:\n{result}\n\nfrom prop {prop}")
+        return None
+    return f"{prop_tag}_{phase_tag}" if phase_tag else prop_tag
+
+
+def _create_input_dict(props, result):
+    input_dict = {k: {} for k in set([prop[0] for prop in props])}
+    for prop in props:
+        label = _get_prop_label(prop, result)
+        if label is not None:
+            input_dict[prop[0]][label] = _extract_values(result, prop)
+    return input_dict
+
+
+def _walk_input_dict(input_dict, path=()):
+    """
+    Yield the output path and value of each entry in a nested input dictionary.
+
+    Empty dictionaries are yielded with a value of None.
+    """
+
+    for k, v in input_dict.items():
+        if isinstance(v, dict):
+            if v:
+                yield from _walk_input_dict(v, (*path, k))
+            else:
+                yield (*path, k), None
+        else:
+            yield (*path, k), v
+
+
+def _check_scalar(v):
+    if isinstance(v, (dict, list)):
+        raise _SchemaMismatch()
+    return v
+
 
-    def _create_input_dict(props, result):
-        input_dict = {k: {} for k in set([prop[0] for prop in props])}
+def _check_str_or_bool(v):
+    if isinstance(v, bool):
+        return v
+    if isinstance(v, str):
+        return v
+    raise _SchemaMismatch()
+
+
+class _ResultSchema:
+    """
+    Compiled mapping from the raw structure of an OLI flash result to output columns.
+
+    The schema records every dictionary and list along the property paths found in a
+    template result, together with its keys (or length), so a result with the same
+    structure can be read with direct lookups instead of repeating the property search.
+    """
+
+    def __init__(self, result):
+        # each container is (parent index, key, dict keys or list length)
+        self.containers = [(None, None, self._shape(result))]
+        self._container_index = {(): 0}
+        self.guards = []
+        leaves = {}
+        props = _find_props(result)
         for prop in props:
-            k = prop[0]
-            phase_tag = ""
-            if "metaData" in prop:
-                prop_tag = prop[-1]
-            elif "result" in prop:
-                # get property tag
-                if isinstance(prop[-1], int):
-                    prop_tag = prop[-2]
-                else:
-                    prop_tag = prop[-1]
-                # get phase tag
-                if any(k in prop for k in ["phases", "total"]):
-                    if "total" in prop:
-                        phase_tag = "total"
-                    else:
-                        phase_tag = prop[prop.index("phases") + 1]
-            elif "submitted_requests" in prop:
-                prop_tag = prop[-1]
-                if "params" in prop:
-                    if isinstance(prop[-1], int):
-                        prop_tag = _get_nested_data(result, prop)["name"]
+            label = _get_prop_label(prop, result)
+            if label is None:
+                continue
+            out_path = (prop[0], label)
+            # a repeated label replaces the earlier entry, as in _create_input_dict
+            leaves[out_path] = self._compile_prop(result, prop, out_path)
+            if "submitted_requests" in prop and isinstance(prop[-1], int):
+                self.guards.append((self._container(result, prop), "name", label))
+        self.nodes = [p for p, spec in leaves.items() if spec is None]
+        self.leaves = [leaf for spec in leaves.values() if spec for leaf in spec]
+
+    @staticmethod
+    def _shape(obj):
+        if isinstance(obj, dict):
+            return frozenset(obj)
+        return len(obj)
+
+    @staticmethod
+    def _matches(obj, shape):
+        if isinstance(obj, dict):
+            return obj.keys() == shape
+        if isinstance(obj, list):
+            return len(obj) == shape
+        return False
+
+    def _container(self, result, path):
+        path = tuple(path)
+        if path not in self._container_index:
+            parent = self._container(result, path[:-1])
+            obj = _get_nested_data(result, path)
+            self.containers.append((parent, path[-1], self._shape(obj)))
+            self._container_index[path] = len(self.containers) - 1
+        return self._container_index[path]
+
+    def _compile_prop(self, result, prop, out_path):
+        """
+        Get the leaves (output path, container index, key, check) for a property.
+
+        Mirrors _extract_values; returns None for properties extracted as an empty dict.
+        """
+
+        values = _get_nested_data(result, prop)
+        if isinstance(values, (str, bool)):
+            parent = self._container(result, prop[:-1])
+            return [(out_path, parent, prop[-1], _check_str_or_bool)]
+        if not isinstance(values, dict):
+            raise RuntimeError(f"Unexpected type for data: {type(values)}")
+        c = self._container(result, prop)
+        leaves = []
+        if any(k in values for k in ["group", "name", "fullVersion"]):
+            if "value" in values:
+                leaves.append(((*out_path, "values"), c, "value", _check_scalar))
+            if "unit" in values:
+                leaves.append(((*out_path, "units"), c, None, _get_unit))
+        elif all(k in values for k in ["found", "phase"]):
+            leaves.extend(self._compile_raw(result, list(prop), out_path))
+        else:
+            _get_unit(values)
+            if "value" in values:
+                leaves.append(((*out_path, "units"), c, None, _get_unit))
+                leaves.append(((*out_path, "values"), c, "value", _check_scalar))
+            elif "values" in values:
+                cv = self._container(result, [*prop, "values"])
+                for k in values["values"]:
+                    leaves.append(((*out_path, k, "units"), c, None, _get_unit))
+                    leaves.append(((*out_path, k, "values"), cv, k, _check_scalar))
+            elif "data" in values:
+                # intended for vaporDiffusivityMatrix
+                cd = self._container(result, [*prop, "data"])
+                names = values["speciesNames"]
+                self.guards.append(
+                    (self._container(result, [*prop, "speciesNames"]), None, names)
+                )
+                mat_dim = int(sqrt(len(values["data"])))
+                for i in range(mat_dim):
+                    for j in range(i, mat_dim):
+                        label = f"({names[i]},{names[j]})"
+                        leaves.append(((*out_path, label, "units"), c, "unit", None))
+                        leaves.append(
+                            (
+                                (*out_path, label, "values"),
+                                cd,
+                                i * mat_dim + j,
+                                _check_scalar,
+                            )
+                        )
             else:
-                _logger.warning(
-                    f"Unexpected result:\n{result}\n\ninput_dict:\n{input_dict} from prop {prop}"
+                raise NotImplementedError(
+                    f"results structure not accounted for. results:\n{values}"
                 )
-                continue
-            label = f"{prop_tag}_{phase_tag}" if phase_tag else prop_tag
-            input_dict[k][label] = _extract_values(result, prop)
-        return input_dict
+        return leaves or None
+
+    def _compile_raw(self, result, path, out_path):
+        c = self._container(result, path)
+        leaves = []
+        for k, v in _get_nested_data(result, path).items():
+            if isinstance(v, dict):
+                leaves.extend(self._compile_raw(result, [*path, k], (*out_path, k)))
+            else:
+                leaves.append(((*out_path, k), c, k, _check_scalar))
+        return leaves
 
-    float_nan = float("nan")
+    def read(self, result):
+        """
+        Read all leaf values of a result with the same structure as the template.
+
+        :param result: dictionary for OLI flash result
 
-    def _add_to_output(input_dict, output_dict, index, number_samples):
+        :return values: list of (output path, value) pairs
         """
-        Add incoming flash results to output data.
 
-        :param input_dict: dictionary for incoming data
-        :param output_dict: dictionary for output data
-        :param index: integer for index of incoming data
-        :param number_samples: integer for total number of incoming data samples
+        try:
+            objs = [result]
+            if not self._matches(result, self.containers[0][2]):
+                raise _SchemaMismatch()
+            for parent, key, shape in self.containers[1:]:
+                obj = objs[parent][key]
+                if not self._matches(obj, shape):
+                    raise _SchemaMismatch()
+                objs.append(obj)
+            for c, key, expected in self.guards:
+                obj = objs[c] if key is None else objs[c][key]
+                if obj != expected:
+                    raise _SchemaMismatch()
+            values = []
+            for out_path, c, key, check in self.leaves:
+                v = objs[c] if key is None else objs[c][key]
+                values.append((out_path, v if check is None else check(v)))
+        except (_SchemaMismatch, KeyError, IndexError, TypeError):
+            return None
+        return values
+
+
+class FlashResultTable:
+    """
+    Columnar store for flattened OLI flash results.
+
+    Property paths are discovered once from the first result and reused for every
+    result with the same structure, filling preallocated NumPy columns. Results
+    with a different structure (e.g., when a new phase forms during a survey) are
+    flattened individually and become the template for subsequent results.
+    Results may be added as they arrive.
+
+    :param num_samples: integer for number of samples to preallocate
+    """
+
+    def __init__(self, num_samples=0):
+        self._capacity = max(int(num_samples), 1)
+        self._size = 0
+        self._columns = {}
+        self._order = {}
+        self._schema = None
+
+    @property
+    def num_samples(self):
+        return self._size
+
+    def add(self, result, index=None):
         """
+        Add a flash result to the table.
 
-        for k, v in input_dict.items():
-            try:
-                val = float(v)
-            except:
-                val = None
-            if val is not None:
-                if k not in output_dict:
-                    output_dict[k] = [float_nan] * number_samples
-                output_dict[k][index] = val
-            elif isinstance(v, str):
-                if k not in output_dict:
-                    if k in ["fullVersion", "units"]:
-                        output_dict[k] = v
-                    else:
-                        output_dict[k] = [float_nan] * number_samples
-                if k in ["fullVersion", "units"]:
-                    if input_dict[k] != output_dict[k]:
-                        raise Exception(f"Input and output do not agree for key {k}")
-                else:
-                    output_dict[k][index] = v
-            elif isinstance(v, dict):
-                if k not in output_dict:
-                    output_dict[k] = {}
-                _add_to_output(input_dict[k], output_dict[k], index, number_samples)
+        :param result: dictionary for OLI flash result
+        :param index: integer for sample index, next sample if None
+        """
+
+        if index is None:
+            index = self._size
+        if index >= self._capacity:
+            self._grow(max(index + 1, 2 * self._capacity))
+        self._size = max(self._size, index + 1)
+
+        values = None if self._schema is None else self._schema.read(result)
+        if values is None:
+            values, nodes = self._read_by_search(result)
+        else:
+            nodes = self._schema.nodes
+        for out_path in nodes:
+            self._order.setdefault(out_path, None)
+        for out_path, v in values:
+            self._store(out_path, index, v)
+
+    def extend(self, results):
+        """
+        Add flash results to the table in order.
+
+        :param results: iterable of dictionaries for OLI flash results
+        """
+
+        for result in results:
+            self.add(result)
+
+    def _read_by_search(self, result):
+        """
+        Read a result by searching its properties, and compile it as the new template.
+
+        :param result: dictionary for OLI flash result
+
+        :return values: list of (output path, value) pairs
+        :return nodes: list of output paths for empty dictionaries
+        """
+
+        input_dict = _create_input_dict(_find_props(result), result)
+        values = []
+        nodes = []
+        for out_path, v in _walk_input_dict(input_dict):
+            if v is None:
+                nodes.append(out_path)
+            else:
+                values.append((out_path, v))
+        schema = _ResultSchema(result)
+        # only reuse the compiled schema if it reproduces the searched values
+        compiled_values = schema.read(result)
+        if (
+            compiled_values is not None
+            and len(compiled_values) == len(values)
+            and dict(compiled_values) == dict(values)
+            and set(schema.nodes) == set(nodes)
+        ):
+            self._schema = schema
+        else:
+            _logger.debug("Unable to compile flash result structure")
+            self._schema = None
+        return values, nodes
+
+    def _grow(self, capacity):
+        for k, col in self._columns.items():
+            if not isinstance(col, str):
+                new_col = np.full(capacity, np.nan, dtype=col.dtype)
+                new_col[: len(col)] = col
+                self._columns[k] = new_col
+        self._capacity = capacity
+
+    def _store(self, out_path, index, v):
+        """
+        Store a value, following the conventions of the nested output dictionary.
+        """
+
+        col = self._columns.get(out_path)
+        if type(v) is float and col is not None and not isinstance(col, str):
+            col[index] = v
+            return
+        try:
+            val = float(v)
+        except (TypeError, ValueError):
+            val = None
+        key = out_path[-1]
+        if val is not None:
+            if col is None:
+                col = self._new_column(out_path, float)
+            elif isinstance(col, str):
+                raise Exception(f"Input and output do not agree for key {key}")
+            col[index] = val
+        elif isinstance(v, str):
+            if key in _CONSTANT_KEYS:
+                if col is None:
+                    self._columns[out_path] = v
+                    self._order.setdefault(out_path, None)
+                elif not isinstance(col, str) or col != v:
+                    raise Exception(f"Input and output do not agree for key {key}")
+            else:
+                if col is None:
+                    col = self._new_column(out_path, object)
+                elif isinstance(col, str):
+                    raise Exception(f"Input and output do not agree for key {key}")
+                elif col.dtype != object:
+                    col = self._columns[out_path] = col.astype(object)
+                col[index] = v
+        else:
+            raise Exception(f"Unexpected value: {v}")
+
+    def _new_column(self, out_path, dtype):
+        col = np.full(self._capacity, np.nan, dtype=dtype)
+        self._columns[out_path] = col
+        self._order.setdefault(out_path, None)
+        return col
+
+    def to_dict(self):
+        """
+        Get results as nested dictionaries of lists, as returned by flatten_results.
+
+        :return output_dict: dictionary for flattened results
+        """
+
+        output_dict = {}
+        for out_path in self._order:
+            d = output_dict
+            for key in out_path[:-1]:
+                d = d.setdefault(key, {})
+            col = self._columns.get(out_path)
+            if col is None:
+                d.setdefault(out_path[-1], {})
+            elif isinstance(col, str):
+                d[out_path[-1]] = col
+            else:
+                d[out_path[-1]] = col[: self._size].tolist()
+        return output_dict
+
+    def to_arrays(self):
+        """
+        Get results as flat NumPy arrays.
+
+        :return arrays: dictionary of arrays keyed by "/"-joined output paths; strings shared by all samples (e.g., units) are 0-d string arrays
+        """
+
+        arrays = {}
+        for out_path, col in self._columns.items():
+            name = "/".join(str(k) for k in out_path)
+            if isinstance(col, str):
+                arrays[name] = np.array(col)
             else:
-                raise Exception(f"Unexpected value: {v}")
+                arrays[name] = col[: self._size].copy()
+        return arrays
 
-    output_dict = {}
-    num_samples = len(processed_requests)
-    for idx, result in enumerate(processed_requests):
-        props = []
-        _find_props(result)
-        input_dict = _create_input_dict(props, result)
-        _add_to_output(input_dict, output_dict, idx, num_samples)
-    return output_dict
+    def to_dataframe(self):
+        """
+        Get results as a pandas DataFrame with one row per sample.
+
+        Strings shared by all samples (e.g., units) are stored in the DataFrame attrs.
+
+        :return df: DataFrame keyed by "/"-joined output paths
+        """
+
+        if not pandas_available:
+            raise ModuleNotFoundError("Module 'pandas' not available.")
+        arrays = self.to_arrays()
+        df = pandas.DataFrame({k: v for k, v in arrays.items() if v.ndim})
+        df.attrs.update({k: str(v) for k, v in arrays.items() if not v.ndim})
+        return df
+
+    def write_npz(self, file_name):
+        """
+        Write results to a compressed NumPy archive.
+
+        :param file_name: string for name of file to write
+
+        :return file_path: string for full path of written file
+        """
+
+        _logger.info(f"Saving content to {file_name}")
+        arrays = {
+            k: v.astype(str) if v.dtype == object else v
+            for k, v in self.to_arrays().items()
+        }
+        with open(file_name, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        _logger.info("Save complete")
+        return Path(file_name).resolve()
+
+    def write_parquet(self, file_name):
+        """
+        Write results to a Parquet file (requires pandas and pyarrow).
+
+        :param file_name: string for name of file to write
+
+        :return file_path: string for full path of written file
+        """
+
+        _logger.info(f"Saving content to {file_name}")
+        self.to_dataframe().to_parquet(file_name)
+        _logger.info("Save complete")
+        return Path(file_name).resolve()
+
+
+def flatten_results(processed_requests, as_table=False):
+    """
+    Flatten OLI flash results into arrays of values for each property.
+
+    :param processed_requests: iterable of results from processed OLI flash requests
+    :param as_table: bool to return a FlashResultTable instead of nested dictionaries
+
+    :return output_dict: dictionary for flattened results, or FlashResultTable if as_table
+    """
+
+    _logger.info("Flattening OLI stream output ... ")
+    num_samples = (
+        len(processed_requests) if hasattr(processed_requests, "__len__") else 0
+    )
+    table = FlashResultTable(num_samples)
+    table.extend(processed_requests)
+    if as_table:
+        return table
+    return table.to_dict()
 
 
 def write_output(content, file_name):
@@ -1230,13 +1726,67 @@ def write_output(content, file_name):
 
     _logger.info(f"Saving content to {file_name}")
     with open(file_name, "w", encoding="utf-8") as f:
-        json.dump(content, f)
+        json.dump(content, f, default=_to_json)
     _logger.info("Save complete")
     file_path = Path(file_name).resolve()
     return file_path
 
 
-def build_survey(survey_arrays, get_oli_names=False, file_name=None, mesh_grid=True):
+def _to_json(obj):
+    # arrays and lazily evaluated survey columns
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class MeshGridColumn(Sequence):
+    """
+    Lazily evaluated values of one variable over the Cartesian product of survey arrays.
+
+    Values are ordered as by itertools.product, without materializing the product.
+
+    :param arrays: list of arrays for each survey variable
+    :param axis: integer for index of the variable in arrays
+    """
+
+    def __init__(self, arrays, axis):
+        self.arrays = arrays
+        self.axis = axis
+        self.values = arrays[axis]
+        self.stride = 1
+        for arr in arrays[axis + 1 :]:
+            self.stride *= len(arr)
+        self.length = self.stride
+        for arr in arrays[: axis + 1]:
+            self.length *= len(arr)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Survey index {index} out of range")
+        return self.values[(index // self.stride) % len(self.values)]
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return f"MeshGridColumn({len(self)} values of {list(self.values)})"
+
+    def tolist(self):
+        return list(self)
+
+
+def build_survey(
+    survey_arrays, get_oli_names=False, file_name=None, mesh_grid=True, lazy=False
+):
     """
     Build a dictionary for modifying flash calculation parameters.
 
@@ -1245,14 +1795,22 @@ def build_survey(survey_arrays, get_oli_names=False, file_name=None, mesh_grid=T
     :param file_name: string for file to write, if any
     :param mesh_grid: if True (default) the input array will be combined to generate combination of all possible samples
         if False, the direct values in survey_arrays will be used
+    :param lazy: if True, mesh grid values are returned as MeshGridColumn sequences evaluated on demand
+        rather than lists, so the product of large surveys is never materialized
 
     :return survey: dictionary for product of survey variables and values
     """
     _name = lambda k: get_oli_name(k) if get_oli_names else k
     if mesh_grid:
-        keys = [get_oli_name(k) if get_oli_names else k for k in survey_arrays]
-        values = list(product(*(survey_arrays.values())))
-        survey = {_name(keys[i]): [val[i] for val in values] for i in range(len(keys))}
+        keys = [_name(k) for k in survey_arrays]
+        arrays = [
+            arr if isinstance(arr, (Sequence, np.ndarray)) else list(arr)
+            for arr in survey_arrays.values()
+        ]
+        survey = {k: MeshGridColumn(arrays, i) for i, k in enumerate(keys)}
+        if not lazy:
+            survey = {k: v.tolist() for k, v in survey.items()}
+        values = survey[keys[-1]] if keys else [()]
     else:
         survey = {}
         values = None
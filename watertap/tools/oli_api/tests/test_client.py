@@ -45,10 +45,12 @@
 # or derivative works thereof, in binary and source code form.
 ###############################################################################
 from pathlib import Path
+import time
 
 import pytest
 
 from watertap.tools.oli_api.client import OLIApi
+from watertap.tools.oli_api.util.result_cache import OLIResultCache
 
 
 @pytest.mark.unit
@@ -97,3 +99,171 @@ def test_valid_phases(oliapi_instance: OLIApi):
 @pytest.mark.unit
 def test_invalid_phases(oliapi_instance_with_invalid_phase: OLIApi):
     oliapi_instance_with_invalid_phase
+
+
+def _stub_requests(num_samples):
+    return [
+        {
+            "flash_method": "isothermal",
+            "dbs_file_id": "stub-dbs",
+            "input_params": {"params": {"sample": idx}},
+            "poll_time": 0.05,
+        }
+        for idx in range(num_samples)
+    ]
+
+
+@pytest.mark.component
+def test_process_request_list_serial(stub_oli_server, stub_oliapi_instance: OLIApi):
+    request_list = _stub_requests(3)
+    results = stub_oliapi_instance.process_request_list(request_list)
+    assert [r["result"]["echo"] for r in results] == [
+        r["input_params"] for r in request_list
+    ]
+    assert stub_oli_server.max_in_flight == 1
+
+
+@pytest.mark.component
+def test_process_request_list_concurrent(stub_oli_server, stub_oliapi_instance: OLIApi):
+    num_samples = 12
+    request_list = _stub_requests(num_samples)
+    timer = time.time()
+    results = stub_oliapi_instance.process_request_list(
+        request_list, max_concurrent_processes=4
+    )
+    elapsed = time.time() - timer
+    # results come back in submission order, with the submitted request attached
+    assert [r["result"]["echo"] for r in results] == [
+        r["input_params"] for r in request_list
+    ]
+    assert [r["submitted_requests"] for r in results] == request_list
+    assert stub_oli_server.max_in_flight == 4
+    # serial execution would take at least num_samples * latency
+    assert elapsed < num_samples * stub_oli_server.latency
+
+
+@pytest.mark.component
+def test_process_request_list_batches_and_burst(
+    stub_oli_server, stub_oliapi_instance: OLIApi
+):
+    request_list = _stub_requests(5)
+    results = stub_oliapi_instance.process_request_list(
+        request_list,
+        burst_job_tag="test",
+        max_concurrent_processes=3,
+        batch_size=2,
+    )
+    assert [r["result"]["echo"] for r in results] == [
+        r["input_params"] for r in request_list
+    ]
+    # batches of 2 never fill the 3 available workers
+    assert stub_oli_server.max_in_flight == 2
+    assert stub_oli_server.burst_tags == ["watertap_burst_test"] * 5
+
+
+@pytest.mark.component
+def test_call_with_result_cache(
+    stub_oli_server, stub_oliapi_instance: OLIApi, tmp_path: Path
+):
+    request_list = _stub_requests(4)
+    with OLIResultCache(tmp_path / "cache.sqlite") as cache:
+        stub_oliapi_instance.result_cache = cache
+        # a partially completed survey populates the cache
+        stub_oliapi_instance.process_request_list(request_list[:2])
+        assert stub_oli_server.submitted == 2
+
+        # the full survey only submits the remaining samples
+        results = stub_oliapi_instance.process_request_list(
+            request_list, max_concurrent_processes=2
+        )
+        assert stub_oli_server.submitted == 4
+        assert [r["result"]["echo"] for r in results] == [
+            r["input_params"] for r in request_list
+        ]
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 4
+        assert stats["entries"] == 4
+
+
+@pytest.mark.component
+def test_call_retries_transient_errors(stub_oli_server, stub_oliapi_instance: OLIApi):
+    stub_oli_server.fail_submits = 2
+    stub_oliapi_instance.retry_post = True
+    request = _stub_requests(1)[0]
+    result = stub_oliapi_instance.call(**request)
+    assert result["result"]["echo"] == request["input_params"]
+    assert stub_oli_server.rejected == 2
+    assert stub_oli_server.submitted == 1
+
+
+@pytest.mark.component
+def test_call_retry_limit(stub_oli_server, stub_oliapi_instance: OLIApi):
+    stub_oli_server.fail_submits = 5
+    stub_oliapi_instance.retry_post = True
+    stub_oliapi_instance.max_retries = 1
+    with pytest.raises(RuntimeError, match="Status code 503 after 1 retries"):
+        stub_oliapi_instance.call(**_stub_requests(1)[0])
+    assert stub_oli_server.rejected == 2
+
+
+@pytest.mark.component
+def test_call_does_not_resubmit_post(stub_oli_server, stub_oliapi_instance: OLIApi):
+    # the server may have accepted the job, so a failed submission is not repeated
+    stub_oli_server.fail_submits = 1
+    with pytest.raises(RuntimeError, match="Status Code: 503"):
+        stub_oliapi_instance.call(**_stub_requests(1)[0])
+    assert stub_oli_server.rejected == 1
+    assert stub_oli_server.submitted == 0
+
+
+@pytest.mark.component
+def test_call_retries_rate_limited_post(stub_oli_server, stub_oliapi_instance: OLIApi):
+    stub_oli_server.fail_submits = 2
+    stub_oli_server.fail_status = 429
+    request = _stub_requests(1)[0]
+    result = stub_oliapi_instance.call(**request)
+    assert result["result"]["echo"] == request["input_params"]
+    assert stub_oli_server.rejected == 2
+    assert stub_oli_server.submitted == 1
+
+
+@pytest.mark.component
+def test_call_polling_backoff_and_timing(stub_oli_server, stub_oliapi_instance: OLIApi):
+    request = {**_stub_requests(1)[0], "poll_time": 0.01}
+    stub_oliapi_instance.call(**request)
+    timing = stub_oliapi_instance.call_timings[-1]
+    # fixed polling at 0.01 s would need about 20 polls to cover the latency
+    assert 1 <= timing["poll_count"] < 12
+    assert timing["queue_time"] >= stub_oli_server.latency
+    assert timing["submit_latency"] < timing["total_time"]
+
+    summary = stub_oliapi_instance.summarize_call_timings()
+    assert summary["calls"] == 1
+    assert summary["cached_calls"] == 0
+    assert summary["total_polls"] == timing["poll_count"]
+
+
+@pytest.mark.component
+def test_call_polling_follows_server_hint(
+    stub_oli_server, stub_oliapi_instance: OLIApi
+):
+    stub_oli_server.poll_retry_after = stub_oli_server.latency
+    request = {**_stub_requests(1)[0], "poll_time": 0.01}
+    stub_oliapi_instance.call(**request)
+    assert stub_oliapi_instance.call_timings[-1]["poll_count"] == 2
+
+
+@pytest.mark.component
+def test_call_timings_bounded(stub_oli_server, stub_oliapi_instance: OLIApi):
+    oliapi = OLIApi(
+        stub_oliapi_instance.credential_manager,
+        interactive_mode=False,
+        max_call_timings=2,
+    )
+    oliapi.process_request_list(_stub_requests(3), max_concurrent_processes=3)
+    assert len(oliapi.call_timings) == 2
+    # each request list is timed separately
+    oliapi.process_request_list(_stub_requests(1))
+    assert len(oliapi.call_timings) == 1
+    oliapi.close()
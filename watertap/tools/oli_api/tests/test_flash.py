@@ -46,12 +46,28 @@
 ###############################################################################
 import pytest
 
+from copy import deepcopy
+from itertools import product
+import json
+import logging
 from pathlib import Path
 
-from watertap.tools.oli_api.flash import Flash, build_survey
+from watertap.tools.oli_api.flash import (
+    Flash,
+    FlashResultTable,
+    CompiledSurvey,
+    MeshGridColumn,
+    build_survey,
+    flatten_results,
+    write_output,
+)
 from watertap.tools.oli_api.client import OLIApi
 
+import numpy as np
 from numpy import linspace
+from pyomo.common.dependencies import attempt_import
+
+pyarrow, pyarrow_available = attempt_import("pyarrow")
 
 
 @pytest.mark.unit
@@ -171,3 +187,247 @@ def test_bubble_point(
     pytest.approx(
         saturation_pressure["result"]["calculatedVariables"]["values"][0], rel=1e-3
     ) == 32.04094
+
+
+def _flash_result(index, solid=False):
+    phases = {
+        "liquid1": {
+            "density": {"unit": "g/L", "value": 1000.0 + index},
+            "molecularConcentration": {
+                "unit": "mg/L",
+                "values": {"NACL": 1.0 + index, "H2O": 1e6},
+            },
+        }
+    }
+    if solid:
+        phases["solid"] = {"phaseAmount": {"unit": "mol", "value": 0.1 * index}}
+    return {
+        "metaData": {"executionTime": {"value": 10.0, "unit": "ms"}},
+        "result": {
+            "total": {"enthalpy": {"unit": "", "value": -100.0 * index}},
+            "phases": phases,
+            "additionalProperties": {
+                "vaporDiffusivityMatrix": {
+                    "unit": "m2/s",
+                    "speciesNames": ["H2O", "N2"],
+                    "data": [1.0, 2.0 + index, 2.0 + index, 3.0],
+                },
+            },
+            "status": "OK" if index % 2 else "WARN",
+        },
+        "submitted_requests": {
+            "flash_method": "wateranalysis",
+            "input_params": {
+                "params": {
+                    "waterAnalysisInputs": [
+                        {
+                            "group": "Properties",
+                            "name": "Temperature",
+                            "unit": "K",
+                            "value": 298.15 + index,
+                        },
+                    ],
+                    "optionalProperties": {"kValuesMBased": True},
+                }
+            },
+        },
+    }
+
+
+def _search_each(results):
+    # reference flattening without reusing the compiled result structure
+    table = FlashResultTable()
+    for result in results:
+        table._schema = None
+        table.add(result)
+    return table.to_dict()
+
+
+@pytest.mark.unit
+def test_flatten_results():
+    results = [_flash_result(i) for i in range(3)]
+    flat = flatten_results(results)
+    assert flat["metaData"]["executionTime"] == {
+        "units": "ms",
+        "values": [10.0, 10.0, 10.0],
+    }
+    assert flat["result"]["enthalpy_total"] == {
+        "units": "dimensionless",
+        "values": [-0.0, -100.0, -200.0],
+    }
+    assert flat["result"]["molecularConcentration_liquid1"]["NACL"] == {
+        "units": "mg/L",
+        "values": [1.0, 2.0, 3.0],
+    }
+    assert flat["result"]["vaporDiffusivityMatrix"]["(H2O,N2)"] == {
+        "units": "m2/s",
+        "values": [2.0, 3.0, 4.0],
+    }
+    assert flat["result"]["status"] == ["WARN", "OK", "WARN"]
+    assert flat["submitted_requests"]["Temperature"] == {
+        "units": "K",
+        "values": [298.15, 299.15, 300.15],
+    }
+    assert flat["submitted_requests"]["kValuesMBased"] == [1.0, 1.0, 1.0]
+    assert flat == _search_each(results)
+
+
+@pytest.mark.unit
+def test_flatten_results_changing_structure():
+    # a solid phase forms part way through the survey
+    results = [_flash_result(i, solid=i in [2, 3]) for i in range(5)]
+    flat = flatten_results(results)
+    amounts = flat["result"]["phaseAmount_solid"]["values"]
+    assert np.isnan(amounts[0]) and np.isnan(amounts[1]) and np.isnan(amounts[4])
+    assert amounts[2:4] == pytest.approx([0.2, 0.3])
+    assert flat["result"]["density_liquid1"]["values"] == [
+        1000.0,
+        1001.0,
+        1002.0,
+        1003.0,
+        1004.0,
+    ]
+    assert str(flat) == str(_search_each(results))
+
+
+@pytest.mark.unit
+def test_flash_result_table_streaming(tmp_path: Path):
+    table = FlashResultTable()
+    for i in range(5):
+        table.add(_flash_result(i))
+    assert table.num_samples == 5
+    assert table.to_dict() == flatten_results(_flash_result(i) for i in range(5))
+
+    arrays = table.to_arrays()
+    assert arrays["result/density_liquid1/values"].tolist() == [
+        1000.0,
+        1001.0,
+        1002.0,
+        1003.0,
+        1004.0,
+    ]
+    assert str(arrays["result/density_liquid1/units"]) == "g/L"
+
+    file_path = table.write_npz(tmp_path / "results.npz")
+    with np.load(file_path) as data:
+        np.testing.assert_array_equal(
+            data["result/density_liquid1/values"],
+            arrays["result/density_liquid1/values"],
+        )
+        assert data["result/status"].tolist() == ["WARN", "OK", "WARN", "OK", "WARN"]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not pyarrow_available, reason="pyarrow not available")
+def test_flash_result_table_parquet(tmp_path: Path):
+    import pandas
+
+    table = flatten_results([_flash_result(i) for i in range(3)], as_table=True)
+    file_path = table.write_parquet(tmp_path / "results.parquet")
+    df = pandas.read_parquet(file_path)
+    assert df["result/density_liquid1/values"].tolist() == [1000.0, 1001.0, 1002.0]
+
+
+@pytest.mark.unit
+def test_build_survey_mesh_grid_is_lazy(tmp_path: Path):
+    arrays = {"Na_+": [0, 10, 20], "temperature": [273.15, 298.15], "Cl_-": [1, 2]}
+    expected = list(product(*arrays.values()))
+    # lists by default
+    survey = build_survey(arrays, get_oli_names=True)
+    assert survey["temperature"] == [val[1] for val in expected]
+    assert all(isinstance(v, list) for v in survey.values())
+
+    survey = build_survey(arrays, get_oli_names=True, lazy=True)
+    assert all(isinstance(v, MeshGridColumn) for v in survey.values())
+    assert list(survey) == ["NAION", "temperature", "CLION"]
+    for i, k in enumerate(survey):
+        assert len(survey[k]) == len(expected)
+        assert survey[k] == [val[i] for val in expected]
+        assert survey[k][-1] == expected[-1][i]
+        assert survey[k][2:5] == [val[i] for val in expected[2:5]]
+
+    file_path = write_output(survey, tmp_path / "survey.json")
+    with open(file_path) as f:
+        assert json.load(f)["temperature"] == [val[1] for val in expected]
+
+    large_survey = build_survey({k: linspace(0, 1, 100) for k in "abc"}, lazy=True)
+    assert len(large_survey["a"]) == 10**6
+    assert large_survey["a"][10**6 - 1] == large_survey["c"][99] == 1
+
+
+@pytest.mark.unit
+def test_compiled_survey(flash_instance: Flash, source_water: dict, caplog):
+    json_input = flash_instance.configure_water_analysis(source_water)
+    reference = deepcopy(json_input)
+    survey = build_survey(
+        {"Na_+": [0, 100], "temperature": [0, 10, 20]}, get_oli_names=True
+    )
+    clones = flash_instance.compile_survey("wateranalysis", json_input, survey)
+    assert len(clones) == 6
+    for idx, clone in enumerate(clones):
+        assert clone == flash_instance.get_clone(
+            "wateranalysis", json_input, idx, survey
+        )
+        inputs = {p["name"]: p["value"] for p in clone["params"]["waterAnalysisInputs"]}
+        assert inputs["NAION"] == 1000 + survey["NAION"][idx]
+        assert inputs["Temperature"] == 273.15 + survey["temperature"][idx]
+    # unmodified content is shared rather than copied
+    assert clones[0]["params"]["optionalProperties"] is (
+        json_input["params"]["optionalProperties"]
+    )
+    assert json_input == reference
+
+    # get_clone compiles a new survey once for all indices
+    survey = dict(survey)
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="watertap.tools.oli_api.flash"):
+        for idx in range(len(clones)):
+            flash_instance.get_clone("wateranalysis", json_input, idx, survey)
+    assert sum("Compiled survey" in r.message for r in caplog.records) == 1
+
+
+@pytest.mark.unit
+def test_compiled_survey_flash_inputs(source_water: dict):
+    flash = Flash(relative_inflows=False)
+    json_input = flash.configure_flash_analysis(
+        source_water, "isothermal", temperature=300
+    )
+    reference = deepcopy(json_input)
+    survey = {"temperature": [310, 320], "NAION": [5, 6]}
+    clones = CompiledSurvey("isothermal", json_input, survey, relative_inflows=False)
+    assert [c["params"]["temperature"]["value"] for c in clones] == [310, 320]
+    assert [c["params"]["inflows"]["values"]["NAION"] for c in clones] == [5, 6]
+    assert json_input == reference
+
+    with pytest.raises(RuntimeError, match="differs from prior key"):
+        CompiledSurvey("isothermal", json_input, {"temperature": [1], "NAION": [1, 2]})
+    with pytest.raises(KeyError):
+        CompiledSurvey("isothermal", json_input, {"not_a_key": [1]})
+
+
+@pytest.mark.component
+def test_run_flash_survey_stub(
+    flash_instance: Flash, source_water: dict, stub_oliapi_instance: OLIApi
+):
+    survey = build_survey({"Na_+": [0, 100], "temperature": [0, 10]}, True)
+    json_input = flash_instance.configure_water_analysis(source_water)
+    output = flash_instance.run_flash(
+        "wateranalysis",
+        stub_oliapi_instance,
+        "stub-dbs",
+        json_input,
+        survey,
+        max_concurrent_processes=4,
+    )
+    assert output["submitted_requests"]["NAION"]["values"] == [
+        1000,
+        1000,
+        1100,
+        1100,
+    ]
+    assert output["submitted_requests"]["Temperature"]["values"] == [
+        273.15,
+        283.15,
+        273.15,
+        283.15,
+    ]
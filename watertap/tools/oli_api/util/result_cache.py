@@ -0,0 +1,206 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+
+class OLIResultCache:
+    """
+    Persistent, content-addressed cache for OLI Cloud flash results.
+
+    Results are stored as compressed JSON in a SQLite database, keyed by a hash
+    of the DBS file ID, flash method and canonicalized JSON input. Entries older
+    than ``max_age`` are discarded on lookup and the least recently used entries
+    are evicted once the stored results exceed ``max_size`` bytes.
+
+    :param file_path: path to the SQLite database file, created if it does not exist
+    :param max_age: float for maximum age of an entry in seconds, no limit if None
+    :param max_size: integer for maximum compressed size of all entries in bytes, no limit if None
+    """
+
+    def __init__(
+        self, file_path="./oli_result_cache.sqlite", max_age=None, max_size=None
+    ):
+        self.file_path = Path(file_path).resolve()
+        self.max_age = max_age
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.file_path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, "
+                "created REAL NOT NULL, "
+                "accessed REAL NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "data BLOB NOT NULL)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None):
+        self.close()
+        return False
+
+    def __len__(self):
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return row[0]
+
+    @staticmethod
+    def make_key(dbs_file_id, flash_method, input_params):
+        """
+        Get the cache key for a flash calculation request.
+
+        :param dbs_file_id: string indicating DBS file
+        :param flash_method: string indicating flash method
+        :param input_params: dictionary for flash calculation inputs
+
+        :return key: string hex digest identifying the request
+        """
+
+        canonical = json.dumps(
+            {
+                "dbs_file_id": dbs_file_id,
+                "flash_method": flash_method,
+                "input_params": input_params,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key):
+        """
+        Get a cached result.
+
+        :param key: string cache key from make_key
+
+        :return result: dictionary for cached result, or None if not found or expired
+        """
+
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created, data FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[0], now):
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM results WHERE key = ?", (key,)
+                    )
+                self.evictions += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE results SET accessed = ? WHERE key = ?", (now, key)
+                )
+            self.hits += 1
+        return json.loads(zlib.decompress(row[1]).decode())
+
+    def set(self, key, result):
+        """
+        Store a result, evicting old entries if size or age limits are exceeded.
+
+        :param key: string cache key from make_key
+        :param result: dictionary for JSON result to store
+        """
+
+        data = zlib.compress(json.dumps(result).encode())
+        now = time.time()
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, now, now, len(data), data),
+                )
+            self._evict(now)
+
+    def _is_expired(self, created, now):
+        return self.max_age is not None and now - created > self.max_age
+
+    def _evict(self, now):
+        with self._connection:
+            if self.max_age is not None:
+                cursor = self._connection.execute(
+                    "DELETE FROM results WHERE created < ?", (now - self.max_age,)
+                )
+                self.evictions += max(cursor.rowcount, 0)
+            if self.max_size is not None:
+                total_size = self._connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()[0]
+                if total_size <= self.max_size:
+                    return
+                rows = self._connection.execute(
+                    "SELECT key, size FROM results ORDER BY accessed ASC"
+                ).fetchall()
+                for key, size in rows:
+                    if total_size <= self.max_size:
+                        break
+                    self._connection.execute(
+                        "DELETE FROM results WHERE key = ?", (key,)
+                    )
+                    total_size -= size
+                    self.evictions += 1
+
+    def stats(self):
+        """
+        Get cache usage counters.
+
+        :return stats: dictionary with hits, misses, evictions, entries and size in bytes
+        """
+
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size": size,
+        }
+
+    def clear(self):
+        """
+        Remove all cached results.
+        """
+
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM results")
+
+    def close(self):
+        """
+        Close the connection to the cache database.
+        """
+
+        with self._lock:
+            self._connection.close()
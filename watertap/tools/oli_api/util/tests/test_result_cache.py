@@ -0,0 +1,72 @@
+#################################################################################
+# WaterTAP Copyright (c) 2020-2026, The Regents of the University of California,
+# through Lawrence Berkeley National Laboratory, Oak Ridge National Laboratory,
+# National Laboratory of the Rockies, and National Energy Technology
+# Laboratory (subject to receipt of any required approvals from the U.S. Dept.
+# of Energy). All rights reserved.
+#
+# Please see the files COPYRIGHT.md and LICENSE.md for full copyright and license
+# information, respectively. These files are also available online at the URL
+# "https://github.com/watertap-org/watertap/"
+#################################################################################
+import time
+
+import pytest
+
+from watertap.tools.oli_api.util.result_cache import OLIResultCache
+
+
+@pytest.mark.unit
+def test_make_key_is_canonical():
+    key = OLIResultCache.make_key("dbs", "isothermal", {"a": 1, "b": {"c": 2.0}})
+    assert key == OLIResultCache.make_key(
+        "dbs", "isothermal", {"b": {"c": 2.0}, "a": 1}
+    )
+    assert key != OLIResultCache.make_key("dbs", "wateranalysis", {"a": 1})
+    assert key != OLIResultCache.make_key("other", "isothermal", {"a": 1})
+
+
+@pytest.mark.unit
+def test_get_set_and_persistence(tmp_path):
+    file_path = tmp_path / "cache.sqlite"
+    key = OLIResultCache.make_key("dbs", "isothermal", {"a": 1})
+    with OLIResultCache(file_path) as cache:
+        assert cache.get(key) is None
+        cache.set(key, {"result": {"value": 1.5}})
+        assert cache.get(key) == {"result": {"value": 1.5}}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    with OLIResultCache(file_path) as cache:
+        assert len(cache) == 1
+        assert cache.get(key) == {"result": {"value": 1.5}}
+        cache.clear()
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_age_eviction(tmp_path):
+    with OLIResultCache(tmp_path / "cache.sqlite", max_age=0.05) as cache:
+        cache.set("old", {"value": 1})
+        time.sleep(0.1)
+        assert cache.get("old") is None
+        assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_size_eviction(tmp_path):
+    with OLIResultCache(tmp_path / "cache.sqlite") as cache:
+        cache.set("probe", {"value": list(range(100))})
+        entry_size = cache.stats()["size"]
+
+    with OLIResultCache(tmp_path / "sized.sqlite", max_size=2 * entry_size) as cache:
+        for key in ["first", "second"]:
+            cache.set(key, {"value": list(range(100))})
+            time.sleep(0.01)
+        # touch "first" so that "second" is the least recently used
+        assert cache.get("first") is not None
+        cache.set("third", {"value": list(range(100))})
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.stats()["evictions"] == 1
@@ -528,6 +528,9 @@ see reaction package for documentation.}""",
             has_phase_equilibrium=self.config.has_phase_equilibrium
         )
 
+        # Geometry is needed before the balances for holdup in dynamic models
+        self.liquid_phase.add_geometry()
+
         self.liquid_phase.add_reaction_blocks(
             has_equilibrium=self.config.has_equilibrium_reactions
         )
@@ -577,8 +580,6 @@ see reaction package for documentation.}""",
                 f"same material flow basis."
             )
 
-        self.liquid_phase.add_geometry()
-
         # Add Ports
         self.add_inlet_port(name="inlet", block=self.liquid_phase, doc="Liquid feed")
         self.add_outlet_port(
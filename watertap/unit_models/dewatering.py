@@ -256,6 +256,7 @@ class DewateringData(SeparatorData):
             self.flowsheet().time,
             units=pyunits.kWh / (pyunits.m**3),
             initialize=0.026,
+            default=0.026,
             mutable=True,
             doc="Specific electricity intensity of unit",
         )
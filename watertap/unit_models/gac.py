@@ -10,7 +10,6 @@
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
 import os
-import pandas as pd
 from enum import Enum, auto
 
 from pyomo.environ import (
@@ -42,11 +41,14 @@ from idaes.core.util.exceptions import ConfigurationError, InitializationError
 import idaes.core.util.scaling as iscale
 import idaes.logger as idaeslog
 from idaes.core.surrogate.surrogate_block import SurrogateBlock
-from idaes.core.surrogate.pysmo_surrogate import PysmoSurrogate
 
 from watertap.core.solvers import get_solver
 from watertap.core import ControlVolume0DBlock, InitializationMixin
 from watertap.core.util.initialization import interval_initializer
+from watertap.core.util.surrogate_registry import (
+    evaluate_surrogate_batch,
+    load_surrogate,
+)
 from watertap.costing.unit_models.gac import cost_gac
 
 __author__ = "Hunter Barber"
@@ -1015,33 +1017,7 @@ class GACData(InitializationMixin, UnitModelBlockData):
         if self.config.cphsdm_calaculation_method == CPHSDMCalculationMethod.surrogate:
 
             init_log.info_high("Initializing values from surrogates.")
-
-            calculate_variable_from_constraint(self.N_Bi, self.eq_number_bi)
-
-            init_data = pd.DataFrame(
-                {
-                    "freund_ninv": [self.freund_ninv.value],
-                    "N_Bi": [self.N_Bi.value],
-                    "conc_ratio_replace": [self.conc_ratio_replace.value],
-                }
-            )
-            init_out = self.min_N_St_surrogate.evaluate_surrogate(init_data)
-            self.min_N_St.value = init_out["min_N_St"].values[0]
-
-            init_out = self.throughput_surrogate.evaluate_surrogate(init_data)
-            self.throughput.value = init_out["throughput"].values[0]
-
-            if self.config.add_trapezoidal_effluent_approximation:
-                for e, c in self.eq_ele_conc_ratio_replace.items():
-                    calculate_variable_from_constraint(
-                        self.ele_conc_ratio_replace[e], c
-                    )
-                for ele in self.ele_index:
-                    init_data["conc_ratio_replace"] = self.ele_conc_ratio_replace[
-                        ele
-                    ].value
-                    init_out = self.throughput_surrogate.evaluate_surrogate(init_data)
-                    self.ele_throughput[ele].value = init_out["throughput"].values[0]
+            set_surrogate_initial_values([self])
 
         # initialize control volume
         flags = self.process_flow.initialize(
@@ -1264,7 +1240,7 @@ class GACData(InitializationMixin, UnitModelBlockData):
     # ---------------------------------------------------------------------
     def add_surrogates(self):
 
-        self.min_N_St_surrogate = PysmoSurrogate.load_from_file(min_N_St_surr_path)
+        self.min_N_St_surrogate = load_surrogate(min_N_St_surr_path)
         self.min_N_St_surrogate_blk = SurrogateBlock(concrete=True)
         self.min_N_St_surrogate_blk.build_model(
             self.min_N_St_surrogate,
@@ -1272,7 +1248,7 @@ class GACData(InitializationMixin, UnitModelBlockData):
             output_vars=[self.min_N_St],
         )
 
-        self.throughput_surrogate = PysmoSurrogate.load_from_file(throughput_surr_path)
+        self.throughput_surrogate = load_surrogate(throughput_surr_path)
         self.throughput_surrogate_blk = SurrogateBlock(concrete=True)
         self.throughput_surrogate_blk.build_model(
             self.throughput_surrogate,
@@ -1579,3 +1555,49 @@ class GACData(InitializationMixin, UnitModelBlockData):
     @property
     def default_costing_method(self):
         return cost_gac
+
+
+def set_surrogate_initial_values(units):
+    """
+    Set initial values of the surrogate outputs of GAC units.
+
+    The Biot number (and the replacement concentration ratio of each element
+    when the trapezoidal effluent approximation is used) is calculated for
+    every unit first, after which each surrogate is evaluated once for all
+    units and elements together.
+
+    Args:
+        units - iterable of GAC unit model data using the surrogate CPHSDM
+                calculation method
+    """
+    # Map id of each surrogate to (surrogate, input rows, output Vars)
+    batches = {}
+
+    def add_point(surrogate, inputs, var):
+        batch = batches.setdefault(id(surrogate), (surrogate, [], []))
+        batch[1].append([inputs[k] for k in surrogate.input_labels()])
+        batch[2].append(var)
+
+    for u in units:
+        calculate_variable_from_constraint(u.N_Bi, u.eq_number_bi)
+        inputs = {
+            "freund_ninv": u.freund_ninv.value,
+            "N_Bi": u.N_Bi.value,
+            "conc_ratio_replace": u.conc_ratio_replace.value,
+        }
+        add_point(u.min_N_St_surrogate, inputs, u.min_N_St)
+        add_point(u.throughput_surrogate, inputs, u.throughput)
+
+        if u.config.add_trapezoidal_effluent_approximation:
+            for e, c in u.eq_ele_conc_ratio_replace.items():
+                calculate_variable_from_constraint(u.ele_conc_ratio_replace[e], c)
+            for ele in u.ele_index:
+                ele_inputs = dict(
+                    inputs, conc_ratio_replace=u.ele_conc_ratio_replace[ele].value
+                )
+                add_point(u.throughput_surrogate, ele_inputs, u.ele_throughput[ele])
+
+    for surrogate, rows, out_vars in batches.values():
+        outputs = evaluate_surrogate_batch(surrogate, rows)
+        for var, val in zip(out_vars, outputs[:, 0]):
+            var.set_value(val)
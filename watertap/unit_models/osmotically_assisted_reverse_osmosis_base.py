@@ -40,6 +40,7 @@ from watertap.core.membrane_channel_base import (
 )
 
 from watertap.core import InitializationMixin
+from watertap.core.membrane_channel1d import MembraneChannel1DBlockData
 from watertap.core.util.initialization import interval_initializer
 from watertap.costing.unit_models.osmotically_assisted_reverse_osmosis import (
     cost_osmotically_assisted_reverse_osmosis,
@@ -580,6 +581,7 @@ class OsmoticallyAssistedReverseOsmosisBaseData(
         solver=None,
         optarg=None,
         raise_on_isothermal_violation=True,
+        element_marching=False,
     ):
         """
         General wrapper for RO initialization routines
@@ -608,6 +610,9 @@ class OsmoticallyAssistedReverseOsmosisBaseData(
             solver : solver object or string indicating which solver to use during
                      initialization, if None provided the default solver will be used
                      (default = None)
+            element_marching : (bool) for 1D models, solve the finite elements one at a
+                               time along the feed side before solving the whole unit
+                               (default = False)
         Returns:
             None
         """
@@ -664,6 +669,12 @@ class OsmoticallyAssistedReverseOsmosisBaseData(
 
         interval_initializer(self)
 
+        if element_marching and isinstance(self.feed_side, MembraneChannel1DBlockData):
+            self.feed_side.initialize_by_element_marching(
+                outlvl=outlvl, solver=solver, optarg=optarg
+            )
+            init_log.info_high("Initialization Step 1c (element marching) Complete")
+
         # Solve unit *without* flux equation
         self.eq_flux_mass.deactivate()
         with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
@@ -32,6 +32,7 @@ from idaes.core.util.tables import create_stream_table_dataframe
 import idaes.logger as idaeslog
 
 from watertap.core import InitializationMixin
+from watertap.core.membrane_channel1d import MembraneChannel1DBlockData
 from watertap.core.membrane_channel_base import (
     validate_membrane_config_args,
     ConcentrationPolarizationType,
@@ -580,6 +581,7 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
         solver=None,
         optarg=None,
         initialization_degrees_of_freedom=0,
+        element_marching=False,
     ):
         """
         General wrapper for RO initialization routines
@@ -605,6 +607,9 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
                      initialization, if None provided the default solver will be used
                      (default = None)
             initialization_degrees_of_freedom : (int) degrees of freedom at start of initialization
+            element_marching : (bool) for 1D models, solve the finite elements one at a
+                               time along the length before solving the whole unit
+                               (default = False)
         Returns:
             None
         """
@@ -651,6 +656,12 @@ class ReverseOsmosisBaseData(InitializationMixin, UnitModelBlockData):
         # pre-solve using interval arithmetic
         interval_initializer(self)
 
+        if element_marching and isinstance(self.feed_side, MembraneChannel1DBlockData):
+            self.feed_side.initialize_by_element_marching(
+                outlvl=outlvl, solver=solver, optarg=optarg
+            )
+            init_log.info_high("Initialization Step 1c (element marching) Complete")
+
         # Create solver
         opt = get_solver(solver, optarg)
 
@@ -11,6 +11,7 @@
 #################################################################################
 
 import pytest
+import pandas as pd
 import pyomo.environ as pyo
 import idaes.core.util.scaling as iscale
 
@@ -21,7 +22,7 @@ from idaes.core import (
 from watertap.core.solvers import get_solver
 from idaes.core.util.exceptions import ConfigurationError
 from watertap.property_models.multicomp_aq_sol_prop_pack import MCASParameterBlock
-from watertap.unit_models.gac import GAC
+from watertap.unit_models.gac import GAC, set_surrogate_initial_values
 from watertap.costing import WaterTAPCosting
 from watertap.unit_models.tests.unit_test_harness import UnitTestHarness
 
@@ -994,3 +995,43 @@ class TestGACErrorLog:
                 surface_diffusion_coefficient_type="calculated",
                 target_species={"species": "TCE"},
             )
+
+
+@pytest.mark.component
+def test_set_surrogate_initial_values():
+    units = [build_hand_surrogate().fs.unit, build_hand_surrogate_no_ss().fs.unit]
+    units[1].conc_ratio_replace.fix(0.3)
+
+    set_surrogate_initial_values(units)
+
+    for u in units:
+        inputs = pd.DataFrame(
+            {
+                "freund_ninv": [u.freund_ninv.value],
+                "N_Bi": [u.N_Bi.value],
+                "conc_ratio_replace": [u.conc_ratio_replace.value],
+            }
+        )
+        assert pyo.value(u.min_N_St) == pytest.approx(
+            u.min_N_St_surrogate.evaluate_surrogate(inputs)["min_N_St"].values[0],
+            rel=1e-8,
+        )
+        assert pyo.value(u.throughput) == pytest.approx(
+            u.throughput_surrogate.evaluate_surrogate(inputs)["throughput"].values[0],
+            rel=1e-8,
+        )
+
+    u = units[0]
+    assert u.config.add_trapezoidal_effluent_approximation
+    for ele in u.ele_index:
+        inputs = pd.DataFrame(
+            {
+                "freund_ninv": [u.freund_ninv.value],
+                "N_Bi": [u.N_Bi.value],
+                "conc_ratio_replace": [u.ele_conc_ratio_replace[ele].value],
+            }
+        )
+        assert pyo.value(u.ele_throughput[ele]) == pytest.approx(
+            u.throughput_surrogate.evaluate_surrogate(inputs)["throughput"].values[0],
+            rel=1e-8,
+        )
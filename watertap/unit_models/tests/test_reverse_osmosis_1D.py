@@ -9,8 +9,9 @@
 # information, respectively. These files are also available online at the URL
 # "https://github.com/watertap-org/watertap/"
 #################################################################################
-from pyomo.environ import ConcreteModel, assert_optimal_termination
+from pyomo.environ import ConcreteModel, Var, assert_optimal_termination, value
 
+from watertap.core import membrane_channel1d
 from watertap.core.solvers import get_solver
 
 from idaes.core import FlowsheetBlock
@@ -1271,3 +1272,60 @@ def test_RO_with_MCAS_NaCl_CaSO4():
         m.fs.unit.rejection_phase_comp[0, "Liq", "Na_+"].fix(r)
         results = solver.solve(m, tee=True)
         assert_optimal_termination(results)
+
+
+@pytest.mark.component
+def test_element_marching():
+    m = build_basic()
+    unit = m.fs.unit
+
+    flags = unit.feed_side.initialize()
+    unit.permeate_side.initialize()
+    n_points = unit.feed_side.initialize_by_element_marching()
+    assert n_points == len(unit.length_domain)
+
+    # Each element is solved from the outlet of the previous one
+    for x in unit.difference_elements:
+        for j in m.fs.properties.component_list:
+            for con in (
+                unit.eq_flux_mass[0, x, "Liq", j],
+                unit.feed_side.material_balances[0, x, j],
+                unit.feed_side.material_flow_dx_disc_eq[0, x, "Liq", j],
+            ):
+                assert value(con.body) == pytest.approx(value(con.upper), abs=1e-8)
+    unit.feed_side.release_state(flags)
+
+    unit.initialize(element_marching=True)
+    results = solver.solve(m)
+    assert_optimal_termination(results)
+    area = value(unit.area)
+
+    # The same solution is found without element marching
+    m = build_basic()
+    m.fs.unit.initialize()
+    results = solver.solve(m)
+    assert_optimal_termination(results)
+    assert value(m.fs.unit.area) == pytest.approx(area, rel=1e-6)
+
+
+@pytest.mark.component
+def test_element_marching_evaluation_error(monkeypatch):
+    m = build_basic()
+    unit = m.fs.unit
+    x = unit.length_domain.first()
+    values = [v.value for v in unit.flux_mass_phase_comp[0, x, :, :]]
+
+    calls = []
+
+    def fail(block, **kwds):
+        # e.g. a failed function evaluation in the AMPL solver library
+        calls.append(block)
+        for v in block.component_data_objects(Var):
+            v.set_value(-1, skip_validation=True)
+        raise RuntimeError("Error in AMPL evaluation")
+
+    monkeypatch.setattr(membrane_channel1d, "solve_strongly_connected_components", fail)
+    # Marching stops at the first point and its values are restored
+    assert unit.feed_side.initialize_by_element_marching() == 0
+    assert len(calls) == 1
+    assert [v.value for v in unit.flux_mass_phase_comp[0, x, :, :]] == values
@@ -30,10 +30,8 @@ from watertap.property_models.multicomp_aq_sol_prop_pack import (
 from idaes.core.util.model_statistics import degrees_of_freedom
 
 from idaes.core.surrogate.surrogate_block import SurrogateBlock
-from idaes.core.surrogate.pysmo_surrogate import (
-    PysmoSurrogate,
-)
 from watertap.unit_models.surrogate_crystallizer import SurrogateCrystallizer
+from watertap.core.util.surrogate_registry import load_surrogate
 
 from idaes.core import UnitModelCostingBlock
 from watertap.costing import WaterTAPCosting
@@ -90,7 +88,7 @@ def add_crystallizer_rbf_model(
             "surrogate_crystallizer_defaults",
             surrogate_name,
         )
-        current_surrogate = PysmoSurrogate.load_from_file(surrogate_path)
+        current_surrogate = load_surrogate(surrogate_path)
 
         getattr(blk, block_name).build_model(
             current_surrogate,
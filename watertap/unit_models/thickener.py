@@ -260,6 +260,7 @@ class ThickenerData(SeparatorData):
             self.flowsheet().time,
             units=pyunits.kWh / (pyunits.m**3),
             initialize=0.01255,
+            default=0.01255,
             mutable=True,
             doc="Specific electricity intensity of unit",
         )
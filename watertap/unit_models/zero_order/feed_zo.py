@@ -28,7 +28,7 @@ import idaes.logger as idaeslog
 from watertap.core.solvers import get_solver
 from idaes.core.util.exceptions import InitializationError
 
-from watertap.core import InitializationMixin
+from watertap.core import InitializationMixin, ZeroOrderBaseData
 
 # Some more inforation about this module
 __author__ = "Andrew Lee"
@@ -186,11 +186,12 @@ class FeedZOData(InitializationMixin, FeedData):
             outlvl=outlvl, optarg=optarg, solver=solver, state_args=state_args
         )
 
-        with idaeslog.solver_log(solve_log, idaeslog.DEBUG) as slc:
-            res = opt.solve(self, tee=slc.tee)
-        init_log.info("Initialization complete: {}.".format(idaeslog.condition(res)))
+        # Solve directly if possible, as for the other zero-order units
+        res = ZeroOrderBaseData._solve_unit(self, opt, solve_log)
+        status = "Solved Directly" if res is None else idaeslog.condition(res)
+        init_log.info("Initialization complete: {}.".format(status))
 
-        if not check_optimal_termination(res):
+        if res is not None and not check_optimal_termination(res):
             raise InitializationError(
                 f"{self.name} failed to initialize successfully. Please check "
                 f"the output logs for more information."